@@ -3,30 +3,41 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import hmac
+import json
 import logging
 import os
-from contextlib import asynccontextmanager
-from typing import Dict, List
+import time
+from contextlib import asynccontextmanager, nullcontext
+from typing import Dict, List, Literal
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from dotenv import load_dotenv
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from langchain.agents import create_agent
 from langchain.tools import tool
-from langchain_mcp_adapters.tools import load_mcp_tools
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.messages.ai import add_usage
 from pydantic import BaseModel
-from src.agents.llm import ChatLLM
+from src.agents.conversation_store import ConversationStore
+from src.agents.llm import ChatLLM, llm_http_client
 from src.agents.mcp_client import MCPClient
 from src.agents.tools import (
     add_to_cart,
     checkout,
+    close_client,
     empty_cart,
     get_ads,
     get_cart,
     get_product,
+    get_products,
     get_recommendations,
     get_shipping_quote,
     get_supported_currencies,
     list_products,
+    start_client,
 )
 from traceloop.sdk.decorators import workflow
 
@@ -34,16 +45,67 @@ from traceloop.sdk.decorators import workflow
 class ChatRequest(BaseModel):
     message: str
     history: List[Dict] | None = None
+    # With a session id the agent keeps the history, and history is only sent to start,
+    # reset or restore it
+    session_id: str | None = None
+    # "final" returns only the answer, "full" every message of the conversation
+    response_mode: Literal["final", "full"] = "final"
+
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def message_text(content):
+    """Returns the text of a message whose content is a string or a list of content parts."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part.get("text", "") for part in content if isinstance(part, dict) and part.get("type") == "text"
+    )
+
+
+def run_metadata(messages, duration):
+    """Summarizes the messages produced by one agent run."""
+    usage = None
+    for message in messages:
+        if isinstance(message, AIMessage) and message.usage_metadata:
+            usage = add_usage(usage, message.usage_metadata)
+    metadata = {
+        "duration_ms": round(duration * 1000, 1),
+        "model_calls": sum(isinstance(m, AIMessage) for m in messages),
+        "tool_calls": sum(isinstance(m, ToolMessage) for m in messages),
+    }
+    if usage:
+        metadata["usage"] = usage
+    return metadata
 
 
 class Agent:
     def __init__(self):
         self.app = FastAPI(lifespan=self.lifespan)
         self.app.post("/prompt")(self.handle_prompt)
-        self.agentRecursionLimit = int(os.getenv("GRAPH_RECURSION_LIMIT", "25"))
+        self.app.post("/prompt/stream")(self.handle_prompt_stream)
+        self.app.post("/reload")(self.handle_reload)
+        self.app.delete("/session/{session_id}")(self.handle_delete_session)
         self.mcp_server_url = f"http://{os.getenv('MCP_ENDPOINT', '0.0.0.0')}:{os.getenv('MCP_PORT', '8011')}/mcp"
+        # /reload is disabled unless a token is configured
+        self.reload_token = os.getenv("AGENT_RELOAD_TOKEN")
+        # Dotenv file re-read by /reload, `.env` is searched for when unset
+        self.config_path = os.getenv("AGENT_CONFIG_PATH")
 
         self.mcp_server = None
+        # Seconds before the MCP tool list is discovered again, 0 waits for list_changed only
+        self.mcp_tools_ttl = float(os.getenv("MCP_TOOLS_TTL", "300"))
+        # Built once in lifespan and shared by all requests until /reload
+        self.agent = None
+        self.llm_http_client = None
+        self.build_lock = asyncio.Lock()
+        self.conversations = ConversationStore(
+            max_sessions=int(os.getenv("CONVERSATION_MAX_SESSIONS", "1000")),
+            max_messages=int(os.getenv("CONVERSATION_MAX_MESSAGES", "50")),
+            path=os.getenv("CONVERSATION_STORE_PATH"),
+        )
 
     @asynccontextmanager
     async def lifespan(self, app: FastAPI):
@@ -52,17 +114,140 @@ class Agent:
             logging.info("MCP tools enabled")
             self.mcp_server = MCPClient()
             await self.mcp_server.connect_to_mcp_server(self.mcp_server_url)
+        else:
+            start_client()
+        self.llm_http_client = llm_http_client()
+        await self.build_agent()
+        watcher = asyncio.create_task(self.watch_mcp_tools()) if self.mcp_server else None
         yield
+        if watcher:
+            watcher.cancel()
         if self.mcp_server:
             await self.mcp_server.cleanup()
+        await close_client()
+        self.conversations.close()
+        await self.llm_http_client.aclose()
 
     async def handle_prompt(self, request: ChatRequest):
-        return await self.run_agent(request.message, request.history)
+        async with self.session_lock(request.session_id):
+            return await self.run_agent(
+                request.message, await self.session_history(request), request.response_mode, request.session_id
+            )
+
+    async def handle_prompt_stream(self, request: ChatRequest):
+        if request.session_id is not None and request.history is None:
+            # Answer unknown sessions with 409 before the stream starts, the
+            # history is read again under the session lock
+            await self.session_history(request)
+        return StreamingResponse(
+            self.stream_session(request),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def stream_session(self, request: ChatRequest):
+        async with self.session_lock(request.session_id):
+            try:
+                history = await self.session_history(request)
+            except HTTPException as e:
+                yield sse_event("error", {"detail": e.detail})
+                return
+            async for event in self.stream_agent(request.message, history, request.session_id):
+                yield event
+
+    def session_lock(self, session_id):
+        """Serializes turns of the same session, so each one sees the previous answer."""
+        if session_id is None:
+            return nullcontext()
+        return self.conversations.lock(session_id)
+
+    async def handle_delete_session(self, session_id: str):
+        await self.conversations.delete(session_id)
+        return {"status": "deleted"}
+
+    async def session_history(self, request: ChatRequest):
+        if request.session_id is None:
+            return request.history
+        if request.history is None:
+            history = await self.conversations.get(request.session_id)
+            if not history:
+                # Unknown, evicted or lost on restart: the client has to resend the conversation
+                raise HTTPException(
+                    status_code=409,
+                    detail="Unknown session, send the conversation in history to start or restore it",
+                )
+            return history
+        await self.conversations.replace(
+            request.session_id,
+            [
+                {"role": m["role"], "content": message_text(m.get("content") or "")}
+                for m in request.history
+                if m.get("role") in ("user", "assistant")
+            ],
+        )
+        return request.history
+
+    async def record_turn(self, session_id, input_prompt, answer):
+        if session_id is not None:
+            await self.conversations.append(
+                session_id,
+                [
+                    {"role": "user", "content": input_prompt},
+                    {"role": "assistant", "content": answer},
+                ],
+            )
+
+    async def handle_reload(self, authorization: str | None = Header(default=None)):
+        """Re-reads `AGENT_CONFIG_PATH` and rebuilds the model, tool list and agent graph.
+
+        Requires `Authorization: Bearer <AGENT_RELOAD_TOKEN>`. Requests already
+        running finish on the previous graph. The LLM connection pool is kept,
+        so `LLM_TLS_VERIFY` needs a restart.
+        """
+        if not self.reload_token:
+            raise HTTPException(status_code=404, detail="Reload is disabled, set AGENT_RELOAD_TOKEN to enable it")
+        if not hmac.compare_digest(authorization or "", f"Bearer {self.reload_token}"):
+            raise HTTPException(status_code=401, detail="Invalid reload token")
+        load_dotenv(self.config_path, override=True)
+        try:
+            tools = await self.build_agent()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e)) from e
+        return {"status": "reloaded", "tools": [t.name for t in tools]}
+
+    async def build_agent(self):
+        async with self.build_lock:
+            self.agentRecursionLimit = int(os.getenv("GRAPH_RECURSION_LIMIT", "25"))
+            # Tool calls of one model turn run concurrently, at most this many at once
+            self.agentMaxConcurrency = int(os.getenv("GRAPH_MAX_CONCURRENCY", "4"))
+            model = ChatLLM(http_async_client=self.llm_http_client)
+            tools = await self.get_tool_list()
+            self.agent = create_agent(
+                model,
+                tools=tools,
+                system_prompt="You are a helpful assistant. Be concise and accurate.",
+            )
+            logging.info(f"Agent built with {len(tools)} tools")
+            return tools
+
+    async def watch_mcp_tools(self):
+        """Rebuilds the agent when the MCP tool list changes or gets older than
+        `MCP_TOOLS_TTL`, so tool discovery never runs on the request path."""
+        while True:
+            try:
+                await asyncio.wait_for(self.mcp_server.tools_changed.wait(), self.mcp_tools_ttl or None)
+            except asyncio.TimeoutError:
+                pass
+            self.mcp_server.tools_changed.clear()
+            try:
+                await self.build_agent()
+            except Exception as e:
+                logging.warning(f"Failed to refresh MCP tools: {e}")
 
     async def get_tool_list(self):
         mcp_enabled = os.getenv("MCP_ENABLED", "False") == "True"
         if mcp_enabled and self.mcp_server is not None:
-            return await load_mcp_tools(self.mcp_server.session)
+            return await self.mcp_server.load_tools()
         else:
             tool_list = [
                 add_to_cart,
@@ -71,6 +256,7 @@ class Agent:
                 get_ads,
                 get_cart,
                 get_product,
+                get_products,
                 get_recommendations,
                 get_shipping_quote,
                 get_supported_currencies,
@@ -79,25 +265,73 @@ class Agent:
             return [tool(t) for t in tool_list]
 
     @workflow(name="astronomy_shop_agent_workflow")
-    async def run_agent(self, input_prompt, history: List[Dict] | None = None):
-        model = ChatLLM()
-        tools = await self.get_tool_list()
-        agent = create_agent(
-            model,
-            tools=tools,
-            system_prompt="You are a helpful assistant. Be concise and accurate.",
-        )
+    async def run_agent(
+        self, input_prompt, history: List[Dict] | None = None, response_mode="final", session_id=None
+    ):
+        agent = self.agent
         try:
             messages = list(history) if history is not None else []
             messages.append({"role": "user", "content": input_prompt})
+            start = time.perf_counter()
             result = await agent.ainvoke(
                 {"messages": messages},
-                config={"recursion_limit": self.agentRecursionLimit},
+                config={
+                    "recursion_limit": self.agentRecursionLimit,
+                    "max_concurrency": self.agentMaxConcurrency,
+                },
             )
-            return {"response": result}
+            await self.record_turn(session_id, input_prompt, result["messages"][-1].text)
+            metadata = run_metadata(result["messages"][len(messages):], time.perf_counter() - start)
+            if response_mode == "final":
+                # Same shape as the full response, so clients reading messages[-1] work with both
+                result = {"messages": result["messages"][-1:]}
+            return {"response": result, "metadata": metadata}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    @workflow(name="astronomy_shop_agent_workflow")
+    async def stream_agent(self, input_prompt, history: List[Dict] | None = None, session_id=None):
+        """Runs the agent and yields its progress as Server-Sent Events.
+
+        Model tokens are sent as `token` events while they are generated, tool
+        calls as `tool_start` and `tool_end`, and the final answer as `done`.
+        Models that do not stream send each reply as a single `token` event.
+        """
+        agent = self.agent
+        messages = list(history) if history is not None else []
+        messages.append({"role": "user", "content": input_prompt})
+        streamed = set()
+        answer = ""
+        try:
+            async for event in agent.astream_events(
+                {"messages": messages},
+                config={
+                    "recursion_limit": self.agentRecursionLimit,
+                    "max_concurrency": self.agentMaxConcurrency,
+                },
+                version="v2",
+            ):
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    content = event["data"]["chunk"].text
+                    if content:
+                        streamed.add(event["run_id"])
+                        yield sse_event("token", {"content": content})
+                elif kind == "on_chat_model_end":
+                    answer = event["data"]["output"].text
+                    if answer and event["run_id"] not in streamed:
+                        yield sse_event("token", {"content": answer})
+                elif kind == "on_tool_start":
+                    yield sse_event("tool_start", {"name": event["name"], "input": event["data"].get("input")})
+                elif kind == "on_tool_end":
+                    output = event["data"].get("output")
+                    yield sse_event("tool_end", {"name": event["name"], "status": getattr(output, "status", "success")})
+            await self.record_turn(session_id, input_prompt, answer)
+            yield sse_event("done", {"content": answer})
+        except Exception as e:
+            logging.exception("Agent stream failed")
+            yield sse_event("error", {"detail": str(e)})
+
     async def launch(self):
         agent_port = int(os.getenv("AGENT_PORT", "8010"))
         agent_config = uvicorn.Config(
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import sqlite3
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ConversationStore:
+    """Keeps the messages of each chat session on the server.
+
+    Recently used sessions are held in an LRU of `max_sessions` entries. When
+    `path` is set, every message is also written to a SQLite database, so
+    sessions evicted from memory or from before a restart are loaded from
+    there. Database calls run on a single worker thread, in the order they
+    were made, so they never block the event loop. Each session keeps its
+    last `max_messages` messages.
+
+    Turns of the same session are serialized by holding `lock(session_id)`
+    while the history is read, the agent runs and the turn is recorded.
+    """
+
+    def __init__(self, max_sessions=1000, max_messages=50, path=None):
+        if max_sessions < 1 or max_messages < 1:
+            raise ValueError("max_sessions and max_messages must be at least 1")
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self._sessions = OrderedDict()
+        # Dropped once no request holds or waits for them
+        self._locks = weakref.WeakValueDictionary()
+        self._db = None
+        self._executor = None
+        if path:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conversation-store")
+            self._executor.submit(self._open, path).result()
+
+    def lock(self, session_id):
+        """Returns the lock that serializes the turns of a session."""
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def get(self, session_id):
+        """Returns the messages of a session, or an empty list if it is unknown."""
+        session = self._sessions.get(session_id)
+        if session is None and self._db:
+            session = await self._run(self._load, session_id)
+            if session:
+                self._cache(session_id, session)
+        if not session:
+            return []
+        self._sessions.move_to_end(session_id)
+        return list(session)
+
+    async def append(self, session_id, messages):
+        session = self._sessions.get(session_id)
+        if session is None:
+            loaded = await self._run(self._load, session_id) if self._db else []
+            # Another request may have loaded the session while this one waited.
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = loaded
+                self._cache(session_id, session)
+        session.extend(messages)
+        del session[: -self.max_messages]
+        self._sessions.move_to_end(session_id)
+        if self._db:
+            await self._run(self._insert, session_id, messages)
+
+    async def replace(self, session_id, messages):
+        await self.delete(session_id)
+        await self.append(session_id, messages)
+
+    async def delete(self, session_id):
+        self._sessions.pop(session_id, None)
+        if self._db:
+            await self._run(self._delete, session_id)
+
+    def close(self):
+        if self._executor:
+            self._executor.submit(self._db.close).result()
+            self._executor.shutdown()
+
+    def _cache(self, session_id, session):
+        self._sessions[session_id] = session
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _open(self, path):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "session_id TEXT NOT NULL, role TEXT NOT NULL, content TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS messages_session_id ON messages (session_id, id)"
+        )
+        self._db.commit()
+
+    def _load(self, session_id):
+        rows = self._db.execute(
+            "SELECT role, content FROM messages WHERE session_id = ? ORDER BY id DESC LIMIT ?",
+            (session_id, self.max_messages),
+        ).fetchall()
+        return [{"role": role, "content": content} for role, content in reversed(rows)]
+
+    def _insert(self, session_id, messages):
+        self._db.executemany(
+            "INSERT INTO messages (session_id, role, content) VALUES (?, ?, ?)",
+            [(session_id, m["role"], m["content"]) for m in messages],
+        )
+        self._db.commit()
+
+    def _delete(self, session_id):
+        self._db.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        self._db.commit()
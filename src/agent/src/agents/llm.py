@@ -3,23 +3,33 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import os
+import re
 
 import httpx
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGenerationChunk
 from langchain_openai import ChatOpenAI
 from src.agents.patch_vcr import VCR
+from vcr.request import Request
+
+
+def llm_http_client():
+    llm_tls_verify = os.getenv("LLM_TLS_VERIFY", "True").lower() == "true"
+    return httpx.AsyncClient(verify=llm_tls_verify)
 
 
 class ChatLLM(ChatOpenAI):
     def __init__(self, **kwargs):
         model_name = os.getenv("LLM_MODEL", "default")
         use_vcr = os.getenv("USE_VCR", "True").lower() == "true"
-        llm_tls_verify = os.getenv("LLM_TLS_VERIFY", "True").lower() == "true"
         cassette_name = ""
         if use_vcr:
             cassette_name = f"{model_name.replace('/', '_')}_cassette.yaml"
         if "http_async_client" not in kwargs:
-            kwargs["http_async_client"] = httpx.AsyncClient(verify=llm_tls_verify)
+            kwargs["http_async_client"] = llm_http_client()
         kwargs.setdefault("openai_api_base", os.getenv("LLM_BASE_URL"))
         kwargs.setdefault("model", model_name)
 
@@ -44,3 +54,61 @@ class ChatLLM(ChatOpenAI):
             with VCR.use_cassette(self._cassette_name):
                 return await super()._agenerate(messages, stop, run_manager, **kwargs)
         return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        if self._has_recording(messages, stop, **kwargs):
+            result = self._generate(messages, stop, **kwargs)
+            for chunk in replay_chunks(result):
+                if run_manager:
+                    run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                yield chunk
+            return
+        yield from super()._stream(messages, stop, run_manager, **kwargs)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        if self._has_recording(messages, stop, **kwargs):
+            result = await self._agenerate(messages, stop, **kwargs)
+            for chunk in replay_chunks(result):
+                if run_manager:
+                    await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                yield chunk
+            return
+        async for chunk in super()._astream(messages, stop, run_manager, **kwargs):
+            yield chunk
+
+    def _has_recording(self, messages, stop=None, **kwargs):
+        """Whether the cassette can answer this request.
+
+        Cassettes hold complete responses, so recorded requests are replayed
+        and re-chunked, while other requests stream from the LLM without being
+        recorded.
+        """
+        if not getattr(self, "_use_vcr", False):
+            return False
+        payload = self._get_request_payload(messages, stop=stop, **kwargs)
+        request = Request("POST", "https://vcr.local/", json.dumps(payload, default=str), {})
+        with VCR.use_cassette(self._cassette_name) as cassette:
+            return bool(cassette.can_play_response_for(request))
+
+
+def replay_chunks(result):
+    """Splits a complete chat result into word chunks, the last one carrying
+    the tool calls, usage and response metadata."""
+    generation = result.generations[0]
+    message = generation.message
+    words = re.split(r"(?<=\s)(?=\S)", message.text)
+    for word in words[:-1]:
+        yield ChatGenerationChunk(message=AIMessageChunk(content=word, id=message.id))
+    yield ChatGenerationChunk(
+        message=AIMessageChunk(
+            content=words[-1],
+            id=message.id,
+            tool_call_chunks=[
+                tool_call_chunk(name=call["name"], args=json.dumps(call["args"]), id=call["id"], index=index)
+                for index, call in enumerate(message.tool_calls)
+            ],
+            usage_metadata=message.usage_metadata,
+            response_metadata=message.response_metadata,
+        ),
+        generation_info=generation.generation_info,
+    )
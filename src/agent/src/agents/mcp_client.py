@@ -4,24 +4,52 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from contextlib import AsyncExitStack
+import asyncio
 import logging
+import time
 
-from mcp import ClientSession
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession, types
 from mcp.client.streamable_http import streamablehttp_client
+from opentelemetry import metrics
+
+meter = metrics.get_meter("astronomy-shop-agent")
+tool_discovery_duration = meter.create_histogram(
+    "demo.agent.mcp.tool_discovery.duration",
+    unit="s",
+    description="Time taken to list the MCP tools and convert them to LangChain tools",
+)
 
 
 class MCPClient:
     def __init__(self):
         self.exit_stack = AsyncExitStack()
         self.session = None
+        # Set when the server sends notifications/tools/list_changed
+        self.tools_changed = asyncio.Event()
 
     async def connect_to_mcp_server(self, url):
         stream_context = streamablehttp_client(url=url)
         read, write, _ = await self.exit_stack.enter_async_context(stream_context)
-        session_context = ClientSession(read, write)
+        session_context = ClientSession(read, write, message_handler=self.handle_message)
         self.session = await self.exit_stack.enter_async_context(session_context)
         await self.session.initialize()
 
+    async def handle_message(self, message):
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            logging.info("MCP tool list changed")
+            self.tools_changed.set()
+
+    async def load_tools(self):
+        start = time.perf_counter()
+        tools = await load_mcp_tools(self.session)
+        duration = time.perf_counter() - start
+        tool_discovery_duration.record(duration)
+        logging.info(f"Discovered {len(tools)} MCP tools in {duration * 1000:.1f} ms")
+        return tools
+
     async def cleanup(self):
         try:
             await self.exit_stack.aclose()
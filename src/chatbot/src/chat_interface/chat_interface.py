@@ -15,7 +15,6 @@ from pydantic import BaseModel
 class ChatUiConfig(BaseModel):
     uiBaseUrl: str
     uiPort: int
-    sessionId: str
     timeout: int
     agentBaseUrl: str
     rootPath: str = ""
@@ -25,18 +24,28 @@ class ChatAgentUI:
     def __init__(self, chat_ui_config: ChatUiConfig):
         self.config = chat_ui_config
 
-    def chat_with_agent(self, message, history, request: gr.Request):
+    def chat_with_agent(self, message, history, session_id):
         try:
-            # session_id = request.session_hash or self.config.sessionId
+            # The agent keeps the conversation of each session, history is
+            # only sent to start a new one
             payload = {
-                # "session_id": session_id,
+                "session_id": session_id,
                 "message": message,
-                "history": history,
             }
+            if not history:
+                payload["history"] = []
             logging.info(f"Sending request {payload} to Agent")
             response = requests.post(
                 self.config.agentBaseUrl, json=payload, timeout=self.config.timeout
             )
+            if response.status_code == 409:
+                # The agent lost the conversation, e.g. after a restart, so
+                # resend it
+                payload["history"] = history
+                logging.info(f"Restoring session {session_id} on Agent")
+                response = requests.post(
+                    self.config.agentBaseUrl, json=payload, timeout=self.config.timeout
+                )
             response.raise_for_status()
 
             agent_data = response.json().get("response", {})
@@ -72,27 +81,31 @@ class ChatAgentUI:
             for ex in config["examples"]
         ]
 
-        def respond(message, history, request: gr.Request):
+        def respond(message, history, session_id):
             message = (message or "").strip()
             if not message:
-                return "", history
+                return "", history, session_id
             history = list(history or [])
-            reply = self.chat_with_agent(message, history, request)
+            # Each conversation has its own session on the agent
+            if not history or not session_id:
+                session_id = str(uuid.uuid4())
+            reply = self.chat_with_agent(message, history, session_id)
             history.append({"role": "user", "content": message})
             history.append({"role": "assistant", "content": reply})
-            return "", history
+            return "", history, session_id
 
-        def respond_fresh(message, request: gr.Request):
+        def respond_fresh(message):
             # Sample-question clicks start a brand new conversation with
             # empty history, rather than continuing the current chat.
             message = (message or "").strip()
             if not message:
-                return "", []
-            reply = self.chat_with_agent(message, [], request)
+                return "", [], None
+            session_id = str(uuid.uuid4())
+            reply = self.chat_with_agent(message, [], session_id)
             return "", [
                 {"role": "user", "content": message},
                 {"role": "assistant", "content": reply},
-            ]
+            ], session_id
 
         with gr.Blocks(
             title=config["title"], analytics_enabled=False
@@ -101,6 +114,7 @@ class ChatAgentUI:
             gr.Markdown(config["description"])
 
             chatbot = gr.Chatbot(height="70vh")
+            session_id = gr.State(None)
             textbox = gr.Textbox(
                 placeholder="Type a message...",
                 show_label=False,
@@ -112,14 +126,14 @@ class ChatAgentUI:
                 example_buttons = [gr.Button(ex, size="sm") for ex in examples]
 
             textbox.submit(
-                respond, [textbox, chatbot], [textbox, chatbot]
+                respond, [textbox, chatbot, session_id], [textbox, chatbot, session_id]
             )
 
             for button, example in zip(example_buttons, examples):
                 button.click(
                     respond_fresh,
                     [gr.State(example)],
-                    [textbox, chatbot],
+                    [textbox, chatbot, session_id],
                 )
 
         chatbot_ui.launch(
@@ -133,7 +147,6 @@ def get_chat_ui_config():
     chat_ui_config = ChatUiConfig(
         uiBaseUrl=os.getenv("CHATBOT_ENDPOINT", "0.0.0.0"),
         uiPort=int(os.getenv("CHATBOT_PORT", "7860")),
-        sessionId=str(uuid.uuid4()),
         timeout=int(os.getenv("AGENT_CHAT_INTERFACE_TIMEOUT", "300")),
         agentBaseUrl=f"http://{os.getenv('AGENT_ENDPOINT', '0.0.0.0')}:{os.getenv('AGENT_PORT', '8010')}/prompt",
         rootPath=os.getenv("CHATBOT_ROOT_PATH", ""),
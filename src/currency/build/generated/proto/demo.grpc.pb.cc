@@ -169,6 +169,8 @@ CartService::Service::~Service() {
 
 static const char* RecommendationService_method_names[] = {
   "/oteldemo.RecommendationService/ListRecommendations",
+  "/oteldemo.RecommendationService/ListRecommendationsBatch",
+  "/oteldemo.RecommendationService/StreamRecommendations",
 };
 
 std::unique_ptr< RecommendationService::Stub> RecommendationService::NewStub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options) {
@@ -179,6 +181,8 @@ std::unique_ptr< RecommendationService::Stub> RecommendationService::NewStub(con
 
 RecommendationService::Stub::Stub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options)
   : channel_(channel), rpcmethod_ListRecommendations_(RecommendationService_method_names[0], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_ListRecommendationsBatch_(RecommendationService_method_names[1], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_StreamRecommendations_(RecommendationService_method_names[2], options.suffix_for_stats(),::grpc::internal::RpcMethod::SERVER_STREAMING, channel)
   {}
 
 ::grpc::Status RecommendationService::Stub::ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::oteldemo::ListRecommendationsResponse* response) {
@@ -204,6 +208,45 @@ void RecommendationService::Stub::async::ListRecommendations(::grpc::ClientConte
   return result;
 }
 
+::grpc::Status RecommendationService::Stub::ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), rpcmethod_ListRecommendationsBatch_, context, request, response);
+}
+
+void RecommendationService::Stub::async::ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc::internal::CallbackUnaryCall< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_ListRecommendationsBatch_, context, request, response, std::move(f));
+}
+
+void RecommendationService::Stub::async::ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) {
+  ::grpc::internal::ClientCallbackUnaryFactory::Create< ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_ListRecommendationsBatch_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* RecommendationService::Stub::PrepareAsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncResponseReaderHelper::Create< ::oteldemo::ListRecommendationsBatchResponse, ::oteldemo::ListRecommendationsBatchRequest, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), cq, rpcmethod_ListRecommendationsBatch_, context, request);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* RecommendationService::Stub::AsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  auto* result =
+    this->PrepareAsyncListRecommendationsBatchRaw(context, request, cq);
+  result->StartCall();
+  return result;
+}
+
+::grpc::ClientReader< ::oteldemo::StreamRecommendationsResponse>* RecommendationService::Stub::StreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request) {
+  return ::grpc::internal::ClientReaderFactory< ::oteldemo::StreamRecommendationsResponse>::Create(channel_.get(), rpcmethod_StreamRecommendations_, context, request);
+}
+
+void RecommendationService::Stub::async::StreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest* request, ::grpc::ClientReadReactor< ::oteldemo::StreamRecommendationsResponse>* reactor) {
+  ::grpc::internal::ClientCallbackReaderFactory< ::oteldemo::StreamRecommendationsResponse>::Create(stub_->channel_.get(), stub_->rpcmethod_StreamRecommendations_, context, request, reactor);
+}
+
+::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>* RecommendationService::Stub::AsyncStreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+  return ::grpc::internal::ClientAsyncReaderFactory< ::oteldemo::StreamRecommendationsResponse>::Create(channel_.get(), cq, rpcmethod_StreamRecommendations_, context, request, true, tag);
+}
+
+::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>* RecommendationService::Stub::PrepareAsyncStreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncReaderFactory< ::oteldemo::StreamRecommendationsResponse>::Create(channel_.get(), cq, rpcmethod_StreamRecommendations_, context, request, false, nullptr);
+}
+
 RecommendationService::Service::Service() {
   AddMethod(new ::grpc::internal::RpcServiceMethod(
       RecommendationService_method_names[0],
@@ -215,6 +258,26 @@ RecommendationService::Service::Service() {
              ::oteldemo::ListRecommendationsResponse* resp) {
                return service->ListRecommendations(ctx, req, resp);
              }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      RecommendationService_method_names[1],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< RecommendationService::Service, ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(
+          [](RecommendationService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::ListRecommendationsBatchRequest* req,
+             ::oteldemo::ListRecommendationsBatchResponse* resp) {
+               return service->ListRecommendationsBatch(ctx, req, resp);
+             }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      RecommendationService_method_names[2],
+      ::grpc::internal::RpcMethod::SERVER_STREAMING,
+      new ::grpc::internal::ServerStreamingHandler< RecommendationService::Service, ::oteldemo::StreamRecommendationsRequest, ::oteldemo::StreamRecommendationsResponse>(
+          [](RecommendationService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::StreamRecommendationsRequest* req,
+             ::grpc::ServerWriter<::oteldemo::StreamRecommendationsResponse>* writer) {
+               return service->StreamRecommendations(ctx, req, writer);
+             }, this)));
 }
 
 RecommendationService::Service::~Service() {
@@ -227,6 +290,20 @@ RecommendationService::Service::~Service() {
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
+::grpc::Status RecommendationService::Service::ListRecommendationsBatch(::grpc::ServerContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status RecommendationService::Service::StreamRecommendations(::grpc::ServerContext* context, const ::oteldemo::StreamRecommendationsRequest* request, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* writer) {
+  (void) context;
+  (void) request;
+  (void) writer;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
 
 static const char* ProductCatalogService_method_names[] = {
   "/oteldemo.ProductCatalogService/ListProducts",
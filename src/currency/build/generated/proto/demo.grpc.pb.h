@@ -583,11 +583,30 @@ class RecommendationService final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>> PrepareAsyncListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>>(PrepareAsyncListRecommendationsRaw(context, request, cq));
     }
+    virtual ::grpc::Status ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>> AsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>>(AsyncListRecommendationsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>> PrepareAsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>>(PrepareAsyncListRecommendationsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReaderInterface< ::oteldemo::StreamRecommendationsResponse>> StreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReaderInterface< ::oteldemo::StreamRecommendationsResponse>>(StreamRecommendationsRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>> AsyncStreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>>(AsyncStreamRecommendationsRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>> PrepareAsyncStreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>>(PrepareAsyncStreamRecommendationsRaw(context, request, cq));
+    }
     class async_interface {
      public:
       virtual ~async_interface() {}
       virtual void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, std::function<void(::grpc::Status)>) = 0;
       virtual void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void StreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest* request, ::grpc::ClientReadReactor< ::oteldemo::StreamRecommendationsResponse>* reactor) = 0;
     };
     typedef class async_interface experimental_async_interface;
     virtual class async_interface* async() { return nullptr; }
@@ -595,6 +614,11 @@ class RecommendationService final {
    private:
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>* AsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>* PrepareAsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>* AsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>* PrepareAsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientReaderInterface< ::oteldemo::StreamRecommendationsResponse>* StreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>* AsyncStreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq, void* tag) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>* PrepareAsyncStreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq) = 0;
   };
   class Stub final : public StubInterface {
    public:
@@ -606,11 +630,30 @@ class RecommendationService final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>> PrepareAsyncListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>>(PrepareAsyncListRecommendationsRaw(context, request, cq));
     }
+    ::grpc::Status ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>> AsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>>(AsyncListRecommendationsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>> PrepareAsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>>(PrepareAsyncListRecommendationsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReader< ::oteldemo::StreamRecommendationsResponse>> StreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReader< ::oteldemo::StreamRecommendationsResponse>>(StreamRecommendationsRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>> AsyncStreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>>(AsyncStreamRecommendationsRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>> PrepareAsyncStreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>>(PrepareAsyncStreamRecommendationsRaw(context, request, cq));
+    }
     class async final :
       public StubInterface::async_interface {
      public:
       void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, std::function<void(::grpc::Status)>) override;
       void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, std::function<void(::grpc::Status)>) override;
+      void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void StreamRecommendations(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest* request, ::grpc::ClientReadReactor< ::oteldemo::StreamRecommendationsResponse>* reactor) override;
      private:
       friend class Stub;
       explicit async(Stub* stub): stub_(stub) { }
@@ -624,7 +667,14 @@ class RecommendationService final {
     class async async_stub_{this};
     ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>* AsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>* PrepareAsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* AsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* PrepareAsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientReader< ::oteldemo::StreamRecommendationsResponse>* StreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request) override;
+    ::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>* AsyncStreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq, void* tag) override;
+    ::grpc::ClientAsyncReader< ::oteldemo::StreamRecommendationsResponse>* PrepareAsyncStreamRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq) override;
     const ::grpc::internal::RpcMethod rpcmethod_ListRecommendations_;
+    const ::grpc::internal::RpcMethod rpcmethod_ListRecommendationsBatch_;
+    const ::grpc::internal::RpcMethod rpcmethod_StreamRecommendations_;
   };
   static std::unique_ptr<Stub> NewStub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options = ::grpc::StubOptions());
 
@@ -633,6 +683,8 @@ class RecommendationService final {
     Service();
     virtual ~Service();
     virtual ::grpc::Status ListRecommendations(::grpc::ServerContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response);
+    virtual ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response);
+    virtual ::grpc::Status StreamRecommendations(::grpc::ServerContext* context, const ::oteldemo::StreamRecommendationsRequest* request, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* writer);
   };
   template <class BaseClass>
   class WithAsyncMethod_ListRecommendations : public BaseClass {
@@ -654,7 +706,47 @@ class RecommendationService final {
       ::grpc::Service::RequestAsyncUnary(0, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
-  typedef WithAsyncMethod_ListRecommendations<Service > AsyncService;
+  template <class BaseClass>
+  class WithAsyncMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodAsync(1);
+    }
+    ~WithAsyncMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestListRecommendationsBatch(::grpc::ServerContext* context, ::oteldemo::ListRecommendationsBatchRequest* request, ::grpc::ServerAsyncResponseWriter< ::oteldemo::ListRecommendationsBatchResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(1, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_StreamRecommendations : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_StreamRecommendations() {
+      ::grpc::Service::MarkMethodAsync(2);
+    }
+    ~WithAsyncMethod_StreamRecommendations() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamRecommendations(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamRecommendationsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestStreamRecommendations(::grpc::ServerContext* context, ::oteldemo::StreamRecommendationsRequest* request, ::grpc::ServerAsyncWriter< ::oteldemo::StreamRecommendationsResponse>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(2, context, request, writer, new_call_cq, notification_cq, tag);
+    }
+  };
+  typedef WithAsyncMethod_ListRecommendations<WithAsyncMethod_ListRecommendationsBatch<WithAsyncMethod_StreamRecommendations<Service > > > AsyncService;
   template <class BaseClass>
   class WithCallbackMethod_ListRecommendations : public BaseClass {
    private:
@@ -682,7 +774,56 @@ class RecommendationService final {
     virtual ::grpc::ServerUnaryReactor* ListRecommendations(
       ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::ListRecommendationsRequest* /*request*/, ::oteldemo::ListRecommendationsResponse* /*response*/)  { return nullptr; }
   };
-  typedef WithCallbackMethod_ListRecommendations<Service > CallbackService;
+  template <class BaseClass>
+  class WithCallbackMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithCallbackMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodCallback(1,
+          new ::grpc::internal::CallbackUnaryHandler< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response) { return this->ListRecommendationsBatch(context, request, response); }));}
+    void SetMessageAllocatorFor_ListRecommendationsBatch(
+        ::grpc::MessageAllocator< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>* allocator) {
+      ::grpc::internal::MethodHandler* const handler = ::grpc::Service::GetHandler(1);
+      static_cast<::grpc::internal::CallbackUnaryHandler< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>*>(handler)
+              ->SetMessageAllocator(allocator);
+    }
+    ~WithCallbackMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* ListRecommendationsBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/)  { return nullptr; }
+  };
+  template <class BaseClass>
+  class WithCallbackMethod_StreamRecommendations : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithCallbackMethod_StreamRecommendations() {
+      ::grpc::Service::MarkMethodCallback(2,
+          new ::grpc::internal::CallbackServerStreamingHandler< ::oteldemo::StreamRecommendationsRequest, ::oteldemo::StreamRecommendationsResponse>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::StreamRecommendationsRequest* request) { return this->StreamRecommendations(context, request); }));
+    }
+    ~WithCallbackMethod_StreamRecommendations() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamRecommendations(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamRecommendationsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerWriteReactor< ::oteldemo::StreamRecommendationsResponse>* StreamRecommendations(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::StreamRecommendationsRequest* /*request*/)  { return nullptr; }
+  };
+  typedef WithCallbackMethod_ListRecommendations<WithCallbackMethod_ListRecommendationsBatch<WithCallbackMethod_StreamRecommendations<Service > > > CallbackService;
   typedef CallbackService ExperimentalCallbackService;
   template <class BaseClass>
   class WithGenericMethod_ListRecommendations : public BaseClass {
@@ -702,6 +843,40 @@ class RecommendationService final {
     }
   };
   template <class BaseClass>
+  class WithGenericMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodGeneric(1);
+    }
+    ~WithGenericMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_StreamRecommendations : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_StreamRecommendations() {
+      ::grpc::Service::MarkMethodGeneric(2);
+    }
+    ~WithGenericMethod_StreamRecommendations() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamRecommendations(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamRecommendationsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
   class WithRawMethod_ListRecommendations : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
@@ -722,6 +897,46 @@ class RecommendationService final {
     }
   };
   template <class BaseClass>
+  class WithRawMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodRaw(1);
+    }
+    ~WithRawMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestListRecommendationsBatch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(1, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_StreamRecommendations : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_StreamRecommendations() {
+      ::grpc::Service::MarkMethodRaw(2);
+    }
+    ~WithRawMethod_StreamRecommendations() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamRecommendations(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamRecommendationsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestStreamRecommendations(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncWriter< ::grpc::ByteBuffer>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(2, context, request, writer, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
   class WithRawCallbackMethod_ListRecommendations : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
@@ -744,6 +959,50 @@ class RecommendationService final {
       ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
   };
   template <class BaseClass>
+  class WithRawCallbackMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodRawCallback(1,
+          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->ListRecommendationsBatch(context, request, response); }));
+    }
+    ~WithRawCallbackMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* ListRecommendationsBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
+  };
+  template <class BaseClass>
+  class WithRawCallbackMethod_StreamRecommendations : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_StreamRecommendations() {
+      ::grpc::Service::MarkMethodRawCallback(2,
+          new ::grpc::internal::CallbackServerStreamingHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const::grpc::ByteBuffer* request) { return this->StreamRecommendations(context, request); }));
+    }
+    ~WithRawCallbackMethod_StreamRecommendations() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamRecommendations(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamRecommendationsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerWriteReactor< ::grpc::ByteBuffer>* StreamRecommendations(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/)  { return nullptr; }
+  };
+  template <class BaseClass>
   class WithStreamedUnaryMethod_ListRecommendations : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
@@ -770,9 +1029,63 @@ class RecommendationService final {
     // replace default version of method with streamed unary
     virtual ::grpc::Status StreamedListRecommendations(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::ListRecommendationsRequest,::oteldemo::ListRecommendationsResponse>* server_unary_streamer) = 0;
   };
-  typedef WithStreamedUnaryMethod_ListRecommendations<Service > StreamedUnaryService;
-  typedef Service SplitStreamedService;
-  typedef WithStreamedUnaryMethod_ListRecommendations<Service > StreamedService;
+  template <class BaseClass>
+  class WithStreamedUnaryMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodStreamed(1,
+        new ::grpc::internal::StreamedUnaryHandler<
+          ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerUnaryStreamer<
+                     ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>* streamer) {
+                       return this->StreamedListRecommendationsBatch(context,
+                         streamer);
+                  }));
+    }
+    ~WithStreamedUnaryMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedListRecommendationsBatch(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::ListRecommendationsBatchRequest,::oteldemo::ListRecommendationsBatchResponse>* server_unary_streamer) = 0;
+  };
+  typedef WithStreamedUnaryMethod_ListRecommendations<WithStreamedUnaryMethod_ListRecommendationsBatch<Service > > StreamedUnaryService;
+  template <class BaseClass>
+  class WithSplitStreamingMethod_StreamRecommendations : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithSplitStreamingMethod_StreamRecommendations() {
+      ::grpc::Service::MarkMethodStreamed(2,
+        new ::grpc::internal::SplitServerStreamingHandler<
+          ::oteldemo::StreamRecommendationsRequest, ::oteldemo::StreamRecommendationsResponse>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerSplitStreamer<
+                     ::oteldemo::StreamRecommendationsRequest, ::oteldemo::StreamRecommendationsResponse>* streamer) {
+                       return this->StreamedStreamRecommendations(context,
+                         streamer);
+                  }));
+    }
+    ~WithSplitStreamingMethod_StreamRecommendations() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status StreamRecommendations(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamRecommendationsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::StreamRecommendationsResponse>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with split streamed
+    virtual ::grpc::Status StreamedStreamRecommendations(::grpc::ServerContext* context, ::grpc::ServerSplitStreamer< ::oteldemo::StreamRecommendationsRequest,::oteldemo::StreamRecommendationsResponse>* server_split_streamer) = 0;
+  };
+  typedef WithSplitStreamingMethod_StreamRecommendations<Service > SplitStreamedService;
+  typedef WithStreamedUnaryMethod_ListRecommendations<WithStreamedUnaryMethod_ListRecommendationsBatch<WithSplitStreamingMethod_StreamRecommendations<Service > > > StreamedService;
 };
 
 // ---------------Product Catalog----------------
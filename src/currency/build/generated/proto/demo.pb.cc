@@ -72,6 +72,67 @@ struct UpdateFlagRequestDefaultTypeInternal {
 PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
     PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 UpdateFlagRequestDefaultTypeInternal _UpdateFlagRequest_default_instance_;
 
+inline constexpr StreamRecommendationsResponse::Impl_::Impl_(
+    ::_pbi::ConstantInitialized) noexcept
+      : _cached_size_{0},
+        product_ids_{},
+        cursor_(
+            &::google::protobuf::internal::fixed_address_empty_string,
+            ::_pbi::ConstantInitialized()) {}
+
+template <typename>
+PROTOBUF_CONSTEXPR StreamRecommendationsResponse::StreamRecommendationsResponse(::_pbi::ConstantInitialized)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(StreamRecommendationsResponse_class_data_.base()),
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(),
+#endif  // PROTOBUF_CUSTOM_VTABLE
+      _impl_(::_pbi::ConstantInitialized()) {
+}
+struct StreamRecommendationsResponseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR StreamRecommendationsResponseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~StreamRecommendationsResponseDefaultTypeInternal() {}
+  union {
+    StreamRecommendationsResponse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 StreamRecommendationsResponseDefaultTypeInternal _StreamRecommendationsResponse_default_instance_;
+
+inline constexpr StreamRecommendationsRequest::Impl_::Impl_(
+    ::_pbi::ConstantInitialized) noexcept
+      : _cached_size_{0},
+        product_ids_{},
+        user_id_(
+            &::google::protobuf::internal::fixed_address_empty_string,
+            ::_pbi::ConstantInitialized()),
+        cursor_(
+            &::google::protobuf::internal::fixed_address_empty_string,
+            ::_pbi::ConstantInitialized()),
+        page_size_{0},
+        max_results_{0} {}
+
+template <typename>
+PROTOBUF_CONSTEXPR StreamRecommendationsRequest::StreamRecommendationsRequest(::_pbi::ConstantInitialized)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(StreamRecommendationsRequest_class_data_.base()),
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(),
+#endif  // PROTOBUF_CUSTOM_VTABLE
+      _impl_(::_pbi::ConstantInitialized()) {
+}
+struct StreamRecommendationsRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR StreamRecommendationsRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~StreamRecommendationsRequestDefaultTypeInternal() {}
+  union {
+    StreamRecommendationsRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 StreamRecommendationsRequestDefaultTypeInternal _StreamRecommendationsRequest_default_instance_;
+
 inline constexpr ShipOrderResponse::Impl_::Impl_(
     ::_pbi::ConstantInitialized) noexcept
       : _cached_size_{0},
@@ -788,6 +849,56 @@ struct OrderItemDefaultTypeInternal {
 PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
     PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 OrderItemDefaultTypeInternal _OrderItem_default_instance_;
 
+inline constexpr ListRecommendationsBatchResponse::Impl_::Impl_(
+    ::_pbi::ConstantInitialized) noexcept
+      : responses_{},
+        _cached_size_{0} {}
+
+template <typename>
+PROTOBUF_CONSTEXPR ListRecommendationsBatchResponse::ListRecommendationsBatchResponse(::_pbi::ConstantInitialized)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(ListRecommendationsBatchResponse_class_data_.base()),
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(),
+#endif  // PROTOBUF_CUSTOM_VTABLE
+      _impl_(::_pbi::ConstantInitialized()) {
+}
+struct ListRecommendationsBatchResponseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ListRecommendationsBatchResponseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ListRecommendationsBatchResponseDefaultTypeInternal() {}
+  union {
+    ListRecommendationsBatchResponse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ListRecommendationsBatchResponseDefaultTypeInternal _ListRecommendationsBatchResponse_default_instance_;
+
+inline constexpr ListRecommendationsBatchRequest::Impl_::Impl_(
+    ::_pbi::ConstantInitialized) noexcept
+      : requests_{},
+        _cached_size_{0} {}
+
+template <typename>
+PROTOBUF_CONSTEXPR ListRecommendationsBatchRequest::ListRecommendationsBatchRequest(::_pbi::ConstantInitialized)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(ListRecommendationsBatchRequest_class_data_.base()),
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(),
+#endif  // PROTOBUF_CUSTOM_VTABLE
+      _impl_(::_pbi::ConstantInitialized()) {
+}
+struct ListRecommendationsBatchRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ListRecommendationsBatchRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ListRecommendationsBatchRequestDefaultTypeInternal() {}
+  union {
+    ListRecommendationsBatchRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ListRecommendationsBatchRequestDefaultTypeInternal _ListRecommendationsBatchRequest_default_instance_;
+
 inline constexpr ListFlagsResponse::Impl_::Impl_(
     ::_pbi::ConstantInitialized) noexcept
       : flag_{},
@@ -1233,6 +1344,30 @@ const ::uint32_t
         ~0u,
         0x000, // bitmap
         PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsResponse, _impl_.product_ids_),
+        0x000, // bitmap
+        PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsBatchRequest, _impl_.requests_),
+        0x000, // bitmap
+        PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsBatchResponse, _impl_.responses_),
+        0x081, // bitmap
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsRequest, _impl_._has_bits_),
+        8, // hasbit index offset
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsRequest, _impl_.user_id_),
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsRequest, _impl_.product_ids_),
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsRequest, _impl_.cursor_),
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsRequest, _impl_.page_size_),
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsRequest, _impl_.max_results_),
+        0,
+        ~0u,
+        1,
+        2,
+        3,
+        0x081, // bitmap
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsResponse, _impl_._has_bits_),
+        5, // hasbit index offset
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsResponse, _impl_.product_ids_),
+        PROTOBUF_FIELD_OFFSET(::oteldemo::StreamRecommendationsResponse, _impl_.cursor_),
+        ~0u,
+        0,
         0x081, // bitmap
         PROTOBUF_FIELD_OFFSET(::oteldemo::Product, _impl_._has_bits_),
         9, // hasbit index offset
@@ -1458,41 +1593,45 @@ static const ::_pbi::MigrationSchema
         {31, sizeof(::oteldemo::Empty)},
         {32, sizeof(::oteldemo::ListRecommendationsRequest)},
         {39, sizeof(::oteldemo::ListRecommendationsResponse)},
-        {41, sizeof(::oteldemo::Product)},
-        {56, sizeof(::oteldemo::ListProductsResponse)},
-        {58, sizeof(::oteldemo::GetProductRequest)},
-        {63, sizeof(::oteldemo::SearchProductsRequest)},
-        {68, sizeof(::oteldemo::SearchProductsResponse)},
-        {70, sizeof(::oteldemo::GetQuoteRequest)},
-        {77, sizeof(::oteldemo::GetQuoteResponse)},
-        {82, sizeof(::oteldemo::ShipOrderRequest)},
-        {89, sizeof(::oteldemo::ShipOrderResponse)},
-        {94, sizeof(::oteldemo::Address)},
-        {107, sizeof(::oteldemo::Money)},
-        {116, sizeof(::oteldemo::GetSupportedCurrenciesResponse)},
-        {118, sizeof(::oteldemo::CurrencyConversionRequest)},
-        {125, sizeof(::oteldemo::CreditCardInfo)},
-        {136, sizeof(::oteldemo::ChargeRequest)},
-        {143, sizeof(::oteldemo::ChargeResponse)},
-        {148, sizeof(::oteldemo::OrderItem)},
-        {155, sizeof(::oteldemo::OrderResult)},
-        {168, sizeof(::oteldemo::SendOrderConfirmationRequest)},
-        {175, sizeof(::oteldemo::PlaceOrderRequest)},
-        {188, sizeof(::oteldemo::PlaceOrderResponse)},
-        {193, sizeof(::oteldemo::AdRequest)},
-        {195, sizeof(::oteldemo::AdResponse)},
-        {197, sizeof(::oteldemo::Ad)},
-        {204, sizeof(::oteldemo::Flag)},
-        {213, sizeof(::oteldemo::GetFlagRequest)},
-        {218, sizeof(::oteldemo::GetFlagResponse)},
-        {223, sizeof(::oteldemo::CreateFlagRequest)},
-        {232, sizeof(::oteldemo::CreateFlagResponse)},
-        {237, sizeof(::oteldemo::UpdateFlagRequest)},
-        {244, sizeof(::oteldemo::UpdateFlagResponse)},
-        {245, sizeof(::oteldemo::ListFlagsRequest)},
-        {246, sizeof(::oteldemo::ListFlagsResponse)},
-        {248, sizeof(::oteldemo::DeleteFlagRequest)},
-        {253, sizeof(::oteldemo::DeleteFlagResponse)},
+        {41, sizeof(::oteldemo::ListRecommendationsBatchRequest)},
+        {43, sizeof(::oteldemo::ListRecommendationsBatchResponse)},
+        {45, sizeof(::oteldemo::StreamRecommendationsRequest)},
+        {58, sizeof(::oteldemo::StreamRecommendationsResponse)},
+        {65, sizeof(::oteldemo::Product)},
+        {80, sizeof(::oteldemo::ListProductsResponse)},
+        {82, sizeof(::oteldemo::GetProductRequest)},
+        {87, sizeof(::oteldemo::SearchProductsRequest)},
+        {92, sizeof(::oteldemo::SearchProductsResponse)},
+        {94, sizeof(::oteldemo::GetQuoteRequest)},
+        {101, sizeof(::oteldemo::GetQuoteResponse)},
+        {106, sizeof(::oteldemo::ShipOrderRequest)},
+        {113, sizeof(::oteldemo::ShipOrderResponse)},
+        {118, sizeof(::oteldemo::Address)},
+        {131, sizeof(::oteldemo::Money)},
+        {140, sizeof(::oteldemo::GetSupportedCurrenciesResponse)},
+        {142, sizeof(::oteldemo::CurrencyConversionRequest)},
+        {149, sizeof(::oteldemo::CreditCardInfo)},
+        {160, sizeof(::oteldemo::ChargeRequest)},
+        {167, sizeof(::oteldemo::ChargeResponse)},
+        {172, sizeof(::oteldemo::OrderItem)},
+        {179, sizeof(::oteldemo::OrderResult)},
+        {192, sizeof(::oteldemo::SendOrderConfirmationRequest)},
+        {199, sizeof(::oteldemo::PlaceOrderRequest)},
+        {212, sizeof(::oteldemo::PlaceOrderResponse)},
+        {217, sizeof(::oteldemo::AdRequest)},
+        {219, sizeof(::oteldemo::AdResponse)},
+        {221, sizeof(::oteldemo::Ad)},
+        {228, sizeof(::oteldemo::Flag)},
+        {237, sizeof(::oteldemo::GetFlagRequest)},
+        {242, sizeof(::oteldemo::GetFlagResponse)},
+        {247, sizeof(::oteldemo::CreateFlagRequest)},
+        {256, sizeof(::oteldemo::CreateFlagResponse)},
+        {261, sizeof(::oteldemo::UpdateFlagRequest)},
+        {268, sizeof(::oteldemo::UpdateFlagResponse)},
+        {269, sizeof(::oteldemo::ListFlagsRequest)},
+        {270, sizeof(::oteldemo::ListFlagsResponse)},
+        {272, sizeof(::oteldemo::DeleteFlagRequest)},
+        {277, sizeof(::oteldemo::DeleteFlagResponse)},
 };
 static const ::_pb::Message* PROTOBUF_NONNULL const file_default_instances[] = {
     &::oteldemo::_CartItem_default_instance_._instance,
@@ -1503,6 +1642,10 @@ static const ::_pb::Message* PROTOBUF_NONNULL const file_default_instances[] = {
     &::oteldemo::_Empty_default_instance_._instance,
     &::oteldemo::_ListRecommendationsRequest_default_instance_._instance,
     &::oteldemo::_ListRecommendationsResponse_default_instance_._instance,
+    &::oteldemo::_ListRecommendationsBatchRequest_default_instance_._instance,
+    &::oteldemo::_ListRecommendationsBatchResponse_default_instance_._instance,
+    &::oteldemo::_StreamRecommendationsRequest_default_instance_._instance,
+    &::oteldemo::_StreamRecommendationsResponse_default_instance_._instance,
     &::oteldemo::_Product_default_instance_._instance,
     &::oteldemo::_ListProductsResponse_default_instance_._instance,
     &::oteldemo::_GetProductRequest_default_instance_._instance,
@@ -1551,118 +1694,134 @@ const char descriptor_table_protodef_demo_2eproto[] ABSL_ATTRIBUTE_SECTION_VARIA
     "ty\"B\n\032ListRecommendationsRequest\022\017\n\007user"
     "_id\030\001 \001(\t\022\023\n\013product_ids\030\002 \003(\t\"2\n\033ListRe"
     "commendationsResponse\022\023\n\013product_ids\030\001 \003"
-    "(\t\"\201\001\n\007Product\022\n\n\002id\030\001 \001(\t\022\014\n\004name\030\002 \001(\t"
-    "\022\023\n\013description\030\003 \001(\t\022\017\n\007picture\030\004 \001(\t\022\""
-    "\n\tprice_usd\030\005 \001(\0132\017.oteldemo.Money\022\022\n\nca"
-    "tegories\030\006 \003(\t\";\n\024ListProductsResponse\022#"
-    "\n\010products\030\001 \003(\0132\021.oteldemo.Product\"\037\n\021G"
-    "etProductRequest\022\n\n\002id\030\001 \001(\t\"&\n\025SearchPr"
-    "oductsRequest\022\r\n\005query\030\001 \001(\t\"<\n\026SearchPr"
-    "oductsResponse\022\"\n\007results\030\001 \003(\0132\021.otelde"
-    "mo.Product\"X\n\017GetQuoteRequest\022\"\n\007address"
-    "\030\001 \001(\0132\021.oteldemo.Address\022!\n\005items\030\002 \003(\013"
-    "2\022.oteldemo.CartItem\"5\n\020GetQuoteResponse"
-    "\022!\n\010cost_usd\030\001 \001(\0132\017.oteldemo.Money\"Y\n\020S"
-    "hipOrderRequest\022\"\n\007address\030\001 \001(\0132\021.oteld"
-    "emo.Address\022!\n\005items\030\002 \003(\0132\022.oteldemo.Ca"
-    "rtItem\"(\n\021ShipOrderResponse\022\023\n\013tracking_"
-    "id\030\001 \001(\t\"a\n\007Address\022\026\n\016street_address\030\001 "
-    "\001(\t\022\014\n\004city\030\002 \001(\t\022\r\n\005state\030\003 \001(\t\022\017\n\007coun"
-    "try\030\004 \001(\t\022\020\n\010zip_code\030\005 \001(\t\"<\n\005Money\022\025\n\r"
-    "currency_code\030\001 \001(\t\022\r\n\005units\030\002 \001(\003\022\r\n\005na"
-    "nos\030\003 \001(\005\"8\n\036GetSupportedCurrenciesRespo"
-    "nse\022\026\n\016currency_codes\030\001 \003(\t\"K\n\031CurrencyC"
-    "onversionRequest\022\035\n\004from\030\001 \001(\0132\017.oteldem"
-    "o.Money\022\017\n\007to_code\030\002 \001(\t\"\220\001\n\016CreditCardI"
-    "nfo\022\032\n\022credit_card_number\030\001 \001(\t\022\027\n\017credi"
-    "t_card_cvv\030\002 \001(\005\022#\n\033credit_card_expirati"
-    "on_year\030\003 \001(\005\022$\n\034credit_card_expiration_"
-    "month\030\004 \001(\005\"_\n\rChargeRequest\022\037\n\006amount\030\001"
-    " \001(\0132\017.oteldemo.Money\022-\n\013credit_card\030\002 \001"
-    "(\0132\030.oteldemo.CreditCardInfo\"(\n\016ChargeRe"
-    "sponse\022\026\n\016transaction_id\030\001 \001(\t\"L\n\tOrderI"
-    "tem\022 \n\004item\030\001 \001(\0132\022.oteldemo.CartItem\022\035\n"
-    "\004cost\030\002 \001(\0132\017.oteldemo.Money\"\266\001\n\013OrderRe"
-    "sult\022\020\n\010order_id\030\001 \001(\t\022\034\n\024shipping_track"
-    "ing_id\030\002 \001(\t\022&\n\rshipping_cost\030\003 \001(\0132\017.ot"
-    "eldemo.Money\022+\n\020shipping_address\030\004 \001(\0132\021"
-    ".oteldemo.Address\022\"\n\005items\030\005 \003(\0132\023.oteld"
-    "emo.OrderItem\"S\n\034SendOrderConfirmationRe"
-    "quest\022\r\n\005email\030\001 \001(\t\022$\n\005order\030\002 \001(\0132\025.ot"
-    "eldemo.OrderResult\"\235\001\n\021PlaceOrderRequest"
-    "\022\017\n\007user_id\030\001 \001(\t\022\025\n\ruser_currency\030\002 \001(\t"
-    "\022\"\n\007address\030\003 \001(\0132\021.oteldemo.Address\022\r\n\005"
-    "email\030\005 \001(\t\022-\n\013credit_card\030\006 \001(\0132\030.oteld"
-    "emo.CreditCardInfo\":\n\022PlaceOrderResponse"
-    "\022$\n\005order\030\001 \001(\0132\025.oteldemo.OrderResult\"!"
-    "\n\tAdRequest\022\024\n\014context_keys\030\001 \003(\t\"\'\n\nAdR"
-    "esponse\022\031\n\003ads\030\001 \003(\0132\014.oteldemo.Ad\"(\n\002Ad"
-    "\022\024\n\014redirect_url\030\001 \001(\t\022\014\n\004text\030\002 \001(\t\":\n\004"
-    "Flag\022\014\n\004name\030\001 \001(\t\022\023\n\013description\030\002 \001(\t\022"
-    "\017\n\007enabled\030\003 \001(\010\"\036\n\016GetFlagRequest\022\014\n\004na"
-    "me\030\001 \001(\t\"/\n\017GetFlagResponse\022\034\n\004flag\030\001 \001("
-    "\0132\016.oteldemo.Flag\"G\n\021CreateFlagRequest\022\014"
-    "\n\004name\030\001 \001(\t\022\023\n\013description\030\002 \001(\t\022\017\n\007ena"
-    "bled\030\003 \001(\010\"2\n\022CreateFlagResponse\022\034\n\004flag"
-    "\030\001 \001(\0132\016.oteldemo.Flag\"2\n\021UpdateFlagRequ"
-    "est\022\014\n\004name\030\001 \001(\t\022\017\n\007enabled\030\002 \001(\010\"\024\n\022Up"
-    "dateFlagResponse\"\022\n\020ListFlagsRequest\"1\n\021"
-    "ListFlagsResponse\022\034\n\004flag\030\001 \003(\0132\016.otelde"
-    "mo.Flag\"!\n\021DeleteFlagRequest\022\014\n\004name\030\001 \001"
-    "(\t\"\024\n\022DeleteFlagResponse2\270\001\n\013CartService"
-    "\0226\n\007AddItem\022\030.oteldemo.AddItemRequest\032\017."
-    "oteldemo.Empty\"\000\0225\n\007GetCart\022\030.oteldemo.G"
-    "etCartRequest\032\016.oteldemo.Cart\"\000\022:\n\tEmpty"
-    "Cart\022\032.oteldemo.EmptyCartRequest\032\017.oteld"
-    "emo.Empty\"\0002}\n\025RecommendationService\022d\n\023"
-    "ListRecommendations\022$.oteldemo.ListRecom"
-    "mendationsRequest\032%.oteldemo.ListRecomme"
-    "ndationsResponse\"\0002\361\001\n\025ProductCatalogSer"
-    "vice\022A\n\014ListProducts\022\017.oteldemo.Empty\032\036."
-    "oteldemo.ListProductsResponse\"\000\022>\n\nGetPr"
-    "oduct\022\033.oteldemo.GetProductRequest\032\021.ote"
-    "ldemo.Product\"\000\022U\n\016SearchProducts\022\037.otel"
-    "demo.SearchProductsRequest\032 .oteldemo.Se"
-    "archProductsResponse\"\0002\236\001\n\017ShippingServi"
-    "ce\022C\n\010GetQuote\022\031.oteldemo.GetQuoteReques"
-    "t\032\032.oteldemo.GetQuoteResponse\"\000\022F\n\tShipO"
-    "rder\022\032.oteldemo.ShipOrderRequest\032\033.oteld"
-    "emo.ShipOrderResponse\"\0002\253\001\n\017CurrencyServ"
-    "ice\022U\n\026GetSupportedCurrencies\022\017.oteldemo"
-    ".Empty\032(.oteldemo.GetSupportedCurrencies"
-    "Response\"\000\022A\n\007Convert\022#.oteldemo.Currenc"
-    "yConversionRequest\032\017.oteldemo.Money\"\0002O\n"
-    "\016PaymentService\022=\n\006Charge\022\027.oteldemo.Cha"
-    "rgeRequest\032\030.oteldemo.ChargeResponse\"\0002b"
-    "\n\014EmailService\022R\n\025SendOrderConfirmation\022"
-    "&.oteldemo.SendOrderConfirmationRequest\032"
-    "\017.oteldemo.Empty\"\0002\\\n\017CheckoutService\022I\n"
-    "\nPlaceOrder\022\033.oteldemo.PlaceOrderRequest"
-    "\032\034.oteldemo.PlaceOrderResponse\"\0002B\n\tAdSe"
-    "rvice\0225\n\006GetAds\022\023.oteldemo.AdRequest\032\024.o"
-    "teldemo.AdResponse\"\0002\377\002\n\022FeatureFlagServ"
-    "ice\022@\n\007GetFlag\022\030.oteldemo.GetFlagRequest"
-    "\032\031.oteldemo.GetFlagResponse\"\000\022I\n\nCreateF"
-    "lag\022\033.oteldemo.CreateFlagRequest\032\034.oteld"
-    "emo.CreateFlagResponse\"\000\022I\n\nUpdateFlag\022\033"
-    ".oteldemo.UpdateFlagRequest\032\034.oteldemo.U"
-    "pdateFlagResponse\"\000\022F\n\tListFlags\022\032.oteld"
-    "emo.ListFlagsRequest\032\033.oteldemo.ListFlag"
-    "sResponse\"\000\022I\n\nDeleteFlag\022\033.oteldemo.Del"
-    "eteFlagRequest\032\034.oteldemo.DeleteFlagResp"
-    "onse\"\000B\023Z\021genproto/oteldemob\006proto3"
+    "(\t\"Y\n\037ListRecommendationsBatchRequest\0226\n"
+    "\010requests\030\001 \003(\0132$.oteldemo.ListRecommend"
+    "ationsRequest\"\\\n ListRecommendationsBatc"
+    "hResponse\0228\n\tresponses\030\001 \003(\0132%.oteldemo."
+    "ListRecommendationsResponse\"|\n\034StreamRec"
+    "ommendationsRequest\022\017\n\007user_id\030\001 \001(\t\022\023\n\013"
+    "product_ids\030\002 \003(\t\022\016\n\006cursor\030\003 \001(\t\022\021\n\tpag"
+    "e_size\030\004 \001(\005\022\023\n\013max_results\030\005 \001(\005\"D\n\035Str"
+    "eamRecommendationsResponse\022\023\n\013product_id"
+    "s\030\001 \003(\t\022\016\n\006cursor\030\002 \001(\t\"\201\001\n\007Product\022\n\n\002i"
+    "d\030\001 \001(\t\022\014\n\004name\030\002 \001(\t\022\023\n\013description\030\003 \001"
+    "(\t\022\017\n\007picture\030\004 \001(\t\022\"\n\tprice_usd\030\005 \001(\0132\017"
+    ".oteldemo.Money\022\022\n\ncategories\030\006 \003(\t\";\n\024L"
+    "istProductsResponse\022#\n\010products\030\001 \003(\0132\021."
+    "oteldemo.Product\"\037\n\021GetProductRequest\022\n\n"
+    "\002id\030\001 \001(\t\"&\n\025SearchProductsRequest\022\r\n\005qu"
+    "ery\030\001 \001(\t\"<\n\026SearchProductsResponse\022\"\n\007r"
+    "esults\030\001 \003(\0132\021.oteldemo.Product\"X\n\017GetQu"
+    "oteRequest\022\"\n\007address\030\001 \001(\0132\021.oteldemo.A"
+    "ddress\022!\n\005items\030\002 \003(\0132\022.oteldemo.CartIte"
+    "m\"5\n\020GetQuoteResponse\022!\n\010cost_usd\030\001 \001(\0132"
+    "\017.oteldemo.Money\"Y\n\020ShipOrderRequest\022\"\n\007"
+    "address\030\001 \001(\0132\021.oteldemo.Address\022!\n\005item"
+    "s\030\002 \003(\0132\022.oteldemo.CartItem\"(\n\021ShipOrder"
+    "Response\022\023\n\013tracking_id\030\001 \001(\t\"a\n\007Address"
+    "\022\026\n\016street_address\030\001 \001(\t\022\014\n\004city\030\002 \001(\t\022\r"
+    "\n\005state\030\003 \001(\t\022\017\n\007country\030\004 \001(\t\022\020\n\010zip_co"
+    "de\030\005 \001(\t\"<\n\005Money\022\025\n\rcurrency_code\030\001 \001(\t"
+    "\022\r\n\005units\030\002 \001(\003\022\r\n\005nanos\030\003 \001(\005\"8\n\036GetSup"
+    "portedCurrenciesResponse\022\026\n\016currency_cod"
+    "es\030\001 \003(\t\"K\n\031CurrencyConversionRequest\022\035\n"
+    "\004from\030\001 \001(\0132\017.oteldemo.Money\022\017\n\007to_code\030"
+    "\002 \001(\t\"\220\001\n\016CreditCardInfo\022\032\n\022credit_card_"
+    "number\030\001 \001(\t\022\027\n\017credit_card_cvv\030\002 \001(\005\022#\n"
+    "\033credit_card_expiration_year\030\003 \001(\005\022$\n\034cr"
+    "edit_card_expiration_month\030\004 \001(\005\"_\n\rChar"
+    "geRequest\022\037\n\006amount\030\001 \001(\0132\017.oteldemo.Mon"
+    "ey\022-\n\013credit_card\030\002 \001(\0132\030.oteldemo.Credi"
+    "tCardInfo\"(\n\016ChargeResponse\022\026\n\016transacti"
+    "on_id\030\001 \001(\t\"L\n\tOrderItem\022 \n\004item\030\001 \001(\0132\022"
+    ".oteldemo.CartItem\022\035\n\004cost\030\002 \001(\0132\017.oteld"
+    "emo.Money\"\266\001\n\013OrderResult\022\020\n\010order_id\030\001 "
+    "\001(\t\022\034\n\024shipping_tracking_id\030\002 \001(\t\022&\n\rshi"
+    "pping_cost\030\003 \001(\0132\017.oteldemo.Money\022+\n\020shi"
+    "pping_address\030\004 \001(\0132\021.oteldemo.Address\022\""
+    "\n\005items\030\005 \003(\0132\023.oteldemo.OrderItem\"S\n\034Se"
+    "ndOrderConfirmationRequest\022\r\n\005email\030\001 \001("
+    "\t\022$\n\005order\030\002 \001(\0132\025.oteldemo.OrderResult\""
+    "\235\001\n\021PlaceOrderRequest\022\017\n\007user_id\030\001 \001(\t\022\025"
+    "\n\ruser_currency\030\002 \001(\t\022\"\n\007address\030\003 \001(\0132\021"
+    ".oteldemo.Address\022\r\n\005email\030\005 \001(\t\022-\n\013cred"
+    "it_card\030\006 \001(\0132\030.oteldemo.CreditCardInfo\""
+    ":\n\022PlaceOrderResponse\022$\n\005order\030\001 \001(\0132\025.o"
+    "teldemo.OrderResult\"!\n\tAdRequest\022\024\n\014cont"
+    "ext_keys\030\001 \003(\t\"\'\n\nAdResponse\022\031\n\003ads\030\001 \003("
+    "\0132\014.oteldemo.Ad\"(\n\002Ad\022\024\n\014redirect_url\030\001 "
+    "\001(\t\022\014\n\004text\030\002 \001(\t\":\n\004Flag\022\014\n\004name\030\001 \001(\t\022"
+    "\023\n\013description\030\002 \001(\t\022\017\n\007enabled\030\003 \001(\010\"\036\n"
+    "\016GetFlagRequest\022\014\n\004name\030\001 \001(\t\"/\n\017GetFlag"
+    "Response\022\034\n\004flag\030\001 \001(\0132\016.oteldemo.Flag\"G"
+    "\n\021CreateFlagRequest\022\014\n\004name\030\001 \001(\t\022\023\n\013des"
+    "cription\030\002 \001(\t\022\017\n\007enabled\030\003 \001(\010\"2\n\022Creat"
+    "eFlagResponse\022\034\n\004flag\030\001 \001(\0132\016.oteldemo.F"
+    "lag\"2\n\021UpdateFlagRequest\022\014\n\004name\030\001 \001(\t\022\017"
+    "\n\007enabled\030\002 \001(\010\"\024\n\022UpdateFlagResponse\"\022\n"
+    "\020ListFlagsRequest\"1\n\021ListFlagsResponse\022\034"
+    "\n\004flag\030\001 \003(\0132\016.oteldemo.Flag\"!\n\021DeleteFl"
+    "agRequest\022\014\n\004name\030\001 \001(\t\"\024\n\022DeleteFlagRes"
+    "ponse2\270\001\n\013CartService\0226\n\007AddItem\022\030.oteld"
+    "emo.AddItemRequest\032\017.oteldemo.Empty\"\000\0225\n"
+    "\007GetCart\022\030.oteldemo.GetCartRequest\032\016.ote"
+    "ldemo.Cart\"\000\022:\n\tEmptyCart\022\032.oteldemo.Emp"
+    "tyCartRequest\032\017.oteldemo.Empty\"\0002\340\002\n\025Rec"
+    "ommendationService\022d\n\023ListRecommendation"
+    "s\022$.oteldemo.ListRecommendationsRequest\032"
+    "%.oteldemo.ListRecommendationsResponse\"\000"
+    "\022s\n\030ListRecommendationsBatch\022).oteldemo."
+    "ListRecommendationsBatchRequest\032*.otelde"
+    "mo.ListRecommendationsBatchResponse\"\000\022l\n"
+    "\025StreamRecommendations\022&.oteldemo.Stream"
+    "RecommendationsRequest\032\'.oteldemo.Stream"
+    "RecommendationsResponse\"\0000\0012\361\001\n\025ProductC"
+    "atalogService\022A\n\014ListProducts\022\017.oteldemo"
+    ".Empty\032\036.oteldemo.ListProductsResponse\"\000"
+    "\022>\n\nGetProduct\022\033.oteldemo.GetProductRequ"
+    "est\032\021.oteldemo.Product\"\000\022U\n\016SearchProduc"
+    "ts\022\037.oteldemo.SearchProductsRequest\032 .ot"
+    "eldemo.SearchProductsResponse\"\0002\236\001\n\017Ship"
+    "pingService\022C\n\010GetQuote\022\031.oteldemo.GetQu"
+    "oteRequest\032\032.oteldemo.GetQuoteResponse\"\000"
+    "\022F\n\tShipOrder\022\032.oteldemo.ShipOrderReques"
+    "t\032\033.oteldemo.ShipOrderResponse\"\0002\253\001\n\017Cur"
+    "rencyService\022U\n\026GetSupportedCurrencies\022\017"
+    ".oteldemo.Empty\032(.oteldemo.GetSupportedC"
+    "urrenciesResponse\"\000\022A\n\007Convert\022#.oteldem"
+    "o.CurrencyConversionRequest\032\017.oteldemo.M"
+    "oney\"\0002O\n\016PaymentService\022=\n\006Charge\022\027.ote"
+    "ldemo.ChargeRequest\032\030.oteldemo.ChargeRes"
+    "ponse\"\0002b\n\014EmailService\022R\n\025SendOrderConf"
+    "irmation\022&.oteldemo.SendOrderConfirmatio"
+    "nRequest\032\017.oteldemo.Empty\"\0002\\\n\017CheckoutS"
+    "ervice\022I\n\nPlaceOrder\022\033.oteldemo.PlaceOrd"
+    "erRequest\032\034.oteldemo.PlaceOrderResponse\""
+    "\0002B\n\tAdService\0225\n\006GetAds\022\023.oteldemo.AdRe"
+    "quest\032\024.oteldemo.AdResponse\"\0002\377\002\n\022Featur"
+    "eFlagService\022@\n\007GetFlag\022\030.oteldemo.GetFl"
+    "agRequest\032\031.oteldemo.GetFlagResponse\"\000\022I"
+    "\n\nCreateFlag\022\033.oteldemo.CreateFlagReques"
+    "t\032\034.oteldemo.CreateFlagResponse\"\000\022I\n\nUpd"
+    "ateFlag\022\033.oteldemo.UpdateFlagRequest\032\034.o"
+    "teldemo.UpdateFlagResponse\"\000\022F\n\tListFlag"
+    "s\022\032.oteldemo.ListFlagsRequest\032\033.oteldemo"
+    ".ListFlagsResponse\"\000\022I\n\nDeleteFlag\022\033.ote"
+    "ldemo.DeleteFlagRequest\032\034.oteldemo.Delet"
+    "eFlagResponse\"\000B\023Z\021genproto/oteldemob\006pr"
+    "oto3"
 };
 static ::absl::once_flag descriptor_table_demo_2eproto_once;
 PROTOBUF_CONSTINIT const ::_pbi::DescriptorTable descriptor_table_demo_2eproto = {
     false,
     false,
-    4395,
+    5004,
     descriptor_table_protodef_demo_2eproto,
     "demo.proto",
     &descriptor_table_demo_2eproto_once,
     nullptr,
     0,
-    43,
+    47,
     schemas,
     file_default_instances,
     TableStruct_demo_2eproto::offsets,
@@ -3775,6 +3934,1247 @@ void ListRecommendationsResponse::InternalSwap(ListRecommendationsResponse* PROT
 }
 // ===================================================================
 
+class ListRecommendationsBatchRequest::_Internal {
+ public:
+};
+
+ListRecommendationsBatchRequest::ListRecommendationsBatchRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, ListRecommendationsBatchRequest_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.ListRecommendationsBatchRequest)
+}
+PROTOBUF_NDEBUG_INLINE ListRecommendationsBatchRequest::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+    const ::oteldemo::ListRecommendationsBatchRequest& from_msg)
+      : requests_{visibility, arena, from.requests_},
+        _cached_size_{0} {}
+
+ListRecommendationsBatchRequest::ListRecommendationsBatchRequest(
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena,
+    const ListRecommendationsBatchRequest& from)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, ListRecommendationsBatchRequest_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  ListRecommendationsBatchRequest* const _this = this;
+  (void)_this;
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  new (&_impl_) Impl_(internal_visibility(), arena, from._impl_, from);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.ListRecommendationsBatchRequest)
+}
+PROTOBUF_NDEBUG_INLINE ListRecommendationsBatchRequest::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+      : requests_{visibility, arena},
+        _cached_size_{0} {}
+
+inline void ListRecommendationsBatchRequest::SharedCtor(::_pb::Arena* PROTOBUF_NULLABLE arena) {
+  new (&_impl_) Impl_(internal_visibility(), arena);
+}
+ListRecommendationsBatchRequest::~ListRecommendationsBatchRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.ListRecommendationsBatchRequest)
+  SharedDtor(*this);
+}
+inline void ListRecommendationsBatchRequest::SharedDtor(MessageLite& self) {
+  ListRecommendationsBatchRequest& this_ = static_cast<ListRecommendationsBatchRequest&>(self);
+  this_._internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  ABSL_DCHECK(this_.GetArena() == nullptr);
+  this_._impl_.~Impl_();
+}
+
+inline void* PROTOBUF_NONNULL ListRecommendationsBatchRequest::PlacementNew_(
+    const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena) {
+  return ::new (mem) ListRecommendationsBatchRequest(arena);
+}
+constexpr auto ListRecommendationsBatchRequest::InternalNewImpl_() {
+  constexpr auto arena_bits = ::google::protobuf::internal::EncodePlacementArenaOffsets({
+      PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchRequest, _impl_.requests_) +
+          decltype(ListRecommendationsBatchRequest::_impl_.requests_)::
+              InternalGetArenaOffset(
+                  ::google::protobuf::Message::internal_visibility()),
+  });
+  if (arena_bits.has_value()) {
+    return ::google::protobuf::internal::MessageCreator::ZeroInit(
+        sizeof(ListRecommendationsBatchRequest), alignof(ListRecommendationsBatchRequest), *arena_bits);
+  } else {
+    return ::google::protobuf::internal::MessageCreator(&ListRecommendationsBatchRequest::PlacementNew_,
+                                 sizeof(ListRecommendationsBatchRequest),
+                                 alignof(ListRecommendationsBatchRequest));
+  }
+}
+constexpr auto ListRecommendationsBatchRequest::InternalGenerateClassData_() {
+  return ::google::protobuf::internal::ClassDataFull{
+      ::google::protobuf::internal::ClassData{
+          &_ListRecommendationsBatchRequest_default_instance_._instance,
+          &_table_.header,
+          nullptr,  // OnDemandRegisterArenaDtor
+          nullptr,  // IsInitialized
+          &ListRecommendationsBatchRequest::MergeImpl,
+          ::google::protobuf::Message::GetNewImpl<ListRecommendationsBatchRequest>(),
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+          &ListRecommendationsBatchRequest::SharedDtor,
+          ::google::protobuf::Message::GetClearImpl<ListRecommendationsBatchRequest>(), &ListRecommendationsBatchRequest::ByteSizeLong,
+              &ListRecommendationsBatchRequest::_InternalSerialize,
+#endif  // PROTOBUF_CUSTOM_VTABLE
+          PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchRequest, _impl_._cached_size_),
+          false,
+      },
+      &ListRecommendationsBatchRequest::kDescriptorMethods,
+      &descriptor_table_demo_2eproto,
+      nullptr,  // tracker
+  };
+}
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 const
+    ::google::protobuf::internal::ClassDataFull ListRecommendationsBatchRequest_class_data_ =
+        ListRecommendationsBatchRequest::InternalGenerateClassData_();
+
+PROTOBUF_ATTRIBUTE_WEAK const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL
+ListRecommendationsBatchRequest::GetClassData() const {
+  ::google::protobuf::internal::PrefetchToLocalCache(&ListRecommendationsBatchRequest_class_data_);
+  ::google::protobuf::internal::PrefetchToLocalCache(ListRecommendationsBatchRequest_class_data_.tc_table);
+  return ListRecommendationsBatchRequest_class_data_.base();
+}
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 1, 0, 2>
+ListRecommendationsBatchRequest::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    ListRecommendationsBatchRequest_class_data_.base(),
+    nullptr,  // post_loop_handler
+    ::_pbi::TcParser::GenericFallback,  // fallback
+    #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
+    ::_pbi::TcParser::GetTable<::oteldemo::ListRecommendationsBatchRequest>(),  // to_prefetch
+    #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
+  }, {{
+    // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+    {::_pbi::TcParser::FastMtR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchRequest, _impl_.requests_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+    {PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchRequest, _impl_.requests_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+  }},
+  {{
+      {::_pbi::TcParser::GetTable<::oteldemo::ListRecommendationsRequest>()},
+  }},
+  {{
+  }},
+};
+PROTOBUF_NOINLINE void ListRecommendationsBatchRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.ListRecommendationsBatchRequest)
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.requests_.Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::uint8_t* PROTOBUF_NONNULL ListRecommendationsBatchRequest::_InternalSerialize(
+    const ::google::protobuf::MessageLite& base, ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) {
+  const ListRecommendationsBatchRequest& this_ = static_cast<const ListRecommendationsBatchRequest&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::uint8_t* PROTOBUF_NONNULL ListRecommendationsBatchRequest::_InternalSerialize(
+    ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+  const ListRecommendationsBatchRequest& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.ListRecommendationsBatchRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+  for (unsigned i = 0, n = static_cast<unsigned>(
+                           this_._internal_requests_size());
+       i < n; i++) {
+    const auto& repfield = this_._internal_requests().Get(i);
+    target =
+        ::google::protobuf::internal::WireFormatLite::InternalWriteMessage(
+            1, repfield, repfield.GetCachedSize(),
+            target, stream);
+  }
+
+  if (ABSL_PREDICT_FALSE(this_._internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            this_._internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.ListRecommendationsBatchRequest)
+  return target;
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::size_t ListRecommendationsBatchRequest::ByteSizeLong(const MessageLite& base) {
+  const ListRecommendationsBatchRequest& this_ = static_cast<const ListRecommendationsBatchRequest&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::size_t ListRecommendationsBatchRequest::ByteSizeLong() const {
+  const ListRecommendationsBatchRequest& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(message_byte_size_start:oteldemo.ListRecommendationsBatchRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void)cached_has_bits;
+
+  ::_pbi::Prefetch5LinesFrom7Lines(&this_);
+   {
+    // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+    {
+      total_size += 1UL * this_._internal_requests_size();
+      for (const auto& msg : this_._internal_requests()) {
+        total_size += ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+      }
+    }
+  }
+  return this_.MaybeComputeUnknownFieldsSize(total_size,
+                                             &this_._impl_._cached_size_);
+}
+
+void ListRecommendationsBatchRequest::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::protobuf::MessageLite& from_msg) {
+  auto* const _this = static_cast<ListRecommendationsBatchRequest*>(&to_msg);
+  auto& from = static_cast<const ListRecommendationsBatchRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.ListRecommendationsBatchRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_requests()->MergeFrom(
+      from._internal_requests());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ListRecommendationsBatchRequest::CopyFrom(const ListRecommendationsBatchRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.ListRecommendationsBatchRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+
+void ListRecommendationsBatchRequest::InternalSwap(ListRecommendationsBatchRequest* PROTOBUF_RESTRICT PROTOBUF_NONNULL other) {
+  using ::std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.requests_.InternalSwap(&other->_impl_.requests_);
+}
+
+::google::protobuf::Metadata ListRecommendationsBatchRequest::GetMetadata() const {
+  return ::google::protobuf::Message::GetMetadataImpl(GetClassData()->full());
+}
+// ===================================================================
+
+class ListRecommendationsBatchResponse::_Internal {
+ public:
+};
+
+ListRecommendationsBatchResponse::ListRecommendationsBatchResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, ListRecommendationsBatchResponse_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.ListRecommendationsBatchResponse)
+}
+PROTOBUF_NDEBUG_INLINE ListRecommendationsBatchResponse::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+    const ::oteldemo::ListRecommendationsBatchResponse& from_msg)
+      : responses_{visibility, arena, from.responses_},
+        _cached_size_{0} {}
+
+ListRecommendationsBatchResponse::ListRecommendationsBatchResponse(
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena,
+    const ListRecommendationsBatchResponse& from)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, ListRecommendationsBatchResponse_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  ListRecommendationsBatchResponse* const _this = this;
+  (void)_this;
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  new (&_impl_) Impl_(internal_visibility(), arena, from._impl_, from);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.ListRecommendationsBatchResponse)
+}
+PROTOBUF_NDEBUG_INLINE ListRecommendationsBatchResponse::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+      : responses_{visibility, arena},
+        _cached_size_{0} {}
+
+inline void ListRecommendationsBatchResponse::SharedCtor(::_pb::Arena* PROTOBUF_NULLABLE arena) {
+  new (&_impl_) Impl_(internal_visibility(), arena);
+}
+ListRecommendationsBatchResponse::~ListRecommendationsBatchResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.ListRecommendationsBatchResponse)
+  SharedDtor(*this);
+}
+inline void ListRecommendationsBatchResponse::SharedDtor(MessageLite& self) {
+  ListRecommendationsBatchResponse& this_ = static_cast<ListRecommendationsBatchResponse&>(self);
+  this_._internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  ABSL_DCHECK(this_.GetArena() == nullptr);
+  this_._impl_.~Impl_();
+}
+
+inline void* PROTOBUF_NONNULL ListRecommendationsBatchResponse::PlacementNew_(
+    const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena) {
+  return ::new (mem) ListRecommendationsBatchResponse(arena);
+}
+constexpr auto ListRecommendationsBatchResponse::InternalNewImpl_() {
+  constexpr auto arena_bits = ::google::protobuf::internal::EncodePlacementArenaOffsets({
+      PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchResponse, _impl_.responses_) +
+          decltype(ListRecommendationsBatchResponse::_impl_.responses_)::
+              InternalGetArenaOffset(
+                  ::google::protobuf::Message::internal_visibility()),
+  });
+  if (arena_bits.has_value()) {
+    return ::google::protobuf::internal::MessageCreator::ZeroInit(
+        sizeof(ListRecommendationsBatchResponse), alignof(ListRecommendationsBatchResponse), *arena_bits);
+  } else {
+    return ::google::protobuf::internal::MessageCreator(&ListRecommendationsBatchResponse::PlacementNew_,
+                                 sizeof(ListRecommendationsBatchResponse),
+                                 alignof(ListRecommendationsBatchResponse));
+  }
+}
+constexpr auto ListRecommendationsBatchResponse::InternalGenerateClassData_() {
+  return ::google::protobuf::internal::ClassDataFull{
+      ::google::protobuf::internal::ClassData{
+          &_ListRecommendationsBatchResponse_default_instance_._instance,
+          &_table_.header,
+          nullptr,  // OnDemandRegisterArenaDtor
+          nullptr,  // IsInitialized
+          &ListRecommendationsBatchResponse::MergeImpl,
+          ::google::protobuf::Message::GetNewImpl<ListRecommendationsBatchResponse>(),
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+          &ListRecommendationsBatchResponse::SharedDtor,
+          ::google::protobuf::Message::GetClearImpl<ListRecommendationsBatchResponse>(), &ListRecommendationsBatchResponse::ByteSizeLong,
+              &ListRecommendationsBatchResponse::_InternalSerialize,
+#endif  // PROTOBUF_CUSTOM_VTABLE
+          PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchResponse, _impl_._cached_size_),
+          false,
+      },
+      &ListRecommendationsBatchResponse::kDescriptorMethods,
+      &descriptor_table_demo_2eproto,
+      nullptr,  // tracker
+  };
+}
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 const
+    ::google::protobuf::internal::ClassDataFull ListRecommendationsBatchResponse_class_data_ =
+        ListRecommendationsBatchResponse::InternalGenerateClassData_();
+
+PROTOBUF_ATTRIBUTE_WEAK const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL
+ListRecommendationsBatchResponse::GetClassData() const {
+  ::google::protobuf::internal::PrefetchToLocalCache(&ListRecommendationsBatchResponse_class_data_);
+  ::google::protobuf::internal::PrefetchToLocalCache(ListRecommendationsBatchResponse_class_data_.tc_table);
+  return ListRecommendationsBatchResponse_class_data_.base();
+}
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 1, 0, 2>
+ListRecommendationsBatchResponse::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    ListRecommendationsBatchResponse_class_data_.base(),
+    nullptr,  // post_loop_handler
+    ::_pbi::TcParser::GenericFallback,  // fallback
+    #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
+    ::_pbi::TcParser::GetTable<::oteldemo::ListRecommendationsBatchResponse>(),  // to_prefetch
+    #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
+  }, {{
+    // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+    {::_pbi::TcParser::FastMtR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchResponse, _impl_.responses_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+    {PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchResponse, _impl_.responses_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+  }},
+  {{
+      {::_pbi::TcParser::GetTable<::oteldemo::ListRecommendationsResponse>()},
+  }},
+  {{
+  }},
+};
+PROTOBUF_NOINLINE void ListRecommendationsBatchResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.ListRecommendationsBatchResponse)
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.responses_.Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::uint8_t* PROTOBUF_NONNULL ListRecommendationsBatchResponse::_InternalSerialize(
+    const ::google::protobuf::MessageLite& base, ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) {
+  const ListRecommendationsBatchResponse& this_ = static_cast<const ListRecommendationsBatchResponse&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::uint8_t* PROTOBUF_NONNULL ListRecommendationsBatchResponse::_InternalSerialize(
+    ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+  const ListRecommendationsBatchResponse& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.ListRecommendationsBatchResponse)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+  for (unsigned i = 0, n = static_cast<unsigned>(
+                           this_._internal_responses_size());
+       i < n; i++) {
+    const auto& repfield = this_._internal_responses().Get(i);
+    target =
+        ::google::protobuf::internal::WireFormatLite::InternalWriteMessage(
+            1, repfield, repfield.GetCachedSize(),
+            target, stream);
+  }
+
+  if (ABSL_PREDICT_FALSE(this_._internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            this_._internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.ListRecommendationsBatchResponse)
+  return target;
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::size_t ListRecommendationsBatchResponse::ByteSizeLong(const MessageLite& base) {
+  const ListRecommendationsBatchResponse& this_ = static_cast<const ListRecommendationsBatchResponse&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::size_t ListRecommendationsBatchResponse::ByteSizeLong() const {
+  const ListRecommendationsBatchResponse& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(message_byte_size_start:oteldemo.ListRecommendationsBatchResponse)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void)cached_has_bits;
+
+  ::_pbi::Prefetch5LinesFrom7Lines(&this_);
+   {
+    // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+    {
+      total_size += 1UL * this_._internal_responses_size();
+      for (const auto& msg : this_._internal_responses()) {
+        total_size += ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+      }
+    }
+  }
+  return this_.MaybeComputeUnknownFieldsSize(total_size,
+                                             &this_._impl_._cached_size_);
+}
+
+void ListRecommendationsBatchResponse::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::protobuf::MessageLite& from_msg) {
+  auto* const _this = static_cast<ListRecommendationsBatchResponse*>(&to_msg);
+  auto& from = static_cast<const ListRecommendationsBatchResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.ListRecommendationsBatchResponse)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_responses()->MergeFrom(
+      from._internal_responses());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ListRecommendationsBatchResponse::CopyFrom(const ListRecommendationsBatchResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.ListRecommendationsBatchResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+
+void ListRecommendationsBatchResponse::InternalSwap(ListRecommendationsBatchResponse* PROTOBUF_RESTRICT PROTOBUF_NONNULL other) {
+  using ::std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.responses_.InternalSwap(&other->_impl_.responses_);
+}
+
+::google::protobuf::Metadata ListRecommendationsBatchResponse::GetMetadata() const {
+  return ::google::protobuf::Message::GetMetadataImpl(GetClassData()->full());
+}
+// ===================================================================
+
+class StreamRecommendationsRequest::_Internal {
+ public:
+  using HasBits =
+      decltype(::std::declval<StreamRecommendationsRequest>()._impl_._has_bits_);
+  static constexpr ::int32_t kHasBitsOffset =
+      8 * PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_._has_bits_);
+};
+
+StreamRecommendationsRequest::StreamRecommendationsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, StreamRecommendationsRequest_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.StreamRecommendationsRequest)
+}
+PROTOBUF_NDEBUG_INLINE StreamRecommendationsRequest::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+    const ::oteldemo::StreamRecommendationsRequest& from_msg)
+      : _has_bits_{from._has_bits_},
+        _cached_size_{0},
+        product_ids_{visibility, arena, from.product_ids_},
+        user_id_(arena, from.user_id_),
+        cursor_(arena, from.cursor_) {}
+
+StreamRecommendationsRequest::StreamRecommendationsRequest(
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena,
+    const StreamRecommendationsRequest& from)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, StreamRecommendationsRequest_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  StreamRecommendationsRequest* const _this = this;
+  (void)_this;
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  new (&_impl_) Impl_(internal_visibility(), arena, from._impl_, from);
+  ::memcpy(reinterpret_cast<char *>(&_impl_) +
+               offsetof(Impl_, page_size_),
+           reinterpret_cast<const char *>(&from._impl_) +
+               offsetof(Impl_, page_size_),
+           offsetof(Impl_, max_results_) -
+               offsetof(Impl_, page_size_) +
+               sizeof(Impl_::max_results_));
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.StreamRecommendationsRequest)
+}
+PROTOBUF_NDEBUG_INLINE StreamRecommendationsRequest::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+      : _cached_size_{0},
+        product_ids_{visibility, arena},
+        user_id_(arena),
+        cursor_(arena) {}
+
+inline void StreamRecommendationsRequest::SharedCtor(::_pb::Arena* PROTOBUF_NULLABLE arena) {
+  new (&_impl_) Impl_(internal_visibility(), arena);
+  ::memset(reinterpret_cast<char *>(&_impl_) +
+               offsetof(Impl_, page_size_),
+           0,
+           offsetof(Impl_, max_results_) -
+               offsetof(Impl_, page_size_) +
+               sizeof(Impl_::max_results_));
+}
+StreamRecommendationsRequest::~StreamRecommendationsRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.StreamRecommendationsRequest)
+  SharedDtor(*this);
+}
+inline void StreamRecommendationsRequest::SharedDtor(MessageLite& self) {
+  StreamRecommendationsRequest& this_ = static_cast<StreamRecommendationsRequest&>(self);
+  this_._internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  ABSL_DCHECK(this_.GetArena() == nullptr);
+  this_._impl_.user_id_.Destroy();
+  this_._impl_.cursor_.Destroy();
+  this_._impl_.~Impl_();
+}
+
+inline void* PROTOBUF_NONNULL StreamRecommendationsRequest::PlacementNew_(
+    const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena) {
+  return ::new (mem) StreamRecommendationsRequest(arena);
+}
+constexpr auto StreamRecommendationsRequest::InternalNewImpl_() {
+  constexpr auto arena_bits = ::google::protobuf::internal::EncodePlacementArenaOffsets({
+      PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.product_ids_) +
+          decltype(StreamRecommendationsRequest::_impl_.product_ids_)::
+              InternalGetArenaOffset(
+                  ::google::protobuf::Message::internal_visibility()),
+  });
+  if (arena_bits.has_value()) {
+    return ::google::protobuf::internal::MessageCreator::CopyInit(
+        sizeof(StreamRecommendationsRequest), alignof(StreamRecommendationsRequest), *arena_bits);
+  } else {
+    return ::google::protobuf::internal::MessageCreator(&StreamRecommendationsRequest::PlacementNew_,
+                                 sizeof(StreamRecommendationsRequest),
+                                 alignof(StreamRecommendationsRequest));
+  }
+}
+constexpr auto StreamRecommendationsRequest::InternalGenerateClassData_() {
+  return ::google::protobuf::internal::ClassDataFull{
+      ::google::protobuf::internal::ClassData{
+          &_StreamRecommendationsRequest_default_instance_._instance,
+          &_table_.header,
+          nullptr,  // OnDemandRegisterArenaDtor
+          nullptr,  // IsInitialized
+          &StreamRecommendationsRequest::MergeImpl,
+          ::google::protobuf::Message::GetNewImpl<StreamRecommendationsRequest>(),
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+          &StreamRecommendationsRequest::SharedDtor,
+          ::google::protobuf::Message::GetClearImpl<StreamRecommendationsRequest>(), &StreamRecommendationsRequest::ByteSizeLong,
+              &StreamRecommendationsRequest::_InternalSerialize,
+#endif  // PROTOBUF_CUSTOM_VTABLE
+          PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_._cached_size_),
+          false,
+      },
+      &StreamRecommendationsRequest::kDescriptorMethods,
+      &descriptor_table_demo_2eproto,
+      nullptr,  // tracker
+  };
+}
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 const
+    ::google::protobuf::internal::ClassDataFull StreamRecommendationsRequest_class_data_ =
+        StreamRecommendationsRequest::InternalGenerateClassData_();
+
+PROTOBUF_ATTRIBUTE_WEAK const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL
+StreamRecommendationsRequest::GetClassData() const {
+  ::google::protobuf::internal::PrefetchToLocalCache(&StreamRecommendationsRequest_class_data_);
+  ::google::protobuf::internal::PrefetchToLocalCache(StreamRecommendationsRequest_class_data_.tc_table);
+  return StreamRecommendationsRequest_class_data_.base();
+}
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<3, 5, 0, 70, 2>
+StreamRecommendationsRequest::_table_ = {
+  {
+    PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_._has_bits_),
+    0, // no _extensions_
+    5, 56,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967264,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    5,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    StreamRecommendationsRequest_class_data_.base(),
+    nullptr,  // post_loop_handler
+    ::_pbi::TcParser::GenericFallback,  // fallback
+    #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
+    ::_pbi::TcParser::GetTable<::oteldemo::StreamRecommendationsRequest>(),  // to_prefetch
+    #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
+  }, {{
+    {::_pbi::TcParser::MiniParse, {}},
+    // string user_id = 1;
+    {::_pbi::TcParser::FastUS1,
+     {10, 0, 0, PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.user_id_)}},
+    // repeated string product_ids = 2;
+    {::_pbi::TcParser::FastUR1,
+     {18, 63, 0, PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.product_ids_)}},
+    // string cursor = 3;
+    {::_pbi::TcParser::FastUS1,
+     {26, 1, 0, PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.cursor_)}},
+    // int32 page_size = 4;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(StreamRecommendationsRequest, _impl_.page_size_), 2>(),
+     {32, 2, 0, PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.page_size_)}},
+    // int32 max_results = 5;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(StreamRecommendationsRequest, _impl_.max_results_), 3>(),
+     {40, 3, 0, PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.max_results_)}},
+    {::_pbi::TcParser::MiniParse, {}},
+    {::_pbi::TcParser::MiniParse, {}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // string user_id = 1;
+    {PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.user_id_), _Internal::kHasBitsOffset + 0, 0,
+    (0 | ::_fl::kFcOptional | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // repeated string product_ids = 2;
+    {PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.product_ids_), -1, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kUtf8String | ::_fl::kRepSString)},
+    // string cursor = 3;
+    {PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.cursor_), _Internal::kHasBitsOffset + 1, 0,
+    (0 | ::_fl::kFcOptional | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // int32 page_size = 4;
+    {PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.page_size_), _Internal::kHasBitsOffset + 2, 0,
+    (0 | ::_fl::kFcOptional | ::_fl::kInt32)},
+    // int32 max_results = 5;
+    {PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.max_results_), _Internal::kHasBitsOffset + 3, 0,
+    (0 | ::_fl::kFcOptional | ::_fl::kInt32)},
+  }},
+  // no aux_entries
+  {{
+    "\45\7\13\6\0\0\0\0"
+    "oteldemo.StreamRecommendationsRequest"
+    "user_id"
+    "product_ids"
+    "cursor"
+  }},
+};
+PROTOBUF_NOINLINE void StreamRecommendationsRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.StreamRecommendationsRequest)
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.product_ids_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if ((cached_has_bits & 0x00000003u) != 0) {
+    if ((cached_has_bits & 0x00000001u) != 0) {
+      _impl_.user_id_.ClearNonDefaultToEmpty();
+    }
+    if ((cached_has_bits & 0x00000002u) != 0) {
+      _impl_.cursor_.ClearNonDefaultToEmpty();
+    }
+  }
+  if ((cached_has_bits & 0x0000000cu) != 0) {
+    ::memset(&_impl_.page_size_, 0, static_cast<::size_t>(
+        reinterpret_cast<char*>(&_impl_.max_results_) -
+        reinterpret_cast<char*>(&_impl_.page_size_)) + sizeof(_impl_.max_results_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::uint8_t* PROTOBUF_NONNULL StreamRecommendationsRequest::_InternalSerialize(
+    const ::google::protobuf::MessageLite& base, ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) {
+  const StreamRecommendationsRequest& this_ = static_cast<const StreamRecommendationsRequest&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::uint8_t* PROTOBUF_NONNULL StreamRecommendationsRequest::_InternalSerialize(
+    ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+  const StreamRecommendationsRequest& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.StreamRecommendationsRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // string user_id = 1;
+  if ((this_._impl_._has_bits_[0] & 0x00000001u) != 0) {
+    if (!this_._internal_user_id().empty()) {
+      const ::std::string& _s = this_._internal_user_id();
+      ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+          _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.StreamRecommendationsRequest.user_id");
+      target = stream->WriteStringMaybeAliased(1, _s, target);
+    }
+  }
+
+  // repeated string product_ids = 2;
+  for (int i = 0, n = this_._internal_product_ids_size(); i < n; ++i) {
+    const auto& s = this_._internal_product_ids().Get(i);
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        s.data(), static_cast<int>(s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.StreamRecommendationsRequest.product_ids");
+    target = stream->WriteString(2, s, target);
+  }
+
+  // string cursor = 3;
+  if ((this_._impl_._has_bits_[0] & 0x00000002u) != 0) {
+    if (!this_._internal_cursor().empty()) {
+      const ::std::string& _s = this_._internal_cursor();
+      ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+          _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.StreamRecommendationsRequest.cursor");
+      target = stream->WriteStringMaybeAliased(3, _s, target);
+    }
+  }
+
+  // int32 page_size = 4;
+  if ((this_._impl_._has_bits_[0] & 0x00000004u) != 0) {
+    if (this_._internal_page_size() != 0) {
+      target =
+          ::google::protobuf::internal::WireFormatLite::WriteInt32ToArrayWithField<4>(
+              stream, this_._internal_page_size(), target);
+    }
+  }
+
+  // int32 max_results = 5;
+  if ((this_._impl_._has_bits_[0] & 0x00000008u) != 0) {
+    if (this_._internal_max_results() != 0) {
+      target =
+          ::google::protobuf::internal::WireFormatLite::WriteInt32ToArrayWithField<5>(
+              stream, this_._internal_max_results(), target);
+    }
+  }
+
+  if (ABSL_PREDICT_FALSE(this_._internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            this_._internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.StreamRecommendationsRequest)
+  return target;
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::size_t StreamRecommendationsRequest::ByteSizeLong(const MessageLite& base) {
+  const StreamRecommendationsRequest& this_ = static_cast<const StreamRecommendationsRequest&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::size_t StreamRecommendationsRequest::ByteSizeLong() const {
+  const StreamRecommendationsRequest& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(message_byte_size_start:oteldemo.StreamRecommendationsRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void)cached_has_bits;
+
+  ::_pbi::Prefetch5LinesFrom7Lines(&this_);
+   {
+    // repeated string product_ids = 2;
+    {
+      total_size +=
+          1 * ::google::protobuf::internal::FromIntSize(this_._internal_product_ids().size());
+      for (int i = 0, n = this_._internal_product_ids().size(); i < n; ++i) {
+        total_size += ::google::protobuf::internal::WireFormatLite::StringSize(
+            this_._internal_product_ids().Get(i));
+      }
+    }
+  }
+  cached_has_bits = this_._impl_._has_bits_[0];
+  if ((cached_has_bits & 0x0000000fu) != 0) {
+    // string user_id = 1;
+    if ((cached_has_bits & 0x00000001u) != 0) {
+      if (!this_._internal_user_id().empty()) {
+        total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                        this_._internal_user_id());
+      }
+    }
+    // string cursor = 3;
+    if ((cached_has_bits & 0x00000002u) != 0) {
+      if (!this_._internal_cursor().empty()) {
+        total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                        this_._internal_cursor());
+      }
+    }
+    // int32 page_size = 4;
+    if ((cached_has_bits & 0x00000004u) != 0) {
+      if (this_._internal_page_size() != 0) {
+        total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(
+            this_._internal_page_size());
+      }
+    }
+    // int32 max_results = 5;
+    if ((cached_has_bits & 0x00000008u) != 0) {
+      if (this_._internal_max_results() != 0) {
+        total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(
+            this_._internal_max_results());
+      }
+    }
+  }
+  return this_.MaybeComputeUnknownFieldsSize(total_size,
+                                             &this_._impl_._cached_size_);
+}
+
+void StreamRecommendationsRequest::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::protobuf::MessageLite& from_msg) {
+  auto* const _this = static_cast<StreamRecommendationsRequest*>(&to_msg);
+  auto& from = static_cast<const StreamRecommendationsRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.StreamRecommendationsRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_product_ids()->MergeFrom(from._internal_product_ids());
+  cached_has_bits = from._impl_._has_bits_[0];
+  if ((cached_has_bits & 0x0000000fu) != 0) {
+    if ((cached_has_bits & 0x00000001u) != 0) {
+      if (!from._internal_user_id().empty()) {
+        _this->_internal_set_user_id(from._internal_user_id());
+      } else {
+        if (_this->_impl_.user_id_.IsDefault()) {
+          _this->_internal_set_user_id("");
+        }
+      }
+    }
+    if ((cached_has_bits & 0x00000002u) != 0) {
+      if (!from._internal_cursor().empty()) {
+        _this->_internal_set_cursor(from._internal_cursor());
+      } else {
+        if (_this->_impl_.cursor_.IsDefault()) {
+          _this->_internal_set_cursor("");
+        }
+      }
+    }
+    if ((cached_has_bits & 0x00000004u) != 0) {
+      if (from._internal_page_size() != 0) {
+        _this->_impl_.page_size_ = from._impl_.page_size_;
+      }
+    }
+    if ((cached_has_bits & 0x00000008u) != 0) {
+      if (from._internal_max_results() != 0) {
+        _this->_impl_.max_results_ = from._impl_.max_results_;
+      }
+    }
+  }
+  _this->_impl_._has_bits_[0] |= cached_has_bits;
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void StreamRecommendationsRequest::CopyFrom(const StreamRecommendationsRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.StreamRecommendationsRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+
+void StreamRecommendationsRequest::InternalSwap(StreamRecommendationsRequest* PROTOBUF_RESTRICT PROTOBUF_NONNULL other) {
+  using ::std::swap;
+  auto* arena = GetArena();
+  ABSL_DCHECK_EQ(arena, other->GetArena());
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.product_ids_.InternalSwap(&other->_impl_.product_ids_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.user_id_, &other->_impl_.user_id_, arena);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.cursor_, &other->_impl_.cursor_, arena);
+  ::google::protobuf::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.max_results_)
+      + sizeof(StreamRecommendationsRequest::_impl_.max_results_)
+      - PROTOBUF_FIELD_OFFSET(StreamRecommendationsRequest, _impl_.page_size_)>(
+          reinterpret_cast<char*>(&_impl_.page_size_),
+          reinterpret_cast<char*>(&other->_impl_.page_size_));
+}
+
+::google::protobuf::Metadata StreamRecommendationsRequest::GetMetadata() const {
+  return ::google::protobuf::Message::GetMetadataImpl(GetClassData()->full());
+}
+// ===================================================================
+
+class StreamRecommendationsResponse::_Internal {
+ public:
+  using HasBits =
+      decltype(::std::declval<StreamRecommendationsResponse>()._impl_._has_bits_);
+  static constexpr ::int32_t kHasBitsOffset =
+      8 * PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_._has_bits_);
+};
+
+StreamRecommendationsResponse::StreamRecommendationsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, StreamRecommendationsResponse_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.StreamRecommendationsResponse)
+}
+PROTOBUF_NDEBUG_INLINE StreamRecommendationsResponse::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+    const ::oteldemo::StreamRecommendationsResponse& from_msg)
+      : _has_bits_{from._has_bits_},
+        _cached_size_{0},
+        product_ids_{visibility, arena, from.product_ids_},
+        cursor_(arena, from.cursor_) {}
+
+StreamRecommendationsResponse::StreamRecommendationsResponse(
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena,
+    const StreamRecommendationsResponse& from)
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+    : ::google::protobuf::Message(arena, StreamRecommendationsResponse_class_data_.base()) {
+#else   // PROTOBUF_CUSTOM_VTABLE
+    : ::google::protobuf::Message(arena) {
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  StreamRecommendationsResponse* const _this = this;
+  (void)_this;
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  new (&_impl_) Impl_(internal_visibility(), arena, from._impl_, from);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.StreamRecommendationsResponse)
+}
+PROTOBUF_NDEBUG_INLINE StreamRecommendationsResponse::Impl_::Impl_(
+    ::google::protobuf::internal::InternalVisibility visibility,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena)
+      : _cached_size_{0},
+        product_ids_{visibility, arena},
+        cursor_(arena) {}
+
+inline void StreamRecommendationsResponse::SharedCtor(::_pb::Arena* PROTOBUF_NULLABLE arena) {
+  new (&_impl_) Impl_(internal_visibility(), arena);
+}
+StreamRecommendationsResponse::~StreamRecommendationsResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.StreamRecommendationsResponse)
+  SharedDtor(*this);
+}
+inline void StreamRecommendationsResponse::SharedDtor(MessageLite& self) {
+  StreamRecommendationsResponse& this_ = static_cast<StreamRecommendationsResponse&>(self);
+  this_._internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  ABSL_DCHECK(this_.GetArena() == nullptr);
+  this_._impl_.cursor_.Destroy();
+  this_._impl_.~Impl_();
+}
+
+inline void* PROTOBUF_NONNULL StreamRecommendationsResponse::PlacementNew_(
+    const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+    ::google::protobuf::Arena* PROTOBUF_NULLABLE arena) {
+  return ::new (mem) StreamRecommendationsResponse(arena);
+}
+constexpr auto StreamRecommendationsResponse::InternalNewImpl_() {
+  constexpr auto arena_bits = ::google::protobuf::internal::EncodePlacementArenaOffsets({
+      PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_.product_ids_) +
+          decltype(StreamRecommendationsResponse::_impl_.product_ids_)::
+              InternalGetArenaOffset(
+                  ::google::protobuf::Message::internal_visibility()),
+  });
+  if (arena_bits.has_value()) {
+    return ::google::protobuf::internal::MessageCreator::CopyInit(
+        sizeof(StreamRecommendationsResponse), alignof(StreamRecommendationsResponse), *arena_bits);
+  } else {
+    return ::google::protobuf::internal::MessageCreator(&StreamRecommendationsResponse::PlacementNew_,
+                                 sizeof(StreamRecommendationsResponse),
+                                 alignof(StreamRecommendationsResponse));
+  }
+}
+constexpr auto StreamRecommendationsResponse::InternalGenerateClassData_() {
+  return ::google::protobuf::internal::ClassDataFull{
+      ::google::protobuf::internal::ClassData{
+          &_StreamRecommendationsResponse_default_instance_._instance,
+          &_table_.header,
+          nullptr,  // OnDemandRegisterArenaDtor
+          nullptr,  // IsInitialized
+          &StreamRecommendationsResponse::MergeImpl,
+          ::google::protobuf::Message::GetNewImpl<StreamRecommendationsResponse>(),
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+          &StreamRecommendationsResponse::SharedDtor,
+          ::google::protobuf::Message::GetClearImpl<StreamRecommendationsResponse>(), &StreamRecommendationsResponse::ByteSizeLong,
+              &StreamRecommendationsResponse::_InternalSerialize,
+#endif  // PROTOBUF_CUSTOM_VTABLE
+          PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_._cached_size_),
+          false,
+      },
+      &StreamRecommendationsResponse::kDescriptorMethods,
+      &descriptor_table_demo_2eproto,
+      nullptr,  // tracker
+  };
+}
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 const
+    ::google::protobuf::internal::ClassDataFull StreamRecommendationsResponse_class_data_ =
+        StreamRecommendationsResponse::InternalGenerateClassData_();
+
+PROTOBUF_ATTRIBUTE_WEAK const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL
+StreamRecommendationsResponse::GetClassData() const {
+  ::google::protobuf::internal::PrefetchToLocalCache(&StreamRecommendationsResponse_class_data_);
+  ::google::protobuf::internal::PrefetchToLocalCache(StreamRecommendationsResponse_class_data_.tc_table);
+  return StreamRecommendationsResponse_class_data_.base();
+}
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<1, 2, 0, 64, 2>
+StreamRecommendationsResponse::_table_ = {
+  {
+    PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_._has_bits_),
+    0, // no _extensions_
+    2, 8,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967292,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    2,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    StreamRecommendationsResponse_class_data_.base(),
+    nullptr,  // post_loop_handler
+    ::_pbi::TcParser::GenericFallback,  // fallback
+    #ifdef PROTOBUF_PREFETCH_PARSE_TABLE
+    ::_pbi::TcParser::GetTable<::oteldemo::StreamRecommendationsResponse>(),  // to_prefetch
+    #endif  // PROTOBUF_PREFETCH_PARSE_TABLE
+  }, {{
+    // string cursor = 2;
+    {::_pbi::TcParser::FastUS1,
+     {18, 0, 0, PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_.cursor_)}},
+    // repeated string product_ids = 1;
+    {::_pbi::TcParser::FastUR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_.product_ids_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated string product_ids = 1;
+    {PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_.product_ids_), -1, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kUtf8String | ::_fl::kRepSString)},
+    // string cursor = 2;
+    {PROTOBUF_FIELD_OFFSET(StreamRecommendationsResponse, _impl_.cursor_), _Internal::kHasBitsOffset + 0, 0,
+    (0 | ::_fl::kFcOptional | ::_fl::kUtf8String | ::_fl::kRepAString)},
+  }},
+  // no aux_entries
+  {{
+    "\46\13\6\0\0\0\0\0"
+    "oteldemo.StreamRecommendationsResponse"
+    "product_ids"
+    "cursor"
+  }},
+};
+PROTOBUF_NOINLINE void StreamRecommendationsResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.StreamRecommendationsResponse)
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.product_ids_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if ((cached_has_bits & 0x00000001u) != 0) {
+    _impl_.cursor_.ClearNonDefaultToEmpty();
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::uint8_t* PROTOBUF_NONNULL StreamRecommendationsResponse::_InternalSerialize(
+    const ::google::protobuf::MessageLite& base, ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) {
+  const StreamRecommendationsResponse& this_ = static_cast<const StreamRecommendationsResponse&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::uint8_t* PROTOBUF_NONNULL StreamRecommendationsResponse::_InternalSerialize(
+    ::uint8_t* PROTOBUF_NONNULL target,
+    ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+  const StreamRecommendationsResponse& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.StreamRecommendationsResponse)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated string product_ids = 1;
+  for (int i = 0, n = this_._internal_product_ids_size(); i < n; ++i) {
+    const auto& s = this_._internal_product_ids().Get(i);
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        s.data(), static_cast<int>(s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.StreamRecommendationsResponse.product_ids");
+    target = stream->WriteString(1, s, target);
+  }
+
+  // string cursor = 2;
+  if ((this_._impl_._has_bits_[0] & 0x00000001u) != 0) {
+    if (!this_._internal_cursor().empty()) {
+      const ::std::string& _s = this_._internal_cursor();
+      ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+          _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.StreamRecommendationsResponse.cursor");
+      target = stream->WriteStringMaybeAliased(2, _s, target);
+    }
+  }
+
+  if (ABSL_PREDICT_FALSE(this_._internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            this_._internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.StreamRecommendationsResponse)
+  return target;
+}
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+::size_t StreamRecommendationsResponse::ByteSizeLong(const MessageLite& base) {
+  const StreamRecommendationsResponse& this_ = static_cast<const StreamRecommendationsResponse&>(base);
+#else   // PROTOBUF_CUSTOM_VTABLE
+::size_t StreamRecommendationsResponse::ByteSizeLong() const {
+  const StreamRecommendationsResponse& this_ = *this;
+#endif  // PROTOBUF_CUSTOM_VTABLE
+  // @@protoc_insertion_point(message_byte_size_start:oteldemo.StreamRecommendationsResponse)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void)cached_has_bits;
+
+  ::_pbi::Prefetch5LinesFrom7Lines(&this_);
+   {
+    // repeated string product_ids = 1;
+    {
+      total_size +=
+          1 * ::google::protobuf::internal::FromIntSize(this_._internal_product_ids().size());
+      for (int i = 0, n = this_._internal_product_ids().size(); i < n; ++i) {
+        total_size += ::google::protobuf::internal::WireFormatLite::StringSize(
+            this_._internal_product_ids().Get(i));
+      }
+    }
+  }
+   {
+    // string cursor = 2;
+    cached_has_bits = this_._impl_._has_bits_[0];
+    if ((cached_has_bits & 0x00000001u) != 0) {
+      if (!this_._internal_cursor().empty()) {
+        total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                        this_._internal_cursor());
+      }
+    }
+  }
+  return this_.MaybeComputeUnknownFieldsSize(total_size,
+                                             &this_._impl_._cached_size_);
+}
+
+void StreamRecommendationsResponse::MergeImpl(::google::protobuf::MessageLite& to_msg, const ::google::protobuf::MessageLite& from_msg) {
+  auto* const _this = static_cast<StreamRecommendationsResponse*>(&to_msg);
+  auto& from = static_cast<const StreamRecommendationsResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.StreamRecommendationsResponse)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_product_ids()->MergeFrom(from._internal_product_ids());
+  cached_has_bits = from._impl_._has_bits_[0];
+  if ((cached_has_bits & 0x00000001u) != 0) {
+    if (!from._internal_cursor().empty()) {
+      _this->_internal_set_cursor(from._internal_cursor());
+    } else {
+      if (_this->_impl_.cursor_.IsDefault()) {
+        _this->_internal_set_cursor("");
+      }
+    }
+  }
+  _this->_impl_._has_bits_[0] |= cached_has_bits;
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void StreamRecommendationsResponse::CopyFrom(const StreamRecommendationsResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.StreamRecommendationsResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+
+void StreamRecommendationsResponse::InternalSwap(StreamRecommendationsResponse* PROTOBUF_RESTRICT PROTOBUF_NONNULL other) {
+  using ::std::swap;
+  auto* arena = GetArena();
+  ABSL_DCHECK_EQ(arena, other->GetArena());
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.product_ids_.InternalSwap(&other->_impl_.product_ids_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.cursor_, &other->_impl_.cursor_, arena);
+}
+
+::google::protobuf::Metadata StreamRecommendationsResponse::GetMetadata() const {
+  return ::google::protobuf::Message::GetMetadataImpl(GetClassData()->full());
+}
+// ===================================================================
+
 class Product::_Internal {
  public:
   using HasBits =
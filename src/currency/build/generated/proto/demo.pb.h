@@ -166,6 +166,14 @@ class ListProductsResponse;
 struct ListProductsResponseDefaultTypeInternal;
 extern ListProductsResponseDefaultTypeInternal _ListProductsResponse_default_instance_;
 extern const ::google::protobuf::internal::ClassDataFull ListProductsResponse_class_data_;
+class ListRecommendationsBatchRequest;
+struct ListRecommendationsBatchRequestDefaultTypeInternal;
+extern ListRecommendationsBatchRequestDefaultTypeInternal _ListRecommendationsBatchRequest_default_instance_;
+extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsBatchRequest_class_data_;
+class ListRecommendationsBatchResponse;
+struct ListRecommendationsBatchResponseDefaultTypeInternal;
+extern ListRecommendationsBatchResponseDefaultTypeInternal _ListRecommendationsBatchResponse_default_instance_;
+extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsBatchResponse_class_data_;
 class ListRecommendationsRequest;
 struct ListRecommendationsRequestDefaultTypeInternal;
 extern ListRecommendationsRequestDefaultTypeInternal _ListRecommendationsRequest_default_instance_;
@@ -218,6 +226,14 @@ class ShipOrderResponse;
 struct ShipOrderResponseDefaultTypeInternal;
 extern ShipOrderResponseDefaultTypeInternal _ShipOrderResponse_default_instance_;
 extern const ::google::protobuf::internal::ClassDataFull ShipOrderResponse_class_data_;
+class StreamRecommendationsRequest;
+struct StreamRecommendationsRequestDefaultTypeInternal;
+extern StreamRecommendationsRequestDefaultTypeInternal _StreamRecommendationsRequest_default_instance_;
+extern const ::google::protobuf::internal::ClassDataFull StreamRecommendationsRequest_class_data_;
+class StreamRecommendationsResponse;
+struct StreamRecommendationsResponseDefaultTypeInternal;
+extern StreamRecommendationsResponseDefaultTypeInternal _StreamRecommendationsResponse_default_instance_;
+extern const ::google::protobuf::internal::ClassDataFull StreamRecommendationsResponse_class_data_;
 class UpdateFlagRequest;
 struct UpdateFlagRequestDefaultTypeInternal;
 extern UpdateFlagRequestDefaultTypeInternal _UpdateFlagRequest_default_instance_;
@@ -293,7 +309,7 @@ class UpdateFlagResponse final : public ::google::protobuf::internal::ZeroFields
     return *reinterpret_cast<const UpdateFlagResponse*>(
         &_UpdateFlagResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 38;
+  static constexpr int kIndexInFileMessages = 42;
   friend void swap(UpdateFlagResponse& a, UpdateFlagResponse& b) { a.Swap(&b); }
   inline void Swap(UpdateFlagResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
@@ -440,7 +456,7 @@ class UpdateFlagRequest final : public ::google::protobuf::Message
     return *reinterpret_cast<const UpdateFlagRequest*>(
         &_UpdateFlagRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 37;
+  static constexpr int kIndexInFileMessages = 41;
   friend void swap(UpdateFlagRequest& a, UpdateFlagRequest& b) { a.Swap(&b); }
   inline void Swap(UpdateFlagRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
@@ -593,30 +609,30 @@ class UpdateFlagRequest final : public ::google::protobuf::Message
 extern const ::google::protobuf::internal::ClassDataFull UpdateFlagRequest_class_data_;
 // -------------------------------------------------------------------
 
-class ShipOrderResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderResponse) */ {
+class StreamRecommendationsResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.StreamRecommendationsResponse) */ {
  public:
-  inline ShipOrderResponse() : ShipOrderResponse(nullptr) {}
-  ~ShipOrderResponse() PROTOBUF_FINAL;
+  inline StreamRecommendationsResponse() : StreamRecommendationsResponse(nullptr) {}
+  ~StreamRecommendationsResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ShipOrderResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(StreamRecommendationsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ShipOrderResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(StreamRecommendationsResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ShipOrderResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR StreamRecommendationsResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline ShipOrderResponse(const ShipOrderResponse& from) : ShipOrderResponse(nullptr, from) {}
-  inline ShipOrderResponse(ShipOrderResponse&& from) noexcept
-      : ShipOrderResponse(nullptr, ::std::move(from)) {}
-  inline ShipOrderResponse& operator=(const ShipOrderResponse& from) {
+  inline StreamRecommendationsResponse(const StreamRecommendationsResponse& from) : StreamRecommendationsResponse(nullptr, from) {}
+  inline StreamRecommendationsResponse(StreamRecommendationsResponse&& from) noexcept
+      : StreamRecommendationsResponse(nullptr, ::std::move(from)) {}
+  inline StreamRecommendationsResponse& operator=(const StreamRecommendationsResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ShipOrderResponse& operator=(ShipOrderResponse&& from) noexcept {
+  inline StreamRecommendationsResponse& operator=(StreamRecommendationsResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -644,13 +660,13 @@ class ShipOrderResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ShipOrderResponse& default_instance() {
-    return *reinterpret_cast<const ShipOrderResponse*>(
-        &_ShipOrderResponse_default_instance_);
+  static const StreamRecommendationsResponse& default_instance() {
+    return *reinterpret_cast<const StreamRecommendationsResponse*>(
+        &_StreamRecommendationsResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 16;
-  friend void swap(ShipOrderResponse& a, ShipOrderResponse& b) { a.Swap(&b); }
-  inline void Swap(ShipOrderResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 11;
+  friend void swap(StreamRecommendationsResponse& a, StreamRecommendationsResponse& b) { a.Swap(&b); }
+  inline void Swap(StreamRecommendationsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -658,7 +674,7 @@ class ShipOrderResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ShipOrderResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(StreamRecommendationsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -666,13 +682,13 @@ class ShipOrderResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ShipOrderResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ShipOrderResponse>(arena);
+  StreamRecommendationsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<StreamRecommendationsResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ShipOrderResponse& from);
+  void CopyFrom(const StreamRecommendationsResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ShipOrderResponse& from) { ShipOrderResponse::MergeImpl(*this, from); }
+  void MergeFrom(const StreamRecommendationsResponse& from) { StreamRecommendationsResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -708,18 +724,18 @@ class ShipOrderResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ShipOrderResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(StreamRecommendationsResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ShipOrderResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.StreamRecommendationsResponse"; }
 
  protected:
-  explicit ShipOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ShipOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ShipOrderResponse& from);
-  ShipOrderResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ShipOrderResponse&& from) noexcept
-      : ShipOrderResponse(arena) {
+  explicit StreamRecommendationsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  StreamRecommendationsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const StreamRecommendationsResponse& from);
+  StreamRecommendationsResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, StreamRecommendationsResponse&& from) noexcept
+      : StreamRecommendationsResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -736,29 +752,52 @@ class ShipOrderResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kTrackingIdFieldNumber = 1,
+    kProductIdsFieldNumber = 1,
+    kCursorFieldNumber = 2,
   };
-  // string tracking_id = 1;
-  void clear_tracking_id() ;
-  const ::std::string& tracking_id() const;
+  // repeated string product_ids = 1;
+  int product_ids_size() const;
+  private:
+  int _internal_product_ids_size() const;
+
+  public:
+  void clear_product_ids() ;
+  const ::std::string& product_ids(int index) const;
+  ::std::string* PROTOBUF_NONNULL mutable_product_ids(int index);
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_tracking_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_tracking_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_tracking_id();
-  void set_allocated_tracking_id(::std::string* PROTOBUF_NULLABLE value);
+  void set_product_ids(int index, Arg_&& value, Args_... args);
+  ::std::string* PROTOBUF_NONNULL add_product_ids();
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void add_product_ids(Arg_&& value, Args_... args);
+  const ::google::protobuf::RepeatedPtrField<::std::string>& product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_product_ids();
 
   private:
-  const ::std::string& _internal_tracking_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_tracking_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_tracking_id();
+  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_product_ids();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderResponse)
+  // string cursor = 2;
+  void clear_cursor() ;
+  const ::std::string& cursor() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_cursor(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_cursor();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_cursor();
+  void set_allocated_cursor(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_cursor() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_cursor(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_cursor();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.StreamRecommendationsResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 46,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   0, 64,
                                    2>
       _table_;
 
@@ -776,43 +815,44 @@ class ShipOrderResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ShipOrderResponse& from_msg);
+        const StreamRecommendationsResponse& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr tracking_id_;
+    ::google::protobuf::RepeatedPtrField<::std::string> product_ids_;
+    ::google::protobuf::internal::ArenaStringPtr cursor_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ShipOrderResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull StreamRecommendationsResponse_class_data_;
 // -------------------------------------------------------------------
 
-class SearchProductsRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.SearchProductsRequest) */ {
+class StreamRecommendationsRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.StreamRecommendationsRequest) */ {
  public:
-  inline SearchProductsRequest() : SearchProductsRequest(nullptr) {}
-  ~SearchProductsRequest() PROTOBUF_FINAL;
+  inline StreamRecommendationsRequest() : StreamRecommendationsRequest(nullptr) {}
+  ~StreamRecommendationsRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(SearchProductsRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(StreamRecommendationsRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(SearchProductsRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(StreamRecommendationsRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR SearchProductsRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR StreamRecommendationsRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline SearchProductsRequest(const SearchProductsRequest& from) : SearchProductsRequest(nullptr, from) {}
-  inline SearchProductsRequest(SearchProductsRequest&& from) noexcept
-      : SearchProductsRequest(nullptr, ::std::move(from)) {}
-  inline SearchProductsRequest& operator=(const SearchProductsRequest& from) {
+  inline StreamRecommendationsRequest(const StreamRecommendationsRequest& from) : StreamRecommendationsRequest(nullptr, from) {}
+  inline StreamRecommendationsRequest(StreamRecommendationsRequest&& from) noexcept
+      : StreamRecommendationsRequest(nullptr, ::std::move(from)) {}
+  inline StreamRecommendationsRequest& operator=(const StreamRecommendationsRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline SearchProductsRequest& operator=(SearchProductsRequest&& from) noexcept {
+  inline StreamRecommendationsRequest& operator=(StreamRecommendationsRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -840,13 +880,13 @@ class SearchProductsRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const SearchProductsRequest& default_instance() {
-    return *reinterpret_cast<const SearchProductsRequest*>(
-        &_SearchProductsRequest_default_instance_);
+  static const StreamRecommendationsRequest& default_instance() {
+    return *reinterpret_cast<const StreamRecommendationsRequest*>(
+        &_StreamRecommendationsRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 11;
-  friend void swap(SearchProductsRequest& a, SearchProductsRequest& b) { a.Swap(&b); }
-  inline void Swap(SearchProductsRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 10;
+  friend void swap(StreamRecommendationsRequest& a, StreamRecommendationsRequest& b) { a.Swap(&b); }
+  inline void Swap(StreamRecommendationsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -854,7 +894,7 @@ class SearchProductsRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(SearchProductsRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(StreamRecommendationsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -862,13 +902,13 @@ class SearchProductsRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  SearchProductsRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<SearchProductsRequest>(arena);
+  StreamRecommendationsRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<StreamRecommendationsRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const SearchProductsRequest& from);
+  void CopyFrom(const StreamRecommendationsRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const SearchProductsRequest& from) { SearchProductsRequest::MergeImpl(*this, from); }
+  void MergeFrom(const StreamRecommendationsRequest& from) { StreamRecommendationsRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -904,18 +944,18 @@ class SearchProductsRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(SearchProductsRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(StreamRecommendationsRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.SearchProductsRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.StreamRecommendationsRequest"; }
 
  protected:
-  explicit SearchProductsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  SearchProductsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const SearchProductsRequest& from);
-  SearchProductsRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, SearchProductsRequest&& from) noexcept
-      : SearchProductsRequest(arena) {
+  explicit StreamRecommendationsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  StreamRecommendationsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const StreamRecommendationsRequest& from);
+  StreamRecommendationsRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, StreamRecommendationsRequest&& from) noexcept
+      : StreamRecommendationsRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -932,29 +972,90 @@ class SearchProductsRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kQueryFieldNumber = 1,
+    kProductIdsFieldNumber = 2,
+    kUserIdFieldNumber = 1,
+    kCursorFieldNumber = 3,
+    kPageSizeFieldNumber = 4,
+    kMaxResultsFieldNumber = 5,
   };
-  // string query = 1;
-  void clear_query() ;
-  const ::std::string& query() const;
+  // repeated string product_ids = 2;
+  int product_ids_size() const;
+  private:
+  int _internal_product_ids_size() const;
+
+  public:
+  void clear_product_ids() ;
+  const ::std::string& product_ids(int index) const;
+  ::std::string* PROTOBUF_NONNULL mutable_product_ids(int index);
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_query(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_query();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_query();
-  void set_allocated_query(::std::string* PROTOBUF_NULLABLE value);
+  void set_product_ids(int index, Arg_&& value, Args_... args);
+  ::std::string* PROTOBUF_NONNULL add_product_ids();
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void add_product_ids(Arg_&& value, Args_... args);
+  const ::google::protobuf::RepeatedPtrField<::std::string>& product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_product_ids();
 
   private:
-  const ::std::string& _internal_query() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_query(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_query();
+  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_product_ids();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.SearchProductsRequest)
+  // string user_id = 1;
+  void clear_user_id() ;
+  const ::std::string& user_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_user_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_user_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
+  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_user_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+
+  public:
+  // string cursor = 3;
+  void clear_cursor() ;
+  const ::std::string& cursor() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_cursor(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_cursor();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_cursor();
+  void set_allocated_cursor(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_cursor() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_cursor(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_cursor();
+
+  public:
+  // int32 page_size = 4;
+  void clear_page_size() ;
+  ::int32_t page_size() const;
+  void set_page_size(::int32_t value);
+
+  private:
+  ::int32_t _internal_page_size() const;
+  void _internal_set_page_size(::int32_t value);
+
+  public:
+  // int32 max_results = 5;
+  void clear_max_results() ;
+  ::int32_t max_results() const;
+  void set_max_results(::int32_t value);
+
+  private:
+  ::int32_t _internal_max_results() const;
+  void _internal_set_max_results(::int32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.StreamRecommendationsRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 44,
+  static const ::google::protobuf::internal::TcParseTable<3, 5,
+                                   0, 70,
                                    2>
       _table_;
 
@@ -972,43 +1073,47 @@ class SearchProductsRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const SearchProductsRequest& from_msg);
+        const StreamRecommendationsRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr query_;
+    ::google::protobuf::RepeatedPtrField<::std::string> product_ids_;
+    ::google::protobuf::internal::ArenaStringPtr user_id_;
+    ::google::protobuf::internal::ArenaStringPtr cursor_;
+    ::int32_t page_size_;
+    ::int32_t max_results_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull SearchProductsRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull StreamRecommendationsRequest_class_data_;
 // -------------------------------------------------------------------
 
-class Money final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.Money) */ {
+class ShipOrderResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderResponse) */ {
  public:
-  inline Money() : Money(nullptr) {}
-  ~Money() PROTOBUF_FINAL;
+  inline ShipOrderResponse() : ShipOrderResponse(nullptr) {}
+  ~ShipOrderResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(Money* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ShipOrderResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(Money));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ShipOrderResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Money(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ShipOrderResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline Money(const Money& from) : Money(nullptr, from) {}
-  inline Money(Money&& from) noexcept
-      : Money(nullptr, ::std::move(from)) {}
-  inline Money& operator=(const Money& from) {
+  inline ShipOrderResponse(const ShipOrderResponse& from) : ShipOrderResponse(nullptr, from) {}
+  inline ShipOrderResponse(ShipOrderResponse&& from) noexcept
+      : ShipOrderResponse(nullptr, ::std::move(from)) {}
+  inline ShipOrderResponse& operator=(const ShipOrderResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Money& operator=(Money&& from) noexcept {
+  inline ShipOrderResponse& operator=(ShipOrderResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -1036,13 +1141,13 @@ class Money final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Money& default_instance() {
-    return *reinterpret_cast<const Money*>(
-        &_Money_default_instance_);
+  static const ShipOrderResponse& default_instance() {
+    return *reinterpret_cast<const ShipOrderResponse*>(
+        &_ShipOrderResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 18;
-  friend void swap(Money& a, Money& b) { a.Swap(&b); }
-  inline void Swap(Money* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 20;
+  friend void swap(ShipOrderResponse& a, ShipOrderResponse& b) { a.Swap(&b); }
+  inline void Swap(ShipOrderResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -1050,7 +1155,7 @@ class Money final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Money* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ShipOrderResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -1058,13 +1163,13 @@ class Money final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Money* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<Money>(arena);
+  ShipOrderResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ShipOrderResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Money& from);
+  void CopyFrom(const ShipOrderResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Money& from) { Money::MergeImpl(*this, from); }
+  void MergeFrom(const ShipOrderResponse& from) { ShipOrderResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -1100,18 +1205,18 @@ class Money final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(Money* PROTOBUF_NONNULL other);
+  void InternalSwap(ShipOrderResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.Money"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ShipOrderResponse"; }
 
  protected:
-  explicit Money(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  Money(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Money& from);
-  Money(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Money&& from) noexcept
-      : Money(arena) {
+  explicit ShipOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ShipOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ShipOrderResponse& from);
+  ShipOrderResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ShipOrderResponse&& from) noexcept
+      : ShipOrderResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -1128,51 +1233,29 @@ class Money final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kCurrencyCodeFieldNumber = 1,
-    kUnitsFieldNumber = 2,
-    kNanosFieldNumber = 3,
+    kTrackingIdFieldNumber = 1,
   };
-  // string currency_code = 1;
-  void clear_currency_code() ;
-  const ::std::string& currency_code() const;
+  // string tracking_id = 1;
+  void clear_tracking_id() ;
+  const ::std::string& tracking_id() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_currency_code(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_currency_code();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_currency_code();
-  void set_allocated_currency_code(::std::string* PROTOBUF_NULLABLE value);
+  void set_tracking_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_tracking_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_tracking_id();
+  void set_allocated_tracking_id(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_currency_code() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_currency_code(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_currency_code();
-
-  public:
-  // int64 units = 2;
-  void clear_units() ;
-  ::int64_t units() const;
-  void set_units(::int64_t value);
-
-  private:
-  ::int64_t _internal_units() const;
-  void _internal_set_units(::int64_t value);
-
-  public:
-  // int32 nanos = 3;
-  void clear_nanos() ;
-  ::int32_t nanos() const;
-  void set_nanos(::int32_t value);
-
-  private:
-  ::int32_t _internal_nanos() const;
-  void _internal_set_nanos(::int32_t value);
+  const ::std::string& _internal_tracking_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_tracking_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_tracking_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Money)
+  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 3,
-                                   0, 36,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   0, 46,
                                    2>
       _table_;
 
@@ -1190,45 +1273,43 @@ class Money final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const Money& from_msg);
+        const ShipOrderResponse& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr currency_code_;
-    ::int64_t units_;
-    ::int32_t nanos_;
+    ::google::protobuf::internal::ArenaStringPtr tracking_id_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull Money_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ShipOrderResponse_class_data_;
 // -------------------------------------------------------------------
 
-class ListRecommendationsResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsResponse) */ {
+class SearchProductsRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.SearchProductsRequest) */ {
  public:
-  inline ListRecommendationsResponse() : ListRecommendationsResponse(nullptr) {}
-  ~ListRecommendationsResponse() PROTOBUF_FINAL;
+  inline SearchProductsRequest() : SearchProductsRequest(nullptr) {}
+  ~SearchProductsRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ListRecommendationsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(SearchProductsRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListRecommendationsResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(SearchProductsRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ListRecommendationsResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR SearchProductsRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline ListRecommendationsResponse(const ListRecommendationsResponse& from) : ListRecommendationsResponse(nullptr, from) {}
-  inline ListRecommendationsResponse(ListRecommendationsResponse&& from) noexcept
-      : ListRecommendationsResponse(nullptr, ::std::move(from)) {}
-  inline ListRecommendationsResponse& operator=(const ListRecommendationsResponse& from) {
+  inline SearchProductsRequest(const SearchProductsRequest& from) : SearchProductsRequest(nullptr, from) {}
+  inline SearchProductsRequest(SearchProductsRequest&& from) noexcept
+      : SearchProductsRequest(nullptr, ::std::move(from)) {}
+  inline SearchProductsRequest& operator=(const SearchProductsRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ListRecommendationsResponse& operator=(ListRecommendationsResponse&& from) noexcept {
+  inline SearchProductsRequest& operator=(SearchProductsRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -1256,13 +1337,13 @@ class ListRecommendationsResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ListRecommendationsResponse& default_instance() {
-    return *reinterpret_cast<const ListRecommendationsResponse*>(
-        &_ListRecommendationsResponse_default_instance_);
+  static const SearchProductsRequest& default_instance() {
+    return *reinterpret_cast<const SearchProductsRequest*>(
+        &_SearchProductsRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 7;
-  friend void swap(ListRecommendationsResponse& a, ListRecommendationsResponse& b) { a.Swap(&b); }
-  inline void Swap(ListRecommendationsResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 15;
+  friend void swap(SearchProductsRequest& a, SearchProductsRequest& b) { a.Swap(&b); }
+  inline void Swap(SearchProductsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -1270,7 +1351,7 @@ class ListRecommendationsResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ListRecommendationsResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(SearchProductsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -1278,13 +1359,13 @@ class ListRecommendationsResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ListRecommendationsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ListRecommendationsResponse>(arena);
+  SearchProductsRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<SearchProductsRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ListRecommendationsResponse& from);
+  void CopyFrom(const SearchProductsRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ListRecommendationsResponse& from) { ListRecommendationsResponse::MergeImpl(*this, from); }
+  void MergeFrom(const SearchProductsRequest& from) { SearchProductsRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -1320,18 +1401,18 @@ class ListRecommendationsResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ListRecommendationsResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(SearchProductsRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ListRecommendationsResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.SearchProductsRequest"; }
 
  protected:
-  explicit ListRecommendationsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ListRecommendationsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListRecommendationsResponse& from);
-  ListRecommendationsResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListRecommendationsResponse&& from) noexcept
-      : ListRecommendationsResponse(arena) {
+  explicit SearchProductsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  SearchProductsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const SearchProductsRequest& from);
+  SearchProductsRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, SearchProductsRequest&& from) noexcept
+      : SearchProductsRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -1348,36 +1429,29 @@ class ListRecommendationsResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kProductIdsFieldNumber = 1,
+    kQueryFieldNumber = 1,
   };
-  // repeated string product_ids = 1;
-  int product_ids_size() const;
-  private:
-  int _internal_product_ids_size() const;
-
-  public:
-  void clear_product_ids() ;
-  const ::std::string& product_ids(int index) const;
-  ::std::string* PROTOBUF_NONNULL mutable_product_ids(int index);
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_product_ids(int index, Arg_&& value, Args_... args);
-  ::std::string* PROTOBUF_NONNULL add_product_ids();
+  // string query = 1;
+  void clear_query() ;
+  const ::std::string& query() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void add_product_ids(Arg_&& value, Args_... args);
-  const ::google::protobuf::RepeatedPtrField<::std::string>& product_ids() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_product_ids();
+  void set_query(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_query();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_query();
+  void set_allocated_query(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_product_ids() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_product_ids();
+  const ::std::string& _internal_query() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_query(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_query();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.SearchProductsRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 56,
+                                   0, 44,
                                    2>
       _table_;
 
@@ -1395,42 +1469,43 @@ class ListRecommendationsResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ListRecommendationsResponse& from_msg);
-    ::google::protobuf::RepeatedPtrField<::std::string> product_ids_;
+        const SearchProductsRequest& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr query_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull SearchProductsRequest_class_data_;
 // -------------------------------------------------------------------
 
-class ListRecommendationsRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsRequest) */ {
+class Money final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.Money) */ {
  public:
-  inline ListRecommendationsRequest() : ListRecommendationsRequest(nullptr) {}
-  ~ListRecommendationsRequest() PROTOBUF_FINAL;
+  inline Money() : Money(nullptr) {}
+  ~Money() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ListRecommendationsRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(Money* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListRecommendationsRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(Money));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ListRecommendationsRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Money(::google::protobuf::internal::ConstantInitialized);
 
-  inline ListRecommendationsRequest(const ListRecommendationsRequest& from) : ListRecommendationsRequest(nullptr, from) {}
-  inline ListRecommendationsRequest(ListRecommendationsRequest&& from) noexcept
-      : ListRecommendationsRequest(nullptr, ::std::move(from)) {}
-  inline ListRecommendationsRequest& operator=(const ListRecommendationsRequest& from) {
+  inline Money(const Money& from) : Money(nullptr, from) {}
+  inline Money(Money&& from) noexcept
+      : Money(nullptr, ::std::move(from)) {}
+  inline Money& operator=(const Money& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ListRecommendationsRequest& operator=(ListRecommendationsRequest&& from) noexcept {
+  inline Money& operator=(Money&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -1458,13 +1533,13 @@ class ListRecommendationsRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ListRecommendationsRequest& default_instance() {
-    return *reinterpret_cast<const ListRecommendationsRequest*>(
-        &_ListRecommendationsRequest_default_instance_);
+  static const Money& default_instance() {
+    return *reinterpret_cast<const Money*>(
+        &_Money_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 6;
-  friend void swap(ListRecommendationsRequest& a, ListRecommendationsRequest& b) { a.Swap(&b); }
-  inline void Swap(ListRecommendationsRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 22;
+  friend void swap(Money& a, Money& b) { a.Swap(&b); }
+  inline void Swap(Money* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -1472,7 +1547,7 @@ class ListRecommendationsRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ListRecommendationsRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(Money* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -1480,13 +1555,13 @@ class ListRecommendationsRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ListRecommendationsRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ListRecommendationsRequest>(arena);
+  Money* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<Money>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ListRecommendationsRequest& from);
+  void CopyFrom(const Money& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ListRecommendationsRequest& from) { ListRecommendationsRequest::MergeImpl(*this, from); }
+  void MergeFrom(const Money& from) { Money::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -1522,18 +1597,18 @@ class ListRecommendationsRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ListRecommendationsRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(Money* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ListRecommendationsRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.Money"; }
 
  protected:
-  explicit ListRecommendationsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ListRecommendationsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListRecommendationsRequest& from);
-  ListRecommendationsRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListRecommendationsRequest&& from) noexcept
-      : ListRecommendationsRequest(arena) {
+  explicit Money(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  Money(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Money& from);
+  Money(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Money&& from) noexcept
+      : Money(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -1550,52 +1625,51 @@ class ListRecommendationsRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kProductIdsFieldNumber = 2,
-    kUserIdFieldNumber = 1,
+    kCurrencyCodeFieldNumber = 1,
+    kUnitsFieldNumber = 2,
+    kNanosFieldNumber = 3,
   };
-  // repeated string product_ids = 2;
-  int product_ids_size() const;
+  // string currency_code = 1;
+  void clear_currency_code() ;
+  const ::std::string& currency_code() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_currency_code(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_currency_code();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_currency_code();
+  void set_allocated_currency_code(::std::string* PROTOBUF_NULLABLE value);
+
   private:
-  int _internal_product_ids_size() const;
+  const ::std::string& _internal_currency_code() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_currency_code(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_currency_code();
 
   public:
-  void clear_product_ids() ;
-  const ::std::string& product_ids(int index) const;
-  ::std::string* PROTOBUF_NONNULL mutable_product_ids(int index);
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_product_ids(int index, Arg_&& value, Args_... args);
-  ::std::string* PROTOBUF_NONNULL add_product_ids();
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void add_product_ids(Arg_&& value, Args_... args);
-  const ::google::protobuf::RepeatedPtrField<::std::string>& product_ids() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_product_ids();
+  // int64 units = 2;
+  void clear_units() ;
+  ::int64_t units() const;
+  void set_units(::int64_t value);
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_product_ids() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_product_ids();
+  ::int64_t _internal_units() const;
+  void _internal_set_units(::int64_t value);
 
   public:
-  // string user_id = 1;
-  void clear_user_id() ;
-  const ::std::string& user_id() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_user_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_user_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
-  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+  // int32 nanos = 3;
+  void clear_nanos() ;
+  ::int32_t nanos() const;
+  void set_nanos(::int32_t value);
 
   private:
-  const ::std::string& _internal_user_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+  ::int32_t _internal_nanos() const;
+  void _internal_set_nanos(::int32_t value);
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.Money)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   0, 62,
+  static const ::google::protobuf::internal::TcParseTable<2, 3,
+                                   0, 36,
                                    2>
       _table_;
 
@@ -1613,43 +1687,45 @@ class ListRecommendationsRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ListRecommendationsRequest& from_msg);
+        const Money& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField<::std::string> product_ids_;
-    ::google::protobuf::internal::ArenaStringPtr user_id_;
+    ::google::protobuf::internal::ArenaStringPtr currency_code_;
+    ::int64_t units_;
+    ::int32_t nanos_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull Money_class_data_;
 // -------------------------------------------------------------------
 
-class ListFlagsRequest final : public ::google::protobuf::internal::ZeroFieldsBase
-/* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsRequest) */ {
+class ListRecommendationsResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsResponse) */ {
  public:
-  inline ListFlagsRequest() : ListFlagsRequest(nullptr) {}
+  inline ListRecommendationsResponse() : ListRecommendationsResponse(nullptr) {}
+  ~ListRecommendationsResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ListFlagsRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ListRecommendationsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListFlagsRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListRecommendationsResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ListFlagsRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ListRecommendationsResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline ListFlagsRequest(const ListFlagsRequest& from) : ListFlagsRequest(nullptr, from) {}
-  inline ListFlagsRequest(ListFlagsRequest&& from) noexcept
-      : ListFlagsRequest(nullptr, ::std::move(from)) {}
-  inline ListFlagsRequest& operator=(const ListFlagsRequest& from) {
+  inline ListRecommendationsResponse(const ListRecommendationsResponse& from) : ListRecommendationsResponse(nullptr, from) {}
+  inline ListRecommendationsResponse(ListRecommendationsResponse&& from) noexcept
+      : ListRecommendationsResponse(nullptr, ::std::move(from)) {}
+  inline ListRecommendationsResponse& operator=(const ListRecommendationsResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ListFlagsRequest& operator=(ListFlagsRequest&& from) noexcept {
+  inline ListRecommendationsResponse& operator=(ListRecommendationsResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -1677,13 +1753,13 @@ class ListFlagsRequest final : public ::google::protobuf::internal::ZeroFieldsBa
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ListFlagsRequest& default_instance() {
-    return *reinterpret_cast<const ListFlagsRequest*>(
-        &_ListFlagsRequest_default_instance_);
+  static const ListRecommendationsResponse& default_instance() {
+    return *reinterpret_cast<const ListRecommendationsResponse*>(
+        &_ListRecommendationsResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 39;
-  friend void swap(ListFlagsRequest& a, ListFlagsRequest& b) { a.Swap(&b); }
-  inline void Swap(ListFlagsRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 7;
+  friend void swap(ListRecommendationsResponse& a, ListRecommendationsResponse& b) { a.Swap(&b); }
+  inline void Swap(ListRecommendationsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -1691,7 +1767,7 @@ class ListFlagsRequest final : public ::google::protobuf::internal::ZeroFieldsBa
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ListFlagsRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ListRecommendationsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -1699,33 +1775,60 @@ class ListFlagsRequest final : public ::google::protobuf::internal::ZeroFieldsBa
 
   // implements Message ----------------------------------------------
 
-  ListFlagsRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::internal::ZeroFieldsBase::DefaultConstruct<ListFlagsRequest>(arena);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
-  inline void CopyFrom(const ListFlagsRequest& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
-  void MergeFrom(const ListFlagsRequest& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  ListRecommendationsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ListRecommendationsResponse>(arena);
   }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const ListRecommendationsResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const ListRecommendationsResponse& from) { ListRecommendationsResponse::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
+                        const ::google::protobuf::MessageLite& from_msg);
 
   public:
   bool IsInitialized() const {
     return true;
   }
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
+  #if defined(PROTOBUF_CUSTOM_VTABLE)
+  private:
+  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
+  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
+
+  public:
+  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+    return _InternalSerialize(*this, target, stream);
+  }
+  #else   // PROTOBUF_CUSTOM_VTABLE
+  ::size_t ByteSizeLong() const final;
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
+  #endif  // PROTOBUF_CUSTOM_VTABLE
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static void SharedDtor(MessageLite& self);
+  void InternalSwap(ListRecommendationsResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ListFlagsRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ListRecommendationsResponse"; }
 
  protected:
-  explicit ListFlagsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ListFlagsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListFlagsRequest& from);
-  ListFlagsRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListFlagsRequest&& from) noexcept
-      : ListFlagsRequest(arena) {
+  explicit ListRecommendationsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ListRecommendationsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListRecommendationsResponse& from);
+  ListRecommendationsResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListRecommendationsResponse&& from) noexcept
+      : ListRecommendationsResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -1741,12 +1844,37 @@ class ListFlagsRequest final : public ::google::protobuf::internal::ZeroFieldsBa
   // nested types ----------------------------------------------------
 
   // accessors -------------------------------------------------------
-  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsRequest)
+  enum : int {
+    kProductIdsFieldNumber = 1,
+  };
+  // repeated string product_ids = 1;
+  int product_ids_size() const;
+  private:
+  int _internal_product_ids_size() const;
+
+  public:
+  void clear_product_ids() ;
+  const ::std::string& product_ids(int index) const;
+  ::std::string* PROTOBUF_NONNULL mutable_product_ids(int index);
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_product_ids(int index, Arg_&& value, Args_... args);
+  ::std::string* PROTOBUF_NONNULL add_product_ids();
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void add_product_ids(Arg_&& value, Args_... args);
+  const ::google::protobuf::RepeatedPtrField<::std::string>& product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_product_ids();
+
+  private:
+  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_product_ids();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 0,
-                                   0, 0,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   0, 56,
                                    2>
       _table_;
 
@@ -1764,39 +1892,42 @@ class ListFlagsRequest final : public ::google::protobuf::internal::ZeroFieldsBa
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ListFlagsRequest& from_msg);
+        const ListRecommendationsResponse& from_msg);
+    ::google::protobuf::RepeatedPtrField<::std::string> product_ids_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
+  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ListFlagsRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsResponse_class_data_;
 // -------------------------------------------------------------------
 
-class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.GetSupportedCurrenciesResponse) */ {
+class ListRecommendationsRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsRequest) */ {
  public:
-  inline GetSupportedCurrenciesResponse() : GetSupportedCurrenciesResponse(nullptr) {}
-  ~GetSupportedCurrenciesResponse() PROTOBUF_FINAL;
+  inline ListRecommendationsRequest() : ListRecommendationsRequest(nullptr) {}
+  ~ListRecommendationsRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ListRecommendationsRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetSupportedCurrenciesResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListRecommendationsRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR GetSupportedCurrenciesResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ListRecommendationsRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline GetSupportedCurrenciesResponse(const GetSupportedCurrenciesResponse& from) : GetSupportedCurrenciesResponse(nullptr, from) {}
-  inline GetSupportedCurrenciesResponse(GetSupportedCurrenciesResponse&& from) noexcept
-      : GetSupportedCurrenciesResponse(nullptr, ::std::move(from)) {}
-  inline GetSupportedCurrenciesResponse& operator=(const GetSupportedCurrenciesResponse& from) {
+  inline ListRecommendationsRequest(const ListRecommendationsRequest& from) : ListRecommendationsRequest(nullptr, from) {}
+  inline ListRecommendationsRequest(ListRecommendationsRequest&& from) noexcept
+      : ListRecommendationsRequest(nullptr, ::std::move(from)) {}
+  inline ListRecommendationsRequest& operator=(const ListRecommendationsRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetSupportedCurrenciesResponse& operator=(GetSupportedCurrenciesResponse&& from) noexcept {
+  inline ListRecommendationsRequest& operator=(ListRecommendationsRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -1824,13 +1955,13 @@ class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetSupportedCurrenciesResponse& default_instance() {
-    return *reinterpret_cast<const GetSupportedCurrenciesResponse*>(
-        &_GetSupportedCurrenciesResponse_default_instance_);
+  static const ListRecommendationsRequest& default_instance() {
+    return *reinterpret_cast<const ListRecommendationsRequest*>(
+        &_ListRecommendationsRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 19;
-  friend void swap(GetSupportedCurrenciesResponse& a, GetSupportedCurrenciesResponse& b) { a.Swap(&b); }
-  inline void Swap(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 6;
+  friend void swap(ListRecommendationsRequest& a, ListRecommendationsRequest& b) { a.Swap(&b); }
+  inline void Swap(ListRecommendationsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -1838,7 +1969,7 @@ class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ListRecommendationsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -1846,13 +1977,13 @@ class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  GetSupportedCurrenciesResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<GetSupportedCurrenciesResponse>(arena);
+  ListRecommendationsRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ListRecommendationsRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetSupportedCurrenciesResponse& from);
+  void CopyFrom(const ListRecommendationsRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const GetSupportedCurrenciesResponse& from) { GetSupportedCurrenciesResponse::MergeImpl(*this, from); }
+  void MergeFrom(const ListRecommendationsRequest& from) { ListRecommendationsRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -1888,18 +2019,18 @@ class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(ListRecommendationsRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.GetSupportedCurrenciesResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ListRecommendationsRequest"; }
 
  protected:
-  explicit GetSupportedCurrenciesResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  GetSupportedCurrenciesResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetSupportedCurrenciesResponse& from);
-  GetSupportedCurrenciesResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetSupportedCurrenciesResponse&& from) noexcept
-      : GetSupportedCurrenciesResponse(arena) {
+  explicit ListRecommendationsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ListRecommendationsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListRecommendationsRequest& from);
+  ListRecommendationsRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListRecommendationsRequest&& from) noexcept
+      : ListRecommendationsRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -1916,35 +2047,51 @@ class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kCurrencyCodesFieldNumber = 1,
+    kProductIdsFieldNumber = 2,
+    kUserIdFieldNumber = 1,
   };
-  // repeated string currency_codes = 1;
-  int currency_codes_size() const;
+  // repeated string product_ids = 2;
+  int product_ids_size() const;
   private:
-  int _internal_currency_codes_size() const;
+  int _internal_product_ids_size() const;
 
   public:
-  void clear_currency_codes() ;
-  const ::std::string& currency_codes(int index) const;
-  ::std::string* PROTOBUF_NONNULL mutable_currency_codes(int index);
+  void clear_product_ids() ;
+  const ::std::string& product_ids(int index) const;
+  ::std::string* PROTOBUF_NONNULL mutable_product_ids(int index);
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_currency_codes(int index, Arg_&& value, Args_... args);
-  ::std::string* PROTOBUF_NONNULL add_currency_codes();
+  void set_product_ids(int index, Arg_&& value, Args_... args);
+  ::std::string* PROTOBUF_NONNULL add_product_ids();
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void add_currency_codes(Arg_&& value, Args_... args);
-  const ::google::protobuf::RepeatedPtrField<::std::string>& currency_codes() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_currency_codes();
+  void add_product_ids(Arg_&& value, Args_... args);
+  const ::google::protobuf::RepeatedPtrField<::std::string>& product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_product_ids();
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_currency_codes() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_currency_codes();
+  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_product_ids() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_product_ids();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetSupportedCurrenciesResponse)
+  // string user_id = 1;
+  void clear_user_id() ;
+  const ::std::string& user_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_user_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_user_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
+  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_user_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
                                    0, 62,
                                    2>
       _table_;
@@ -1963,42 +2110,43 @@ class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const GetSupportedCurrenciesResponse& from_msg);
-    ::google::protobuf::RepeatedPtrField<::std::string> currency_codes_;
-    ::google::protobuf::internal::CachedSize _cached_size_;
+        const ListRecommendationsRequest& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::RepeatedPtrField<::std::string> product_ids_;
+    ::google::protobuf::internal::ArenaStringPtr user_id_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull GetSupportedCurrenciesResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsRequest_class_data_;
 // -------------------------------------------------------------------
 
-class GetProductRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.GetProductRequest) */ {
+class ListFlagsRequest final : public ::google::protobuf::internal::ZeroFieldsBase
+/* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsRequest) */ {
  public:
-  inline GetProductRequest() : GetProductRequest(nullptr) {}
-  ~GetProductRequest() PROTOBUF_FINAL;
+  inline ListFlagsRequest() : ListFlagsRequest(nullptr) {}
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(GetProductRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ListFlagsRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetProductRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListFlagsRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR GetProductRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ListFlagsRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline GetProductRequest(const GetProductRequest& from) : GetProductRequest(nullptr, from) {}
-  inline GetProductRequest(GetProductRequest&& from) noexcept
-      : GetProductRequest(nullptr, ::std::move(from)) {}
-  inline GetProductRequest& operator=(const GetProductRequest& from) {
+  inline ListFlagsRequest(const ListFlagsRequest& from) : ListFlagsRequest(nullptr, from) {}
+  inline ListFlagsRequest(ListFlagsRequest&& from) noexcept
+      : ListFlagsRequest(nullptr, ::std::move(from)) {}
+  inline ListFlagsRequest& operator=(const ListFlagsRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetProductRequest& operator=(GetProductRequest&& from) noexcept {
+  inline ListFlagsRequest& operator=(ListFlagsRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -2026,13 +2174,13 @@ class GetProductRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetProductRequest& default_instance() {
-    return *reinterpret_cast<const GetProductRequest*>(
-        &_GetProductRequest_default_instance_);
+  static const ListFlagsRequest& default_instance() {
+    return *reinterpret_cast<const ListFlagsRequest*>(
+        &_ListFlagsRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 10;
-  friend void swap(GetProductRequest& a, GetProductRequest& b) { a.Swap(&b); }
-  inline void Swap(GetProductRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 43;
+  friend void swap(ListFlagsRequest& a, ListFlagsRequest& b) { a.Swap(&b); }
+  inline void Swap(ListFlagsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -2040,7 +2188,7 @@ class GetProductRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetProductRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ListFlagsRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -2048,60 +2196,33 @@ class GetProductRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  GetProductRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<GetProductRequest>(arena);
+  ListFlagsRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::internal::ZeroFieldsBase::DefaultConstruct<ListFlagsRequest>(arena);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
+  inline void CopyFrom(const ListFlagsRequest& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
+  void MergeFrom(const ListFlagsRequest& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
   }
-  using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetProductRequest& from);
-  using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const GetProductRequest& from) { GetProductRequest::MergeImpl(*this, from); }
-
-  private:
-  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
-                        const ::google::protobuf::MessageLite& from_msg);
 
   public:
   bool IsInitialized() const {
     return true;
   }
-  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
-  #if defined(PROTOBUF_CUSTOM_VTABLE)
-  private:
-  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
-  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
-
-  public:
-  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
-  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
-    return _InternalSerialize(*this, target, stream);
-  }
-  #else   // PROTOBUF_CUSTOM_VTABLE
-  ::size_t ByteSizeLong() const final;
-  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
-  #endif  // PROTOBUF_CUSTOM_VTABLE
-  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
-
-  private:
-  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  static void SharedDtor(MessageLite& self);
-  void InternalSwap(GetProductRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.GetProductRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ListFlagsRequest"; }
 
  protected:
-  explicit GetProductRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  GetProductRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetProductRequest& from);
-  GetProductRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetProductRequest&& from) noexcept
-      : GetProductRequest(arena) {
+  explicit ListFlagsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ListFlagsRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListFlagsRequest& from);
+  ListFlagsRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListFlagsRequest&& from) noexcept
+      : ListFlagsRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -2117,30 +2238,12 @@ class GetProductRequest final : public ::google::protobuf::Message
   // nested types ----------------------------------------------------
 
   // accessors -------------------------------------------------------
-  enum : int {
-    kIdFieldNumber = 1,
-  };
-  // string id = 1;
-  void clear_id() ;
-  const ::std::string& id() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_id();
-  void set_allocated_id(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_id();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetProductRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 37,
+  static const ::google::protobuf::internal::TcParseTable<0, 0,
+                                   0, 0,
                                    2>
       _table_;
 
@@ -2158,43 +2261,39 @@ class GetProductRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const GetProductRequest& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
-    ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr id_;
+        const ListFlagsRequest& from_msg);
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
-  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull GetProductRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ListFlagsRequest_class_data_;
 // -------------------------------------------------------------------
 
-class GetFlagRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.GetFlagRequest) */ {
+class GetSupportedCurrenciesResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.GetSupportedCurrenciesResponse) */ {
  public:
-  inline GetFlagRequest() : GetFlagRequest(nullptr) {}
-  ~GetFlagRequest() PROTOBUF_FINAL;
+  inline GetSupportedCurrenciesResponse() : GetSupportedCurrenciesResponse(nullptr) {}
+  ~GetSupportedCurrenciesResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(GetFlagRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetFlagRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetSupportedCurrenciesResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR GetFlagRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetSupportedCurrenciesResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline GetFlagRequest(const GetFlagRequest& from) : GetFlagRequest(nullptr, from) {}
-  inline GetFlagRequest(GetFlagRequest&& from) noexcept
-      : GetFlagRequest(nullptr, ::std::move(from)) {}
-  inline GetFlagRequest& operator=(const GetFlagRequest& from) {
+  inline GetSupportedCurrenciesResponse(const GetSupportedCurrenciesResponse& from) : GetSupportedCurrenciesResponse(nullptr, from) {}
+  inline GetSupportedCurrenciesResponse(GetSupportedCurrenciesResponse&& from) noexcept
+      : GetSupportedCurrenciesResponse(nullptr, ::std::move(from)) {}
+  inline GetSupportedCurrenciesResponse& operator=(const GetSupportedCurrenciesResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetFlagRequest& operator=(GetFlagRequest&& from) noexcept {
+  inline GetSupportedCurrenciesResponse& operator=(GetSupportedCurrenciesResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -2222,13 +2321,13 @@ class GetFlagRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetFlagRequest& default_instance() {
-    return *reinterpret_cast<const GetFlagRequest*>(
-        &_GetFlagRequest_default_instance_);
+  static const GetSupportedCurrenciesResponse& default_instance() {
+    return *reinterpret_cast<const GetSupportedCurrenciesResponse*>(
+        &_GetSupportedCurrenciesResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 33;
-  friend void swap(GetFlagRequest& a, GetFlagRequest& b) { a.Swap(&b); }
-  inline void Swap(GetFlagRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 23;
+  friend void swap(GetSupportedCurrenciesResponse& a, GetSupportedCurrenciesResponse& b) { a.Swap(&b); }
+  inline void Swap(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -2236,7 +2335,7 @@ class GetFlagRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetFlagRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -2244,13 +2343,13 @@ class GetFlagRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  GetFlagRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<GetFlagRequest>(arena);
+  GetSupportedCurrenciesResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<GetSupportedCurrenciesResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetFlagRequest& from);
+  void CopyFrom(const GetSupportedCurrenciesResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const GetFlagRequest& from) { GetFlagRequest::MergeImpl(*this, from); }
+  void MergeFrom(const GetSupportedCurrenciesResponse& from) { GetSupportedCurrenciesResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -2286,18 +2385,18 @@ class GetFlagRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(GetFlagRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(GetSupportedCurrenciesResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.GetFlagRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.GetSupportedCurrenciesResponse"; }
 
  protected:
-  explicit GetFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  GetFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetFlagRequest& from);
-  GetFlagRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetFlagRequest&& from) noexcept
-      : GetFlagRequest(arena) {
+  explicit GetSupportedCurrenciesResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  GetSupportedCurrenciesResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetSupportedCurrenciesResponse& from);
+  GetSupportedCurrenciesResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetSupportedCurrenciesResponse&& from) noexcept
+      : GetSupportedCurrenciesResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -2314,29 +2413,36 @@ class GetFlagRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kNameFieldNumber = 1,
+    kCurrencyCodesFieldNumber = 1,
   };
-  // string name = 1;
-  void clear_name() ;
-  const ::std::string& name() const;
+  // repeated string currency_codes = 1;
+  int currency_codes_size() const;
+  private:
+  int _internal_currency_codes_size() const;
+
+  public:
+  void clear_currency_codes() ;
+  const ::std::string& currency_codes(int index) const;
+  ::std::string* PROTOBUF_NONNULL mutable_currency_codes(int index);
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_name();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_name();
-  void set_allocated_name(::std::string* PROTOBUF_NULLABLE value);
+  void set_currency_codes(int index, Arg_&& value, Args_... args);
+  ::std::string* PROTOBUF_NONNULL add_currency_codes();
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void add_currency_codes(Arg_&& value, Args_... args);
+  const ::google::protobuf::RepeatedPtrField<::std::string>& currency_codes() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_currency_codes();
 
   private:
-  const ::std::string& _internal_name() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_name(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
+  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_currency_codes() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_currency_codes();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetSupportedCurrenciesResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 36,
+                                   0, 62,
                                    2>
       _table_;
 
@@ -2354,43 +2460,42 @@ class GetFlagRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const GetFlagRequest& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+        const GetSupportedCurrenciesResponse& from_msg);
+    ::google::protobuf::RepeatedPtrField<::std::string> currency_codes_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr name_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull GetFlagRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull GetSupportedCurrenciesResponse_class_data_;
 // -------------------------------------------------------------------
 
-class GetCartRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.GetCartRequest) */ {
+class GetProductRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.GetProductRequest) */ {
  public:
-  inline GetCartRequest() : GetCartRequest(nullptr) {}
-  ~GetCartRequest() PROTOBUF_FINAL;
+  inline GetProductRequest() : GetProductRequest(nullptr) {}
+  ~GetProductRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(GetCartRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(GetProductRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetCartRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetProductRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR GetCartRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetProductRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline GetCartRequest(const GetCartRequest& from) : GetCartRequest(nullptr, from) {}
-  inline GetCartRequest(GetCartRequest&& from) noexcept
-      : GetCartRequest(nullptr, ::std::move(from)) {}
-  inline GetCartRequest& operator=(const GetCartRequest& from) {
+  inline GetProductRequest(const GetProductRequest& from) : GetProductRequest(nullptr, from) {}
+  inline GetProductRequest(GetProductRequest&& from) noexcept
+      : GetProductRequest(nullptr, ::std::move(from)) {}
+  inline GetProductRequest& operator=(const GetProductRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetCartRequest& operator=(GetCartRequest&& from) noexcept {
+  inline GetProductRequest& operator=(GetProductRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -2418,13 +2523,13 @@ class GetCartRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetCartRequest& default_instance() {
-    return *reinterpret_cast<const GetCartRequest*>(
-        &_GetCartRequest_default_instance_);
+  static const GetProductRequest& default_instance() {
+    return *reinterpret_cast<const GetProductRequest*>(
+        &_GetProductRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 3;
-  friend void swap(GetCartRequest& a, GetCartRequest& b) { a.Swap(&b); }
-  inline void Swap(GetCartRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 14;
+  friend void swap(GetProductRequest& a, GetProductRequest& b) { a.Swap(&b); }
+  inline void Swap(GetProductRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -2432,7 +2537,7 @@ class GetCartRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetCartRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(GetProductRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -2440,13 +2545,13 @@ class GetCartRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  GetCartRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<GetCartRequest>(arena);
+  GetProductRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<GetProductRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetCartRequest& from);
+  void CopyFrom(const GetProductRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const GetCartRequest& from) { GetCartRequest::MergeImpl(*this, from); }
+  void MergeFrom(const GetProductRequest& from) { GetProductRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -2482,18 +2587,18 @@ class GetCartRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(GetCartRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(GetProductRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.GetCartRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.GetProductRequest"; }
 
  protected:
-  explicit GetCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  GetCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetCartRequest& from);
-  GetCartRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetCartRequest&& from) noexcept
-      : GetCartRequest(arena) {
+  explicit GetProductRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  GetProductRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetProductRequest& from);
+  GetProductRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetProductRequest&& from) noexcept
+      : GetProductRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -2510,29 +2615,29 @@ class GetCartRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kUserIdFieldNumber = 1,
+    kIdFieldNumber = 1,
   };
-  // string user_id = 1;
-  void clear_user_id() ;
-  const ::std::string& user_id() const;
+  // string id = 1;
+  void clear_id() ;
+  const ::std::string& id() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_user_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_user_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
-  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+  void set_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_id();
+  void set_allocated_id(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_user_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+  const ::std::string& _internal_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetCartRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetProductRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 39,
+                                   0, 37,
                                    2>
       _table_;
 
@@ -2550,43 +2655,43 @@ class GetCartRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const GetCartRequest& from_msg);
+        const GetProductRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr user_id_;
+    ::google::protobuf::internal::ArenaStringPtr id_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull GetCartRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull GetProductRequest_class_data_;
 // -------------------------------------------------------------------
 
-class Flag final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.Flag) */ {
+class GetFlagRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.GetFlagRequest) */ {
  public:
-  inline Flag() : Flag(nullptr) {}
-  ~Flag() PROTOBUF_FINAL;
+  inline GetFlagRequest() : GetFlagRequest(nullptr) {}
+  ~GetFlagRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(Flag* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(GetFlagRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(Flag));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetFlagRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Flag(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetFlagRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline Flag(const Flag& from) : Flag(nullptr, from) {}
-  inline Flag(Flag&& from) noexcept
-      : Flag(nullptr, ::std::move(from)) {}
-  inline Flag& operator=(const Flag& from) {
+  inline GetFlagRequest(const GetFlagRequest& from) : GetFlagRequest(nullptr, from) {}
+  inline GetFlagRequest(GetFlagRequest&& from) noexcept
+      : GetFlagRequest(nullptr, ::std::move(from)) {}
+  inline GetFlagRequest& operator=(const GetFlagRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Flag& operator=(Flag&& from) noexcept {
+  inline GetFlagRequest& operator=(GetFlagRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -2614,13 +2719,13 @@ class Flag final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Flag& default_instance() {
-    return *reinterpret_cast<const Flag*>(
-        &_Flag_default_instance_);
+  static const GetFlagRequest& default_instance() {
+    return *reinterpret_cast<const GetFlagRequest*>(
+        &_GetFlagRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 32;
-  friend void swap(Flag& a, Flag& b) { a.Swap(&b); }
-  inline void Swap(Flag* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 37;
+  friend void swap(GetFlagRequest& a, GetFlagRequest& b) { a.Swap(&b); }
+  inline void Swap(GetFlagRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -2628,7 +2733,7 @@ class Flag final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Flag* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(GetFlagRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -2636,13 +2741,13 @@ class Flag final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Flag* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<Flag>(arena);
+  GetFlagRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<GetFlagRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Flag& from);
+  void CopyFrom(const GetFlagRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Flag& from) { Flag::MergeImpl(*this, from); }
+  void MergeFrom(const GetFlagRequest& from) { GetFlagRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -2678,18 +2783,18 @@ class Flag final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(Flag* PROTOBUF_NONNULL other);
+  void InternalSwap(GetFlagRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.Flag"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.GetFlagRequest"; }
 
  protected:
-  explicit Flag(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  Flag(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Flag& from);
-  Flag(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Flag&& from) noexcept
-      : Flag(arena) {
+  explicit GetFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  GetFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetFlagRequest& from);
+  GetFlagRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetFlagRequest&& from) noexcept
+      : GetFlagRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -2707,8 +2812,6 @@ class Flag final : public ::google::protobuf::Message
   // accessors -------------------------------------------------------
   enum : int {
     kNameFieldNumber = 1,
-    kDescriptionFieldNumber = 2,
-    kEnabledFieldNumber = 3,
   };
   // string name = 1;
   void clear_name() ;
@@ -2725,37 +2828,12 @@ class Flag final : public ::google::protobuf::Message
   ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
 
   public:
-  // string description = 2;
-  void clear_description() ;
-  const ::std::string& description() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_description(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_description();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_description();
-  void set_allocated_description(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_description() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_description(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_description();
-
-  public:
-  // bool enabled = 3;
-  void clear_enabled() ;
-  bool enabled() const;
-  void set_enabled(bool value);
-
-  private:
-  bool _internal_enabled() const;
-  void _internal_set_enabled(bool value);
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Flag)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 3,
-                                   0, 37,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   0, 36,
                                    2>
       _table_;
 
@@ -2773,45 +2851,43 @@ class Flag final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const Flag& from_msg);
+        const GetFlagRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
     ::google::protobuf::internal::ArenaStringPtr name_;
-    ::google::protobuf::internal::ArenaStringPtr description_;
-    bool enabled_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull Flag_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull GetFlagRequest_class_data_;
 // -------------------------------------------------------------------
 
-class EmptyCartRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.EmptyCartRequest) */ {
+class GetCartRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.GetCartRequest) */ {
  public:
-  inline EmptyCartRequest() : EmptyCartRequest(nullptr) {}
-  ~EmptyCartRequest() PROTOBUF_FINAL;
+  inline GetCartRequest() : GetCartRequest(nullptr) {}
+  ~GetCartRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(EmptyCartRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(GetCartRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(EmptyCartRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetCartRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR EmptyCartRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetCartRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline EmptyCartRequest(const EmptyCartRequest& from) : EmptyCartRequest(nullptr, from) {}
-  inline EmptyCartRequest(EmptyCartRequest&& from) noexcept
-      : EmptyCartRequest(nullptr, ::std::move(from)) {}
-  inline EmptyCartRequest& operator=(const EmptyCartRequest& from) {
+  inline GetCartRequest(const GetCartRequest& from) : GetCartRequest(nullptr, from) {}
+  inline GetCartRequest(GetCartRequest&& from) noexcept
+      : GetCartRequest(nullptr, ::std::move(from)) {}
+  inline GetCartRequest& operator=(const GetCartRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline EmptyCartRequest& operator=(EmptyCartRequest&& from) noexcept {
+  inline GetCartRequest& operator=(GetCartRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -2839,13 +2915,13 @@ class EmptyCartRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const EmptyCartRequest& default_instance() {
-    return *reinterpret_cast<const EmptyCartRequest*>(
-        &_EmptyCartRequest_default_instance_);
+  static const GetCartRequest& default_instance() {
+    return *reinterpret_cast<const GetCartRequest*>(
+        &_GetCartRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 2;
-  friend void swap(EmptyCartRequest& a, EmptyCartRequest& b) { a.Swap(&b); }
-  inline void Swap(EmptyCartRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 3;
+  friend void swap(GetCartRequest& a, GetCartRequest& b) { a.Swap(&b); }
+  inline void Swap(GetCartRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -2853,7 +2929,7 @@ class EmptyCartRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(EmptyCartRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(GetCartRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -2861,13 +2937,13 @@ class EmptyCartRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  EmptyCartRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<EmptyCartRequest>(arena);
+  GetCartRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<GetCartRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const EmptyCartRequest& from);
+  void CopyFrom(const GetCartRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const EmptyCartRequest& from) { EmptyCartRequest::MergeImpl(*this, from); }
+  void MergeFrom(const GetCartRequest& from) { GetCartRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -2903,18 +2979,18 @@ class EmptyCartRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(EmptyCartRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(GetCartRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.EmptyCartRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.GetCartRequest"; }
 
  protected:
-  explicit EmptyCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  EmptyCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const EmptyCartRequest& from);
-  EmptyCartRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, EmptyCartRequest&& from) noexcept
-      : EmptyCartRequest(arena) {
+  explicit GetCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  GetCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetCartRequest& from);
+  GetCartRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetCartRequest&& from) noexcept
+      : GetCartRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -2948,12 +3024,12 @@ class EmptyCartRequest final : public ::google::protobuf::Message
   ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.EmptyCartRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetCartRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 41,
+                                   0, 39,
                                    2>
       _table_;
 
@@ -2971,7 +3047,7 @@ class EmptyCartRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const EmptyCartRequest& from_msg);
+        const GetCartRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
     ::google::protobuf::internal::ArenaStringPtr user_id_;
@@ -2981,32 +3057,33 @@ class EmptyCartRequest final : public ::google::protobuf::Message
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull EmptyCartRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull GetCartRequest_class_data_;
 // -------------------------------------------------------------------
 
-class Empty final : public ::google::protobuf::internal::ZeroFieldsBase
-/* @@protoc_insertion_point(class_definition:oteldemo.Empty) */ {
+class Flag final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.Flag) */ {
  public:
-  inline Empty() : Empty(nullptr) {}
+  inline Flag() : Flag(nullptr) {}
+  ~Flag() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(Empty* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(Flag* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(Empty));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(Flag));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Empty(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Flag(::google::protobuf::internal::ConstantInitialized);
 
-  inline Empty(const Empty& from) : Empty(nullptr, from) {}
-  inline Empty(Empty&& from) noexcept
-      : Empty(nullptr, ::std::move(from)) {}
-  inline Empty& operator=(const Empty& from) {
-    CopyFrom(from);
-    return *this;
+  inline Flag(const Flag& from) : Flag(nullptr, from) {}
+  inline Flag(Flag&& from) noexcept
+      : Flag(nullptr, ::std::move(from)) {}
+  inline Flag& operator=(const Flag& from) {
+    CopyFrom(from);
+    return *this;
   }
-  inline Empty& operator=(Empty&& from) noexcept {
+  inline Flag& operator=(Flag&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -3034,13 +3111,13 @@ class Empty final : public ::google::protobuf::internal::ZeroFieldsBase
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Empty& default_instance() {
-    return *reinterpret_cast<const Empty*>(
-        &_Empty_default_instance_);
+  static const Flag& default_instance() {
+    return *reinterpret_cast<const Flag*>(
+        &_Flag_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 5;
-  friend void swap(Empty& a, Empty& b) { a.Swap(&b); }
-  inline void Swap(Empty* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 36;
+  friend void swap(Flag& a, Flag& b) { a.Swap(&b); }
+  inline void Swap(Flag* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -3048,7 +3125,7 @@ class Empty final : public ::google::protobuf::internal::ZeroFieldsBase
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Empty* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(Flag* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -3056,33 +3133,60 @@ class Empty final : public ::google::protobuf::internal::ZeroFieldsBase
 
   // implements Message ----------------------------------------------
 
-  Empty* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::internal::ZeroFieldsBase::DefaultConstruct<Empty>(arena);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
-  inline void CopyFrom(const Empty& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
-  void MergeFrom(const Empty& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  Flag* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<Flag>(arena);
   }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const Flag& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const Flag& from) { Flag::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
+                        const ::google::protobuf::MessageLite& from_msg);
 
   public:
   bool IsInitialized() const {
     return true;
   }
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
+  #if defined(PROTOBUF_CUSTOM_VTABLE)
+  private:
+  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
+  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
+
+  public:
+  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+    return _InternalSerialize(*this, target, stream);
+  }
+  #else   // PROTOBUF_CUSTOM_VTABLE
+  ::size_t ByteSizeLong() const final;
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
+  #endif  // PROTOBUF_CUSTOM_VTABLE
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static void SharedDtor(MessageLite& self);
+  void InternalSwap(Flag* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.Empty"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.Flag"; }
 
  protected:
-  explicit Empty(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  Empty(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Empty& from);
-  Empty(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Empty&& from) noexcept
-      : Empty(arena) {
+  explicit Flag(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  Flag(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Flag& from);
+  Flag(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Flag&& from) noexcept
+      : Flag(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -3098,12 +3202,57 @@ class Empty final : public ::google::protobuf::internal::ZeroFieldsBase
   // nested types ----------------------------------------------------
 
   // accessors -------------------------------------------------------
-  // @@protoc_insertion_point(class_scope:oteldemo.Empty)
+  enum : int {
+    kNameFieldNumber = 1,
+    kDescriptionFieldNumber = 2,
+    kEnabledFieldNumber = 3,
+  };
+  // string name = 1;
+  void clear_name() ;
+  const ::std::string& name() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_name(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_name();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_name();
+  void set_allocated_name(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_name() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_name(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
+
+  public:
+  // string description = 2;
+  void clear_description() ;
+  const ::std::string& description() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_description(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_description();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_description();
+  void set_allocated_description(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_description() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_description(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_description();
+
+  public:
+  // bool enabled = 3;
+  void clear_enabled() ;
+  bool enabled() const;
+  void set_enabled(bool value);
+
+  private:
+  bool _internal_enabled() const;
+  void _internal_set_enabled(bool value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.Flag)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 0,
-                                   0, 0,
+  static const ::google::protobuf::internal::TcParseTable<2, 3,
+                                   0, 37,
                                    2>
       _table_;
 
@@ -3121,38 +3270,45 @@ class Empty final : public ::google::protobuf::internal::ZeroFieldsBase
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const Empty& from_msg);
+        const Flag& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    ::google::protobuf::internal::ArenaStringPtr description_;
+    bool enabled_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
+  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull Empty_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull Flag_class_data_;
 // -------------------------------------------------------------------
 
-class DeleteFlagResponse final : public ::google::protobuf::internal::ZeroFieldsBase
-/* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagResponse) */ {
+class EmptyCartRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.EmptyCartRequest) */ {
  public:
-  inline DeleteFlagResponse() : DeleteFlagResponse(nullptr) {}
+  inline EmptyCartRequest() : EmptyCartRequest(nullptr) {}
+  ~EmptyCartRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(DeleteFlagResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(EmptyCartRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(DeleteFlagResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(EmptyCartRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR DeleteFlagResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR EmptyCartRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline DeleteFlagResponse(const DeleteFlagResponse& from) : DeleteFlagResponse(nullptr, from) {}
-  inline DeleteFlagResponse(DeleteFlagResponse&& from) noexcept
-      : DeleteFlagResponse(nullptr, ::std::move(from)) {}
-  inline DeleteFlagResponse& operator=(const DeleteFlagResponse& from) {
+  inline EmptyCartRequest(const EmptyCartRequest& from) : EmptyCartRequest(nullptr, from) {}
+  inline EmptyCartRequest(EmptyCartRequest&& from) noexcept
+      : EmptyCartRequest(nullptr, ::std::move(from)) {}
+  inline EmptyCartRequest& operator=(const EmptyCartRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DeleteFlagResponse& operator=(DeleteFlagResponse&& from) noexcept {
+  inline EmptyCartRequest& operator=(EmptyCartRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -3180,13 +3336,13 @@ class DeleteFlagResponse final : public ::google::protobuf::internal::ZeroFields
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const DeleteFlagResponse& default_instance() {
-    return *reinterpret_cast<const DeleteFlagResponse*>(
-        &_DeleteFlagResponse_default_instance_);
+  static const EmptyCartRequest& default_instance() {
+    return *reinterpret_cast<const EmptyCartRequest*>(
+        &_EmptyCartRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 42;
-  friend void swap(DeleteFlagResponse& a, DeleteFlagResponse& b) { a.Swap(&b); }
-  inline void Swap(DeleteFlagResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 2;
+  friend void swap(EmptyCartRequest& a, EmptyCartRequest& b) { a.Swap(&b); }
+  inline void Swap(EmptyCartRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -3194,7 +3350,7 @@ class DeleteFlagResponse final : public ::google::protobuf::internal::ZeroFields
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(DeleteFlagResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(EmptyCartRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -3202,33 +3358,60 @@ class DeleteFlagResponse final : public ::google::protobuf::internal::ZeroFields
 
   // implements Message ----------------------------------------------
 
-  DeleteFlagResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::internal::ZeroFieldsBase::DefaultConstruct<DeleteFlagResponse>(arena);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
-  inline void CopyFrom(const DeleteFlagResponse& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
-  void MergeFrom(const DeleteFlagResponse& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  EmptyCartRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<EmptyCartRequest>(arena);
   }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const EmptyCartRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const EmptyCartRequest& from) { EmptyCartRequest::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
+                        const ::google::protobuf::MessageLite& from_msg);
 
   public:
   bool IsInitialized() const {
     return true;
   }
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
+  #if defined(PROTOBUF_CUSTOM_VTABLE)
+  private:
+  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
+  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
+
+  public:
+  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+    return _InternalSerialize(*this, target, stream);
+  }
+  #else   // PROTOBUF_CUSTOM_VTABLE
+  ::size_t ByteSizeLong() const final;
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
+  #endif  // PROTOBUF_CUSTOM_VTABLE
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static void SharedDtor(MessageLite& self);
+  void InternalSwap(EmptyCartRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.DeleteFlagResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.EmptyCartRequest"; }
 
  protected:
-  explicit DeleteFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  DeleteFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const DeleteFlagResponse& from);
-  DeleteFlagResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, DeleteFlagResponse&& from) noexcept
-      : DeleteFlagResponse(arena) {
+  explicit EmptyCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  EmptyCartRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const EmptyCartRequest& from);
+  EmptyCartRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, EmptyCartRequest&& from) noexcept
+      : EmptyCartRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -3244,62 +3427,83 @@ class DeleteFlagResponse final : public ::google::protobuf::internal::ZeroFields
   // nested types ----------------------------------------------------
 
   // accessors -------------------------------------------------------
-  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagResponse)
- private:
-  class _Internal;
-  friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 0,
-                                   0, 0,
-                                   2>
-      _table_;
-
-  friend class ::google::protobuf::MessageLite;
-  friend class ::google::protobuf::Arena;
-  template <typename T>
-  friend class ::google::protobuf::Arena::InternalHelper;
-  using InternalArenaConstructable_ = void;
-  using DestructorSkippable_ = void;
-  struct Impl_ {
-    inline explicit constexpr Impl_(::google::protobuf::internal::ConstantInitialized) noexcept;
-    inline explicit Impl_(
+  enum : int {
+    kUserIdFieldNumber = 1,
+  };
+  // string user_id = 1;
+  void clear_user_id() ;
+  const ::std::string& user_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_user_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_user_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
+  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_user_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.EmptyCartRequest)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   0, 41,
+                                   2>
+      _table_;
+
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const DeleteFlagResponse& from_msg);
+        const EmptyCartRequest& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr user_id_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
+  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull DeleteFlagResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull EmptyCartRequest_class_data_;
 // -------------------------------------------------------------------
 
-class DeleteFlagRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagRequest) */ {
+class Empty final : public ::google::protobuf::internal::ZeroFieldsBase
+/* @@protoc_insertion_point(class_definition:oteldemo.Empty) */ {
  public:
-  inline DeleteFlagRequest() : DeleteFlagRequest(nullptr) {}
-  ~DeleteFlagRequest() PROTOBUF_FINAL;
+  inline Empty() : Empty(nullptr) {}
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(DeleteFlagRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(Empty* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(DeleteFlagRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(Empty));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR DeleteFlagRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Empty(::google::protobuf::internal::ConstantInitialized);
 
-  inline DeleteFlagRequest(const DeleteFlagRequest& from) : DeleteFlagRequest(nullptr, from) {}
-  inline DeleteFlagRequest(DeleteFlagRequest&& from) noexcept
-      : DeleteFlagRequest(nullptr, ::std::move(from)) {}
-  inline DeleteFlagRequest& operator=(const DeleteFlagRequest& from) {
+  inline Empty(const Empty& from) : Empty(nullptr, from) {}
+  inline Empty(Empty&& from) noexcept
+      : Empty(nullptr, ::std::move(from)) {}
+  inline Empty& operator=(const Empty& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DeleteFlagRequest& operator=(DeleteFlagRequest&& from) noexcept {
+  inline Empty& operator=(Empty&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -3327,13 +3531,13 @@ class DeleteFlagRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const DeleteFlagRequest& default_instance() {
-    return *reinterpret_cast<const DeleteFlagRequest*>(
-        &_DeleteFlagRequest_default_instance_);
+  static const Empty& default_instance() {
+    return *reinterpret_cast<const Empty*>(
+        &_Empty_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 41;
-  friend void swap(DeleteFlagRequest& a, DeleteFlagRequest& b) { a.Swap(&b); }
-  inline void Swap(DeleteFlagRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 5;
+  friend void swap(Empty& a, Empty& b) { a.Swap(&b); }
+  inline void Swap(Empty* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -3341,7 +3545,7 @@ class DeleteFlagRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(DeleteFlagRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(Empty* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -3349,60 +3553,33 @@ class DeleteFlagRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  DeleteFlagRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<DeleteFlagRequest>(arena);
+  Empty* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::internal::ZeroFieldsBase::DefaultConstruct<Empty>(arena);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
+  inline void CopyFrom(const Empty& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
+  void MergeFrom(const Empty& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
   }
-  using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const DeleteFlagRequest& from);
-  using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const DeleteFlagRequest& from) { DeleteFlagRequest::MergeImpl(*this, from); }
-
-  private:
-  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
-                        const ::google::protobuf::MessageLite& from_msg);
 
   public:
   bool IsInitialized() const {
     return true;
   }
-  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
-  #if defined(PROTOBUF_CUSTOM_VTABLE)
-  private:
-  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
-  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
-
-  public:
-  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
-  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
-    return _InternalSerialize(*this, target, stream);
-  }
-  #else   // PROTOBUF_CUSTOM_VTABLE
-  ::size_t ByteSizeLong() const final;
-  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
-  #endif  // PROTOBUF_CUSTOM_VTABLE
-  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
-
-  private:
-  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  static void SharedDtor(MessageLite& self);
-  void InternalSwap(DeleteFlagRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.DeleteFlagRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.Empty"; }
 
  protected:
-  explicit DeleteFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  DeleteFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const DeleteFlagRequest& from);
-  DeleteFlagRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, DeleteFlagRequest&& from) noexcept
-      : DeleteFlagRequest(arena) {
+  explicit Empty(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  Empty(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Empty& from);
+  Empty(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Empty&& from) noexcept
+      : Empty(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -3418,30 +3595,12 @@ class DeleteFlagRequest final : public ::google::protobuf::Message
   // nested types ----------------------------------------------------
 
   // accessors -------------------------------------------------------
-  enum : int {
-    kNameFieldNumber = 1,
-  };
-  // string name = 1;
-  void clear_name() ;
-  const ::std::string& name() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_name();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_name();
-  void set_allocated_name(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_name() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_name(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.Empty)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 39,
+  static const ::google::protobuf::internal::TcParseTable<0, 0,
+                                   0, 0,
                                    2>
       _table_;
 
@@ -3459,43 +3618,38 @@ class DeleteFlagRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const DeleteFlagRequest& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
-    ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr name_;
+        const Empty& from_msg);
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
-  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull DeleteFlagRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull Empty_class_data_;
 // -------------------------------------------------------------------
 
-class CreditCardInfo final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.CreditCardInfo) */ {
+class DeleteFlagResponse final : public ::google::protobuf::internal::ZeroFieldsBase
+/* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagResponse) */ {
  public:
-  inline CreditCardInfo() : CreditCardInfo(nullptr) {}
-  ~CreditCardInfo() PROTOBUF_FINAL;
+  inline DeleteFlagResponse() : DeleteFlagResponse(nullptr) {}
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(CreditCardInfo* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(DeleteFlagResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(CreditCardInfo));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(DeleteFlagResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR CreditCardInfo(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR DeleteFlagResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline CreditCardInfo(const CreditCardInfo& from) : CreditCardInfo(nullptr, from) {}
-  inline CreditCardInfo(CreditCardInfo&& from) noexcept
-      : CreditCardInfo(nullptr, ::std::move(from)) {}
-  inline CreditCardInfo& operator=(const CreditCardInfo& from) {
+  inline DeleteFlagResponse(const DeleteFlagResponse& from) : DeleteFlagResponse(nullptr, from) {}
+  inline DeleteFlagResponse(DeleteFlagResponse&& from) noexcept
+      : DeleteFlagResponse(nullptr, ::std::move(from)) {}
+  inline DeleteFlagResponse& operator=(const DeleteFlagResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CreditCardInfo& operator=(CreditCardInfo&& from) noexcept {
+  inline DeleteFlagResponse& operator=(DeleteFlagResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -3523,13 +3677,13 @@ class CreditCardInfo final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CreditCardInfo& default_instance() {
-    return *reinterpret_cast<const CreditCardInfo*>(
-        &_CreditCardInfo_default_instance_);
+  static const DeleteFlagResponse& default_instance() {
+    return *reinterpret_cast<const DeleteFlagResponse*>(
+        &_DeleteFlagResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 21;
-  friend void swap(CreditCardInfo& a, CreditCardInfo& b) { a.Swap(&b); }
-  inline void Swap(CreditCardInfo* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 46;
+  friend void swap(DeleteFlagResponse& a, DeleteFlagResponse& b) { a.Swap(&b); }
+  inline void Swap(DeleteFlagResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -3537,7 +3691,7 @@ class CreditCardInfo final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CreditCardInfo* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(DeleteFlagResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -3545,60 +3699,33 @@ class CreditCardInfo final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  CreditCardInfo* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<CreditCardInfo>(arena);
+  DeleteFlagResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::internal::ZeroFieldsBase::DefaultConstruct<DeleteFlagResponse>(arena);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
+  inline void CopyFrom(const DeleteFlagResponse& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
+  void MergeFrom(const DeleteFlagResponse& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
   }
-  using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CreditCardInfo& from);
-  using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const CreditCardInfo& from) { CreditCardInfo::MergeImpl(*this, from); }
-
-  private:
-  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
-                        const ::google::protobuf::MessageLite& from_msg);
 
   public:
   bool IsInitialized() const {
     return true;
   }
-  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
-  #if defined(PROTOBUF_CUSTOM_VTABLE)
-  private:
-  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
-  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
-
-  public:
-  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
-  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
-    return _InternalSerialize(*this, target, stream);
-  }
-  #else   // PROTOBUF_CUSTOM_VTABLE
-  ::size_t ByteSizeLong() const final;
-  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
-      ::uint8_t* PROTOBUF_NONNULL target,
-      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
-  #endif  // PROTOBUF_CUSTOM_VTABLE
-  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
-
-  private:
-  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  static void SharedDtor(MessageLite& self);
-  void InternalSwap(CreditCardInfo* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.CreditCardInfo"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.DeleteFlagResponse"; }
 
  protected:
-  explicit CreditCardInfo(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  CreditCardInfo(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CreditCardInfo& from);
-  CreditCardInfo(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CreditCardInfo&& from) noexcept
-      : CreditCardInfo(arena) {
+  explicit DeleteFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  DeleteFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const DeleteFlagResponse& from);
+  DeleteFlagResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, DeleteFlagResponse&& from) noexcept
+      : DeleteFlagResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -3614,63 +3741,12 @@ class CreditCardInfo final : public ::google::protobuf::Message
   // nested types ----------------------------------------------------
 
   // accessors -------------------------------------------------------
-  enum : int {
-    kCreditCardNumberFieldNumber = 1,
-    kCreditCardCvvFieldNumber = 2,
-    kCreditCardExpirationYearFieldNumber = 3,
-    kCreditCardExpirationMonthFieldNumber = 4,
-  };
-  // string credit_card_number = 1;
-  void clear_credit_card_number() ;
-  const ::std::string& credit_card_number() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_credit_card_number(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_credit_card_number();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_credit_card_number();
-  void set_allocated_credit_card_number(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_credit_card_number() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_credit_card_number(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_credit_card_number();
-
-  public:
-  // int32 credit_card_cvv = 2;
-  void clear_credit_card_cvv() ;
-  ::int32_t credit_card_cvv() const;
-  void set_credit_card_cvv(::int32_t value);
-
-  private:
-  ::int32_t _internal_credit_card_cvv() const;
-  void _internal_set_credit_card_cvv(::int32_t value);
-
-  public:
-  // int32 credit_card_expiration_year = 3;
-  void clear_credit_card_expiration_year() ;
-  ::int32_t credit_card_expiration_year() const;
-  void set_credit_card_expiration_year(::int32_t value);
-
-  private:
-  ::int32_t _internal_credit_card_expiration_year() const;
-  void _internal_set_credit_card_expiration_year(::int32_t value);
-
-  public:
-  // int32 credit_card_expiration_month = 4;
-  void clear_credit_card_expiration_month() ;
-  ::int32_t credit_card_expiration_month() const;
-  void set_credit_card_expiration_month(::int32_t value);
-
-  private:
-  ::int32_t _internal_credit_card_expiration_month() const;
-  void _internal_set_credit_card_expiration_month(::int32_t value);
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CreditCardInfo)
+  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 4,
-                                   0, 50,
+  static const ::google::protobuf::internal::TcParseTable<0, 0,
+                                   0, 0,
                                    2>
       _table_;
 
@@ -3688,46 +3764,39 @@ class CreditCardInfo final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const CreditCardInfo& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
-    ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr credit_card_number_;
-    ::int32_t credit_card_cvv_;
-    ::int32_t credit_card_expiration_year_;
-    ::int32_t credit_card_expiration_month_;
+        const DeleteFlagResponse& from_msg);
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
-  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull CreditCardInfo_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull DeleteFlagResponse_class_data_;
 // -------------------------------------------------------------------
 
-class CreateFlagRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagRequest) */ {
+class DeleteFlagRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagRequest) */ {
  public:
-  inline CreateFlagRequest() : CreateFlagRequest(nullptr) {}
-  ~CreateFlagRequest() PROTOBUF_FINAL;
+  inline DeleteFlagRequest() : DeleteFlagRequest(nullptr) {}
+  ~DeleteFlagRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(CreateFlagRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(DeleteFlagRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(CreateFlagRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(DeleteFlagRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR CreateFlagRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR DeleteFlagRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline CreateFlagRequest(const CreateFlagRequest& from) : CreateFlagRequest(nullptr, from) {}
-  inline CreateFlagRequest(CreateFlagRequest&& from) noexcept
-      : CreateFlagRequest(nullptr, ::std::move(from)) {}
-  inline CreateFlagRequest& operator=(const CreateFlagRequest& from) {
+  inline DeleteFlagRequest(const DeleteFlagRequest& from) : DeleteFlagRequest(nullptr, from) {}
+  inline DeleteFlagRequest(DeleteFlagRequest&& from) noexcept
+      : DeleteFlagRequest(nullptr, ::std::move(from)) {}
+  inline DeleteFlagRequest& operator=(const DeleteFlagRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CreateFlagRequest& operator=(CreateFlagRequest&& from) noexcept {
+  inline DeleteFlagRequest& operator=(DeleteFlagRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -3755,13 +3824,13 @@ class CreateFlagRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CreateFlagRequest& default_instance() {
-    return *reinterpret_cast<const CreateFlagRequest*>(
-        &_CreateFlagRequest_default_instance_);
+  static const DeleteFlagRequest& default_instance() {
+    return *reinterpret_cast<const DeleteFlagRequest*>(
+        &_DeleteFlagRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 35;
-  friend void swap(CreateFlagRequest& a, CreateFlagRequest& b) { a.Swap(&b); }
-  inline void Swap(CreateFlagRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 45;
+  friend void swap(DeleteFlagRequest& a, DeleteFlagRequest& b) { a.Swap(&b); }
+  inline void Swap(DeleteFlagRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -3769,7 +3838,7 @@ class CreateFlagRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CreateFlagRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(DeleteFlagRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -3777,13 +3846,13 @@ class CreateFlagRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  CreateFlagRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<CreateFlagRequest>(arena);
+  DeleteFlagRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<DeleteFlagRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CreateFlagRequest& from);
+  void CopyFrom(const DeleteFlagRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const CreateFlagRequest& from) { CreateFlagRequest::MergeImpl(*this, from); }
+  void MergeFrom(const DeleteFlagRequest& from) { DeleteFlagRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -3819,18 +3888,18 @@ class CreateFlagRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(CreateFlagRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(DeleteFlagRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.CreateFlagRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.DeleteFlagRequest"; }
 
  protected:
-  explicit CreateFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  CreateFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CreateFlagRequest& from);
-  CreateFlagRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CreateFlagRequest&& from) noexcept
-      : CreateFlagRequest(arena) {
+  explicit DeleteFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  DeleteFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const DeleteFlagRequest& from);
+  DeleteFlagRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, DeleteFlagRequest&& from) noexcept
+      : DeleteFlagRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -3848,8 +3917,6 @@ class CreateFlagRequest final : public ::google::protobuf::Message
   // accessors -------------------------------------------------------
   enum : int {
     kNameFieldNumber = 1,
-    kDescriptionFieldNumber = 2,
-    kEnabledFieldNumber = 3,
   };
   // string name = 1;
   void clear_name() ;
@@ -3866,37 +3933,12 @@ class CreateFlagRequest final : public ::google::protobuf::Message
   ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
 
   public:
-  // string description = 2;
-  void clear_description() ;
-  const ::std::string& description() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_description(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_description();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_description();
-  void set_allocated_description(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_description() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_description(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_description();
-
-  public:
-  // bool enabled = 3;
-  void clear_enabled() ;
-  bool enabled() const;
-  void set_enabled(bool value);
-
-  private:
-  bool _internal_enabled() const;
-  void _internal_set_enabled(bool value);
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 3,
-                                   0, 50,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   0, 39,
                                    2>
       _table_;
 
@@ -3914,45 +3956,43 @@ class CreateFlagRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const CreateFlagRequest& from_msg);
+        const DeleteFlagRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
     ::google::protobuf::internal::ArenaStringPtr name_;
-    ::google::protobuf::internal::ArenaStringPtr description_;
-    bool enabled_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull CreateFlagRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull DeleteFlagRequest_class_data_;
 // -------------------------------------------------------------------
 
-class ChargeResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ChargeResponse) */ {
+class CreditCardInfo final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.CreditCardInfo) */ {
  public:
-  inline ChargeResponse() : ChargeResponse(nullptr) {}
-  ~ChargeResponse() PROTOBUF_FINAL;
+  inline CreditCardInfo() : CreditCardInfo(nullptr) {}
+  ~CreditCardInfo() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ChargeResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(CreditCardInfo* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ChargeResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(CreditCardInfo));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ChargeResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR CreditCardInfo(::google::protobuf::internal::ConstantInitialized);
 
-  inline ChargeResponse(const ChargeResponse& from) : ChargeResponse(nullptr, from) {}
-  inline ChargeResponse(ChargeResponse&& from) noexcept
-      : ChargeResponse(nullptr, ::std::move(from)) {}
-  inline ChargeResponse& operator=(const ChargeResponse& from) {
+  inline CreditCardInfo(const CreditCardInfo& from) : CreditCardInfo(nullptr, from) {}
+  inline CreditCardInfo(CreditCardInfo&& from) noexcept
+      : CreditCardInfo(nullptr, ::std::move(from)) {}
+  inline CreditCardInfo& operator=(const CreditCardInfo& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ChargeResponse& operator=(ChargeResponse&& from) noexcept {
+  inline CreditCardInfo& operator=(CreditCardInfo&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -3980,13 +4020,13 @@ class ChargeResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ChargeResponse& default_instance() {
-    return *reinterpret_cast<const ChargeResponse*>(
-        &_ChargeResponse_default_instance_);
+  static const CreditCardInfo& default_instance() {
+    return *reinterpret_cast<const CreditCardInfo*>(
+        &_CreditCardInfo_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 23;
-  friend void swap(ChargeResponse& a, ChargeResponse& b) { a.Swap(&b); }
-  inline void Swap(ChargeResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 25;
+  friend void swap(CreditCardInfo& a, CreditCardInfo& b) { a.Swap(&b); }
+  inline void Swap(CreditCardInfo* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -3994,7 +4034,7 @@ class ChargeResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ChargeResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(CreditCardInfo* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -4002,13 +4042,13 @@ class ChargeResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ChargeResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ChargeResponse>(arena);
+  CreditCardInfo* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<CreditCardInfo>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ChargeResponse& from);
+  void CopyFrom(const CreditCardInfo& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ChargeResponse& from) { ChargeResponse::MergeImpl(*this, from); }
+  void MergeFrom(const CreditCardInfo& from) { CreditCardInfo::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -4044,18 +4084,18 @@ class ChargeResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ChargeResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(CreditCardInfo* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ChargeResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.CreditCardInfo"; }
 
  protected:
-  explicit ChargeResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ChargeResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ChargeResponse& from);
-  ChargeResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ChargeResponse&& from) noexcept
-      : ChargeResponse(arena) {
+  explicit CreditCardInfo(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  CreditCardInfo(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CreditCardInfo& from);
+  CreditCardInfo(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CreditCardInfo&& from) noexcept
+      : CreditCardInfo(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -4072,29 +4112,62 @@ class ChargeResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kTransactionIdFieldNumber = 1,
+    kCreditCardNumberFieldNumber = 1,
+    kCreditCardCvvFieldNumber = 2,
+    kCreditCardExpirationYearFieldNumber = 3,
+    kCreditCardExpirationMonthFieldNumber = 4,
   };
-  // string transaction_id = 1;
-  void clear_transaction_id() ;
-  const ::std::string& transaction_id() const;
+  // string credit_card_number = 1;
+  void clear_credit_card_number() ;
+  const ::std::string& credit_card_number() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_transaction_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_transaction_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_transaction_id();
-  void set_allocated_transaction_id(::std::string* PROTOBUF_NULLABLE value);
+  void set_credit_card_number(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_credit_card_number();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_credit_card_number();
+  void set_allocated_credit_card_number(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_transaction_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_transaction_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_transaction_id();
+  const ::std::string& _internal_credit_card_number() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_credit_card_number(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_credit_card_number();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ChargeResponse)
+  // int32 credit_card_cvv = 2;
+  void clear_credit_card_cvv() ;
+  ::int32_t credit_card_cvv() const;
+  void set_credit_card_cvv(::int32_t value);
+
+  private:
+  ::int32_t _internal_credit_card_cvv() const;
+  void _internal_set_credit_card_cvv(::int32_t value);
+
+  public:
+  // int32 credit_card_expiration_year = 3;
+  void clear_credit_card_expiration_year() ;
+  ::int32_t credit_card_expiration_year() const;
+  void set_credit_card_expiration_year(::int32_t value);
+
+  private:
+  ::int32_t _internal_credit_card_expiration_year() const;
+  void _internal_set_credit_card_expiration_year(::int32_t value);
+
+  public:
+  // int32 credit_card_expiration_month = 4;
+  void clear_credit_card_expiration_month() ;
+  ::int32_t credit_card_expiration_month() const;
+  void set_credit_card_expiration_month(::int32_t value);
+
+  private:
+  ::int32_t _internal_credit_card_expiration_month() const;
+  void _internal_set_credit_card_expiration_month(::int32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.CreditCardInfo)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 46,
+  static const ::google::protobuf::internal::TcParseTable<2, 4,
+                                   0, 50,
                                    2>
       _table_;
 
@@ -4112,43 +4185,46 @@ class ChargeResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ChargeResponse& from_msg);
+        const CreditCardInfo& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr transaction_id_;
+    ::google::protobuf::internal::ArenaStringPtr credit_card_number_;
+    ::int32_t credit_card_cvv_;
+    ::int32_t credit_card_expiration_year_;
+    ::int32_t credit_card_expiration_month_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ChargeResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull CreditCardInfo_class_data_;
 // -------------------------------------------------------------------
 
-class CartItem final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.CartItem) */ {
+class CreateFlagRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagRequest) */ {
  public:
-  inline CartItem() : CartItem(nullptr) {}
-  ~CartItem() PROTOBUF_FINAL;
+  inline CreateFlagRequest() : CreateFlagRequest(nullptr) {}
+  ~CreateFlagRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(CartItem* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(CreateFlagRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(CartItem));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(CreateFlagRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR CartItem(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR CreateFlagRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline CartItem(const CartItem& from) : CartItem(nullptr, from) {}
-  inline CartItem(CartItem&& from) noexcept
-      : CartItem(nullptr, ::std::move(from)) {}
-  inline CartItem& operator=(const CartItem& from) {
+  inline CreateFlagRequest(const CreateFlagRequest& from) : CreateFlagRequest(nullptr, from) {}
+  inline CreateFlagRequest(CreateFlagRequest&& from) noexcept
+      : CreateFlagRequest(nullptr, ::std::move(from)) {}
+  inline CreateFlagRequest& operator=(const CreateFlagRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CartItem& operator=(CartItem&& from) noexcept {
+  inline CreateFlagRequest& operator=(CreateFlagRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -4176,13 +4252,13 @@ class CartItem final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CartItem& default_instance() {
-    return *reinterpret_cast<const CartItem*>(
-        &_CartItem_default_instance_);
+  static const CreateFlagRequest& default_instance() {
+    return *reinterpret_cast<const CreateFlagRequest*>(
+        &_CreateFlagRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 0;
-  friend void swap(CartItem& a, CartItem& b) { a.Swap(&b); }
-  inline void Swap(CartItem* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 39;
+  friend void swap(CreateFlagRequest& a, CreateFlagRequest& b) { a.Swap(&b); }
+  inline void Swap(CreateFlagRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -4190,7 +4266,7 @@ class CartItem final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CartItem* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(CreateFlagRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -4198,13 +4274,13 @@ class CartItem final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  CartItem* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<CartItem>(arena);
+  CreateFlagRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<CreateFlagRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CartItem& from);
+  void CopyFrom(const CreateFlagRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const CartItem& from) { CartItem::MergeImpl(*this, from); }
+  void MergeFrom(const CreateFlagRequest& from) { CreateFlagRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -4240,18 +4316,18 @@ class CartItem final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(CartItem* PROTOBUF_NONNULL other);
+  void InternalSwap(CreateFlagRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.CartItem"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.CreateFlagRequest"; }
 
  protected:
-  explicit CartItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  CartItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CartItem& from);
-  CartItem(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CartItem&& from) noexcept
-      : CartItem(arena) {
+  explicit CreateFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  CreateFlagRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CreateFlagRequest& from);
+  CreateFlagRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CreateFlagRequest&& from) noexcept
+      : CreateFlagRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -4268,40 +4344,56 @@ class CartItem final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kProductIdFieldNumber = 1,
-    kQuantityFieldNumber = 2,
+    kNameFieldNumber = 1,
+    kDescriptionFieldNumber = 2,
+    kEnabledFieldNumber = 3,
   };
-  // string product_id = 1;
-  void clear_product_id() ;
-  const ::std::string& product_id() const;
+  // string name = 1;
+  void clear_name() ;
+  const ::std::string& name() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_product_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_product_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_product_id();
-  void set_allocated_product_id(::std::string* PROTOBUF_NULLABLE value);
+  void set_name(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_name();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_name();
+  void set_allocated_name(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_product_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_product_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_product_id();
+  const ::std::string& _internal_name() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_name(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
 
   public:
-  // int32 quantity = 2;
-  void clear_quantity() ;
-  ::int32_t quantity() const;
-  void set_quantity(::int32_t value);
+  // string description = 2;
+  void clear_description() ;
+  const ::std::string& description() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_description(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_description();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_description();
+  void set_allocated_description(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  ::int32_t _internal_quantity() const;
-  void _internal_set_quantity(::int32_t value);
+  const ::std::string& _internal_description() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_description(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_description();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CartItem)
+  // bool enabled = 3;
+  void clear_enabled() ;
+  bool enabled() const;
+  void set_enabled(bool value);
+
+  private:
+  bool _internal_enabled() const;
+  void _internal_set_enabled(bool value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   0, 36,
+  static const ::google::protobuf::internal::TcParseTable<2, 3,
+                                   0, 50,
                                    2>
       _table_;
 
@@ -4319,44 +4411,45 @@ class CartItem final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const CartItem& from_msg);
+        const CreateFlagRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr product_id_;
-    ::int32_t quantity_;
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    ::google::protobuf::internal::ArenaStringPtr description_;
+    bool enabled_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull CartItem_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull CreateFlagRequest_class_data_;
 // -------------------------------------------------------------------
 
-class Address final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.Address) */ {
+class ChargeResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ChargeResponse) */ {
  public:
-  inline Address() : Address(nullptr) {}
-  ~Address() PROTOBUF_FINAL;
+  inline ChargeResponse() : ChargeResponse(nullptr) {}
+  ~ChargeResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(Address* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ChargeResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(Address));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ChargeResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Address(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ChargeResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline Address(const Address& from) : Address(nullptr, from) {}
-  inline Address(Address&& from) noexcept
-      : Address(nullptr, ::std::move(from)) {}
-  inline Address& operator=(const Address& from) {
+  inline ChargeResponse(const ChargeResponse& from) : ChargeResponse(nullptr, from) {}
+  inline ChargeResponse(ChargeResponse&& from) noexcept
+      : ChargeResponse(nullptr, ::std::move(from)) {}
+  inline ChargeResponse& operator=(const ChargeResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Address& operator=(Address&& from) noexcept {
+  inline ChargeResponse& operator=(ChargeResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -4384,13 +4477,13 @@ class Address final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Address& default_instance() {
-    return *reinterpret_cast<const Address*>(
-        &_Address_default_instance_);
+  static const ChargeResponse& default_instance() {
+    return *reinterpret_cast<const ChargeResponse*>(
+        &_ChargeResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 17;
-  friend void swap(Address& a, Address& b) { a.Swap(&b); }
-  inline void Swap(Address* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 27;
+  friend void swap(ChargeResponse& a, ChargeResponse& b) { a.Swap(&b); }
+  inline void Swap(ChargeResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -4398,7 +4491,7 @@ class Address final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Address* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ChargeResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -4406,13 +4499,13 @@ class Address final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Address* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<Address>(arena);
+  ChargeResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ChargeResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Address& from);
+  void CopyFrom(const ChargeResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Address& from) { Address::MergeImpl(*this, from); }
+  void MergeFrom(const ChargeResponse& from) { ChargeResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -4448,18 +4541,18 @@ class Address final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(Address* PROTOBUF_NONNULL other);
+  void InternalSwap(ChargeResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.Address"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ChargeResponse"; }
 
  protected:
-  explicit Address(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  Address(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Address& from);
-  Address(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Address&& from) noexcept
-      : Address(arena) {
+  explicit ChargeResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ChargeResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ChargeResponse& from);
+  ChargeResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ChargeResponse&& from) noexcept
+      : ChargeResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -4476,93 +4569,29 @@ class Address final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kStreetAddressFieldNumber = 1,
-    kCityFieldNumber = 2,
-    kStateFieldNumber = 3,
-    kCountryFieldNumber = 4,
-    kZipCodeFieldNumber = 5,
+    kTransactionIdFieldNumber = 1,
   };
-  // string street_address = 1;
-  void clear_street_address() ;
-  const ::std::string& street_address() const;
+  // string transaction_id = 1;
+  void clear_transaction_id() ;
+  const ::std::string& transaction_id() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_street_address(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_street_address();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_street_address();
-  void set_allocated_street_address(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_street_address() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_street_address(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_street_address();
-
-  public:
-  // string city = 2;
-  void clear_city() ;
-  const ::std::string& city() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_city(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_city();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_city();
-  void set_allocated_city(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_city() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_city(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_city();
-
-  public:
-  // string state = 3;
-  void clear_state() ;
-  const ::std::string& state() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_state(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_state();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_state();
-  void set_allocated_state(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_state() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_state(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_state();
-
-  public:
-  // string country = 4;
-  void clear_country() ;
-  const ::std::string& country() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_country(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_country();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_country();
-  void set_allocated_country(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_country() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_country(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_country();
-
-  public:
-  // string zip_code = 5;
-  void clear_zip_code() ;
-  const ::std::string& zip_code() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_zip_code(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_zip_code();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_zip_code();
-  void set_allocated_zip_code(::std::string* PROTOBUF_NULLABLE value);
+  void set_transaction_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_transaction_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_transaction_id();
+  void set_allocated_transaction_id(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_zip_code() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_zip_code(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_zip_code();
+  const ::std::string& _internal_transaction_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_transaction_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_transaction_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Address)
+  // @@protoc_insertion_point(class_scope:oteldemo.ChargeResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<3, 5,
-                                   0, 63,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   0, 46,
                                    2>
       _table_;
 
@@ -4580,47 +4609,43 @@ class Address final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const Address& from_msg);
+        const ChargeResponse& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr street_address_;
-    ::google::protobuf::internal::ArenaStringPtr city_;
-    ::google::protobuf::internal::ArenaStringPtr state_;
-    ::google::protobuf::internal::ArenaStringPtr country_;
-    ::google::protobuf::internal::ArenaStringPtr zip_code_;
+    ::google::protobuf::internal::ArenaStringPtr transaction_id_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull Address_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ChargeResponse_class_data_;
 // -------------------------------------------------------------------
 
-class AdRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.AdRequest) */ {
+class CartItem final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.CartItem) */ {
  public:
-  inline AdRequest() : AdRequest(nullptr) {}
-  ~AdRequest() PROTOBUF_FINAL;
+  inline CartItem() : CartItem(nullptr) {}
+  ~CartItem() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(AdRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(CartItem* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(AdRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(CartItem));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR AdRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR CartItem(::google::protobuf::internal::ConstantInitialized);
 
-  inline AdRequest(const AdRequest& from) : AdRequest(nullptr, from) {}
-  inline AdRequest(AdRequest&& from) noexcept
-      : AdRequest(nullptr, ::std::move(from)) {}
-  inline AdRequest& operator=(const AdRequest& from) {
+  inline CartItem(const CartItem& from) : CartItem(nullptr, from) {}
+  inline CartItem(CartItem&& from) noexcept
+      : CartItem(nullptr, ::std::move(from)) {}
+  inline CartItem& operator=(const CartItem& from) {
     CopyFrom(from);
     return *this;
   }
-  inline AdRequest& operator=(AdRequest&& from) noexcept {
+  inline CartItem& operator=(CartItem&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -4648,13 +4673,13 @@ class AdRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const AdRequest& default_instance() {
-    return *reinterpret_cast<const AdRequest*>(
-        &_AdRequest_default_instance_);
+  static const CartItem& default_instance() {
+    return *reinterpret_cast<const CartItem*>(
+        &_CartItem_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 29;
-  friend void swap(AdRequest& a, AdRequest& b) { a.Swap(&b); }
-  inline void Swap(AdRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 0;
+  friend void swap(CartItem& a, CartItem& b) { a.Swap(&b); }
+  inline void Swap(CartItem* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -4662,7 +4687,7 @@ class AdRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(AdRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(CartItem* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -4670,13 +4695,13 @@ class AdRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  AdRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<AdRequest>(arena);
+  CartItem* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<CartItem>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const AdRequest& from);
+  void CopyFrom(const CartItem& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const AdRequest& from) { AdRequest::MergeImpl(*this, from); }
+  void MergeFrom(const CartItem& from) { CartItem::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -4712,18 +4737,18 @@ class AdRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(AdRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(CartItem* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.AdRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.CartItem"; }
 
  protected:
-  explicit AdRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  AdRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const AdRequest& from);
-  AdRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, AdRequest&& from) noexcept
-      : AdRequest(arena) {
+  explicit CartItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  CartItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CartItem& from);
+  CartItem(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CartItem&& from) noexcept
+      : CartItem(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -4740,36 +4765,40 @@ class AdRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kContextKeysFieldNumber = 1,
+    kProductIdFieldNumber = 1,
+    kQuantityFieldNumber = 2,
   };
-  // repeated string context_keys = 1;
-  int context_keys_size() const;
+  // string product_id = 1;
+  void clear_product_id() ;
+  const ::std::string& product_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_product_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_product_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_product_id();
+  void set_allocated_product_id(::std::string* PROTOBUF_NULLABLE value);
+
   private:
-  int _internal_context_keys_size() const;
+  const ::std::string& _internal_product_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_product_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_product_id();
 
   public:
-  void clear_context_keys() ;
-  const ::std::string& context_keys(int index) const;
-  ::std::string* PROTOBUF_NONNULL mutable_context_keys(int index);
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_context_keys(int index, Arg_&& value, Args_... args);
-  ::std::string* PROTOBUF_NONNULL add_context_keys();
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void add_context_keys(Arg_&& value, Args_... args);
-  const ::google::protobuf::RepeatedPtrField<::std::string>& context_keys() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_context_keys();
+  // int32 quantity = 2;
+  void clear_quantity() ;
+  ::int32_t quantity() const;
+  void set_quantity(::int32_t value);
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_context_keys() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_context_keys();
+  ::int32_t _internal_quantity() const;
+  void _internal_set_quantity(::int32_t value);
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.AdRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.CartItem)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   0, 39,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   0, 36,
                                    2>
       _table_;
 
@@ -4787,42 +4816,44 @@ class AdRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const AdRequest& from_msg);
-    ::google::protobuf::RepeatedPtrField<::std::string> context_keys_;
+        const CartItem& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr product_id_;
+    ::int32_t quantity_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull AdRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull CartItem_class_data_;
 // -------------------------------------------------------------------
 
-class Ad final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.Ad) */ {
+class Address final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.Address) */ {
  public:
-  inline Ad() : Ad(nullptr) {}
-  ~Ad() PROTOBUF_FINAL;
+  inline Address() : Address(nullptr) {}
+  ~Address() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(Ad* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(Address* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(Ad));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(Address));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Ad(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Address(::google::protobuf::internal::ConstantInitialized);
 
-  inline Ad(const Ad& from) : Ad(nullptr, from) {}
-  inline Ad(Ad&& from) noexcept
-      : Ad(nullptr, ::std::move(from)) {}
-  inline Ad& operator=(const Ad& from) {
+  inline Address(const Address& from) : Address(nullptr, from) {}
+  inline Address(Address&& from) noexcept
+      : Address(nullptr, ::std::move(from)) {}
+  inline Address& operator=(const Address& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Ad& operator=(Ad&& from) noexcept {
+  inline Address& operator=(Address&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -4850,13 +4881,13 @@ class Ad final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Ad& default_instance() {
-    return *reinterpret_cast<const Ad*>(
-        &_Ad_default_instance_);
+  static const Address& default_instance() {
+    return *reinterpret_cast<const Address*>(
+        &_Address_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 31;
-  friend void swap(Ad& a, Ad& b) { a.Swap(&b); }
-  inline void Swap(Ad* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 21;
+  friend void swap(Address& a, Address& b) { a.Swap(&b); }
+  inline void Swap(Address* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -4864,7 +4895,7 @@ class Ad final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Ad* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(Address* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -4872,13 +4903,13 @@ class Ad final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Ad* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<Ad>(arena);
+  Address* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<Address>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Ad& from);
+  void CopyFrom(const Address& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Ad& from) { Ad::MergeImpl(*this, from); }
+  void MergeFrom(const Address& from) { Address::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -4914,18 +4945,18 @@ class Ad final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(Ad* PROTOBUF_NONNULL other);
+  void InternalSwap(Address* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.Ad"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.Address"; }
 
  protected:
-  explicit Ad(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  Ad(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Ad& from);
-  Ad(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Ad&& from) noexcept
-      : Ad(arena) {
+  explicit Address(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  Address(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Address& from);
+  Address(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Address&& from) noexcept
+      : Address(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -4942,45 +4973,93 @@ class Ad final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kRedirectUrlFieldNumber = 1,
-    kTextFieldNumber = 2,
+    kStreetAddressFieldNumber = 1,
+    kCityFieldNumber = 2,
+    kStateFieldNumber = 3,
+    kCountryFieldNumber = 4,
+    kZipCodeFieldNumber = 5,
   };
-  // string redirect_url = 1;
-  void clear_redirect_url() ;
-  const ::std::string& redirect_url() const;
+  // string street_address = 1;
+  void clear_street_address() ;
+  const ::std::string& street_address() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_redirect_url(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_redirect_url();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_redirect_url();
-  void set_allocated_redirect_url(::std::string* PROTOBUF_NULLABLE value);
+  void set_street_address(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_street_address();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_street_address();
+  void set_allocated_street_address(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_redirect_url() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_redirect_url(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_redirect_url();
+  const ::std::string& _internal_street_address() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_street_address(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_street_address();
 
   public:
-  // string text = 2;
-  void clear_text() ;
-  const ::std::string& text() const;
+  // string city = 2;
+  void clear_city() ;
+  const ::std::string& city() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_text(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_text();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_text();
-  void set_allocated_text(::std::string* PROTOBUF_NULLABLE value);
+  void set_city(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_city();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_city();
+  void set_allocated_city(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_text() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_text(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_text();
+  const ::std::string& _internal_city() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_city(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_city();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Ad)
+  // string state = 3;
+  void clear_state() ;
+  const ::std::string& state() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_state(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_state();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_state();
+  void set_allocated_state(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_state() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_state(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_state();
+
+  public:
+  // string country = 4;
+  void clear_country() ;
+  const ::std::string& country() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_country(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_country();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_country();
+  void set_allocated_country(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_country() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_country(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_country();
+
+  public:
+  // string zip_code = 5;
+  void clear_zip_code() ;
+  const ::std::string& zip_code() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_zip_code(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_zip_code();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_zip_code();
+  void set_allocated_zip_code(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_zip_code() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_zip_code(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_zip_code();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.Address)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   0, 36,
+  static const ::google::protobuf::internal::TcParseTable<3, 5,
+                                   0, 63,
                                    2>
       _table_;
 
@@ -4998,44 +5077,47 @@ class Ad final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const Ad& from_msg);
+        const Address& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr redirect_url_;
-    ::google::protobuf::internal::ArenaStringPtr text_;
+    ::google::protobuf::internal::ArenaStringPtr street_address_;
+    ::google::protobuf::internal::ArenaStringPtr city_;
+    ::google::protobuf::internal::ArenaStringPtr state_;
+    ::google::protobuf::internal::ArenaStringPtr country_;
+    ::google::protobuf::internal::ArenaStringPtr zip_code_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull Ad_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull Address_class_data_;
 // -------------------------------------------------------------------
 
-class ShipOrderRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderRequest) */ {
+class AdRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.AdRequest) */ {
  public:
-  inline ShipOrderRequest() : ShipOrderRequest(nullptr) {}
-  ~ShipOrderRequest() PROTOBUF_FINAL;
+  inline AdRequest() : AdRequest(nullptr) {}
+  ~AdRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ShipOrderRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(AdRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ShipOrderRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(AdRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ShipOrderRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR AdRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline ShipOrderRequest(const ShipOrderRequest& from) : ShipOrderRequest(nullptr, from) {}
-  inline ShipOrderRequest(ShipOrderRequest&& from) noexcept
-      : ShipOrderRequest(nullptr, ::std::move(from)) {}
-  inline ShipOrderRequest& operator=(const ShipOrderRequest& from) {
+  inline AdRequest(const AdRequest& from) : AdRequest(nullptr, from) {}
+  inline AdRequest(AdRequest&& from) noexcept
+      : AdRequest(nullptr, ::std::move(from)) {}
+  inline AdRequest& operator=(const AdRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ShipOrderRequest& operator=(ShipOrderRequest&& from) noexcept {
+  inline AdRequest& operator=(AdRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -5063,13 +5145,13 @@ class ShipOrderRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ShipOrderRequest& default_instance() {
-    return *reinterpret_cast<const ShipOrderRequest*>(
-        &_ShipOrderRequest_default_instance_);
+  static const AdRequest& default_instance() {
+    return *reinterpret_cast<const AdRequest*>(
+        &_AdRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 15;
-  friend void swap(ShipOrderRequest& a, ShipOrderRequest& b) { a.Swap(&b); }
-  inline void Swap(ShipOrderRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 33;
+  friend void swap(AdRequest& a, AdRequest& b) { a.Swap(&b); }
+  inline void Swap(AdRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -5077,7 +5159,7 @@ class ShipOrderRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ShipOrderRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(AdRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -5085,13 +5167,13 @@ class ShipOrderRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ShipOrderRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ShipOrderRequest>(arena);
+  AdRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<AdRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ShipOrderRequest& from);
+  void CopyFrom(const AdRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ShipOrderRequest& from) { ShipOrderRequest::MergeImpl(*this, from); }
+  void MergeFrom(const AdRequest& from) { AdRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -5127,18 +5209,18 @@ class ShipOrderRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ShipOrderRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(AdRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ShipOrderRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.AdRequest"; }
 
  protected:
-  explicit ShipOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ShipOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ShipOrderRequest& from);
-  ShipOrderRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ShipOrderRequest&& from) noexcept
-      : ShipOrderRequest(arena) {
+  explicit AdRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  AdRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const AdRequest& from);
+  AdRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, AdRequest&& from) noexcept
+      : AdRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -5155,47 +5237,36 @@ class ShipOrderRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kItemsFieldNumber = 2,
-    kAddressFieldNumber = 1,
+    kContextKeysFieldNumber = 1,
   };
-  // repeated .oteldemo.CartItem items = 2;
-  int items_size() const;
+  // repeated string context_keys = 1;
+  int context_keys_size() const;
   private:
-  int _internal_items_size() const;
-
-  public:
-  void clear_items() ;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_items(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL mutable_items();
+  int _internal_context_keys_size() const;
 
-  private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL _internal_mutable_items();
   public:
-  const ::oteldemo::CartItem& items(int index) const;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL add_items();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& items() const;
-  // .oteldemo.Address address = 1;
-  bool has_address() const;
-  void clear_address() ;
-  const ::oteldemo::Address& address() const;
-  [[nodiscard]] ::oteldemo::Address* PROTOBUF_NULLABLE release_address();
-  ::oteldemo::Address* PROTOBUF_NONNULL mutable_address();
-  void set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
-  ::oteldemo::Address* PROTOBUF_NULLABLE unsafe_arena_release_address();
+  void clear_context_keys() ;
+  const ::std::string& context_keys(int index) const;
+  ::std::string* PROTOBUF_NONNULL mutable_context_keys(int index);
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_context_keys(int index, Arg_&& value, Args_... args);
+  ::std::string* PROTOBUF_NONNULL add_context_keys();
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void add_context_keys(Arg_&& value, Args_... args);
+  const ::google::protobuf::RepeatedPtrField<::std::string>& context_keys() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_context_keys();
 
   private:
-  const ::oteldemo::Address& _internal_address() const;
-  ::oteldemo::Address* PROTOBUF_NONNULL _internal_mutable_address();
+  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_context_keys() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_context_keys();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.AdRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   2, 0,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   0, 39,
                                    2>
       _table_;
 
@@ -5213,44 +5284,42 @@ class ShipOrderRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ShipOrderRequest& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+        const AdRequest& from_msg);
+    ::google::protobuf::RepeatedPtrField<::std::string> context_keys_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
-    ::oteldemo::Address* PROTOBUF_NULLABLE address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ShipOrderRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull AdRequest_class_data_;
 // -------------------------------------------------------------------
 
-class Product final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.Product) */ {
+class Ad final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.Ad) */ {
  public:
-  inline Product() : Product(nullptr) {}
-  ~Product() PROTOBUF_FINAL;
+  inline Ad() : Ad(nullptr) {}
+  ~Ad() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(Product* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(Ad* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(Product));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(Ad));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Product(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Ad(::google::protobuf::internal::ConstantInitialized);
 
-  inline Product(const Product& from) : Product(nullptr, from) {}
-  inline Product(Product&& from) noexcept
-      : Product(nullptr, ::std::move(from)) {}
-  inline Product& operator=(const Product& from) {
+  inline Ad(const Ad& from) : Ad(nullptr, from) {}
+  inline Ad(Ad&& from) noexcept
+      : Ad(nullptr, ::std::move(from)) {}
+  inline Ad& operator=(const Ad& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Product& operator=(Product&& from) noexcept {
+  inline Ad& operator=(Ad&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -5278,13 +5347,13 @@ class Product final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Product& default_instance() {
-    return *reinterpret_cast<const Product*>(
-        &_Product_default_instance_);
+  static const Ad& default_instance() {
+    return *reinterpret_cast<const Ad*>(
+        &_Ad_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 8;
-  friend void swap(Product& a, Product& b) { a.Swap(&b); }
-  inline void Swap(Product* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 35;
+  friend void swap(Ad& a, Ad& b) { a.Swap(&b); }
+  inline void Swap(Ad* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -5292,7 +5361,7 @@ class Product final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Product* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(Ad* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -5300,13 +5369,13 @@ class Product final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Product* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<Product>(arena);
+  Ad* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<Ad>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Product& from);
+  void CopyFrom(const Ad& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Product& from) { Product::MergeImpl(*this, from); }
+  void MergeFrom(const Ad& from) { Ad::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -5342,18 +5411,18 @@ class Product final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(Product* PROTOBUF_NONNULL other);
+  void InternalSwap(Ad* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.Product"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.Ad"; }
 
  protected:
-  explicit Product(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  Product(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Product& from);
-  Product(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Product&& from) noexcept
-      : Product(arena) {
+  explicit Ad(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  Ad(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Ad& from);
+  Ad(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Ad&& from) noexcept
+      : Ad(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -5370,116 +5439,45 @@ class Product final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kCategoriesFieldNumber = 6,
-    kIdFieldNumber = 1,
-    kNameFieldNumber = 2,
-    kDescriptionFieldNumber = 3,
-    kPictureFieldNumber = 4,
-    kPriceUsdFieldNumber = 5,
+    kRedirectUrlFieldNumber = 1,
+    kTextFieldNumber = 2,
   };
-  // repeated string categories = 6;
-  int categories_size() const;
-  private:
-  int _internal_categories_size() const;
-
-  public:
-  void clear_categories() ;
-  const ::std::string& categories(int index) const;
-  ::std::string* PROTOBUF_NONNULL mutable_categories(int index);
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_categories(int index, Arg_&& value, Args_... args);
-  ::std::string* PROTOBUF_NONNULL add_categories();
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void add_categories(Arg_&& value, Args_... args);
-  const ::google::protobuf::RepeatedPtrField<::std::string>& categories() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_categories();
-
-  private:
-  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_categories() const;
-  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_categories();
-
-  public:
-  // string id = 1;
-  void clear_id() ;
-  const ::std::string& id() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_id();
-  void set_allocated_id(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_id();
-
-  public:
-  // string name = 2;
-  void clear_name() ;
-  const ::std::string& name() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_name();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_name();
-  void set_allocated_name(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_name() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_name(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
-
-  public:
-  // string description = 3;
-  void clear_description() ;
-  const ::std::string& description() const;
+  // string redirect_url = 1;
+  void clear_redirect_url() ;
+  const ::std::string& redirect_url() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_description(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_description();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_description();
-  void set_allocated_description(::std::string* PROTOBUF_NULLABLE value);
+  void set_redirect_url(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_redirect_url();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_redirect_url();
+  void set_allocated_redirect_url(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_description() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_description(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_description();
+  const ::std::string& _internal_redirect_url() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_redirect_url(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_redirect_url();
 
   public:
-  // string picture = 4;
-  void clear_picture() ;
-  const ::std::string& picture() const;
+  // string text = 2;
+  void clear_text() ;
+  const ::std::string& text() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_picture(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_picture();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_picture();
-  void set_allocated_picture(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_picture() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_picture(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_picture();
-
-  public:
-  // .oteldemo.Money price_usd = 5;
-  bool has_price_usd() const;
-  void clear_price_usd() ;
-  const ::oteldemo::Money& price_usd() const;
-  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_price_usd();
-  ::oteldemo::Money* PROTOBUF_NONNULL mutable_price_usd();
-  void set_allocated_price_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_price_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_price_usd();
+  void set_text(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_text();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_text();
+  void set_allocated_text(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::oteldemo::Money& _internal_price_usd() const;
-  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_price_usd();
+  const ::std::string& _internal_text() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_text(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_text();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Product)
+  // @@protoc_insertion_point(class_scope:oteldemo.Ad)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<3, 6,
-                                   1, 59,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   0, 36,
                                    2>
       _table_;
 
@@ -5497,48 +5495,44 @@ class Product final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const Product& from_msg);
+        const Ad& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField<::std::string> categories_;
-    ::google::protobuf::internal::ArenaStringPtr id_;
-    ::google::protobuf::internal::ArenaStringPtr name_;
-    ::google::protobuf::internal::ArenaStringPtr description_;
-    ::google::protobuf::internal::ArenaStringPtr picture_;
-    ::oteldemo::Money* PROTOBUF_NULLABLE price_usd_;
+    ::google::protobuf::internal::ArenaStringPtr redirect_url_;
+    ::google::protobuf::internal::ArenaStringPtr text_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull Product_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull Ad_class_data_;
 // -------------------------------------------------------------------
 
-class PlaceOrderRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderRequest) */ {
+class ShipOrderRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderRequest) */ {
  public:
-  inline PlaceOrderRequest() : PlaceOrderRequest(nullptr) {}
-  ~PlaceOrderRequest() PROTOBUF_FINAL;
+  inline ShipOrderRequest() : ShipOrderRequest(nullptr) {}
+  ~ShipOrderRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(PlaceOrderRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ShipOrderRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(PlaceOrderRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ShipOrderRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR PlaceOrderRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ShipOrderRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline PlaceOrderRequest(const PlaceOrderRequest& from) : PlaceOrderRequest(nullptr, from) {}
-  inline PlaceOrderRequest(PlaceOrderRequest&& from) noexcept
-      : PlaceOrderRequest(nullptr, ::std::move(from)) {}
-  inline PlaceOrderRequest& operator=(const PlaceOrderRequest& from) {
+  inline ShipOrderRequest(const ShipOrderRequest& from) : ShipOrderRequest(nullptr, from) {}
+  inline ShipOrderRequest(ShipOrderRequest&& from) noexcept
+      : ShipOrderRequest(nullptr, ::std::move(from)) {}
+  inline ShipOrderRequest& operator=(const ShipOrderRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline PlaceOrderRequest& operator=(PlaceOrderRequest&& from) noexcept {
+  inline ShipOrderRequest& operator=(ShipOrderRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -5566,13 +5560,13 @@ class PlaceOrderRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const PlaceOrderRequest& default_instance() {
-    return *reinterpret_cast<const PlaceOrderRequest*>(
-        &_PlaceOrderRequest_default_instance_);
+  static const ShipOrderRequest& default_instance() {
+    return *reinterpret_cast<const ShipOrderRequest*>(
+        &_ShipOrderRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 27;
-  friend void swap(PlaceOrderRequest& a, PlaceOrderRequest& b) { a.Swap(&b); }
-  inline void Swap(PlaceOrderRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 19;
+  friend void swap(ShipOrderRequest& a, ShipOrderRequest& b) { a.Swap(&b); }
+  inline void Swap(ShipOrderRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -5580,7 +5574,7 @@ class PlaceOrderRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(PlaceOrderRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ShipOrderRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -5588,13 +5582,13 @@ class PlaceOrderRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  PlaceOrderRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<PlaceOrderRequest>(arena);
+  ShipOrderRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ShipOrderRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const PlaceOrderRequest& from);
+  void CopyFrom(const ShipOrderRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const PlaceOrderRequest& from) { PlaceOrderRequest::MergeImpl(*this, from); }
+  void MergeFrom(const ShipOrderRequest& from) { ShipOrderRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -5630,18 +5624,18 @@ class PlaceOrderRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(PlaceOrderRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(ShipOrderRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.PlaceOrderRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ShipOrderRequest"; }
 
  protected:
-  explicit PlaceOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  PlaceOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const PlaceOrderRequest& from);
-  PlaceOrderRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, PlaceOrderRequest&& from) noexcept
-      : PlaceOrderRequest(arena) {
+  explicit ShipOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ShipOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ShipOrderRequest& from);
+  ShipOrderRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ShipOrderRequest&& from) noexcept
+      : ShipOrderRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -5658,58 +5652,27 @@ class PlaceOrderRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kUserIdFieldNumber = 1,
-    kUserCurrencyFieldNumber = 2,
-    kEmailFieldNumber = 5,
-    kAddressFieldNumber = 3,
-    kCreditCardFieldNumber = 6,
+    kItemsFieldNumber = 2,
+    kAddressFieldNumber = 1,
   };
-  // string user_id = 1;
-  void clear_user_id() ;
-  const ::std::string& user_id() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_user_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_user_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
-  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
-
+  // repeated .oteldemo.CartItem items = 2;
+  int items_size() const;
   private:
-  const ::std::string& _internal_user_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+  int _internal_items_size() const;
 
   public:
-  // string user_currency = 2;
-  void clear_user_currency() ;
-  const ::std::string& user_currency() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_user_currency(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_user_currency();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_currency();
-  void set_allocated_user_currency(::std::string* PROTOBUF_NULLABLE value);
+  void clear_items() ;
+  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_items(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL mutable_items();
 
   private:
-  const ::std::string& _internal_user_currency() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_user_currency(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_currency();
-
-  public:
-  // string email = 5;
-  void clear_email() ;
-  const ::std::string& email() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_email(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_email();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_email();
-  void set_allocated_email(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_email() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_email(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_email();
-
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL _internal_mutable_items();
   public:
-  // .oteldemo.Address address = 3;
+  const ::oteldemo::CartItem& items(int index) const;
+  ::oteldemo::CartItem* PROTOBUF_NONNULL add_items();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& items() const;
+  // .oteldemo.Address address = 1;
   bool has_address() const;
   void clear_address() ;
   const ::oteldemo::Address& address() const;
@@ -5724,27 +5687,12 @@ class PlaceOrderRequest final : public ::google::protobuf::Message
   ::oteldemo::Address* PROTOBUF_NONNULL _internal_mutable_address();
 
   public:
-  // .oteldemo.CreditCardInfo credit_card = 6;
-  bool has_credit_card() const;
-  void clear_credit_card() ;
-  const ::oteldemo::CreditCardInfo& credit_card() const;
-  [[nodiscard]] ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE release_credit_card();
-  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL mutable_credit_card();
-  void set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
-  ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE unsafe_arena_release_credit_card();
-
-  private:
-  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
-  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL _internal_mutable_credit_card();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<3, 5,
-                                   2, 60,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   2, 0,
                                    2>
       _table_;
 
@@ -5762,47 +5710,44 @@ class PlaceOrderRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const PlaceOrderRequest& from_msg);
+        const ShipOrderRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr user_id_;
-    ::google::protobuf::internal::ArenaStringPtr user_currency_;
-    ::google::protobuf::internal::ArenaStringPtr email_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
     ::oteldemo::Address* PROTOBUF_NULLABLE address_;
-    ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE credit_card_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull PlaceOrderRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ShipOrderRequest_class_data_;
 // -------------------------------------------------------------------
 
-class OrderItem final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.OrderItem) */ {
+class Product final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.Product) */ {
  public:
-  inline OrderItem() : OrderItem(nullptr) {}
-  ~OrderItem() PROTOBUF_FINAL;
+  inline Product() : Product(nullptr) {}
+  ~Product() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(OrderItem* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(Product* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(OrderItem));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(Product));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR OrderItem(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Product(::google::protobuf::internal::ConstantInitialized);
 
-  inline OrderItem(const OrderItem& from) : OrderItem(nullptr, from) {}
-  inline OrderItem(OrderItem&& from) noexcept
-      : OrderItem(nullptr, ::std::move(from)) {}
-  inline OrderItem& operator=(const OrderItem& from) {
+  inline Product(const Product& from) : Product(nullptr, from) {}
+  inline Product(Product&& from) noexcept
+      : Product(nullptr, ::std::move(from)) {}
+  inline Product& operator=(const Product& from) {
     CopyFrom(from);
     return *this;
   }
-  inline OrderItem& operator=(OrderItem&& from) noexcept {
+  inline Product& operator=(Product&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -5830,13 +5775,13 @@ class OrderItem final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const OrderItem& default_instance() {
-    return *reinterpret_cast<const OrderItem*>(
-        &_OrderItem_default_instance_);
+  static const Product& default_instance() {
+    return *reinterpret_cast<const Product*>(
+        &_Product_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 24;
-  friend void swap(OrderItem& a, OrderItem& b) { a.Swap(&b); }
-  inline void Swap(OrderItem* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 12;
+  friend void swap(Product& a, Product& b) { a.Swap(&b); }
+  inline void Swap(Product* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -5844,7 +5789,7 @@ class OrderItem final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(OrderItem* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(Product* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -5852,13 +5797,13 @@ class OrderItem final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  OrderItem* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<OrderItem>(arena);
+  Product* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<Product>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const OrderItem& from);
+  void CopyFrom(const Product& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const OrderItem& from) { OrderItem::MergeImpl(*this, from); }
+  void MergeFrom(const Product& from) { Product::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -5894,18 +5839,18 @@ class OrderItem final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(OrderItem* PROTOBUF_NONNULL other);
+  void InternalSwap(Product* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.OrderItem"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.Product"; }
 
  protected:
-  explicit OrderItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  OrderItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const OrderItem& from);
-  OrderItem(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, OrderItem&& from) noexcept
-      : OrderItem(arena) {
+  explicit Product(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  Product(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Product& from);
+  Product(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Product&& from) noexcept
+      : Product(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -5922,45 +5867,116 @@ class OrderItem final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kItemFieldNumber = 1,
-    kCostFieldNumber = 2,
+    kCategoriesFieldNumber = 6,
+    kIdFieldNumber = 1,
+    kNameFieldNumber = 2,
+    kDescriptionFieldNumber = 3,
+    kPictureFieldNumber = 4,
+    kPriceUsdFieldNumber = 5,
   };
-  // .oteldemo.CartItem item = 1;
-  bool has_item() const;
-  void clear_item() ;
-  const ::oteldemo::CartItem& item() const;
-  [[nodiscard]] ::oteldemo::CartItem* PROTOBUF_NULLABLE release_item();
-  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_item();
-  void set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
-  ::oteldemo::CartItem* PROTOBUF_NULLABLE unsafe_arena_release_item();
+  // repeated string categories = 6;
+  int categories_size() const;
+  private:
+  int _internal_categories_size() const;
+
+  public:
+  void clear_categories() ;
+  const ::std::string& categories(int index) const;
+  ::std::string* PROTOBUF_NONNULL mutable_categories(int index);
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_categories(int index, Arg_&& value, Args_... args);
+  ::std::string* PROTOBUF_NONNULL add_categories();
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void add_categories(Arg_&& value, Args_... args);
+  const ::google::protobuf::RepeatedPtrField<::std::string>& categories() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL mutable_categories();
 
   private:
-  const ::oteldemo::CartItem& _internal_item() const;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL _internal_mutable_item();
+  const ::google::protobuf::RepeatedPtrField<::std::string>& _internal_categories() const;
+  ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL _internal_mutable_categories();
 
   public:
-  // .oteldemo.Money cost = 2;
-  bool has_cost() const;
-  void clear_cost() ;
-  const ::oteldemo::Money& cost() const;
-  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_cost();
-  ::oteldemo::Money* PROTOBUF_NONNULL mutable_cost();
-  void set_allocated_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_cost();
+  // string id = 1;
+  void clear_id() ;
+  const ::std::string& id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_id();
+  void set_allocated_id(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::oteldemo::Money& _internal_cost() const;
-  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_cost();
+  const ::std::string& _internal_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.OrderItem)
+  // string name = 2;
+  void clear_name() ;
+  const ::std::string& name() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_name(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_name();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_name();
+  void set_allocated_name(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_name() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_name(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_name();
+
+  public:
+  // string description = 3;
+  void clear_description() ;
+  const ::std::string& description() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_description(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_description();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_description();
+  void set_allocated_description(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_description() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_description(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_description();
+
+  public:
+  // string picture = 4;
+  void clear_picture() ;
+  const ::std::string& picture() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_picture(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_picture();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_picture();
+  void set_allocated_picture(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_picture() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_picture(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_picture();
+
+  public:
+  // .oteldemo.Money price_usd = 5;
+  bool has_price_usd() const;
+  void clear_price_usd() ;
+  const ::oteldemo::Money& price_usd() const;
+  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_price_usd();
+  ::oteldemo::Money* PROTOBUF_NONNULL mutable_price_usd();
+  void set_allocated_price_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_price_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_price_usd();
+
+  private:
+  const ::oteldemo::Money& _internal_price_usd() const;
+  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_price_usd();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.Product)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   2, 0,
+  static const ::google::protobuf::internal::TcParseTable<3, 6,
+                                   1, 59,
                                    2>
       _table_;
 
@@ -5978,44 +5994,48 @@ class OrderItem final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const OrderItem& from_msg);
+        const Product& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::CartItem* PROTOBUF_NULLABLE item_;
-    ::oteldemo::Money* PROTOBUF_NULLABLE cost_;
+    ::google::protobuf::RepeatedPtrField<::std::string> categories_;
+    ::google::protobuf::internal::ArenaStringPtr id_;
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    ::google::protobuf::internal::ArenaStringPtr description_;
+    ::google::protobuf::internal::ArenaStringPtr picture_;
+    ::oteldemo::Money* PROTOBUF_NULLABLE price_usd_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull OrderItem_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull Product_class_data_;
 // -------------------------------------------------------------------
 
-class ListFlagsResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsResponse) */ {
+class PlaceOrderRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderRequest) */ {
  public:
-  inline ListFlagsResponse() : ListFlagsResponse(nullptr) {}
-  ~ListFlagsResponse() PROTOBUF_FINAL;
+  inline PlaceOrderRequest() : PlaceOrderRequest(nullptr) {}
+  ~PlaceOrderRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ListFlagsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(PlaceOrderRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListFlagsResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(PlaceOrderRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ListFlagsResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR PlaceOrderRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline ListFlagsResponse(const ListFlagsResponse& from) : ListFlagsResponse(nullptr, from) {}
-  inline ListFlagsResponse(ListFlagsResponse&& from) noexcept
-      : ListFlagsResponse(nullptr, ::std::move(from)) {}
-  inline ListFlagsResponse& operator=(const ListFlagsResponse& from) {
+  inline PlaceOrderRequest(const PlaceOrderRequest& from) : PlaceOrderRequest(nullptr, from) {}
+  inline PlaceOrderRequest(PlaceOrderRequest&& from) noexcept
+      : PlaceOrderRequest(nullptr, ::std::move(from)) {}
+  inline PlaceOrderRequest& operator=(const PlaceOrderRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ListFlagsResponse& operator=(ListFlagsResponse&& from) noexcept {
+  inline PlaceOrderRequest& operator=(PlaceOrderRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -6043,13 +6063,13 @@ class ListFlagsResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ListFlagsResponse& default_instance() {
-    return *reinterpret_cast<const ListFlagsResponse*>(
-        &_ListFlagsResponse_default_instance_);
+  static const PlaceOrderRequest& default_instance() {
+    return *reinterpret_cast<const PlaceOrderRequest*>(
+        &_PlaceOrderRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 40;
-  friend void swap(ListFlagsResponse& a, ListFlagsResponse& b) { a.Swap(&b); }
-  inline void Swap(ListFlagsResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 31;
+  friend void swap(PlaceOrderRequest& a, PlaceOrderRequest& b) { a.Swap(&b); }
+  inline void Swap(PlaceOrderRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -6057,7 +6077,7 @@ class ListFlagsResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ListFlagsResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(PlaceOrderRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -6065,13 +6085,13 @@ class ListFlagsResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ListFlagsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ListFlagsResponse>(arena);
+  PlaceOrderRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<PlaceOrderRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ListFlagsResponse& from);
+  void CopyFrom(const PlaceOrderRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ListFlagsResponse& from) { ListFlagsResponse::MergeImpl(*this, from); }
+  void MergeFrom(const PlaceOrderRequest& from) { PlaceOrderRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -6107,18 +6127,18 @@ class ListFlagsResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ListFlagsResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(PlaceOrderRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ListFlagsResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.PlaceOrderRequest"; }
 
  protected:
-  explicit ListFlagsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ListFlagsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListFlagsResponse& from);
-  ListFlagsResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListFlagsResponse&& from) noexcept
-      : ListFlagsResponse(arena) {
+  explicit PlaceOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  PlaceOrderRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const PlaceOrderRequest& from);
+  PlaceOrderRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, PlaceOrderRequest&& from) noexcept
+      : PlaceOrderRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -6135,31 +6155,93 @@ class ListFlagsResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kFlagFieldNumber = 1,
+    kUserIdFieldNumber = 1,
+    kUserCurrencyFieldNumber = 2,
+    kEmailFieldNumber = 5,
+    kAddressFieldNumber = 3,
+    kCreditCardFieldNumber = 6,
   };
-  // repeated .oteldemo.Flag flag = 1;
-  int flag_size() const;
+  // string user_id = 1;
+  void clear_user_id() ;
+  const ::std::string& user_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_user_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_user_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
+  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+
   private:
-  int _internal_flag_size() const;
+  const ::std::string& _internal_user_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
 
   public:
-  void clear_flag() ;
-  ::oteldemo::Flag* PROTOBUF_NONNULL mutable_flag(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>* PROTOBUF_NONNULL mutable_flag();
+  // string user_currency = 2;
+  void clear_user_currency() ;
+  const ::std::string& user_currency() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_user_currency(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_user_currency();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_currency();
+  void set_allocated_user_currency(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>& _internal_flag() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>* PROTOBUF_NONNULL _internal_mutable_flag();
+  const ::std::string& _internal_user_currency() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_user_currency(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_currency();
+
   public:
-  const ::oteldemo::Flag& flag(int index) const;
-  ::oteldemo::Flag* PROTOBUF_NONNULL add_flag();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>& flag() const;
-  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsResponse)
+  // string email = 5;
+  void clear_email() ;
+  const ::std::string& email() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_email(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_email();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_email();
+  void set_allocated_email(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_email() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_email(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_email();
+
+  public:
+  // .oteldemo.Address address = 3;
+  bool has_address() const;
+  void clear_address() ;
+  const ::oteldemo::Address& address() const;
+  [[nodiscard]] ::oteldemo::Address* PROTOBUF_NULLABLE release_address();
+  ::oteldemo::Address* PROTOBUF_NONNULL mutable_address();
+  void set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
+  ::oteldemo::Address* PROTOBUF_NULLABLE unsafe_arena_release_address();
+
+  private:
+  const ::oteldemo::Address& _internal_address() const;
+  ::oteldemo::Address* PROTOBUF_NONNULL _internal_mutable_address();
+
+  public:
+  // .oteldemo.CreditCardInfo credit_card = 6;
+  bool has_credit_card() const;
+  void clear_credit_card() ;
+  const ::oteldemo::CreditCardInfo& credit_card() const;
+  [[nodiscard]] ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE release_credit_card();
+  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL mutable_credit_card();
+  void set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
+  ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE unsafe_arena_release_credit_card();
+
+  private:
+  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
+  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL _internal_mutable_credit_card();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   1, 0,
+  static const ::google::protobuf::internal::TcParseTable<3, 5,
+                                   2, 60,
                                    2>
       _table_;
 
@@ -6177,42 +6259,47 @@ class ListFlagsResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ListFlagsResponse& from_msg);
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag > flag_;
+        const PlaceOrderRequest& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr user_id_;
+    ::google::protobuf::internal::ArenaStringPtr user_currency_;
+    ::google::protobuf::internal::ArenaStringPtr email_;
+    ::oteldemo::Address* PROTOBUF_NULLABLE address_;
+    ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE credit_card_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ListFlagsResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull PlaceOrderRequest_class_data_;
 // -------------------------------------------------------------------
 
-class GetQuoteResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteResponse) */ {
+class OrderItem final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.OrderItem) */ {
  public:
-  inline GetQuoteResponse() : GetQuoteResponse(nullptr) {}
-  ~GetQuoteResponse() PROTOBUF_FINAL;
+  inline OrderItem() : OrderItem(nullptr) {}
+  ~OrderItem() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(GetQuoteResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(OrderItem* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetQuoteResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(OrderItem));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR GetQuoteResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR OrderItem(::google::protobuf::internal::ConstantInitialized);
 
-  inline GetQuoteResponse(const GetQuoteResponse& from) : GetQuoteResponse(nullptr, from) {}
-  inline GetQuoteResponse(GetQuoteResponse&& from) noexcept
-      : GetQuoteResponse(nullptr, ::std::move(from)) {}
-  inline GetQuoteResponse& operator=(const GetQuoteResponse& from) {
+  inline OrderItem(const OrderItem& from) : OrderItem(nullptr, from) {}
+  inline OrderItem(OrderItem&& from) noexcept
+      : OrderItem(nullptr, ::std::move(from)) {}
+  inline OrderItem& operator=(const OrderItem& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetQuoteResponse& operator=(GetQuoteResponse&& from) noexcept {
+  inline OrderItem& operator=(OrderItem&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -6240,13 +6327,13 @@ class GetQuoteResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetQuoteResponse& default_instance() {
-    return *reinterpret_cast<const GetQuoteResponse*>(
-        &_GetQuoteResponse_default_instance_);
+  static const OrderItem& default_instance() {
+    return *reinterpret_cast<const OrderItem*>(
+        &_OrderItem_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 14;
-  friend void swap(GetQuoteResponse& a, GetQuoteResponse& b) { a.Swap(&b); }
-  inline void Swap(GetQuoteResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 28;
+  friend void swap(OrderItem& a, OrderItem& b) { a.Swap(&b); }
+  inline void Swap(OrderItem* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -6254,7 +6341,7 @@ class GetQuoteResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetQuoteResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(OrderItem* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -6262,13 +6349,13 @@ class GetQuoteResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  GetQuoteResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<GetQuoteResponse>(arena);
+  OrderItem* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<OrderItem>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetQuoteResponse& from);
+  void CopyFrom(const OrderItem& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const GetQuoteResponse& from) { GetQuoteResponse::MergeImpl(*this, from); }
+  void MergeFrom(const OrderItem& from) { OrderItem::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -6304,18 +6391,18 @@ class GetQuoteResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(GetQuoteResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(OrderItem* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.GetQuoteResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.OrderItem"; }
 
  protected:
-  explicit GetQuoteResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  GetQuoteResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetQuoteResponse& from);
-  GetQuoteResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetQuoteResponse&& from) noexcept
-      : GetQuoteResponse(arena) {
+  explicit OrderItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  OrderItem(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const OrderItem& from);
+  OrderItem(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, OrderItem&& from) noexcept
+      : OrderItem(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -6332,36 +6419,52 @@ class GetQuoteResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kCostUsdFieldNumber = 1,
+    kItemFieldNumber = 1,
+    kCostFieldNumber = 2,
   };
-  // .oteldemo.Money cost_usd = 1;
-  bool has_cost_usd() const;
-  void clear_cost_usd() ;
-  const ::oteldemo::Money& cost_usd() const;
-  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_cost_usd();
-  ::oteldemo::Money* PROTOBUF_NONNULL mutable_cost_usd();
-  void set_allocated_cost_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_cost_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_cost_usd();
+  // .oteldemo.CartItem item = 1;
+  bool has_item() const;
+  void clear_item() ;
+  const ::oteldemo::CartItem& item() const;
+  [[nodiscard]] ::oteldemo::CartItem* PROTOBUF_NULLABLE release_item();
+  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_item();
+  void set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
+  ::oteldemo::CartItem* PROTOBUF_NULLABLE unsafe_arena_release_item();
 
   private:
-  const ::oteldemo::Money& _internal_cost_usd() const;
-  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_cost_usd();
+  const ::oteldemo::CartItem& _internal_item() const;
+  ::oteldemo::CartItem* PROTOBUF_NONNULL _internal_mutable_item();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteResponse)
- private:
-  class _Internal;
-  friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   1, 0,
-                                   2>
-      _table_;
-
-  friend class ::google::protobuf::MessageLite;
-  friend class ::google::protobuf::Arena;
-  template <typename T>
-  friend class ::google::protobuf::Arena::InternalHelper;
+  // .oteldemo.Money cost = 2;
+  bool has_cost() const;
+  void clear_cost() ;
+  const ::oteldemo::Money& cost() const;
+  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_cost();
+  ::oteldemo::Money* PROTOBUF_NONNULL mutable_cost();
+  void set_allocated_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_cost();
+
+  private:
+  const ::oteldemo::Money& _internal_cost() const;
+  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_cost();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.OrderItem)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   2, 0,
+                                   2>
+      _table_;
+
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
   using InternalArenaConstructable_ = void;
   using DestructorSkippable_ = void;
   struct Impl_ {
@@ -6372,43 +6475,44 @@ class GetQuoteResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const GetQuoteResponse& from_msg);
+        const OrderItem& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Money* PROTOBUF_NULLABLE cost_usd_;
+    ::oteldemo::CartItem* PROTOBUF_NULLABLE item_;
+    ::oteldemo::Money* PROTOBUF_NULLABLE cost_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull GetQuoteResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull OrderItem_class_data_;
 // -------------------------------------------------------------------
 
-class GetQuoteRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteRequest) */ {
+class ListRecommendationsBatchResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsBatchResponse) */ {
  public:
-  inline GetQuoteRequest() : GetQuoteRequest(nullptr) {}
-  ~GetQuoteRequest() PROTOBUF_FINAL;
+  inline ListRecommendationsBatchResponse() : ListRecommendationsBatchResponse(nullptr) {}
+  ~ListRecommendationsBatchResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(GetQuoteRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ListRecommendationsBatchResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetQuoteRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListRecommendationsBatchResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR GetQuoteRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ListRecommendationsBatchResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline GetQuoteRequest(const GetQuoteRequest& from) : GetQuoteRequest(nullptr, from) {}
-  inline GetQuoteRequest(GetQuoteRequest&& from) noexcept
-      : GetQuoteRequest(nullptr, ::std::move(from)) {}
-  inline GetQuoteRequest& operator=(const GetQuoteRequest& from) {
+  inline ListRecommendationsBatchResponse(const ListRecommendationsBatchResponse& from) : ListRecommendationsBatchResponse(nullptr, from) {}
+  inline ListRecommendationsBatchResponse(ListRecommendationsBatchResponse&& from) noexcept
+      : ListRecommendationsBatchResponse(nullptr, ::std::move(from)) {}
+  inline ListRecommendationsBatchResponse& operator=(const ListRecommendationsBatchResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetQuoteRequest& operator=(GetQuoteRequest&& from) noexcept {
+  inline ListRecommendationsBatchResponse& operator=(ListRecommendationsBatchResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -6436,13 +6540,13 @@ class GetQuoteRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetQuoteRequest& default_instance() {
-    return *reinterpret_cast<const GetQuoteRequest*>(
-        &_GetQuoteRequest_default_instance_);
+  static const ListRecommendationsBatchResponse& default_instance() {
+    return *reinterpret_cast<const ListRecommendationsBatchResponse*>(
+        &_ListRecommendationsBatchResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 13;
-  friend void swap(GetQuoteRequest& a, GetQuoteRequest& b) { a.Swap(&b); }
-  inline void Swap(GetQuoteRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 9;
+  friend void swap(ListRecommendationsBatchResponse& a, ListRecommendationsBatchResponse& b) { a.Swap(&b); }
+  inline void Swap(ListRecommendationsBatchResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -6450,7 +6554,7 @@ class GetQuoteRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetQuoteRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ListRecommendationsBatchResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -6458,13 +6562,13 @@ class GetQuoteRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  GetQuoteRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<GetQuoteRequest>(arena);
+  ListRecommendationsBatchResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ListRecommendationsBatchResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetQuoteRequest& from);
+  void CopyFrom(const ListRecommendationsBatchResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const GetQuoteRequest& from) { GetQuoteRequest::MergeImpl(*this, from); }
+  void MergeFrom(const ListRecommendationsBatchResponse& from) { ListRecommendationsBatchResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -6500,18 +6604,18 @@ class GetQuoteRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(GetQuoteRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(ListRecommendationsBatchResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.GetQuoteRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ListRecommendationsBatchResponse"; }
 
  protected:
-  explicit GetQuoteRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  GetQuoteRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetQuoteRequest& from);
-  GetQuoteRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetQuoteRequest&& from) noexcept
-      : GetQuoteRequest(arena) {
+  explicit ListRecommendationsBatchResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ListRecommendationsBatchResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListRecommendationsBatchResponse& from);
+  ListRecommendationsBatchResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListRecommendationsBatchResponse&& from) noexcept
+      : ListRecommendationsBatchResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -6528,47 +6632,31 @@ class GetQuoteRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kItemsFieldNumber = 2,
-    kAddressFieldNumber = 1,
+    kResponsesFieldNumber = 1,
   };
-  // repeated .oteldemo.CartItem items = 2;
-  int items_size() const;
+  // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+  int responses_size() const;
   private:
-  int _internal_items_size() const;
-
-  public:
-  void clear_items() ;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_items(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL mutable_items();
+  int _internal_responses_size() const;
 
-  private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL _internal_mutable_items();
   public:
-  const ::oteldemo::CartItem& items(int index) const;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL add_items();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& items() const;
-  // .oteldemo.Address address = 1;
-  bool has_address() const;
-  void clear_address() ;
-  const ::oteldemo::Address& address() const;
-  [[nodiscard]] ::oteldemo::Address* PROTOBUF_NULLABLE release_address();
-  ::oteldemo::Address* PROTOBUF_NONNULL mutable_address();
-  void set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
-  ::oteldemo::Address* PROTOBUF_NULLABLE unsafe_arena_release_address();
+  void clear_responses() ;
+  ::oteldemo::ListRecommendationsResponse* PROTOBUF_NONNULL mutable_responses(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>* PROTOBUF_NONNULL mutable_responses();
 
   private:
-  const ::oteldemo::Address& _internal_address() const;
-  ::oteldemo::Address* PROTOBUF_NONNULL _internal_mutable_address();
-
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>& _internal_responses() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>* PROTOBUF_NONNULL _internal_mutable_responses();
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteRequest)
+  const ::oteldemo::ListRecommendationsResponse& responses(int index) const;
+  ::oteldemo::ListRecommendationsResponse* PROTOBUF_NONNULL add_responses();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>& responses() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsBatchResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   2, 0,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   1, 0,
                                    2>
       _table_;
 
@@ -6586,44 +6674,42 @@ class GetQuoteRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const GetQuoteRequest& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+        const ListRecommendationsBatchResponse& from_msg);
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsResponse > responses_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
-    ::oteldemo::Address* PROTOBUF_NULLABLE address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull GetQuoteRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsBatchResponse_class_data_;
 // -------------------------------------------------------------------
 
-class GetFlagResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.GetFlagResponse) */ {
+class ListRecommendationsBatchRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsBatchRequest) */ {
  public:
-  inline GetFlagResponse() : GetFlagResponse(nullptr) {}
-  ~GetFlagResponse() PROTOBUF_FINAL;
+  inline ListRecommendationsBatchRequest() : ListRecommendationsBatchRequest(nullptr) {}
+  ~ListRecommendationsBatchRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(GetFlagResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ListRecommendationsBatchRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetFlagResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListRecommendationsBatchRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR GetFlagResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ListRecommendationsBatchRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline GetFlagResponse(const GetFlagResponse& from) : GetFlagResponse(nullptr, from) {}
-  inline GetFlagResponse(GetFlagResponse&& from) noexcept
-      : GetFlagResponse(nullptr, ::std::move(from)) {}
-  inline GetFlagResponse& operator=(const GetFlagResponse& from) {
+  inline ListRecommendationsBatchRequest(const ListRecommendationsBatchRequest& from) : ListRecommendationsBatchRequest(nullptr, from) {}
+  inline ListRecommendationsBatchRequest(ListRecommendationsBatchRequest&& from) noexcept
+      : ListRecommendationsBatchRequest(nullptr, ::std::move(from)) {}
+  inline ListRecommendationsBatchRequest& operator=(const ListRecommendationsBatchRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetFlagResponse& operator=(GetFlagResponse&& from) noexcept {
+  inline ListRecommendationsBatchRequest& operator=(ListRecommendationsBatchRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -6651,13 +6737,13 @@ class GetFlagResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetFlagResponse& default_instance() {
-    return *reinterpret_cast<const GetFlagResponse*>(
-        &_GetFlagResponse_default_instance_);
+  static const ListRecommendationsBatchRequest& default_instance() {
+    return *reinterpret_cast<const ListRecommendationsBatchRequest*>(
+        &_ListRecommendationsBatchRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 34;
-  friend void swap(GetFlagResponse& a, GetFlagResponse& b) { a.Swap(&b); }
-  inline void Swap(GetFlagResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 8;
+  friend void swap(ListRecommendationsBatchRequest& a, ListRecommendationsBatchRequest& b) { a.Swap(&b); }
+  inline void Swap(ListRecommendationsBatchRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -6665,7 +6751,7 @@ class GetFlagResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetFlagResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ListRecommendationsBatchRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -6673,13 +6759,13 @@ class GetFlagResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  GetFlagResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<GetFlagResponse>(arena);
+  ListRecommendationsBatchRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ListRecommendationsBatchRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetFlagResponse& from);
+  void CopyFrom(const ListRecommendationsBatchRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const GetFlagResponse& from) { GetFlagResponse::MergeImpl(*this, from); }
+  void MergeFrom(const ListRecommendationsBatchRequest& from) { ListRecommendationsBatchRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -6715,18 +6801,18 @@ class GetFlagResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(GetFlagResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(ListRecommendationsBatchRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.GetFlagResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ListRecommendationsBatchRequest"; }
 
  protected:
-  explicit GetFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  GetFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetFlagResponse& from);
-  GetFlagResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetFlagResponse&& from) noexcept
-      : GetFlagResponse(arena) {
+  explicit ListRecommendationsBatchRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ListRecommendationsBatchRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListRecommendationsBatchRequest& from);
+  ListRecommendationsBatchRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListRecommendationsBatchRequest&& from) noexcept
+      : ListRecommendationsBatchRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -6743,24 +6829,26 @@ class GetFlagResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kFlagFieldNumber = 1,
+    kRequestsFieldNumber = 1,
   };
-  // .oteldemo.Flag flag = 1;
-  bool has_flag() const;
-  void clear_flag() ;
-  const ::oteldemo::Flag& flag() const;
-  [[nodiscard]] ::oteldemo::Flag* PROTOBUF_NULLABLE release_flag();
-  ::oteldemo::Flag* PROTOBUF_NONNULL mutable_flag();
-  void set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
-  ::oteldemo::Flag* PROTOBUF_NULLABLE unsafe_arena_release_flag();
-
+  // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+  int requests_size() const;
   private:
-  const ::oteldemo::Flag& _internal_flag() const;
-  ::oteldemo::Flag* PROTOBUF_NONNULL _internal_mutable_flag();
+  int _internal_requests_size() const;
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagResponse)
+  void clear_requests() ;
+  ::oteldemo::ListRecommendationsRequest* PROTOBUF_NONNULL mutable_requests(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>* PROTOBUF_NONNULL mutable_requests();
+
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>& _internal_requests() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>* PROTOBUF_NONNULL _internal_mutable_requests();
+  public:
+  const ::oteldemo::ListRecommendationsRequest& requests(int index) const;
+  ::oteldemo::ListRecommendationsRequest* PROTOBUF_NONNULL add_requests();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>& requests() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsBatchRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
@@ -6783,43 +6871,42 @@ class GetFlagResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const GetFlagResponse& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+        const ListRecommendationsBatchRequest& from_msg);
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsRequest > requests_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Flag* PROTOBUF_NULLABLE flag_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull GetFlagResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ListRecommendationsBatchRequest_class_data_;
 // -------------------------------------------------------------------
 
-class CurrencyConversionRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.CurrencyConversionRequest) */ {
+class ListFlagsResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsResponse) */ {
  public:
-  inline CurrencyConversionRequest() : CurrencyConversionRequest(nullptr) {}
-  ~CurrencyConversionRequest() PROTOBUF_FINAL;
+  inline ListFlagsResponse() : ListFlagsResponse(nullptr) {}
+  ~ListFlagsResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(CurrencyConversionRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ListFlagsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(CurrencyConversionRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListFlagsResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR CurrencyConversionRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ListFlagsResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline CurrencyConversionRequest(const CurrencyConversionRequest& from) : CurrencyConversionRequest(nullptr, from) {}
-  inline CurrencyConversionRequest(CurrencyConversionRequest&& from) noexcept
-      : CurrencyConversionRequest(nullptr, ::std::move(from)) {}
-  inline CurrencyConversionRequest& operator=(const CurrencyConversionRequest& from) {
+  inline ListFlagsResponse(const ListFlagsResponse& from) : ListFlagsResponse(nullptr, from) {}
+  inline ListFlagsResponse(ListFlagsResponse&& from) noexcept
+      : ListFlagsResponse(nullptr, ::std::move(from)) {}
+  inline ListFlagsResponse& operator=(const ListFlagsResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CurrencyConversionRequest& operator=(CurrencyConversionRequest&& from) noexcept {
+  inline ListFlagsResponse& operator=(ListFlagsResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -6847,13 +6934,13 @@ class CurrencyConversionRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CurrencyConversionRequest& default_instance() {
-    return *reinterpret_cast<const CurrencyConversionRequest*>(
-        &_CurrencyConversionRequest_default_instance_);
+  static const ListFlagsResponse& default_instance() {
+    return *reinterpret_cast<const ListFlagsResponse*>(
+        &_ListFlagsResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 20;
-  friend void swap(CurrencyConversionRequest& a, CurrencyConversionRequest& b) { a.Swap(&b); }
-  inline void Swap(CurrencyConversionRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 44;
+  friend void swap(ListFlagsResponse& a, ListFlagsResponse& b) { a.Swap(&b); }
+  inline void Swap(ListFlagsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -6861,7 +6948,7 @@ class CurrencyConversionRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CurrencyConversionRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ListFlagsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -6869,13 +6956,13 @@ class CurrencyConversionRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  CurrencyConversionRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<CurrencyConversionRequest>(arena);
+  ListFlagsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ListFlagsResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CurrencyConversionRequest& from);
+  void CopyFrom(const ListFlagsResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const CurrencyConversionRequest& from) { CurrencyConversionRequest::MergeImpl(*this, from); }
+  void MergeFrom(const ListFlagsResponse& from) { ListFlagsResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -6911,18 +6998,18 @@ class CurrencyConversionRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(CurrencyConversionRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(ListFlagsResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.CurrencyConversionRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ListFlagsResponse"; }
 
  protected:
-  explicit CurrencyConversionRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  CurrencyConversionRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CurrencyConversionRequest& from);
-  CurrencyConversionRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CurrencyConversionRequest&& from) noexcept
-      : CurrencyConversionRequest(arena) {
+  explicit ListFlagsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ListFlagsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListFlagsResponse& from);
+  ListFlagsResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListFlagsResponse&& from) noexcept
+      : ListFlagsResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -6939,45 +7026,31 @@ class CurrencyConversionRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kToCodeFieldNumber = 2,
-    kFromFieldNumber = 1,
+    kFlagFieldNumber = 1,
   };
-  // string to_code = 2;
-  void clear_to_code() ;
-  const ::std::string& to_code() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_to_code(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_to_code();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_to_code();
-  void set_allocated_to_code(::std::string* PROTOBUF_NULLABLE value);
-
+  // repeated .oteldemo.Flag flag = 1;
+  int flag_size() const;
   private:
-  const ::std::string& _internal_to_code() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_to_code(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_to_code();
+  int _internal_flag_size() const;
 
   public:
-  // .oteldemo.Money from = 1;
-  bool has_from() const;
-  void clear_from() ;
-  const ::oteldemo::Money& from() const;
-  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_from();
-  ::oteldemo::Money* PROTOBUF_NONNULL mutable_from();
-  void set_allocated_from(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_from(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_from();
+  void clear_flag() ;
+  ::oteldemo::Flag* PROTOBUF_NONNULL mutable_flag(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>* PROTOBUF_NONNULL mutable_flag();
 
   private:
-  const ::oteldemo::Money& _internal_from() const;
-  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_from();
-
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>& _internal_flag() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>* PROTOBUF_NONNULL _internal_mutable_flag();
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CurrencyConversionRequest)
+  const ::oteldemo::Flag& flag(int index) const;
+  ::oteldemo::Flag* PROTOBUF_NONNULL add_flag();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>& flag() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   1, 50,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   1, 0,
                                    2>
       _table_;
 
@@ -6995,44 +7068,42 @@ class CurrencyConversionRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const CurrencyConversionRequest& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+        const ListFlagsResponse& from_msg);
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag > flag_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr to_code_;
-    ::oteldemo::Money* PROTOBUF_NULLABLE from_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull CurrencyConversionRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ListFlagsResponse_class_data_;
 // -------------------------------------------------------------------
 
-class CreateFlagResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagResponse) */ {
+class GetQuoteResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteResponse) */ {
  public:
-  inline CreateFlagResponse() : CreateFlagResponse(nullptr) {}
-  ~CreateFlagResponse() PROTOBUF_FINAL;
+  inline GetQuoteResponse() : GetQuoteResponse(nullptr) {}
+  ~GetQuoteResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(CreateFlagResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(GetQuoteResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(CreateFlagResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetQuoteResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR CreateFlagResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetQuoteResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline CreateFlagResponse(const CreateFlagResponse& from) : CreateFlagResponse(nullptr, from) {}
-  inline CreateFlagResponse(CreateFlagResponse&& from) noexcept
-      : CreateFlagResponse(nullptr, ::std::move(from)) {}
-  inline CreateFlagResponse& operator=(const CreateFlagResponse& from) {
+  inline GetQuoteResponse(const GetQuoteResponse& from) : GetQuoteResponse(nullptr, from) {}
+  inline GetQuoteResponse(GetQuoteResponse&& from) noexcept
+      : GetQuoteResponse(nullptr, ::std::move(from)) {}
+  inline GetQuoteResponse& operator=(const GetQuoteResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CreateFlagResponse& operator=(CreateFlagResponse&& from) noexcept {
+  inline GetQuoteResponse& operator=(GetQuoteResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -7060,13 +7131,13 @@ class CreateFlagResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CreateFlagResponse& default_instance() {
-    return *reinterpret_cast<const CreateFlagResponse*>(
-        &_CreateFlagResponse_default_instance_);
+  static const GetQuoteResponse& default_instance() {
+    return *reinterpret_cast<const GetQuoteResponse*>(
+        &_GetQuoteResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 36;
-  friend void swap(CreateFlagResponse& a, CreateFlagResponse& b) { a.Swap(&b); }
-  inline void Swap(CreateFlagResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 18;
+  friend void swap(GetQuoteResponse& a, GetQuoteResponse& b) { a.Swap(&b); }
+  inline void Swap(GetQuoteResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -7074,7 +7145,7 @@ class CreateFlagResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CreateFlagResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(GetQuoteResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -7082,13 +7153,13 @@ class CreateFlagResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  CreateFlagResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<CreateFlagResponse>(arena);
+  GetQuoteResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<GetQuoteResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CreateFlagResponse& from);
+  void CopyFrom(const GetQuoteResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const CreateFlagResponse& from) { CreateFlagResponse::MergeImpl(*this, from); }
+  void MergeFrom(const GetQuoteResponse& from) { GetQuoteResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -7124,18 +7195,18 @@ class CreateFlagResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(CreateFlagResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(GetQuoteResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.CreateFlagResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.GetQuoteResponse"; }
 
  protected:
-  explicit CreateFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  CreateFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CreateFlagResponse& from);
-  CreateFlagResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CreateFlagResponse&& from) noexcept
-      : CreateFlagResponse(arena) {
+  explicit GetQuoteResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  GetQuoteResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetQuoteResponse& from);
+  GetQuoteResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetQuoteResponse&& from) noexcept
+      : GetQuoteResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -7152,24 +7223,24 @@ class CreateFlagResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kFlagFieldNumber = 1,
+    kCostUsdFieldNumber = 1,
   };
-  // .oteldemo.Flag flag = 1;
-  bool has_flag() const;
-  void clear_flag() ;
-  const ::oteldemo::Flag& flag() const;
-  [[nodiscard]] ::oteldemo::Flag* PROTOBUF_NULLABLE release_flag();
-  ::oteldemo::Flag* PROTOBUF_NONNULL mutable_flag();
-  void set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
-  ::oteldemo::Flag* PROTOBUF_NULLABLE unsafe_arena_release_flag();
+  // .oteldemo.Money cost_usd = 1;
+  bool has_cost_usd() const;
+  void clear_cost_usd() ;
+  const ::oteldemo::Money& cost_usd() const;
+  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_cost_usd();
+  ::oteldemo::Money* PROTOBUF_NONNULL mutable_cost_usd();
+  void set_allocated_cost_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_cost_usd(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_cost_usd();
 
   private:
-  const ::oteldemo::Flag& _internal_flag() const;
-  ::oteldemo::Flag* PROTOBUF_NONNULL _internal_mutable_flag();
+  const ::oteldemo::Money& _internal_cost_usd() const;
+  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_cost_usd();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
@@ -7192,43 +7263,43 @@ class CreateFlagResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const CreateFlagResponse& from_msg);
+        const GetQuoteResponse& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Flag* PROTOBUF_NULLABLE flag_;
+    ::oteldemo::Money* PROTOBUF_NULLABLE cost_usd_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull CreateFlagResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull GetQuoteResponse_class_data_;
 // -------------------------------------------------------------------
 
-class ChargeRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ChargeRequest) */ {
+class GetQuoteRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteRequest) */ {
  public:
-  inline ChargeRequest() : ChargeRequest(nullptr) {}
-  ~ChargeRequest() PROTOBUF_FINAL;
+  inline GetQuoteRequest() : GetQuoteRequest(nullptr) {}
+  ~GetQuoteRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ChargeRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(GetQuoteRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ChargeRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetQuoteRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ChargeRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetQuoteRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline ChargeRequest(const ChargeRequest& from) : ChargeRequest(nullptr, from) {}
-  inline ChargeRequest(ChargeRequest&& from) noexcept
-      : ChargeRequest(nullptr, ::std::move(from)) {}
-  inline ChargeRequest& operator=(const ChargeRequest& from) {
+  inline GetQuoteRequest(const GetQuoteRequest& from) : GetQuoteRequest(nullptr, from) {}
+  inline GetQuoteRequest(GetQuoteRequest&& from) noexcept
+      : GetQuoteRequest(nullptr, ::std::move(from)) {}
+  inline GetQuoteRequest& operator=(const GetQuoteRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ChargeRequest& operator=(ChargeRequest&& from) noexcept {
+  inline GetQuoteRequest& operator=(GetQuoteRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -7256,13 +7327,13 @@ class ChargeRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ChargeRequest& default_instance() {
-    return *reinterpret_cast<const ChargeRequest*>(
-        &_ChargeRequest_default_instance_);
+  static const GetQuoteRequest& default_instance() {
+    return *reinterpret_cast<const GetQuoteRequest*>(
+        &_GetQuoteRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 22;
-  friend void swap(ChargeRequest& a, ChargeRequest& b) { a.Swap(&b); }
-  inline void Swap(ChargeRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 17;
+  friend void swap(GetQuoteRequest& a, GetQuoteRequest& b) { a.Swap(&b); }
+  inline void Swap(GetQuoteRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -7270,7 +7341,7 @@ class ChargeRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ChargeRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(GetQuoteRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -7278,13 +7349,13 @@ class ChargeRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ChargeRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ChargeRequest>(arena);
+  GetQuoteRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<GetQuoteRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ChargeRequest& from);
+  void CopyFrom(const GetQuoteRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ChargeRequest& from) { ChargeRequest::MergeImpl(*this, from); }
+  void MergeFrom(const GetQuoteRequest& from) { GetQuoteRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -7320,18 +7391,18 @@ class ChargeRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ChargeRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(GetQuoteRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ChargeRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.GetQuoteRequest"; }
 
  protected:
-  explicit ChargeRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ChargeRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ChargeRequest& from);
-  ChargeRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ChargeRequest&& from) noexcept
-      : ChargeRequest(arena) {
+  explicit GetQuoteRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  GetQuoteRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetQuoteRequest& from);
+  GetQuoteRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetQuoteRequest&& from) noexcept
+      : GetQuoteRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -7348,40 +7419,42 @@ class ChargeRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kAmountFieldNumber = 1,
-    kCreditCardFieldNumber = 2,
+    kItemsFieldNumber = 2,
+    kAddressFieldNumber = 1,
   };
-  // .oteldemo.Money amount = 1;
-  bool has_amount() const;
-  void clear_amount() ;
-  const ::oteldemo::Money& amount() const;
-  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_amount();
-  ::oteldemo::Money* PROTOBUF_NONNULL mutable_amount();
-  void set_allocated_amount(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_amount(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_amount();
-
+  // repeated .oteldemo.CartItem items = 2;
+  int items_size() const;
   private:
-  const ::oteldemo::Money& _internal_amount() const;
-  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_amount();
+  int _internal_items_size() const;
 
   public:
-  // .oteldemo.CreditCardInfo credit_card = 2;
-  bool has_credit_card() const;
-  void clear_credit_card() ;
-  const ::oteldemo::CreditCardInfo& credit_card() const;
-  [[nodiscard]] ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE release_credit_card();
-  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL mutable_credit_card();
-  void set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
-  ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE unsafe_arena_release_credit_card();
+  void clear_items() ;
+  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_items(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL mutable_items();
 
   private:
-  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
-  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL _internal_mutable_credit_card();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL _internal_mutable_items();
+  public:
+  const ::oteldemo::CartItem& items(int index) const;
+  ::oteldemo::CartItem* PROTOBUF_NONNULL add_items();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& items() const;
+  // .oteldemo.Address address = 1;
+  bool has_address() const;
+  void clear_address() ;
+  const ::oteldemo::Address& address() const;
+  [[nodiscard]] ::oteldemo::Address* PROTOBUF_NULLABLE release_address();
+  ::oteldemo::Address* PROTOBUF_NONNULL mutable_address();
+  void set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
+  ::oteldemo::Address* PROTOBUF_NULLABLE unsafe_arena_release_address();
+
+  private:
+  const ::oteldemo::Address& _internal_address() const;
+  ::oteldemo::Address* PROTOBUF_NONNULL _internal_mutable_address();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ChargeRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
@@ -7404,44 +7477,44 @@ class ChargeRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ChargeRequest& from_msg);
+        const GetQuoteRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Money* PROTOBUF_NULLABLE amount_;
-    ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE credit_card_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
+    ::oteldemo::Address* PROTOBUF_NULLABLE address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ChargeRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull GetQuoteRequest_class_data_;
 // -------------------------------------------------------------------
 
-class Cart final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.Cart) */ {
+class GetFlagResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.GetFlagResponse) */ {
  public:
-  inline Cart() : Cart(nullptr) {}
-  ~Cart() PROTOBUF_FINAL;
+  inline GetFlagResponse() : GetFlagResponse(nullptr) {}
+  ~GetFlagResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(Cart* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(GetFlagResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(Cart));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(GetFlagResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR Cart(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetFlagResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline Cart(const Cart& from) : Cart(nullptr, from) {}
-  inline Cart(Cart&& from) noexcept
-      : Cart(nullptr, ::std::move(from)) {}
-  inline Cart& operator=(const Cart& from) {
+  inline GetFlagResponse(const GetFlagResponse& from) : GetFlagResponse(nullptr, from) {}
+  inline GetFlagResponse(GetFlagResponse&& from) noexcept
+      : GetFlagResponse(nullptr, ::std::move(from)) {}
+  inline GetFlagResponse& operator=(const GetFlagResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Cart& operator=(Cart&& from) noexcept {
+  inline GetFlagResponse& operator=(GetFlagResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -7469,13 +7542,13 @@ class Cart final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Cart& default_instance() {
-    return *reinterpret_cast<const Cart*>(
-        &_Cart_default_instance_);
+  static const GetFlagResponse& default_instance() {
+    return *reinterpret_cast<const GetFlagResponse*>(
+        &_GetFlagResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 4;
-  friend void swap(Cart& a, Cart& b) { a.Swap(&b); }
-  inline void Swap(Cart* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 38;
+  friend void swap(GetFlagResponse& a, GetFlagResponse& b) { a.Swap(&b); }
+  inline void Swap(GetFlagResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -7483,7 +7556,7 @@ class Cart final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Cart* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(GetFlagResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -7491,13 +7564,13 @@ class Cart final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  Cart* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<Cart>(arena);
+  GetFlagResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<GetFlagResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Cart& from);
+  void CopyFrom(const GetFlagResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const Cart& from) { Cart::MergeImpl(*this, from); }
+  void MergeFrom(const GetFlagResponse& from) { GetFlagResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -7533,18 +7606,18 @@ class Cart final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(Cart* PROTOBUF_NONNULL other);
+  void InternalSwap(GetFlagResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.Cart"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.GetFlagResponse"; }
 
  protected:
-  explicit Cart(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  Cart(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Cart& from);
-  Cart(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Cart&& from) noexcept
-      : Cart(arena) {
+  explicit GetFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  GetFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const GetFlagResponse& from);
+  GetFlagResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, GetFlagResponse&& from) noexcept
+      : GetFlagResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -7561,47 +7634,29 @@ class Cart final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kItemsFieldNumber = 2,
-    kUserIdFieldNumber = 1,
+    kFlagFieldNumber = 1,
   };
-  // repeated .oteldemo.CartItem items = 2;
-  int items_size() const;
-  private:
-  int _internal_items_size() const;
-
-  public:
-  void clear_items() ;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_items(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL mutable_items();
-
-  private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL _internal_mutable_items();
-  public:
-  const ::oteldemo::CartItem& items(int index) const;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL add_items();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& items() const;
-  // string user_id = 1;
-  void clear_user_id() ;
-  const ::std::string& user_id() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_user_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_user_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
-  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+  // .oteldemo.Flag flag = 1;
+  bool has_flag() const;
+  void clear_flag() ;
+  const ::oteldemo::Flag& flag() const;
+  [[nodiscard]] ::oteldemo::Flag* PROTOBUF_NULLABLE release_flag();
+  ::oteldemo::Flag* PROTOBUF_NONNULL mutable_flag();
+  void set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
+  ::oteldemo::Flag* PROTOBUF_NULLABLE unsafe_arena_release_flag();
 
   private:
-  const ::std::string& _internal_user_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+  const ::oteldemo::Flag& _internal_flag() const;
+  ::oteldemo::Flag* PROTOBUF_NONNULL _internal_mutable_flag();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Cart)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   1, 29,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   1, 0,
                                    2>
       _table_;
 
@@ -7619,44 +7674,43 @@ class Cart final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const Cart& from_msg);
+        const GetFlagResponse& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
-    ::google::protobuf::internal::ArenaStringPtr user_id_;
+    ::oteldemo::Flag* PROTOBUF_NULLABLE flag_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull Cart_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull GetFlagResponse_class_data_;
 // -------------------------------------------------------------------
 
-class AddItemRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.AddItemRequest) */ {
+class CurrencyConversionRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.CurrencyConversionRequest) */ {
  public:
-  inline AddItemRequest() : AddItemRequest(nullptr) {}
-  ~AddItemRequest() PROTOBUF_FINAL;
+  inline CurrencyConversionRequest() : CurrencyConversionRequest(nullptr) {}
+  ~CurrencyConversionRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(AddItemRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(CurrencyConversionRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(AddItemRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(CurrencyConversionRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR AddItemRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR CurrencyConversionRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline AddItemRequest(const AddItemRequest& from) : AddItemRequest(nullptr, from) {}
-  inline AddItemRequest(AddItemRequest&& from) noexcept
-      : AddItemRequest(nullptr, ::std::move(from)) {}
-  inline AddItemRequest& operator=(const AddItemRequest& from) {
+  inline CurrencyConversionRequest(const CurrencyConversionRequest& from) : CurrencyConversionRequest(nullptr, from) {}
+  inline CurrencyConversionRequest(CurrencyConversionRequest&& from) noexcept
+      : CurrencyConversionRequest(nullptr, ::std::move(from)) {}
+  inline CurrencyConversionRequest& operator=(const CurrencyConversionRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline AddItemRequest& operator=(AddItemRequest&& from) noexcept {
+  inline CurrencyConversionRequest& operator=(CurrencyConversionRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -7684,13 +7738,13 @@ class AddItemRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const AddItemRequest& default_instance() {
-    return *reinterpret_cast<const AddItemRequest*>(
-        &_AddItemRequest_default_instance_);
+  static const CurrencyConversionRequest& default_instance() {
+    return *reinterpret_cast<const CurrencyConversionRequest*>(
+        &_CurrencyConversionRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 1;
-  friend void swap(AddItemRequest& a, AddItemRequest& b) { a.Swap(&b); }
-  inline void Swap(AddItemRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 24;
+  friend void swap(CurrencyConversionRequest& a, CurrencyConversionRequest& b) { a.Swap(&b); }
+  inline void Swap(CurrencyConversionRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -7698,7 +7752,7 @@ class AddItemRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(AddItemRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(CurrencyConversionRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -7706,13 +7760,13 @@ class AddItemRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  AddItemRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<AddItemRequest>(arena);
+  CurrencyConversionRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<CurrencyConversionRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const AddItemRequest& from);
+  void CopyFrom(const CurrencyConversionRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const AddItemRequest& from) { AddItemRequest::MergeImpl(*this, from); }
+  void MergeFrom(const CurrencyConversionRequest& from) { CurrencyConversionRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -7748,18 +7802,18 @@ class AddItemRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(AddItemRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(CurrencyConversionRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.AddItemRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.CurrencyConversionRequest"; }
 
  protected:
-  explicit AddItemRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  AddItemRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const AddItemRequest& from);
-  AddItemRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, AddItemRequest&& from) noexcept
-      : AddItemRequest(arena) {
+  explicit CurrencyConversionRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  CurrencyConversionRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CurrencyConversionRequest& from);
+  CurrencyConversionRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CurrencyConversionRequest&& from) noexcept
+      : CurrencyConversionRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -7776,45 +7830,45 @@ class AddItemRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kUserIdFieldNumber = 1,
-    kItemFieldNumber = 2,
+    kToCodeFieldNumber = 2,
+    kFromFieldNumber = 1,
   };
-  // string user_id = 1;
-  void clear_user_id() ;
-  const ::std::string& user_id() const;
+  // string to_code = 2;
+  void clear_to_code() ;
+  const ::std::string& to_code() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_user_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_user_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
-  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+  void set_to_code(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_to_code();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_to_code();
+  void set_allocated_to_code(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_user_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
+  const ::std::string& _internal_to_code() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_to_code(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_to_code();
 
   public:
-  // .oteldemo.CartItem item = 2;
-  bool has_item() const;
-  void clear_item() ;
-  const ::oteldemo::CartItem& item() const;
-  [[nodiscard]] ::oteldemo::CartItem* PROTOBUF_NULLABLE release_item();
-  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_item();
-  void set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
-  ::oteldemo::CartItem* PROTOBUF_NULLABLE unsafe_arena_release_item();
+  // .oteldemo.Money from = 1;
+  bool has_from() const;
+  void clear_from() ;
+  const ::oteldemo::Money& from() const;
+  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_from();
+  ::oteldemo::Money* PROTOBUF_NONNULL mutable_from();
+  void set_allocated_from(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_from(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_from();
 
   private:
-  const ::oteldemo::CartItem& _internal_item() const;
-  ::oteldemo::CartItem* PROTOBUF_NONNULL _internal_mutable_item();
+  const ::oteldemo::Money& _internal_from() const;
+  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_from();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.AddItemRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.CurrencyConversionRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
   static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   1, 39,
+                                   1, 50,
                                    2>
       _table_;
 
@@ -7832,44 +7886,44 @@ class AddItemRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const AddItemRequest& from_msg);
+        const CurrencyConversionRequest& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr user_id_;
-    ::oteldemo::CartItem* PROTOBUF_NULLABLE item_;
+    ::google::protobuf::internal::ArenaStringPtr to_code_;
+    ::oteldemo::Money* PROTOBUF_NULLABLE from_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull AddItemRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull CurrencyConversionRequest_class_data_;
 // -------------------------------------------------------------------
 
-class AdResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.AdResponse) */ {
+class CreateFlagResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagResponse) */ {
  public:
-  inline AdResponse() : AdResponse(nullptr) {}
-  ~AdResponse() PROTOBUF_FINAL;
+  inline CreateFlagResponse() : CreateFlagResponse(nullptr) {}
+  ~CreateFlagResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(AdResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(CreateFlagResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(AdResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(CreateFlagResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR AdResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR CreateFlagResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline AdResponse(const AdResponse& from) : AdResponse(nullptr, from) {}
-  inline AdResponse(AdResponse&& from) noexcept
-      : AdResponse(nullptr, ::std::move(from)) {}
-  inline AdResponse& operator=(const AdResponse& from) {
+  inline CreateFlagResponse(const CreateFlagResponse& from) : CreateFlagResponse(nullptr, from) {}
+  inline CreateFlagResponse(CreateFlagResponse&& from) noexcept
+      : CreateFlagResponse(nullptr, ::std::move(from)) {}
+  inline CreateFlagResponse& operator=(const CreateFlagResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline AdResponse& operator=(AdResponse&& from) noexcept {
+  inline CreateFlagResponse& operator=(CreateFlagResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -7897,13 +7951,13 @@ class AdResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const AdResponse& default_instance() {
-    return *reinterpret_cast<const AdResponse*>(
-        &_AdResponse_default_instance_);
+  static const CreateFlagResponse& default_instance() {
+    return *reinterpret_cast<const CreateFlagResponse*>(
+        &_CreateFlagResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 30;
-  friend void swap(AdResponse& a, AdResponse& b) { a.Swap(&b); }
-  inline void Swap(AdResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 40;
+  friend void swap(CreateFlagResponse& a, CreateFlagResponse& b) { a.Swap(&b); }
+  inline void Swap(CreateFlagResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -7911,7 +7965,7 @@ class AdResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(AdResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(CreateFlagResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -7919,13 +7973,13 @@ class AdResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  AdResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<AdResponse>(arena);
+  CreateFlagResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<CreateFlagResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const AdResponse& from);
+  void CopyFrom(const CreateFlagResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const AdResponse& from) { AdResponse::MergeImpl(*this, from); }
+  void MergeFrom(const CreateFlagResponse& from) { CreateFlagResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -7961,18 +8015,18 @@ class AdResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(AdResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(CreateFlagResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.AdResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.CreateFlagResponse"; }
 
  protected:
-  explicit AdResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  AdResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const AdResponse& from);
-  AdResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, AdResponse&& from) noexcept
-      : AdResponse(arena) {
+  explicit CreateFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  CreateFlagResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const CreateFlagResponse& from);
+  CreateFlagResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, CreateFlagResponse&& from) noexcept
+      : CreateFlagResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -7989,26 +8043,24 @@ class AdResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kAdsFieldNumber = 1,
+    kFlagFieldNumber = 1,
   };
-  // repeated .oteldemo.Ad ads = 1;
-  int ads_size() const;
-  private:
-  int _internal_ads_size() const;
-
-  public:
-  void clear_ads() ;
-  ::oteldemo::Ad* PROTOBUF_NONNULL mutable_ads(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>* PROTOBUF_NONNULL mutable_ads();
+  // .oteldemo.Flag flag = 1;
+  bool has_flag() const;
+  void clear_flag() ;
+  const ::oteldemo::Flag& flag() const;
+  [[nodiscard]] ::oteldemo::Flag* PROTOBUF_NULLABLE release_flag();
+  ::oteldemo::Flag* PROTOBUF_NONNULL mutable_flag();
+  void set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* PROTOBUF_NULLABLE value);
+  ::oteldemo::Flag* PROTOBUF_NULLABLE unsafe_arena_release_flag();
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>& _internal_ads() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>* PROTOBUF_NONNULL _internal_mutable_ads();
+  const ::oteldemo::Flag& _internal_flag() const;
+  ::oteldemo::Flag* PROTOBUF_NONNULL _internal_mutable_flag();
+
   public:
-  const ::oteldemo::Ad& ads(int index) const;
-  ::oteldemo::Ad* PROTOBUF_NONNULL add_ads();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>& ads() const;
-  // @@protoc_insertion_point(class_scope:oteldemo.AdResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
@@ -8031,42 +8083,43 @@ class AdResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const AdResponse& from_msg);
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad > ads_;
+        const CreateFlagResponse& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::Flag* PROTOBUF_NULLABLE flag_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull AdResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull CreateFlagResponse_class_data_;
 // -------------------------------------------------------------------
 
-class SearchProductsResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.SearchProductsResponse) */ {
+class ChargeRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ChargeRequest) */ {
  public:
-  inline SearchProductsResponse() : SearchProductsResponse(nullptr) {}
-  ~SearchProductsResponse() PROTOBUF_FINAL;
+  inline ChargeRequest() : ChargeRequest(nullptr) {}
+  ~ChargeRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(SearchProductsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(ChargeRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(SearchProductsResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ChargeRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR SearchProductsResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ChargeRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline SearchProductsResponse(const SearchProductsResponse& from) : SearchProductsResponse(nullptr, from) {}
-  inline SearchProductsResponse(SearchProductsResponse&& from) noexcept
-      : SearchProductsResponse(nullptr, ::std::move(from)) {}
-  inline SearchProductsResponse& operator=(const SearchProductsResponse& from) {
+  inline ChargeRequest(const ChargeRequest& from) : ChargeRequest(nullptr, from) {}
+  inline ChargeRequest(ChargeRequest&& from) noexcept
+      : ChargeRequest(nullptr, ::std::move(from)) {}
+  inline ChargeRequest& operator=(const ChargeRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline SearchProductsResponse& operator=(SearchProductsResponse&& from) noexcept {
+  inline ChargeRequest& operator=(ChargeRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -8094,13 +8147,13 @@ class SearchProductsResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const SearchProductsResponse& default_instance() {
-    return *reinterpret_cast<const SearchProductsResponse*>(
-        &_SearchProductsResponse_default_instance_);
+  static const ChargeRequest& default_instance() {
+    return *reinterpret_cast<const ChargeRequest*>(
+        &_ChargeRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 12;
-  friend void swap(SearchProductsResponse& a, SearchProductsResponse& b) { a.Swap(&b); }
-  inline void Swap(SearchProductsResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 26;
+  friend void swap(ChargeRequest& a, ChargeRequest& b) { a.Swap(&b); }
+  inline void Swap(ChargeRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -8108,7 +8161,7 @@ class SearchProductsResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(SearchProductsResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(ChargeRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -8116,13 +8169,13 @@ class SearchProductsResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  SearchProductsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<SearchProductsResponse>(arena);
+  ChargeRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ChargeRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const SearchProductsResponse& from);
+  void CopyFrom(const ChargeRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const SearchProductsResponse& from) { SearchProductsResponse::MergeImpl(*this, from); }
+  void MergeFrom(const ChargeRequest& from) { ChargeRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -8158,18 +8211,18 @@ class SearchProductsResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(SearchProductsResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(ChargeRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.SearchProductsResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.ChargeRequest"; }
 
  protected:
-  explicit SearchProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  SearchProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const SearchProductsResponse& from);
-  SearchProductsResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, SearchProductsResponse&& from) noexcept
-      : SearchProductsResponse(arena) {
+  explicit ChargeRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ChargeRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ChargeRequest& from);
+  ChargeRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ChargeRequest&& from) noexcept
+      : ChargeRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -8186,31 +8239,45 @@ class SearchProductsResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kResultsFieldNumber = 1,
+    kAmountFieldNumber = 1,
+    kCreditCardFieldNumber = 2,
   };
-  // repeated .oteldemo.Product results = 1;
-  int results_size() const;
+  // .oteldemo.Money amount = 1;
+  bool has_amount() const;
+  void clear_amount() ;
+  const ::oteldemo::Money& amount() const;
+  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_amount();
+  ::oteldemo::Money* PROTOBUF_NONNULL mutable_amount();
+  void set_allocated_amount(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_amount(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_amount();
+
   private:
-  int _internal_results_size() const;
+  const ::oteldemo::Money& _internal_amount() const;
+  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_amount();
 
   public:
-  void clear_results() ;
-  ::oteldemo::Product* PROTOBUF_NONNULL mutable_results(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL mutable_results();
+  // .oteldemo.CreditCardInfo credit_card = 2;
+  bool has_credit_card() const;
+  void clear_credit_card() ;
+  const ::oteldemo::CreditCardInfo& credit_card() const;
+  [[nodiscard]] ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE release_credit_card();
+  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL mutable_credit_card();
+  void set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE value);
+  ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE unsafe_arena_release_credit_card();
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& _internal_results() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL _internal_mutable_results();
+  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
+  ::oteldemo::CreditCardInfo* PROTOBUF_NONNULL _internal_mutable_credit_card();
+
   public:
-  const ::oteldemo::Product& results(int index) const;
-  ::oteldemo::Product* PROTOBUF_NONNULL add_results();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& results() const;
-  // @@protoc_insertion_point(class_scope:oteldemo.SearchProductsResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.ChargeRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   1, 0,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   2, 0,
                                    2>
       _table_;
 
@@ -8228,42 +8295,44 @@ class SearchProductsResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const SearchProductsResponse& from_msg);
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::Product > results_;
+        const ChargeRequest& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::Money* PROTOBUF_NULLABLE amount_;
+    ::oteldemo::CreditCardInfo* PROTOBUF_NULLABLE credit_card_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull SearchProductsResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull ChargeRequest_class_data_;
 // -------------------------------------------------------------------
 
-class OrderResult final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.OrderResult) */ {
+class Cart final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.Cart) */ {
  public:
-  inline OrderResult() : OrderResult(nullptr) {}
-  ~OrderResult() PROTOBUF_FINAL;
+  inline Cart() : Cart(nullptr) {}
+  ~Cart() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(OrderResult* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(Cart* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(OrderResult));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(Cart));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR OrderResult(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Cart(::google::protobuf::internal::ConstantInitialized);
 
-  inline OrderResult(const OrderResult& from) : OrderResult(nullptr, from) {}
-  inline OrderResult(OrderResult&& from) noexcept
-      : OrderResult(nullptr, ::std::move(from)) {}
-  inline OrderResult& operator=(const OrderResult& from) {
+  inline Cart(const Cart& from) : Cart(nullptr, from) {}
+  inline Cart(Cart&& from) noexcept
+      : Cart(nullptr, ::std::move(from)) {}
+  inline Cart& operator=(const Cart& from) {
     CopyFrom(from);
     return *this;
   }
-  inline OrderResult& operator=(OrderResult&& from) noexcept {
+  inline Cart& operator=(Cart&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -8291,13 +8360,13 @@ class OrderResult final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const OrderResult& default_instance() {
-    return *reinterpret_cast<const OrderResult*>(
-        &_OrderResult_default_instance_);
+  static const Cart& default_instance() {
+    return *reinterpret_cast<const Cart*>(
+        &_Cart_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 25;
-  friend void swap(OrderResult& a, OrderResult& b) { a.Swap(&b); }
-  inline void Swap(OrderResult* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 4;
+  friend void swap(Cart& a, Cart& b) { a.Swap(&b); }
+  inline void Swap(Cart* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -8305,7 +8374,7 @@ class OrderResult final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(OrderResult* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(Cart* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -8313,13 +8382,13 @@ class OrderResult final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  OrderResult* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<OrderResult>(arena);
+  Cart* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<Cart>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const OrderResult& from);
+  void CopyFrom(const Cart& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const OrderResult& from) { OrderResult::MergeImpl(*this, from); }
+  void MergeFrom(const Cart& from) { Cart::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -8355,18 +8424,18 @@ class OrderResult final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(OrderResult* PROTOBUF_NONNULL other);
+  void InternalSwap(Cart* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.OrderResult"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.Cart"; }
 
  protected:
-  explicit OrderResult(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  OrderResult(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const OrderResult& from);
-  OrderResult(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, OrderResult&& from) noexcept
-      : OrderResult(arena) {
+  explicit Cart(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  Cart(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Cart& from);
+  Cart(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, Cart&& from) noexcept
+      : Cart(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -8383,95 +8452,47 @@ class OrderResult final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kItemsFieldNumber = 5,
-    kOrderIdFieldNumber = 1,
-    kShippingTrackingIdFieldNumber = 2,
-    kShippingCostFieldNumber = 3,
-    kShippingAddressFieldNumber = 4,
+    kItemsFieldNumber = 2,
+    kUserIdFieldNumber = 1,
   };
-  // repeated .oteldemo.OrderItem items = 5;
+  // repeated .oteldemo.CartItem items = 2;
   int items_size() const;
   private:
   int _internal_items_size() const;
 
   public:
   void clear_items() ;
-  ::oteldemo::OrderItem* PROTOBUF_NONNULL mutable_items(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>* PROTOBUF_NONNULL mutable_items();
+  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_items(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL mutable_items();
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>& _internal_items() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>* PROTOBUF_NONNULL _internal_mutable_items();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL _internal_mutable_items();
   public:
-  const ::oteldemo::OrderItem& items(int index) const;
-  ::oteldemo::OrderItem* PROTOBUF_NONNULL add_items();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>& items() const;
-  // string order_id = 1;
-  void clear_order_id() ;
-  const ::std::string& order_id() const;
+  const ::oteldemo::CartItem& items(int index) const;
+  ::oteldemo::CartItem* PROTOBUF_NONNULL add_items();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& items() const;
+  // string user_id = 1;
+  void clear_user_id() ;
+  const ::std::string& user_id() const;
   template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_order_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_order_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_order_id();
-  void set_allocated_order_id(::std::string* PROTOBUF_NULLABLE value);
+  void set_user_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_user_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
+  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
 
   private:
-  const ::std::string& _internal_order_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_order_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_order_id();
-
-  public:
-  // string shipping_tracking_id = 2;
-  void clear_shipping_tracking_id() ;
-  const ::std::string& shipping_tracking_id() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_shipping_tracking_id(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_shipping_tracking_id();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_shipping_tracking_id();
-  void set_allocated_shipping_tracking_id(::std::string* PROTOBUF_NULLABLE value);
-
-  private:
-  const ::std::string& _internal_shipping_tracking_id() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_shipping_tracking_id(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_shipping_tracking_id();
-
-  public:
-  // .oteldemo.Money shipping_cost = 3;
-  bool has_shipping_cost() const;
-  void clear_shipping_cost() ;
-  const ::oteldemo::Money& shipping_cost() const;
-  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_shipping_cost();
-  ::oteldemo::Money* PROTOBUF_NONNULL mutable_shipping_cost();
-  void set_allocated_shipping_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_shipping_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
-  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_shipping_cost();
-
-  private:
-  const ::oteldemo::Money& _internal_shipping_cost() const;
-  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_shipping_cost();
-
-  public:
-  // .oteldemo.Address shipping_address = 4;
-  bool has_shipping_address() const;
-  void clear_shipping_address() ;
-  const ::oteldemo::Address& shipping_address() const;
-  [[nodiscard]] ::oteldemo::Address* PROTOBUF_NULLABLE release_shipping_address();
-  ::oteldemo::Address* PROTOBUF_NONNULL mutable_shipping_address();
-  void set_allocated_shipping_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_shipping_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
-  ::oteldemo::Address* PROTOBUF_NULLABLE unsafe_arena_release_shipping_address();
-
-  private:
-  const ::oteldemo::Address& _internal_shipping_address() const;
-  ::oteldemo::Address* PROTOBUF_NONNULL _internal_mutable_shipping_address();
+  const ::std::string& _internal_user_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.OrderResult)
+  // @@protoc_insertion_point(class_scope:oteldemo.Cart)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<3, 5,
-                                   3, 57,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   1, 29,
                                    2>
       _table_;
 
@@ -8489,47 +8510,44 @@ class OrderResult final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const OrderResult& from_msg);
+        const Cart& from_msg);
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem > items_;
-    ::google::protobuf::internal::ArenaStringPtr order_id_;
-    ::google::protobuf::internal::ArenaStringPtr shipping_tracking_id_;
-    ::oteldemo::Money* PROTOBUF_NULLABLE shipping_cost_;
-    ::oteldemo::Address* PROTOBUF_NULLABLE shipping_address_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
+    ::google::protobuf::internal::ArenaStringPtr user_id_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull OrderResult_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull Cart_class_data_;
 // -------------------------------------------------------------------
 
-class ListProductsResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.ListProductsResponse) */ {
+class AddItemRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.AddItemRequest) */ {
  public:
-  inline ListProductsResponse() : ListProductsResponse(nullptr) {}
-  ~ListProductsResponse() PROTOBUF_FINAL;
+  inline AddItemRequest() : AddItemRequest(nullptr) {}
+  ~AddItemRequest() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(ListProductsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(AddItemRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListProductsResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(AddItemRequest));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR ListProductsResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR AddItemRequest(::google::protobuf::internal::ConstantInitialized);
 
-  inline ListProductsResponse(const ListProductsResponse& from) : ListProductsResponse(nullptr, from) {}
-  inline ListProductsResponse(ListProductsResponse&& from) noexcept
-      : ListProductsResponse(nullptr, ::std::move(from)) {}
-  inline ListProductsResponse& operator=(const ListProductsResponse& from) {
+  inline AddItemRequest(const AddItemRequest& from) : AddItemRequest(nullptr, from) {}
+  inline AddItemRequest(AddItemRequest&& from) noexcept
+      : AddItemRequest(nullptr, ::std::move(from)) {}
+  inline AddItemRequest& operator=(const AddItemRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ListProductsResponse& operator=(ListProductsResponse&& from) noexcept {
+  inline AddItemRequest& operator=(AddItemRequest&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -8557,13 +8575,13 @@ class ListProductsResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ListProductsResponse& default_instance() {
-    return *reinterpret_cast<const ListProductsResponse*>(
-        &_ListProductsResponse_default_instance_);
+  static const AddItemRequest& default_instance() {
+    return *reinterpret_cast<const AddItemRequest*>(
+        &_AddItemRequest_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 9;
-  friend void swap(ListProductsResponse& a, ListProductsResponse& b) { a.Swap(&b); }
-  inline void Swap(ListProductsResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 1;
+  friend void swap(AddItemRequest& a, AddItemRequest& b) { a.Swap(&b); }
+  inline void Swap(AddItemRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -8571,7 +8589,7 @@ class ListProductsResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ListProductsResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(AddItemRequest* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -8579,13 +8597,13 @@ class ListProductsResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  ListProductsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<ListProductsResponse>(arena);
+  AddItemRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<AddItemRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ListProductsResponse& from);
+  void CopyFrom(const AddItemRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const ListProductsResponse& from) { ListProductsResponse::MergeImpl(*this, from); }
+  void MergeFrom(const AddItemRequest& from) { AddItemRequest::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -8621,18 +8639,18 @@ class ListProductsResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(ListProductsResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(AddItemRequest* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.ListProductsResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.AddItemRequest"; }
 
  protected:
-  explicit ListProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  ListProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListProductsResponse& from);
-  ListProductsResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListProductsResponse&& from) noexcept
-      : ListProductsResponse(arena) {
+  explicit AddItemRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  AddItemRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const AddItemRequest& from);
+  AddItemRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, AddItemRequest&& from) noexcept
+      : AddItemRequest(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -8649,31 +8667,45 @@ class ListProductsResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kProductsFieldNumber = 1,
+    kUserIdFieldNumber = 1,
+    kItemFieldNumber = 2,
   };
-  // repeated .oteldemo.Product products = 1;
-  int products_size() const;
+  // string user_id = 1;
+  void clear_user_id() ;
+  const ::std::string& user_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_user_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_user_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_user_id();
+  void set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value);
+
   private:
-  int _internal_products_size() const;
+  const ::std::string& _internal_user_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_user_id();
 
   public:
-  void clear_products() ;
-  ::oteldemo::Product* PROTOBUF_NONNULL mutable_products(int index);
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL mutable_products();
+  // .oteldemo.CartItem item = 2;
+  bool has_item() const;
+  void clear_item() ;
+  const ::oteldemo::CartItem& item() const;
+  [[nodiscard]] ::oteldemo::CartItem* PROTOBUF_NULLABLE release_item();
+  ::oteldemo::CartItem* PROTOBUF_NONNULL mutable_item();
+  void set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_item(::oteldemo::CartItem* PROTOBUF_NULLABLE value);
+  ::oteldemo::CartItem* PROTOBUF_NULLABLE unsafe_arena_release_item();
 
   private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& _internal_products() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL _internal_mutable_products();
+  const ::oteldemo::CartItem& _internal_item() const;
+  ::oteldemo::CartItem* PROTOBUF_NONNULL _internal_mutable_item();
+
   public:
-  const ::oteldemo::Product& products(int index) const;
-  ::oteldemo::Product* PROTOBUF_NONNULL add_products();
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& products() const;
-  // @@protoc_insertion_point(class_scope:oteldemo.ListProductsResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.AddItemRequest)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1,
-                                   1, 0,
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   1, 39,
                                    2>
       _table_;
 
@@ -8691,42 +8723,44 @@ class ListProductsResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const ListProductsResponse& from_msg);
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::Product > products_;
+        const AddItemRequest& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr user_id_;
+    ::oteldemo::CartItem* PROTOBUF_NULLABLE item_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull ListProductsResponse_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull AddItemRequest_class_data_;
 // -------------------------------------------------------------------
 
-class SendOrderConfirmationRequest final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.SendOrderConfirmationRequest) */ {
+class AdResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.AdResponse) */ {
  public:
-  inline SendOrderConfirmationRequest() : SendOrderConfirmationRequest(nullptr) {}
-  ~SendOrderConfirmationRequest() PROTOBUF_FINAL;
+  inline AdResponse() : AdResponse(nullptr) {}
+  ~AdResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(SendOrderConfirmationRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(AdResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(SendOrderConfirmationRequest));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(AdResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR SendOrderConfirmationRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR AdResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline SendOrderConfirmationRequest(const SendOrderConfirmationRequest& from) : SendOrderConfirmationRequest(nullptr, from) {}
-  inline SendOrderConfirmationRequest(SendOrderConfirmationRequest&& from) noexcept
-      : SendOrderConfirmationRequest(nullptr, ::std::move(from)) {}
-  inline SendOrderConfirmationRequest& operator=(const SendOrderConfirmationRequest& from) {
+  inline AdResponse(const AdResponse& from) : AdResponse(nullptr, from) {}
+  inline AdResponse(AdResponse&& from) noexcept
+      : AdResponse(nullptr, ::std::move(from)) {}
+  inline AdResponse& operator=(const AdResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline SendOrderConfirmationRequest& operator=(SendOrderConfirmationRequest&& from) noexcept {
+  inline AdResponse& operator=(AdResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -8754,13 +8788,13 @@ class SendOrderConfirmationRequest final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const SendOrderConfirmationRequest& default_instance() {
-    return *reinterpret_cast<const SendOrderConfirmationRequest*>(
-        &_SendOrderConfirmationRequest_default_instance_);
+  static const AdResponse& default_instance() {
+    return *reinterpret_cast<const AdResponse*>(
+        &_AdResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 26;
-  friend void swap(SendOrderConfirmationRequest& a, SendOrderConfirmationRequest& b) { a.Swap(&b); }
-  inline void Swap(SendOrderConfirmationRequest* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 34;
+  friend void swap(AdResponse& a, AdResponse& b) { a.Swap(&b); }
+  inline void Swap(AdResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -8768,7 +8802,7 @@ class SendOrderConfirmationRequest final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(SendOrderConfirmationRequest* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(AdResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -8776,13 +8810,13 @@ class SendOrderConfirmationRequest final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  SendOrderConfirmationRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<SendOrderConfirmationRequest>(arena);
+  AdResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<AdResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const SendOrderConfirmationRequest& from);
+  void CopyFrom(const AdResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const SendOrderConfirmationRequest& from) { SendOrderConfirmationRequest::MergeImpl(*this, from); }
+  void MergeFrom(const AdResponse& from) { AdResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -8818,18 +8852,18 @@ class SendOrderConfirmationRequest final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(SendOrderConfirmationRequest* PROTOBUF_NONNULL other);
+  void InternalSwap(AdResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.SendOrderConfirmationRequest"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.AdResponse"; }
 
  protected:
-  explicit SendOrderConfirmationRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  SendOrderConfirmationRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const SendOrderConfirmationRequest& from);
-  SendOrderConfirmationRequest(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, SendOrderConfirmationRequest&& from) noexcept
-      : SendOrderConfirmationRequest(arena) {
+  explicit AdResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  AdResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const AdResponse& from);
+  AdResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, AdResponse&& from) noexcept
+      : AdResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -8846,45 +8880,31 @@ class SendOrderConfirmationRequest final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kEmailFieldNumber = 1,
-    kOrderFieldNumber = 2,
+    kAdsFieldNumber = 1,
   };
-  // string email = 1;
-  void clear_email() ;
-  const ::std::string& email() const;
-  template <typename Arg_ = const ::std::string&, typename... Args_>
-  void set_email(Arg_&& arg, Args_... args);
-  ::std::string* PROTOBUF_NONNULL mutable_email();
-  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_email();
-  void set_allocated_email(::std::string* PROTOBUF_NULLABLE value);
-
+  // repeated .oteldemo.Ad ads = 1;
+  int ads_size() const;
   private:
-  const ::std::string& _internal_email() const;
-  PROTOBUF_ALWAYS_INLINE void _internal_set_email(const ::std::string& value);
-  ::std::string* PROTOBUF_NONNULL _internal_mutable_email();
+  int _internal_ads_size() const;
 
   public:
-  // .oteldemo.OrderResult order = 2;
-  bool has_order() const;
-  void clear_order() ;
-  const ::oteldemo::OrderResult& order() const;
-  [[nodiscard]] ::oteldemo::OrderResult* PROTOBUF_NULLABLE release_order();
-  ::oteldemo::OrderResult* PROTOBUF_NONNULL mutable_order();
-  void set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
-  ::oteldemo::OrderResult* PROTOBUF_NULLABLE unsafe_arena_release_order();
+  void clear_ads() ;
+  ::oteldemo::Ad* PROTOBUF_NONNULL mutable_ads(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>* PROTOBUF_NONNULL mutable_ads();
 
   private:
-  const ::oteldemo::OrderResult& _internal_order() const;
-  ::oteldemo::OrderResult* PROTOBUF_NONNULL _internal_mutable_order();
-
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>& _internal_ads() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>* PROTOBUF_NONNULL _internal_mutable_ads();
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.SendOrderConfirmationRequest)
+  const ::oteldemo::Ad& ads(int index) const;
+  ::oteldemo::Ad* PROTOBUF_NONNULL add_ads();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>& ads() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.AdResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2,
-                                   1, 51,
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   1, 0,
                                    2>
       _table_;
 
@@ -8902,44 +8922,42 @@ class SendOrderConfirmationRequest final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const SendOrderConfirmationRequest& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+        const AdResponse& from_msg);
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad > ads_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr email_;
-    ::oteldemo::OrderResult* PROTOBUF_NULLABLE order_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull SendOrderConfirmationRequest_class_data_;
+extern const ::google::protobuf::internal::ClassDataFull AdResponse_class_data_;
 // -------------------------------------------------------------------
 
-class PlaceOrderResponse final : public ::google::protobuf::Message
-/* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderResponse) */ {
+class SearchProductsResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.SearchProductsResponse) */ {
  public:
-  inline PlaceOrderResponse() : PlaceOrderResponse(nullptr) {}
-  ~PlaceOrderResponse() PROTOBUF_FINAL;
+  inline SearchProductsResponse() : SearchProductsResponse(nullptr) {}
+  ~SearchProductsResponse() PROTOBUF_FINAL;
 
 #if defined(PROTOBUF_CUSTOM_VTABLE)
-  void operator delete(PlaceOrderResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+  void operator delete(SearchProductsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
     SharedDtor(*msg);
-    ::google::protobuf::internal::SizedDelete(msg, sizeof(PlaceOrderResponse));
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(SearchProductsResponse));
   }
 #endif
 
   template <typename = void>
-  explicit PROTOBUF_CONSTEXPR PlaceOrderResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR SearchProductsResponse(::google::protobuf::internal::ConstantInitialized);
 
-  inline PlaceOrderResponse(const PlaceOrderResponse& from) : PlaceOrderResponse(nullptr, from) {}
-  inline PlaceOrderResponse(PlaceOrderResponse&& from) noexcept
-      : PlaceOrderResponse(nullptr, ::std::move(from)) {}
-  inline PlaceOrderResponse& operator=(const PlaceOrderResponse& from) {
+  inline SearchProductsResponse(const SearchProductsResponse& from) : SearchProductsResponse(nullptr, from) {}
+  inline SearchProductsResponse(SearchProductsResponse&& from) noexcept
+      : SearchProductsResponse(nullptr, ::std::move(from)) {}
+  inline SearchProductsResponse& operator=(const SearchProductsResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline PlaceOrderResponse& operator=(PlaceOrderResponse&& from) noexcept {
+  inline SearchProductsResponse& operator=(SearchProductsResponse&& from) noexcept {
     if (this == &from) return *this;
     if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
       InternalSwap(&from);
@@ -8967,13 +8985,13 @@ class PlaceOrderResponse final : public ::google::protobuf::Message
   static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const PlaceOrderResponse& default_instance() {
-    return *reinterpret_cast<const PlaceOrderResponse*>(
-        &_PlaceOrderResponse_default_instance_);
+  static const SearchProductsResponse& default_instance() {
+    return *reinterpret_cast<const SearchProductsResponse*>(
+        &_SearchProductsResponse_default_instance_);
   }
-  static constexpr int kIndexInFileMessages = 28;
-  friend void swap(PlaceOrderResponse& a, PlaceOrderResponse& b) { a.Swap(&b); }
-  inline void Swap(PlaceOrderResponse* PROTOBUF_NONNULL other) {
+  static constexpr int kIndexInFileMessages = 16;
+  friend void swap(SearchProductsResponse& a, SearchProductsResponse& b) { a.Swap(&b); }
+  inline void Swap(SearchProductsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
       InternalSwap(other);
@@ -8981,7 +8999,7 @@ class PlaceOrderResponse final : public ::google::protobuf::Message
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(PlaceOrderResponse* PROTOBUF_NONNULL other) {
+  void UnsafeArenaSwap(SearchProductsResponse* PROTOBUF_NONNULL other) {
     if (other == this) return;
     ABSL_DCHECK(GetArena() == other->GetArena());
     InternalSwap(other);
@@ -8989,13 +9007,13 @@ class PlaceOrderResponse final : public ::google::protobuf::Message
 
   // implements Message ----------------------------------------------
 
-  PlaceOrderResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
-    return ::google::protobuf::Message::DefaultConstruct<PlaceOrderResponse>(arena);
+  SearchProductsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<SearchProductsResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const PlaceOrderResponse& from);
+  void CopyFrom(const SearchProductsResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom(const PlaceOrderResponse& from) { PlaceOrderResponse::MergeImpl(*this, from); }
+  void MergeFrom(const SearchProductsResponse& from) { SearchProductsResponse::MergeImpl(*this, from); }
 
   private:
   static void MergeImpl(::google::protobuf::MessageLite& to_msg,
@@ -9031,18 +9049,18 @@ class PlaceOrderResponse final : public ::google::protobuf::Message
   private:
   void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
   static void SharedDtor(MessageLite& self);
-  void InternalSwap(PlaceOrderResponse* PROTOBUF_NONNULL other);
+  void InternalSwap(SearchProductsResponse* PROTOBUF_NONNULL other);
  private:
   template <typename T>
   friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
-  static ::absl::string_view FullMessageName() { return "oteldemo.PlaceOrderResponse"; }
+  static ::absl::string_view FullMessageName() { return "oteldemo.SearchProductsResponse"; }
 
  protected:
-  explicit PlaceOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
-  PlaceOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const PlaceOrderResponse& from);
-  PlaceOrderResponse(
-      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, PlaceOrderResponse&& from) noexcept
-      : PlaceOrderResponse(arena) {
+  explicit SearchProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  SearchProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const SearchProductsResponse& from);
+  SearchProductsResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, SearchProductsResponse&& from) noexcept
+      : SearchProductsResponse(arena) {
     *this = ::std::move(from);
   }
   const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
@@ -9059,24 +9077,26 @@ class PlaceOrderResponse final : public ::google::protobuf::Message
 
   // accessors -------------------------------------------------------
   enum : int {
-    kOrderFieldNumber = 1,
+    kResultsFieldNumber = 1,
   };
-  // .oteldemo.OrderResult order = 1;
-  bool has_order() const;
-  void clear_order() ;
-  const ::oteldemo::OrderResult& order() const;
-  [[nodiscard]] ::oteldemo::OrderResult* PROTOBUF_NULLABLE release_order();
-  ::oteldemo::OrderResult* PROTOBUF_NONNULL mutable_order();
-  void set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
-  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
-  ::oteldemo::OrderResult* PROTOBUF_NULLABLE unsafe_arena_release_order();
-
+  // repeated .oteldemo.Product results = 1;
+  int results_size() const;
   private:
-  const ::oteldemo::OrderResult& _internal_order() const;
-  ::oteldemo::OrderResult* PROTOBUF_NONNULL _internal_mutable_order();
+  int _internal_results_size() const;
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderResponse)
+  void clear_results() ;
+  ::oteldemo::Product* PROTOBUF_NONNULL mutable_results(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL mutable_results();
+
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& _internal_results() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL _internal_mutable_results();
+  public:
+  const ::oteldemo::Product& results(int index) const;
+  ::oteldemo::Product* PROTOBUF_NONNULL add_results();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& results() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.SearchProductsResponse)
  private:
   class _Internal;
   friend class ::google::protobuf::internal::TcParser;
@@ -9099,107 +9119,978 @@ class PlaceOrderResponse final : public ::google::protobuf::Message
     inline explicit Impl_(
         ::google::protobuf::internal::InternalVisibility visibility,
         ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
-        const PlaceOrderResponse& from_msg);
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+        const SearchProductsResponse& from_msg);
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::Product > results_;
     ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::OrderResult* PROTOBUF_NULLABLE order_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };
 
-extern const ::google::protobuf::internal::ClassDataFull PlaceOrderResponse_class_data_;
-
-// ===================================================================
-
-
+extern const ::google::protobuf::internal::ClassDataFull SearchProductsResponse_class_data_;
+// -------------------------------------------------------------------
 
+class OrderResult final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.OrderResult) */ {
+ public:
+  inline OrderResult() : OrderResult(nullptr) {}
+  ~OrderResult() PROTOBUF_FINAL;
 
-// ===================================================================
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+  void operator delete(OrderResult* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+    SharedDtor(*msg);
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(OrderResult));
+  }
+#endif
 
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR OrderResult(::google::protobuf::internal::ConstantInitialized);
 
-#ifdef __GNUC__
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wstrict-aliasing"
-#endif  // __GNUC__
-// -------------------------------------------------------------------
+  inline OrderResult(const OrderResult& from) : OrderResult(nullptr, from) {}
+  inline OrderResult(OrderResult&& from) noexcept
+      : OrderResult(nullptr, ::std::move(from)) {}
+  inline OrderResult& operator=(const OrderResult& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline OrderResult& operator=(OrderResult&& from) noexcept {
+    if (this == &from) return *this;
+    if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
 
-// CartItem
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* PROTOBUF_NONNULL mutable_unknown_fields()
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
 
-// string product_id = 1;
-inline void CartItem::clear_product_id() {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_.product_id_.ClearToEmpty();
-  _impl_._has_bits_[0] &= ~0x00000001u;
-}
-inline const ::std::string& CartItem::product_id() const
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.CartItem.product_id)
-  return _internal_product_id();
-}
-template <typename Arg_, typename... Args_>
-PROTOBUF_ALWAYS_INLINE void CartItem::set_product_id(Arg_&& arg, Args_... args) {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_._has_bits_[0] |= 0x00000001u;
-  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
-  // @@protoc_insertion_point(field_set:oteldemo.CartItem.product_id)
-}
-inline ::std::string* PROTOBUF_NONNULL CartItem::mutable_product_id()
-    ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  ::std::string* _s = _internal_mutable_product_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.CartItem.product_id)
-  return _s;
-}
-inline const ::std::string& CartItem::_internal_product_id() const {
-  ::google::protobuf::internal::TSanRead(&_impl_);
-  return _impl_.product_id_.Get();
-}
-inline void CartItem::_internal_set_product_id(const ::std::string& value) {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_._has_bits_[0] |= 0x00000001u;
-  _impl_.product_id_.Set(value, GetArena());
-}
-inline ::std::string* PROTOBUF_NONNULL CartItem::_internal_mutable_product_id() {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_._has_bits_[0] |= 0x00000001u;
-  return _impl_.product_id_.Mutable( GetArena());
-}
-inline ::std::string* PROTOBUF_NULLABLE CartItem::release_product_id() {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  // @@protoc_insertion_point(field_release:oteldemo.CartItem.product_id)
-  if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
-    return nullptr;
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL descriptor() {
+    return GetDescriptor();
   }
-  _impl_._has_bits_[0] &= ~0x00000001u;
-  auto* released = _impl_.product_id_.Release();
-  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString()) {
-    _impl_.product_id_.Set("", GetArena());
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
   }
-  return released;
-}
-inline void CartItem::set_allocated_product_id(::std::string* PROTOBUF_NULLABLE value) {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  if (value != nullptr) {
-    _impl_._has_bits_[0] |= 0x00000001u;
-  } else {
-    _impl_._has_bits_[0] &= ~0x00000001u;
+  static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
+    return default_instance().GetMetadata().reflection;
   }
-  _impl_.product_id_.SetAllocated(value, GetArena());
-  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.product_id_.IsDefault()) {
-    _impl_.product_id_.Set("", GetArena());
+  static const OrderResult& default_instance() {
+    return *reinterpret_cast<const OrderResult*>(
+        &_OrderResult_default_instance_);
   }
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.CartItem.product_id)
-}
-
-// int32 quantity = 2;
-inline void CartItem::clear_quantity() {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_.quantity_ = 0;
-  _impl_._has_bits_[0] &= ~0x00000002u;
-}
-inline ::int32_t CartItem::quantity() const {
-  // @@protoc_insertion_point(field_get:oteldemo.CartItem.quantity)
+  static constexpr int kIndexInFileMessages = 29;
+  friend void swap(OrderResult& a, OrderResult& b) { a.Swap(&b); }
+  inline void Swap(OrderResult* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(OrderResult* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetArena() == other->GetArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  OrderResult* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<OrderResult>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const OrderResult& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const OrderResult& from) { OrderResult::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
+                        const ::google::protobuf::MessageLite& from_msg);
+
+  public:
+  bool IsInitialized() const {
+    return true;
+  }
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
+  #if defined(PROTOBUF_CUSTOM_VTABLE)
+  private:
+  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
+  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
+
+  public:
+  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+    return _InternalSerialize(*this, target, stream);
+  }
+  #else   // PROTOBUF_CUSTOM_VTABLE
+  ::size_t ByteSizeLong() const final;
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
+  #endif  // PROTOBUF_CUSTOM_VTABLE
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static void SharedDtor(MessageLite& self);
+  void InternalSwap(OrderResult* PROTOBUF_NONNULL other);
+ private:
+  template <typename T>
+  friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
+  static ::absl::string_view FullMessageName() { return "oteldemo.OrderResult"; }
+
+ protected:
+  explicit OrderResult(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  OrderResult(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const OrderResult& from);
+  OrderResult(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, OrderResult&& from) noexcept
+      : OrderResult(arena) {
+    *this = ::std::move(from);
+  }
+  const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
+  static void* PROTOBUF_NONNULL PlacementNew_(
+      const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static constexpr auto InternalNewImpl_();
+
+ public:
+  static constexpr auto InternalGenerateClassData_();
+
+  ::google::protobuf::Metadata GetMetadata() const;
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+  enum : int {
+    kItemsFieldNumber = 5,
+    kOrderIdFieldNumber = 1,
+    kShippingTrackingIdFieldNumber = 2,
+    kShippingCostFieldNumber = 3,
+    kShippingAddressFieldNumber = 4,
+  };
+  // repeated .oteldemo.OrderItem items = 5;
+  int items_size() const;
+  private:
+  int _internal_items_size() const;
+
+  public:
+  void clear_items() ;
+  ::oteldemo::OrderItem* PROTOBUF_NONNULL mutable_items(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>* PROTOBUF_NONNULL mutable_items();
+
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>& _internal_items() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>* PROTOBUF_NONNULL _internal_mutable_items();
+  public:
+  const ::oteldemo::OrderItem& items(int index) const;
+  ::oteldemo::OrderItem* PROTOBUF_NONNULL add_items();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>& items() const;
+  // string order_id = 1;
+  void clear_order_id() ;
+  const ::std::string& order_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_order_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_order_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_order_id();
+  void set_allocated_order_id(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_order_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_order_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_order_id();
+
+  public:
+  // string shipping_tracking_id = 2;
+  void clear_shipping_tracking_id() ;
+  const ::std::string& shipping_tracking_id() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_shipping_tracking_id(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_shipping_tracking_id();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_shipping_tracking_id();
+  void set_allocated_shipping_tracking_id(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_shipping_tracking_id() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_shipping_tracking_id(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_shipping_tracking_id();
+
+  public:
+  // .oteldemo.Money shipping_cost = 3;
+  bool has_shipping_cost() const;
+  void clear_shipping_cost() ;
+  const ::oteldemo::Money& shipping_cost() const;
+  [[nodiscard]] ::oteldemo::Money* PROTOBUF_NULLABLE release_shipping_cost();
+  ::oteldemo::Money* PROTOBUF_NONNULL mutable_shipping_cost();
+  void set_allocated_shipping_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_shipping_cost(::oteldemo::Money* PROTOBUF_NULLABLE value);
+  ::oteldemo::Money* PROTOBUF_NULLABLE unsafe_arena_release_shipping_cost();
+
+  private:
+  const ::oteldemo::Money& _internal_shipping_cost() const;
+  ::oteldemo::Money* PROTOBUF_NONNULL _internal_mutable_shipping_cost();
+
+  public:
+  // .oteldemo.Address shipping_address = 4;
+  bool has_shipping_address() const;
+  void clear_shipping_address() ;
+  const ::oteldemo::Address& shipping_address() const;
+  [[nodiscard]] ::oteldemo::Address* PROTOBUF_NULLABLE release_shipping_address();
+  ::oteldemo::Address* PROTOBUF_NONNULL mutable_shipping_address();
+  void set_allocated_shipping_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_shipping_address(::oteldemo::Address* PROTOBUF_NULLABLE value);
+  ::oteldemo::Address* PROTOBUF_NULLABLE unsafe_arena_release_shipping_address();
+
+  private:
+  const ::oteldemo::Address& _internal_shipping_address() const;
+  ::oteldemo::Address* PROTOBUF_NONNULL _internal_mutable_shipping_address();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.OrderResult)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<3, 5,
+                                   3, 57,
+                                   2>
+      _table_;
+
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+        const OrderResult& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem > items_;
+    ::google::protobuf::internal::ArenaStringPtr order_id_;
+    ::google::protobuf::internal::ArenaStringPtr shipping_tracking_id_;
+    ::oteldemo::Money* PROTOBUF_NULLABLE shipping_cost_;
+    ::oteldemo::Address* PROTOBUF_NULLABLE shipping_address_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};
+
+extern const ::google::protobuf::internal::ClassDataFull OrderResult_class_data_;
+// -------------------------------------------------------------------
+
+class ListProductsResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.ListProductsResponse) */ {
+ public:
+  inline ListProductsResponse() : ListProductsResponse(nullptr) {}
+  ~ListProductsResponse() PROTOBUF_FINAL;
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+  void operator delete(ListProductsResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+    SharedDtor(*msg);
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(ListProductsResponse));
+  }
+#endif
+
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR ListProductsResponse(::google::protobuf::internal::ConstantInitialized);
+
+  inline ListProductsResponse(const ListProductsResponse& from) : ListProductsResponse(nullptr, from) {}
+  inline ListProductsResponse(ListProductsResponse&& from) noexcept
+      : ListProductsResponse(nullptr, ::std::move(from)) {}
+  inline ListProductsResponse& operator=(const ListProductsResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ListProductsResponse& operator=(ListProductsResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* PROTOBUF_NONNULL mutable_unknown_fields()
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ListProductsResponse& default_instance() {
+    return *reinterpret_cast<const ListProductsResponse*>(
+        &_ListProductsResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages = 13;
+  friend void swap(ListProductsResponse& a, ListProductsResponse& b) { a.Swap(&b); }
+  inline void Swap(ListProductsResponse* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ListProductsResponse* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetArena() == other->GetArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ListProductsResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<ListProductsResponse>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const ListProductsResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const ListProductsResponse& from) { ListProductsResponse::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
+                        const ::google::protobuf::MessageLite& from_msg);
+
+  public:
+  bool IsInitialized() const {
+    return true;
+  }
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
+  #if defined(PROTOBUF_CUSTOM_VTABLE)
+  private:
+  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
+  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
+
+  public:
+  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+    return _InternalSerialize(*this, target, stream);
+  }
+  #else   // PROTOBUF_CUSTOM_VTABLE
+  ::size_t ByteSizeLong() const final;
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
+  #endif  // PROTOBUF_CUSTOM_VTABLE
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static void SharedDtor(MessageLite& self);
+  void InternalSwap(ListProductsResponse* PROTOBUF_NONNULL other);
+ private:
+  template <typename T>
+  friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
+  static ::absl::string_view FullMessageName() { return "oteldemo.ListProductsResponse"; }
+
+ protected:
+  explicit ListProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  ListProductsResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const ListProductsResponse& from);
+  ListProductsResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, ListProductsResponse&& from) noexcept
+      : ListProductsResponse(arena) {
+    *this = ::std::move(from);
+  }
+  const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
+  static void* PROTOBUF_NONNULL PlacementNew_(
+      const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static constexpr auto InternalNewImpl_();
+
+ public:
+  static constexpr auto InternalGenerateClassData_();
+
+  ::google::protobuf::Metadata GetMetadata() const;
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+  enum : int {
+    kProductsFieldNumber = 1,
+  };
+  // repeated .oteldemo.Product products = 1;
+  int products_size() const;
+  private:
+  int _internal_products_size() const;
+
+  public:
+  void clear_products() ;
+  ::oteldemo::Product* PROTOBUF_NONNULL mutable_products(int index);
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL mutable_products();
+
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& _internal_products() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Product>* PROTOBUF_NONNULL _internal_mutable_products();
+  public:
+  const ::oteldemo::Product& products(int index) const;
+  ::oteldemo::Product* PROTOBUF_NONNULL add_products();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>& products() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.ListProductsResponse)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   1, 0,
+                                   2>
+      _table_;
+
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+        const ListProductsResponse& from_msg);
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::Product > products_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};
+
+extern const ::google::protobuf::internal::ClassDataFull ListProductsResponse_class_data_;
+// -------------------------------------------------------------------
+
+class SendOrderConfirmationRequest final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.SendOrderConfirmationRequest) */ {
+ public:
+  inline SendOrderConfirmationRequest() : SendOrderConfirmationRequest(nullptr) {}
+  ~SendOrderConfirmationRequest() PROTOBUF_FINAL;
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+  void operator delete(SendOrderConfirmationRequest* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+    SharedDtor(*msg);
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(SendOrderConfirmationRequest));
+  }
+#endif
+
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR SendOrderConfirmationRequest(::google::protobuf::internal::ConstantInitialized);
+
+  inline SendOrderConfirmationRequest(const SendOrderConfirmationRequest& from) : SendOrderConfirmationRequest(nullptr, from) {}
+  inline SendOrderConfirmationRequest(SendOrderConfirmationRequest&& from) noexcept
+      : SendOrderConfirmationRequest(nullptr, ::std::move(from)) {}
+  inline SendOrderConfirmationRequest& operator=(const SendOrderConfirmationRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline SendOrderConfirmationRequest& operator=(SendOrderConfirmationRequest&& from) noexcept {
+    if (this == &from) return *this;
+    if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* PROTOBUF_NONNULL mutable_unknown_fields()
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const SendOrderConfirmationRequest& default_instance() {
+    return *reinterpret_cast<const SendOrderConfirmationRequest*>(
+        &_SendOrderConfirmationRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages = 30;
+  friend void swap(SendOrderConfirmationRequest& a, SendOrderConfirmationRequest& b) { a.Swap(&b); }
+  inline void Swap(SendOrderConfirmationRequest* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(SendOrderConfirmationRequest* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetArena() == other->GetArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  SendOrderConfirmationRequest* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<SendOrderConfirmationRequest>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const SendOrderConfirmationRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const SendOrderConfirmationRequest& from) { SendOrderConfirmationRequest::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
+                        const ::google::protobuf::MessageLite& from_msg);
+
+  public:
+  bool IsInitialized() const {
+    return true;
+  }
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
+  #if defined(PROTOBUF_CUSTOM_VTABLE)
+  private:
+  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
+  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
+
+  public:
+  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+    return _InternalSerialize(*this, target, stream);
+  }
+  #else   // PROTOBUF_CUSTOM_VTABLE
+  ::size_t ByteSizeLong() const final;
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
+  #endif  // PROTOBUF_CUSTOM_VTABLE
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static void SharedDtor(MessageLite& self);
+  void InternalSwap(SendOrderConfirmationRequest* PROTOBUF_NONNULL other);
+ private:
+  template <typename T>
+  friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
+  static ::absl::string_view FullMessageName() { return "oteldemo.SendOrderConfirmationRequest"; }
+
+ protected:
+  explicit SendOrderConfirmationRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  SendOrderConfirmationRequest(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const SendOrderConfirmationRequest& from);
+  SendOrderConfirmationRequest(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, SendOrderConfirmationRequest&& from) noexcept
+      : SendOrderConfirmationRequest(arena) {
+    *this = ::std::move(from);
+  }
+  const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
+  static void* PROTOBUF_NONNULL PlacementNew_(
+      const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static constexpr auto InternalNewImpl_();
+
+ public:
+  static constexpr auto InternalGenerateClassData_();
+
+  ::google::protobuf::Metadata GetMetadata() const;
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+  enum : int {
+    kEmailFieldNumber = 1,
+    kOrderFieldNumber = 2,
+  };
+  // string email = 1;
+  void clear_email() ;
+  const ::std::string& email() const;
+  template <typename Arg_ = const ::std::string&, typename... Args_>
+  void set_email(Arg_&& arg, Args_... args);
+  ::std::string* PROTOBUF_NONNULL mutable_email();
+  [[nodiscard]] ::std::string* PROTOBUF_NULLABLE release_email();
+  void set_allocated_email(::std::string* PROTOBUF_NULLABLE value);
+
+  private:
+  const ::std::string& _internal_email() const;
+  PROTOBUF_ALWAYS_INLINE void _internal_set_email(const ::std::string& value);
+  ::std::string* PROTOBUF_NONNULL _internal_mutable_email();
+
+  public:
+  // .oteldemo.OrderResult order = 2;
+  bool has_order() const;
+  void clear_order() ;
+  const ::oteldemo::OrderResult& order() const;
+  [[nodiscard]] ::oteldemo::OrderResult* PROTOBUF_NULLABLE release_order();
+  ::oteldemo::OrderResult* PROTOBUF_NONNULL mutable_order();
+  void set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
+  ::oteldemo::OrderResult* PROTOBUF_NULLABLE unsafe_arena_release_order();
+
+  private:
+  const ::oteldemo::OrderResult& _internal_order() const;
+  ::oteldemo::OrderResult* PROTOBUF_NONNULL _internal_mutable_order();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.SendOrderConfirmationRequest)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<1, 2,
+                                   1, 51,
+                                   2>
+      _table_;
+
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+        const SendOrderConfirmationRequest& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr email_;
+    ::oteldemo::OrderResult* PROTOBUF_NULLABLE order_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};
+
+extern const ::google::protobuf::internal::ClassDataFull SendOrderConfirmationRequest_class_data_;
+// -------------------------------------------------------------------
+
+class PlaceOrderResponse final : public ::google::protobuf::Message
+/* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderResponse) */ {
+ public:
+  inline PlaceOrderResponse() : PlaceOrderResponse(nullptr) {}
+  ~PlaceOrderResponse() PROTOBUF_FINAL;
+
+#if defined(PROTOBUF_CUSTOM_VTABLE)
+  void operator delete(PlaceOrderResponse* PROTOBUF_NONNULL msg, std::destroying_delete_t) {
+    SharedDtor(*msg);
+    ::google::protobuf::internal::SizedDelete(msg, sizeof(PlaceOrderResponse));
+  }
+#endif
+
+  template <typename = void>
+  explicit PROTOBUF_CONSTEXPR PlaceOrderResponse(::google::protobuf::internal::ConstantInitialized);
+
+  inline PlaceOrderResponse(const PlaceOrderResponse& from) : PlaceOrderResponse(nullptr, from) {}
+  inline PlaceOrderResponse(PlaceOrderResponse&& from) noexcept
+      : PlaceOrderResponse(nullptr, ::std::move(from)) {}
+  inline PlaceOrderResponse& operator=(const PlaceOrderResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline PlaceOrderResponse& operator=(PlaceOrderResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (::google::protobuf::internal::CanMoveWithInternalSwap(GetArena(), from.GetArena())) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* PROTOBUF_NONNULL mutable_unknown_fields()
+      ABSL_ATTRIBUTE_LIFETIME_BOUND {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* PROTOBUF_NONNULL GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* PROTOBUF_NONNULL GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const PlaceOrderResponse& default_instance() {
+    return *reinterpret_cast<const PlaceOrderResponse*>(
+        &_PlaceOrderResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages = 32;
+  friend void swap(PlaceOrderResponse& a, PlaceOrderResponse& b) { a.Swap(&b); }
+  inline void Swap(PlaceOrderResponse* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    if (::google::protobuf::internal::CanUseInternalSwap(GetArena(), other->GetArena())) {
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(PlaceOrderResponse* PROTOBUF_NONNULL other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetArena() == other->GetArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  PlaceOrderResponse* PROTOBUF_NONNULL New(::google::protobuf::Arena* PROTOBUF_NULLABLE arena = nullptr) const {
+    return ::google::protobuf::Message::DefaultConstruct<PlaceOrderResponse>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const PlaceOrderResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom(const PlaceOrderResponse& from) { PlaceOrderResponse::MergeImpl(*this, from); }
+
+  private:
+  static void MergeImpl(::google::protobuf::MessageLite& to_msg,
+                        const ::google::protobuf::MessageLite& from_msg);
+
+  public:
+  bool IsInitialized() const {
+    return true;
+  }
+  ABSL_ATTRIBUTE_REINITIALIZES void Clear() PROTOBUF_FINAL;
+  #if defined(PROTOBUF_CUSTOM_VTABLE)
+  private:
+  static ::size_t ByteSizeLong(const ::google::protobuf::MessageLite& msg);
+  static ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      const ::google::protobuf::MessageLite& msg, ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream);
+
+  public:
+  ::size_t ByteSizeLong() const { return ByteSizeLong(*this); }
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const {
+    return _InternalSerialize(*this, target, stream);
+  }
+  #else   // PROTOBUF_CUSTOM_VTABLE
+  ::size_t ByteSizeLong() const final;
+  ::uint8_t* PROTOBUF_NONNULL _InternalSerialize(
+      ::uint8_t* PROTOBUF_NONNULL target,
+      ::google::protobuf::io::EpsCopyOutputStream* PROTOBUF_NONNULL stream) const final;
+  #endif  // PROTOBUF_CUSTOM_VTABLE
+  int GetCachedSize() const { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static void SharedDtor(MessageLite& self);
+  void InternalSwap(PlaceOrderResponse* PROTOBUF_NONNULL other);
+ private:
+  template <typename T>
+  friend ::absl::string_view(::google::protobuf::internal::GetAnyMessageName)();
+  static ::absl::string_view FullMessageName() { return "oteldemo.PlaceOrderResponse"; }
+
+ protected:
+  explicit PlaceOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  PlaceOrderResponse(::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const PlaceOrderResponse& from);
+  PlaceOrderResponse(
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, PlaceOrderResponse&& from) noexcept
+      : PlaceOrderResponse(arena) {
+    *this = ::std::move(from);
+  }
+  const ::google::protobuf::internal::ClassData* PROTOBUF_NONNULL GetClassData() const PROTOBUF_FINAL;
+  static void* PROTOBUF_NONNULL PlacementNew_(
+      const void* PROTOBUF_NONNULL, void* PROTOBUF_NONNULL mem,
+      ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+  static constexpr auto InternalNewImpl_();
+
+ public:
+  static constexpr auto InternalGenerateClassData_();
+
+  ::google::protobuf::Metadata GetMetadata() const;
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+  enum : int {
+    kOrderFieldNumber = 1,
+  };
+  // .oteldemo.OrderResult order = 1;
+  bool has_order() const;
+  void clear_order() ;
+  const ::oteldemo::OrderResult& order() const;
+  [[nodiscard]] ::oteldemo::OrderResult* PROTOBUF_NULLABLE release_order();
+  ::oteldemo::OrderResult* PROTOBUF_NONNULL mutable_order();
+  void set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
+  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* PROTOBUF_NULLABLE value);
+  ::oteldemo::OrderResult* PROTOBUF_NULLABLE unsafe_arena_release_order();
+
+  private:
+  const ::oteldemo::OrderResult& _internal_order() const;
+  ::oteldemo::OrderResult* PROTOBUF_NONNULL _internal_mutable_order();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderResponse)
+ private:
+  class _Internal;
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1,
+                                   1, 0,
+                                   2>
+      _table_;
+
+  friend class ::google::protobuf::MessageLite;
+  friend class ::google::protobuf::Arena;
+  template <typename T>
+  friend class ::google::protobuf::Arena::InternalHelper;
+  using InternalArenaConstructable_ = void;
+  using DestructorSkippable_ = void;
+  struct Impl_ {
+    inline explicit constexpr Impl_(::google::protobuf::internal::ConstantInitialized) noexcept;
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena);
+    inline explicit Impl_(
+        ::google::protobuf::internal::InternalVisibility visibility,
+        ::google::protobuf::Arena* PROTOBUF_NULLABLE arena, const Impl_& from,
+        const PlaceOrderResponse& from_msg);
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::OrderResult* PROTOBUF_NULLABLE order_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};
+
+extern const ::google::protobuf::internal::ClassDataFull PlaceOrderResponse_class_data_;
+
+// ===================================================================
+
+
+
+
+// ===================================================================
+
+
+#ifdef __GNUC__
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wstrict-aliasing"
+#endif  // __GNUC__
+// -------------------------------------------------------------------
+
+// CartItem
+
+// string product_id = 1;
+inline void CartItem::clear_product_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.product_id_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::std::string& CartItem::product_id() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.CartItem.product_id)
+  return _internal_product_id();
+}
+template <typename Arg_, typename... Args_>
+PROTOBUF_ALWAYS_INLINE void CartItem::set_product_id(Arg_&& arg, Args_... args) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:oteldemo.CartItem.product_id)
+}
+inline ::std::string* PROTOBUF_NONNULL CartItem::mutable_product_id()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.CartItem.product_id)
+  return _s;
+}
+inline const ::std::string& CartItem::_internal_product_id() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.product_id_.Get();
+}
+inline void CartItem::_internal_set_product_id(const ::std::string& value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.product_id_.Set(value, GetArena());
+}
+inline ::std::string* PROTOBUF_NONNULL CartItem::_internal_mutable_product_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.product_id_.Mutable( GetArena());
+}
+inline ::std::string* PROTOBUF_NULLABLE CartItem::release_product_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  // @@protoc_insertion_point(field_release:oteldemo.CartItem.product_id)
+  if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* released = _impl_.product_id_.Release();
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString()) {
+    _impl_.product_id_.Set("", GetArena());
+  }
+  return released;
+}
+inline void CartItem::set_allocated_product_id(::std::string* PROTOBUF_NULLABLE value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.product_id_.SetAllocated(value, GetArena());
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.product_id_.IsDefault()) {
+    _impl_.product_id_.Set("", GetArena());
+  }
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.CartItem.product_id)
+}
+
+// int32 quantity = 2;
+inline void CartItem::clear_quantity() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.quantity_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline ::int32_t CartItem::quantity() const {
+  // @@protoc_insertion_point(field_get:oteldemo.CartItem.quantity)
   return _internal_quantity();
 }
 inline void CartItem::set_quantity(::int32_t value) {
@@ -9370,64 +10261,202 @@ inline void AddItemRequest::set_allocated_item(::oteldemo::CartItem* PROTOBUF_NU
   }
 
   if (value != nullptr) {
-    ::google::protobuf::Arena* submessage_arena = value->GetArena();
-    if (message_arena != submessage_arena) {
-      value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
-    }
-    _impl_._has_bits_[0] |= 0x00000002u;
+    ::google::protobuf::Arena* submessage_arena = value->GetArena();
+    if (message_arena != submessage_arena) {
+      value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+
+  _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(value);
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.AddItemRequest.item)
+}
+
+// -------------------------------------------------------------------
+
+// EmptyCartRequest
+
+// string user_id = 1;
+inline void EmptyCartRequest::clear_user_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.user_id_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::std::string& EmptyCartRequest::user_id() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.EmptyCartRequest.user_id)
+  return _internal_user_id();
+}
+template <typename Arg_, typename... Args_>
+PROTOBUF_ALWAYS_INLINE void EmptyCartRequest::set_user_id(Arg_&& arg, Args_... args) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:oteldemo.EmptyCartRequest.user_id)
+}
+inline ::std::string* PROTOBUF_NONNULL EmptyCartRequest::mutable_user_id()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::std::string* _s = _internal_mutable_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.EmptyCartRequest.user_id)
+  return _s;
+}
+inline const ::std::string& EmptyCartRequest::_internal_user_id() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.user_id_.Get();
+}
+inline void EmptyCartRequest::_internal_set_user_id(const ::std::string& value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.user_id_.Set(value, GetArena());
+}
+inline ::std::string* PROTOBUF_NONNULL EmptyCartRequest::_internal_mutable_user_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.user_id_.Mutable( GetArena());
+}
+inline ::std::string* PROTOBUF_NULLABLE EmptyCartRequest::release_user_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  // @@protoc_insertion_point(field_release:oteldemo.EmptyCartRequest.user_id)
+  if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* released = _impl_.user_id_.Release();
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString()) {
+    _impl_.user_id_.Set("", GetArena());
+  }
+  return released;
+}
+inline void EmptyCartRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.user_id_.SetAllocated(value, GetArena());
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.user_id_.IsDefault()) {
+    _impl_.user_id_.Set("", GetArena());
+  }
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.EmptyCartRequest.user_id)
+}
+
+// -------------------------------------------------------------------
+
+// GetCartRequest
+
+// string user_id = 1;
+inline void GetCartRequest::clear_user_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.user_id_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::std::string& GetCartRequest::user_id() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.GetCartRequest.user_id)
+  return _internal_user_id();
+}
+template <typename Arg_, typename... Args_>
+PROTOBUF_ALWAYS_INLINE void GetCartRequest::set_user_id(Arg_&& arg, Args_... args) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:oteldemo.GetCartRequest.user_id)
+}
+inline ::std::string* PROTOBUF_NONNULL GetCartRequest::mutable_user_id()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::std::string* _s = _internal_mutable_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetCartRequest.user_id)
+  return _s;
+}
+inline const ::std::string& GetCartRequest::_internal_user_id() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.user_id_.Get();
+}
+inline void GetCartRequest::_internal_set_user_id(const ::std::string& value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.user_id_.Set(value, GetArena());
+}
+inline ::std::string* PROTOBUF_NONNULL GetCartRequest::_internal_mutable_user_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.user_id_.Mutable( GetArena());
+}
+inline ::std::string* PROTOBUF_NULLABLE GetCartRequest::release_user_id() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  // @@protoc_insertion_point(field_release:oteldemo.GetCartRequest.user_id)
+  if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* released = _impl_.user_id_.Release();
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString()) {
+    _impl_.user_id_.Set("", GetArena());
+  }
+  return released;
+}
+inline void GetCartRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
   } else {
-    _impl_._has_bits_[0] &= ~0x00000002u;
+    _impl_._has_bits_[0] &= ~0x00000001u;
   }
-
-  _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(value);
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.AddItemRequest.item)
+  _impl_.user_id_.SetAllocated(value, GetArena());
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.user_id_.IsDefault()) {
+    _impl_.user_id_.Set("", GetArena());
+  }
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetCartRequest.user_id)
 }
 
 // -------------------------------------------------------------------
 
-// EmptyCartRequest
+// Cart
 
 // string user_id = 1;
-inline void EmptyCartRequest::clear_user_id() {
+inline void Cart::clear_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_.user_id_.ClearToEmpty();
   _impl_._has_bits_[0] &= ~0x00000001u;
 }
-inline const ::std::string& EmptyCartRequest::user_id() const
+inline const ::std::string& Cart::user_id() const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.EmptyCartRequest.user_id)
+  // @@protoc_insertion_point(field_get:oteldemo.Cart.user_id)
   return _internal_user_id();
 }
 template <typename Arg_, typename... Args_>
-PROTOBUF_ALWAYS_INLINE void EmptyCartRequest::set_user_id(Arg_&& arg, Args_... args) {
+PROTOBUF_ALWAYS_INLINE void Cart::set_user_id(Arg_&& arg, Args_... args) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
-  // @@protoc_insertion_point(field_set:oteldemo.EmptyCartRequest.user_id)
+  // @@protoc_insertion_point(field_set:oteldemo.Cart.user_id)
 }
-inline ::std::string* PROTOBUF_NONNULL EmptyCartRequest::mutable_user_id()
+inline ::std::string* PROTOBUF_NONNULL Cart::mutable_user_id()
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
   ::std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.EmptyCartRequest.user_id)
+  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.user_id)
   return _s;
 }
-inline const ::std::string& EmptyCartRequest::_internal_user_id() const {
+inline const ::std::string& Cart::_internal_user_id() const {
   ::google::protobuf::internal::TSanRead(&_impl_);
   return _impl_.user_id_.Get();
 }
-inline void EmptyCartRequest::_internal_set_user_id(const ::std::string& value) {
+inline void Cart::_internal_set_user_id(const ::std::string& value) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   _impl_.user_id_.Set(value, GetArena());
 }
-inline ::std::string* PROTOBUF_NONNULL EmptyCartRequest::_internal_mutable_user_id() {
+inline ::std::string* PROTOBUF_NONNULL Cart::_internal_mutable_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   return _impl_.user_id_.Mutable( GetArena());
 }
-inline ::std::string* PROTOBUF_NULLABLE EmptyCartRequest::release_user_id() {
+inline ::std::string* PROTOBUF_NULLABLE Cart::release_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  // @@protoc_insertion_point(field_release:oteldemo.EmptyCartRequest.user_id)
+  // @@protoc_insertion_point(field_release:oteldemo.Cart.user_id)
   if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
     return nullptr;
   }
@@ -9438,7 +10467,7 @@ inline ::std::string* PROTOBUF_NULLABLE EmptyCartRequest::release_user_id() {
   }
   return released;
 }
-inline void EmptyCartRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
+inline void Cart::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   if (value != nullptr) {
     _impl_._has_bits_[0] |= 0x00000001u;
@@ -9449,54 +10478,108 @@ inline void EmptyCartRequest::set_allocated_user_id(::std::string* PROTOBUF_NULL
   if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.user_id_.IsDefault()) {
     _impl_.user_id_.Set("", GetArena());
   }
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.EmptyCartRequest.user_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.Cart.user_id)
+}
+
+// repeated .oteldemo.CartItem items = 2;
+inline int Cart::_internal_items_size() const {
+  return _internal_items().size();
+}
+inline int Cart::items_size() const {
+  return _internal_items_size();
+}
+inline void Cart::clear_items() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.items_.Clear();
+}
+inline ::oteldemo::CartItem* PROTOBUF_NONNULL Cart::mutable_items(int index)
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.items)
+  return _internal_mutable_items()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL Cart::mutable_items()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.Cart.items)
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  return _internal_mutable_items();
+}
+inline const ::oteldemo::CartItem& Cart::items(int index) const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.Cart.items)
+  return _internal_items().Get(index);
+}
+inline ::oteldemo::CartItem* PROTOBUF_NONNULL Cart::add_items()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::oteldemo::CartItem* _add = _internal_mutable_items()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.Cart.items)
+  return _add;
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& Cart::items() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:oteldemo.Cart.items)
+  return _internal_items();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>&
+Cart::_internal_items() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.items_;
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL
+Cart::_internal_mutable_items() {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return &_impl_.items_;
 }
 
 // -------------------------------------------------------------------
 
-// GetCartRequest
+// Empty
+
+// -------------------------------------------------------------------
+
+// ListRecommendationsRequest
 
 // string user_id = 1;
-inline void GetCartRequest::clear_user_id() {
+inline void ListRecommendationsRequest::clear_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_.user_id_.ClearToEmpty();
   _impl_._has_bits_[0] &= ~0x00000001u;
 }
-inline const ::std::string& GetCartRequest::user_id() const
+inline const ::std::string& ListRecommendationsRequest::user_id() const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.GetCartRequest.user_id)
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.user_id)
   return _internal_user_id();
 }
 template <typename Arg_, typename... Args_>
-PROTOBUF_ALWAYS_INLINE void GetCartRequest::set_user_id(Arg_&& arg, Args_... args) {
+PROTOBUF_ALWAYS_INLINE void ListRecommendationsRequest::set_user_id(Arg_&& arg, Args_... args) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
-  // @@protoc_insertion_point(field_set:oteldemo.GetCartRequest.user_id)
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.user_id)
 }
-inline ::std::string* PROTOBUF_NONNULL GetCartRequest::mutable_user_id()
+inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::mutable_user_id()
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
   ::std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.GetCartRequest.user_id)
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.user_id)
   return _s;
 }
-inline const ::std::string& GetCartRequest::_internal_user_id() const {
+inline const ::std::string& ListRecommendationsRequest::_internal_user_id() const {
   ::google::protobuf::internal::TSanRead(&_impl_);
   return _impl_.user_id_.Get();
 }
-inline void GetCartRequest::_internal_set_user_id(const ::std::string& value) {
+inline void ListRecommendationsRequest::_internal_set_user_id(const ::std::string& value) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   _impl_.user_id_.Set(value, GetArena());
 }
-inline ::std::string* PROTOBUF_NONNULL GetCartRequest::_internal_mutable_user_id() {
+inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::_internal_mutable_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   return _impl_.user_id_.Mutable( GetArena());
 }
-inline ::std::string* PROTOBUF_NULLABLE GetCartRequest::release_user_id() {
+inline ::std::string* PROTOBUF_NULLABLE ListRecommendationsRequest::release_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  // @@protoc_insertion_point(field_release:oteldemo.GetCartRequest.user_id)
+  // @@protoc_insertion_point(field_release:oteldemo.ListRecommendationsRequest.user_id)
   if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
     return nullptr;
   }
@@ -9507,7 +10590,7 @@ inline ::std::string* PROTOBUF_NULLABLE GetCartRequest::release_user_id() {
   }
   return released;
 }
-inline void GetCartRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
+inline void ListRecommendationsRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   if (value != nullptr) {
     _impl_._has_bits_[0] |= 0x00000001u;
@@ -9518,177 +10601,294 @@ inline void GetCartRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLAB
   if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.user_id_.IsDefault()) {
     _impl_.user_id_.Set("", GetArena());
   }
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetCartRequest.user_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ListRecommendationsRequest.user_id)
+}
+
+// repeated string product_ids = 2;
+inline int ListRecommendationsRequest::_internal_product_ids_size() const {
+  return _internal_product_ids().size();
+}
+inline int ListRecommendationsRequest::product_ids_size() const {
+  return _internal_product_ids_size();
+}
+inline void ListRecommendationsRequest::clear_product_ids() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.product_ids_.Clear();
+}
+inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::add_product_ids()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::std::string* _s = _internal_mutable_product_ids()->Add();
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsRequest.product_ids)
+  return _s;
+}
+inline const ::std::string& ListRecommendationsRequest::product_ids(int index) const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.product_ids)
+  return _internal_product_ids().Get(index);
+}
+inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::mutable_product_ids(int index)
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.product_ids)
+  return _internal_mutable_product_ids()->Mutable(index);
+}
+template <typename Arg_, typename... Args_>
+inline void ListRecommendationsRequest::set_product_ids(int index, Arg_&& value, Args_... args) {
+  ::google::protobuf::internal::AssignToString(*_internal_mutable_product_ids()->Mutable(index), ::std::forward<Arg_>(value),
+                        args... );
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.product_ids)
+}
+template <typename Arg_, typename... Args_>
+inline void ListRecommendationsRequest::add_product_ids(Arg_&& value, Args_... args) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::google::protobuf::internal::AddToRepeatedPtrField(*_internal_mutable_product_ids(),
+                               ::std::forward<Arg_>(value),
+                               args... );
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline const ::google::protobuf::RepeatedPtrField<::std::string>& ListRecommendationsRequest::product_ids()
+    const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsRequest.product_ids)
+  return _internal_product_ids();
+}
+inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
+ListRecommendationsRequest::mutable_product_ids() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsRequest.product_ids)
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  return _internal_mutable_product_ids();
+}
+inline const ::google::protobuf::RepeatedPtrField<::std::string>&
+ListRecommendationsRequest::_internal_product_ids() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.product_ids_;
+}
+inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
+ListRecommendationsRequest::_internal_mutable_product_ids() {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return &_impl_.product_ids_;
+}
+
+// -------------------------------------------------------------------
+
+// ListRecommendationsResponse
+
+// repeated string product_ids = 1;
+inline int ListRecommendationsResponse::_internal_product_ids_size() const {
+  return _internal_product_ids().size();
+}
+inline int ListRecommendationsResponse::product_ids_size() const {
+  return _internal_product_ids_size();
+}
+inline void ListRecommendationsResponse::clear_product_ids() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.product_ids_.Clear();
+}
+inline ::std::string* PROTOBUF_NONNULL ListRecommendationsResponse::add_product_ids()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::std::string* _s = _internal_mutable_product_ids()->Add();
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsResponse.product_ids)
+  return _s;
+}
+inline const ::std::string& ListRecommendationsResponse::product_ids(int index) const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsResponse.product_ids)
+  return _internal_product_ids().Get(index);
+}
+inline ::std::string* PROTOBUF_NONNULL ListRecommendationsResponse::mutable_product_ids(int index)
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsResponse.product_ids)
+  return _internal_mutable_product_ids()->Mutable(index);
+}
+template <typename Arg_, typename... Args_>
+inline void ListRecommendationsResponse::set_product_ids(int index, Arg_&& value, Args_... args) {
+  ::google::protobuf::internal::AssignToString(*_internal_mutable_product_ids()->Mutable(index), ::std::forward<Arg_>(value),
+                        args... );
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsResponse.product_ids)
+}
+template <typename Arg_, typename... Args_>
+inline void ListRecommendationsResponse::add_product_ids(Arg_&& value, Args_... args) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  ::google::protobuf::internal::AddToRepeatedPtrField(*_internal_mutable_product_ids(),
+                               ::std::forward<Arg_>(value),
+                               args... );
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline const ::google::protobuf::RepeatedPtrField<::std::string>& ListRecommendationsResponse::product_ids()
+    const ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsResponse.product_ids)
+  return _internal_product_ids();
+}
+inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
+ListRecommendationsResponse::mutable_product_ids() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsResponse.product_ids)
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  return _internal_mutable_product_ids();
+}
+inline const ::google::protobuf::RepeatedPtrField<::std::string>&
+ListRecommendationsResponse::_internal_product_ids() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.product_ids_;
+}
+inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
+ListRecommendationsResponse::_internal_mutable_product_ids() {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return &_impl_.product_ids_;
 }
 
 // -------------------------------------------------------------------
 
-// Cart
+// ListRecommendationsBatchRequest
 
-// string user_id = 1;
-inline void Cart::clear_user_id() {
+// repeated .oteldemo.ListRecommendationsRequest requests = 1;
+inline int ListRecommendationsBatchRequest::_internal_requests_size() const {
+  return _internal_requests().size();
+}
+inline int ListRecommendationsBatchRequest::requests_size() const {
+  return _internal_requests_size();
+}
+inline void ListRecommendationsBatchRequest::clear_requests() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_.user_id_.ClearToEmpty();
-  _impl_._has_bits_[0] &= ~0x00000001u;
+  _impl_.requests_.Clear();
 }
-inline const ::std::string& Cart::user_id() const
+inline ::oteldemo::ListRecommendationsRequest* PROTOBUF_NONNULL ListRecommendationsBatchRequest::mutable_requests(int index)
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.Cart.user_id)
-  return _internal_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsBatchRequest.requests)
+  return _internal_mutable_requests()->Mutable(index);
 }
-template <typename Arg_, typename... Args_>
-PROTOBUF_ALWAYS_INLINE void Cart::set_user_id(Arg_&& arg, Args_... args) {
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>* PROTOBUF_NONNULL ListRecommendationsBatchRequest::mutable_requests()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsBatchRequest.requests)
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_._has_bits_[0] |= 0x00000001u;
-  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
-  // @@protoc_insertion_point(field_set:oteldemo.Cart.user_id)
+  return _internal_mutable_requests();
 }
-inline ::std::string* PROTOBUF_NONNULL Cart::mutable_user_id()
+inline const ::oteldemo::ListRecommendationsRequest& ListRecommendationsBatchRequest::requests(int index) const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  ::std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.user_id)
-  return _s;
-}
-inline const ::std::string& Cart::_internal_user_id() const {
-  ::google::protobuf::internal::TSanRead(&_impl_);
-  return _impl_.user_id_.Get();
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsBatchRequest.requests)
+  return _internal_requests().Get(index);
 }
-inline void Cart::_internal_set_user_id(const ::std::string& value) {
+inline ::oteldemo::ListRecommendationsRequest* PROTOBUF_NONNULL ListRecommendationsBatchRequest::add_requests()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_._has_bits_[0] |= 0x00000001u;
-  _impl_.user_id_.Set(value, GetArena());
+  ::oteldemo::ListRecommendationsRequest* _add = _internal_mutable_requests()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsBatchRequest.requests)
+  return _add;
 }
-inline ::std::string* PROTOBUF_NONNULL Cart::_internal_mutable_user_id() {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_._has_bits_[0] |= 0x00000001u;
-  return _impl_.user_id_.Mutable( GetArena());
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>& ListRecommendationsBatchRequest::requests() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsBatchRequest.requests)
+  return _internal_requests();
 }
-inline ::std::string* PROTOBUF_NULLABLE Cart::release_user_id() {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  // @@protoc_insertion_point(field_release:oteldemo.Cart.user_id)
-  if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
-    return nullptr;
-  }
-  _impl_._has_bits_[0] &= ~0x00000001u;
-  auto* released = _impl_.user_id_.Release();
-  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString()) {
-    _impl_.user_id_.Set("", GetArena());
-  }
-  return released;
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>&
+ListRecommendationsBatchRequest::_internal_requests() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.requests_;
 }
-inline void Cart::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
-  ::google::protobuf::internal::TSanWrite(&_impl_);
-  if (value != nullptr) {
-    _impl_._has_bits_[0] |= 0x00000001u;
-  } else {
-    _impl_._has_bits_[0] &= ~0x00000001u;
-  }
-  _impl_.user_id_.SetAllocated(value, GetArena());
-  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.user_id_.IsDefault()) {
-    _impl_.user_id_.Set("", GetArena());
-  }
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.Cart.user_id)
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>* PROTOBUF_NONNULL
+ListRecommendationsBatchRequest::_internal_mutable_requests() {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return &_impl_.requests_;
 }
 
-// repeated .oteldemo.CartItem items = 2;
-inline int Cart::_internal_items_size() const {
-  return _internal_items().size();
+// -------------------------------------------------------------------
+
+// ListRecommendationsBatchResponse
+
+// repeated .oteldemo.ListRecommendationsResponse responses = 1;
+inline int ListRecommendationsBatchResponse::_internal_responses_size() const {
+  return _internal_responses().size();
 }
-inline int Cart::items_size() const {
-  return _internal_items_size();
+inline int ListRecommendationsBatchResponse::responses_size() const {
+  return _internal_responses_size();
 }
-inline void Cart::clear_items() {
+inline void ListRecommendationsBatchResponse::clear_responses() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  _impl_.items_.Clear();
+  _impl_.responses_.Clear();
 }
-inline ::oteldemo::CartItem* PROTOBUF_NONNULL Cart::mutable_items(int index)
+inline ::oteldemo::ListRecommendationsResponse* PROTOBUF_NONNULL ListRecommendationsBatchResponse::mutable_responses(int index)
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.items)
-  return _internal_mutable_items()->Mutable(index);
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsBatchResponse.responses)
+  return _internal_mutable_responses()->Mutable(index);
 }
-inline ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL Cart::mutable_items()
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>* PROTOBUF_NONNULL ListRecommendationsBatchResponse::mutable_responses()
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.Cart.items)
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsBatchResponse.responses)
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  return _internal_mutable_items();
+  return _internal_mutable_responses();
 }
-inline const ::oteldemo::CartItem& Cart::items(int index) const
+inline const ::oteldemo::ListRecommendationsResponse& ListRecommendationsBatchResponse::responses(int index) const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.Cart.items)
-  return _internal_items().Get(index);
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsBatchResponse.responses)
+  return _internal_responses().Get(index);
 }
-inline ::oteldemo::CartItem* PROTOBUF_NONNULL Cart::add_items()
+inline ::oteldemo::ListRecommendationsResponse* PROTOBUF_NONNULL ListRecommendationsBatchResponse::add_responses()
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  ::oteldemo::CartItem* _add = _internal_mutable_items()->Add();
-  // @@protoc_insertion_point(field_add:oteldemo.Cart.items)
+  ::oteldemo::ListRecommendationsResponse* _add = _internal_mutable_responses()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsBatchResponse.responses)
   return _add;
 }
-inline const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& Cart::items() const
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>& ListRecommendationsBatchResponse::responses() const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:oteldemo.Cart.items)
-  return _internal_items();
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsBatchResponse.responses)
+  return _internal_responses();
 }
-inline const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>&
-Cart::_internal_items() const {
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>&
+ListRecommendationsBatchResponse::_internal_responses() const {
   ::google::protobuf::internal::TSanRead(&_impl_);
-  return _impl_.items_;
+  return _impl_.responses_;
 }
-inline ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* PROTOBUF_NONNULL
-Cart::_internal_mutable_items() {
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>* PROTOBUF_NONNULL
+ListRecommendationsBatchResponse::_internal_mutable_responses() {
   ::google::protobuf::internal::TSanRead(&_impl_);
-  return &_impl_.items_;
+  return &_impl_.responses_;
 }
 
 // -------------------------------------------------------------------
 
-// Empty
-
-// -------------------------------------------------------------------
-
-// ListRecommendationsRequest
+// StreamRecommendationsRequest
 
 // string user_id = 1;
-inline void ListRecommendationsRequest::clear_user_id() {
+inline void StreamRecommendationsRequest::clear_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_.user_id_.ClearToEmpty();
   _impl_._has_bits_[0] &= ~0x00000001u;
 }
-inline const ::std::string& ListRecommendationsRequest::user_id() const
+inline const ::std::string& StreamRecommendationsRequest::user_id() const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.user_id)
+  // @@protoc_insertion_point(field_get:oteldemo.StreamRecommendationsRequest.user_id)
   return _internal_user_id();
 }
 template <typename Arg_, typename... Args_>
-PROTOBUF_ALWAYS_INLINE void ListRecommendationsRequest::set_user_id(Arg_&& arg, Args_... args) {
+PROTOBUF_ALWAYS_INLINE void StreamRecommendationsRequest::set_user_id(Arg_&& arg, Args_... args) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.user_id)
+  // @@protoc_insertion_point(field_set:oteldemo.StreamRecommendationsRequest.user_id)
 }
-inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::mutable_user_id()
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsRequest::mutable_user_id()
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
   ::std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.user_id)
+  // @@protoc_insertion_point(field_mutable:oteldemo.StreamRecommendationsRequest.user_id)
   return _s;
 }
-inline const ::std::string& ListRecommendationsRequest::_internal_user_id() const {
+inline const ::std::string& StreamRecommendationsRequest::_internal_user_id() const {
   ::google::protobuf::internal::TSanRead(&_impl_);
   return _impl_.user_id_.Get();
 }
-inline void ListRecommendationsRequest::_internal_set_user_id(const ::std::string& value) {
+inline void StreamRecommendationsRequest::_internal_set_user_id(const ::std::string& value) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   _impl_.user_id_.Set(value, GetArena());
 }
-inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::_internal_mutable_user_id() {
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsRequest::_internal_mutable_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_._has_bits_[0] |= 0x00000001u;
   return _impl_.user_id_.Mutable( GetArena());
 }
-inline ::std::string* PROTOBUF_NULLABLE ListRecommendationsRequest::release_user_id() {
+inline ::std::string* PROTOBUF_NULLABLE StreamRecommendationsRequest::release_user_id() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
-  // @@protoc_insertion_point(field_release:oteldemo.ListRecommendationsRequest.user_id)
+  // @@protoc_insertion_point(field_release:oteldemo.StreamRecommendationsRequest.user_id)
   if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
     return nullptr;
   }
@@ -9699,7 +10899,7 @@ inline ::std::string* PROTOBUF_NULLABLE ListRecommendationsRequest::release_user
   }
   return released;
 }
-inline void ListRecommendationsRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
+inline void StreamRecommendationsRequest::set_allocated_user_id(::std::string* PROTOBUF_NULLABLE value) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   if (value != nullptr) {
     _impl_._has_bits_[0] |= 0x00000001u;
@@ -9710,141 +10910,319 @@ inline void ListRecommendationsRequest::set_allocated_user_id(::std::string* PRO
   if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.user_id_.IsDefault()) {
     _impl_.user_id_.Set("", GetArena());
   }
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.ListRecommendationsRequest.user_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.StreamRecommendationsRequest.user_id)
 }
 
 // repeated string product_ids = 2;
-inline int ListRecommendationsRequest::_internal_product_ids_size() const {
+inline int StreamRecommendationsRequest::_internal_product_ids_size() const {
   return _internal_product_ids().size();
 }
-inline int ListRecommendationsRequest::product_ids_size() const {
+inline int StreamRecommendationsRequest::product_ids_size() const {
   return _internal_product_ids_size();
 }
-inline void ListRecommendationsRequest::clear_product_ids() {
+inline void StreamRecommendationsRequest::clear_product_ids() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_.product_ids_.Clear();
 }
-inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::add_product_ids()
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsRequest::add_product_ids()
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   ::std::string* _s = _internal_mutable_product_ids()->Add();
-  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsRequest.product_ids)
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.StreamRecommendationsRequest.product_ids)
   return _s;
 }
-inline const ::std::string& ListRecommendationsRequest::product_ids(int index) const
+inline const ::std::string& StreamRecommendationsRequest::product_ids(int index) const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.product_ids)
+  // @@protoc_insertion_point(field_get:oteldemo.StreamRecommendationsRequest.product_ids)
   return _internal_product_ids().Get(index);
 }
-inline ::std::string* PROTOBUF_NONNULL ListRecommendationsRequest::mutable_product_ids(int index)
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsRequest::mutable_product_ids(int index)
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.product_ids)
+  // @@protoc_insertion_point(field_mutable:oteldemo.StreamRecommendationsRequest.product_ids)
   return _internal_mutable_product_ids()->Mutable(index);
 }
 template <typename Arg_, typename... Args_>
-inline void ListRecommendationsRequest::set_product_ids(int index, Arg_&& value, Args_... args) {
+inline void StreamRecommendationsRequest::set_product_ids(int index, Arg_&& value, Args_... args) {
   ::google::protobuf::internal::AssignToString(*_internal_mutable_product_ids()->Mutable(index), ::std::forward<Arg_>(value),
                         args... );
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.product_ids)
+  // @@protoc_insertion_point(field_set:oteldemo.StreamRecommendationsRequest.product_ids)
 }
 template <typename Arg_, typename... Args_>
-inline void ListRecommendationsRequest::add_product_ids(Arg_&& value, Args_... args) {
+inline void StreamRecommendationsRequest::add_product_ids(Arg_&& value, Args_... args) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   ::google::protobuf::internal::AddToRepeatedPtrField(*_internal_mutable_product_ids(),
                                ::std::forward<Arg_>(value),
                                args... );
-  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsRequest.product_ids)
+  // @@protoc_insertion_point(field_add:oteldemo.StreamRecommendationsRequest.product_ids)
 }
-inline const ::google::protobuf::RepeatedPtrField<::std::string>& ListRecommendationsRequest::product_ids()
+inline const ::google::protobuf::RepeatedPtrField<::std::string>& StreamRecommendationsRequest::product_ids()
     const ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsRequest.product_ids)
+  // @@protoc_insertion_point(field_list:oteldemo.StreamRecommendationsRequest.product_ids)
   return _internal_product_ids();
 }
 inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
-ListRecommendationsRequest::mutable_product_ids() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsRequest.product_ids)
+StreamRecommendationsRequest::mutable_product_ids() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.StreamRecommendationsRequest.product_ids)
   ::google::protobuf::internal::TSanWrite(&_impl_);
   return _internal_mutable_product_ids();
 }
 inline const ::google::protobuf::RepeatedPtrField<::std::string>&
-ListRecommendationsRequest::_internal_product_ids() const {
+StreamRecommendationsRequest::_internal_product_ids() const {
   ::google::protobuf::internal::TSanRead(&_impl_);
   return _impl_.product_ids_;
 }
 inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
-ListRecommendationsRequest::_internal_mutable_product_ids() {
+StreamRecommendationsRequest::_internal_mutable_product_ids() {
   ::google::protobuf::internal::TSanRead(&_impl_);
   return &_impl_.product_ids_;
 }
 
+// string cursor = 3;
+inline void StreamRecommendationsRequest::clear_cursor() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.cursor_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const ::std::string& StreamRecommendationsRequest::cursor() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.StreamRecommendationsRequest.cursor)
+  return _internal_cursor();
+}
+template <typename Arg_, typename... Args_>
+PROTOBUF_ALWAYS_INLINE void StreamRecommendationsRequest::set_cursor(Arg_&& arg, Args_... args) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.cursor_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:oteldemo.StreamRecommendationsRequest.cursor)
+}
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsRequest::mutable_cursor()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::std::string* _s = _internal_mutable_cursor();
+  // @@protoc_insertion_point(field_mutable:oteldemo.StreamRecommendationsRequest.cursor)
+  return _s;
+}
+inline const ::std::string& StreamRecommendationsRequest::_internal_cursor() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.cursor_.Get();
+}
+inline void StreamRecommendationsRequest::_internal_set_cursor(const ::std::string& value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.cursor_.Set(value, GetArena());
+}
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsRequest::_internal_mutable_cursor() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.cursor_.Mutable( GetArena());
+}
+inline ::std::string* PROTOBUF_NULLABLE StreamRecommendationsRequest::release_cursor() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  // @@protoc_insertion_point(field_release:oteldemo.StreamRecommendationsRequest.cursor)
+  if ((_impl_._has_bits_[0] & 0x00000002u) == 0) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* released = _impl_.cursor_.Release();
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString()) {
+    _impl_.cursor_.Set("", GetArena());
+  }
+  return released;
+}
+inline void StreamRecommendationsRequest::set_allocated_cursor(::std::string* PROTOBUF_NULLABLE value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.cursor_.SetAllocated(value, GetArena());
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.cursor_.IsDefault()) {
+    _impl_.cursor_.Set("", GetArena());
+  }
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.StreamRecommendationsRequest.cursor)
+}
+
+// int32 page_size = 4;
+inline void StreamRecommendationsRequest::clear_page_size() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.page_size_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline ::int32_t StreamRecommendationsRequest::page_size() const {
+  // @@protoc_insertion_point(field_get:oteldemo.StreamRecommendationsRequest.page_size)
+  return _internal_page_size();
+}
+inline void StreamRecommendationsRequest::set_page_size(::int32_t value) {
+  _internal_set_page_size(value);
+  _impl_._has_bits_[0] |= 0x00000004u;
+  // @@protoc_insertion_point(field_set:oteldemo.StreamRecommendationsRequest.page_size)
+}
+inline ::int32_t StreamRecommendationsRequest::_internal_page_size() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.page_size_;
+}
+inline void StreamRecommendationsRequest::_internal_set_page_size(::int32_t value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.page_size_ = value;
+}
+
+// int32 max_results = 5;
+inline void StreamRecommendationsRequest::clear_max_results() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.max_results_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000008u;
+}
+inline ::int32_t StreamRecommendationsRequest::max_results() const {
+  // @@protoc_insertion_point(field_get:oteldemo.StreamRecommendationsRequest.max_results)
+  return _internal_max_results();
+}
+inline void StreamRecommendationsRequest::set_max_results(::int32_t value) {
+  _internal_set_max_results(value);
+  _impl_._has_bits_[0] |= 0x00000008u;
+  // @@protoc_insertion_point(field_set:oteldemo.StreamRecommendationsRequest.max_results)
+}
+inline ::int32_t StreamRecommendationsRequest::_internal_max_results() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.max_results_;
+}
+inline void StreamRecommendationsRequest::_internal_set_max_results(::int32_t value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.max_results_ = value;
+}
+
 // -------------------------------------------------------------------
 
-// ListRecommendationsResponse
+// StreamRecommendationsResponse
 
 // repeated string product_ids = 1;
-inline int ListRecommendationsResponse::_internal_product_ids_size() const {
+inline int StreamRecommendationsResponse::_internal_product_ids_size() const {
   return _internal_product_ids().size();
 }
-inline int ListRecommendationsResponse::product_ids_size() const {
+inline int StreamRecommendationsResponse::product_ids_size() const {
   return _internal_product_ids_size();
 }
-inline void ListRecommendationsResponse::clear_product_ids() {
+inline void StreamRecommendationsResponse::clear_product_ids() {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   _impl_.product_ids_.Clear();
 }
-inline ::std::string* PROTOBUF_NONNULL ListRecommendationsResponse::add_product_ids()
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsResponse::add_product_ids()
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   ::std::string* _s = _internal_mutable_product_ids()->Add();
-  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsResponse.product_ids)
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.StreamRecommendationsResponse.product_ids)
   return _s;
 }
-inline const ::std::string& ListRecommendationsResponse::product_ids(int index) const
+inline const ::std::string& StreamRecommendationsResponse::product_ids(int index) const
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsResponse.product_ids)
+  // @@protoc_insertion_point(field_get:oteldemo.StreamRecommendationsResponse.product_ids)
   return _internal_product_ids().Get(index);
 }
-inline ::std::string* PROTOBUF_NONNULL ListRecommendationsResponse::mutable_product_ids(int index)
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsResponse::mutable_product_ids(int index)
     ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsResponse.product_ids)
+  // @@protoc_insertion_point(field_mutable:oteldemo.StreamRecommendationsResponse.product_ids)
   return _internal_mutable_product_ids()->Mutable(index);
 }
 template <typename Arg_, typename... Args_>
-inline void ListRecommendationsResponse::set_product_ids(int index, Arg_&& value, Args_... args) {
+inline void StreamRecommendationsResponse::set_product_ids(int index, Arg_&& value, Args_... args) {
   ::google::protobuf::internal::AssignToString(*_internal_mutable_product_ids()->Mutable(index), ::std::forward<Arg_>(value),
                         args... );
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsResponse.product_ids)
+  // @@protoc_insertion_point(field_set:oteldemo.StreamRecommendationsResponse.product_ids)
 }
 template <typename Arg_, typename... Args_>
-inline void ListRecommendationsResponse::add_product_ids(Arg_&& value, Args_... args) {
+inline void StreamRecommendationsResponse::add_product_ids(Arg_&& value, Args_... args) {
   ::google::protobuf::internal::TSanWrite(&_impl_);
   ::google::protobuf::internal::AddToRepeatedPtrField(*_internal_mutable_product_ids(),
                                ::std::forward<Arg_>(value),
                                args... );
-  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsResponse.product_ids)
+  // @@protoc_insertion_point(field_add:oteldemo.StreamRecommendationsResponse.product_ids)
 }
-inline const ::google::protobuf::RepeatedPtrField<::std::string>& ListRecommendationsResponse::product_ids()
+inline const ::google::protobuf::RepeatedPtrField<::std::string>& StreamRecommendationsResponse::product_ids()
     const ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsResponse.product_ids)
+  // @@protoc_insertion_point(field_list:oteldemo.StreamRecommendationsResponse.product_ids)
   return _internal_product_ids();
 }
 inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
-ListRecommendationsResponse::mutable_product_ids() ABSL_ATTRIBUTE_LIFETIME_BOUND {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsResponse.product_ids)
+StreamRecommendationsResponse::mutable_product_ids() ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.StreamRecommendationsResponse.product_ids)
   ::google::protobuf::internal::TSanWrite(&_impl_);
   return _internal_mutable_product_ids();
 }
 inline const ::google::protobuf::RepeatedPtrField<::std::string>&
-ListRecommendationsResponse::_internal_product_ids() const {
+StreamRecommendationsResponse::_internal_product_ids() const {
   ::google::protobuf::internal::TSanRead(&_impl_);
   return _impl_.product_ids_;
 }
 inline ::google::protobuf::RepeatedPtrField<::std::string>* PROTOBUF_NONNULL
-ListRecommendationsResponse::_internal_mutable_product_ids() {
+StreamRecommendationsResponse::_internal_mutable_product_ids() {
   ::google::protobuf::internal::TSanRead(&_impl_);
   return &_impl_.product_ids_;
 }
 
+// string cursor = 2;
+inline void StreamRecommendationsResponse::clear_cursor() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_.cursor_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::std::string& StreamRecommendationsResponse::cursor() const
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  // @@protoc_insertion_point(field_get:oteldemo.StreamRecommendationsResponse.cursor)
+  return _internal_cursor();
+}
+template <typename Arg_, typename... Args_>
+PROTOBUF_ALWAYS_INLINE void StreamRecommendationsResponse::set_cursor(Arg_&& arg, Args_... args) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.cursor_.Set(static_cast<Arg_&&>(arg), args..., GetArena());
+  // @@protoc_insertion_point(field_set:oteldemo.StreamRecommendationsResponse.cursor)
+}
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsResponse::mutable_cursor()
+    ABSL_ATTRIBUTE_LIFETIME_BOUND {
+  ::std::string* _s = _internal_mutable_cursor();
+  // @@protoc_insertion_point(field_mutable:oteldemo.StreamRecommendationsResponse.cursor)
+  return _s;
+}
+inline const ::std::string& StreamRecommendationsResponse::_internal_cursor() const {
+  ::google::protobuf::internal::TSanRead(&_impl_);
+  return _impl_.cursor_.Get();
+}
+inline void StreamRecommendationsResponse::_internal_set_cursor(const ::std::string& value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.cursor_.Set(value, GetArena());
+}
+inline ::std::string* PROTOBUF_NONNULL StreamRecommendationsResponse::_internal_mutable_cursor() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.cursor_.Mutable( GetArena());
+}
+inline ::std::string* PROTOBUF_NULLABLE StreamRecommendationsResponse::release_cursor() {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  // @@protoc_insertion_point(field_release:oteldemo.StreamRecommendationsResponse.cursor)
+  if ((_impl_._has_bits_[0] & 0x00000001u) == 0) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* released = _impl_.cursor_.Release();
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString()) {
+    _impl_.cursor_.Set("", GetArena());
+  }
+  return released;
+}
+inline void StreamRecommendationsResponse::set_allocated_cursor(::std::string* PROTOBUF_NULLABLE value) {
+  ::google::protobuf::internal::TSanWrite(&_impl_);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.cursor_.SetAllocated(value, GetArena());
+  if (::google::protobuf::internal::DebugHardenForceCopyDefaultString() && _impl_.cursor_.IsDefault()) {
+    _impl_.cursor_.Set("", GetArena());
+  }
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.StreamRecommendationsResponse.cursor)
+}
+
 // -------------------------------------------------------------------
 
 // Product
@@ -31,6 +31,12 @@ class MockRecommendationServiceStub : public RecommendationService::StubInterfac
   MOCK_METHOD3(ListRecommendations, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::oteldemo::ListRecommendationsResponse* response));
   MOCK_METHOD3(AsyncListRecommendationsRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq));
   MOCK_METHOD3(PrepareAsyncListRecommendationsRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(ListRecommendationsBatch, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response));
+  MOCK_METHOD3(AsyncListRecommendationsBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(PrepareAsyncListRecommendationsBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD2(StreamRecommendationsRaw, ::grpc::ClientReaderInterface< ::oteldemo::StreamRecommendationsResponse>*(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request));
+  MOCK_METHOD4(AsyncStreamRecommendationsRaw, ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>*(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq, void* tag));
+  MOCK_METHOD3(PrepareAsyncStreamRecommendationsRaw, ::grpc::ClientAsyncReaderInterface< ::oteldemo::StreamRecommendationsResponse>*(::grpc::ClientContext* context, const ::oteldemo::StreamRecommendationsRequest& request, ::grpc::CompletionQueue* cq));
 };
 
 class MockProductCatalogServiceStub : public ProductCatalogService::StubInterface {
@@ -11,7 +11,9 @@ import {
   type ChannelCredentials,
   Client,
   type ClientOptions,
+  type ClientReadableStream,
   type ClientUnaryCall,
+  type handleServerStreamingCall,
   type handleUnaryCall,
   makeGenericClientConstructor,
   type Metadata,
@@ -56,6 +58,31 @@ export interface ListRecommendationsResponse {
   productIds: string[];
 }
 
+export interface ListRecommendationsBatchRequest {
+  requests: ListRecommendationsRequest[];
+}
+
+export interface ListRecommendationsBatchResponse {
+  /** One response per request, in request order. */
+  responses: ListRecommendationsResponse[];
+}
+
+export interface StreamRecommendationsRequest {
+  userId: string;
+  productIds: string[];
+  /** Cursor of a previously received response, to resume the stream after it. */
+  cursor: string;
+  /** Product ids per response message, defaults to 5. */
+  pageSize: number;
+  /** Maximum number of product ids to stream, 0 streams the whole catalog. */
+  maxResults: number;
+}
+
+export interface StreamRecommendationsResponse {
+  productIds: string[];
+  cursor: string;
+}
+
 export interface Product {
   id: string;
   name: string;
@@ -813,6 +840,358 @@ export const ListRecommendationsResponse: MessageFns<ListRecommendationsResponse
   },
 };
 
+function createBaseListRecommendationsBatchRequest(): ListRecommendationsBatchRequest {
+  return { requests: [] };
+}
+
+export const ListRecommendationsBatchRequest: MessageFns<ListRecommendationsBatchRequest> = {
+  encode(message: ListRecommendationsBatchRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.requests) {
+      ListRecommendationsRequest.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ListRecommendationsBatchRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListRecommendationsBatchRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.requests.push(ListRecommendationsRequest.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ListRecommendationsBatchRequest {
+    return {
+      requests: globalThis.Array.isArray(object?.requests)
+        ? object.requests.map((e: any) => ListRecommendationsRequest.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: ListRecommendationsBatchRequest): unknown {
+    const obj: any = {};
+    if (message.requests?.length) {
+      obj.requests = message.requests.map((e) => ListRecommendationsRequest.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListRecommendationsBatchRequest>, I>>(base?: I): ListRecommendationsBatchRequest {
+    return ListRecommendationsBatchRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListRecommendationsBatchRequest>, I>>(
+    object: I,
+  ): ListRecommendationsBatchRequest {
+    const message = createBaseListRecommendationsBatchRequest();
+    message.requests = object.requests?.map((e) => ListRecommendationsRequest.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseListRecommendationsBatchResponse(): ListRecommendationsBatchResponse {
+  return { responses: [] };
+}
+
+export const ListRecommendationsBatchResponse: MessageFns<ListRecommendationsBatchResponse> = {
+  encode(message: ListRecommendationsBatchResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.responses) {
+      ListRecommendationsResponse.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ListRecommendationsBatchResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListRecommendationsBatchResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.responses.push(ListRecommendationsResponse.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ListRecommendationsBatchResponse {
+    return {
+      responses: globalThis.Array.isArray(object?.responses)
+        ? object.responses.map((e: any) => ListRecommendationsResponse.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: ListRecommendationsBatchResponse): unknown {
+    const obj: any = {};
+    if (message.responses?.length) {
+      obj.responses = message.responses.map((e) => ListRecommendationsResponse.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListRecommendationsBatchResponse>, I>>(
+    base?: I,
+  ): ListRecommendationsBatchResponse {
+    return ListRecommendationsBatchResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListRecommendationsBatchResponse>, I>>(
+    object: I,
+  ): ListRecommendationsBatchResponse {
+    const message = createBaseListRecommendationsBatchResponse();
+    message.responses = object.responses?.map((e) => ListRecommendationsResponse.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseStreamRecommendationsRequest(): StreamRecommendationsRequest {
+  return { userId: "", productIds: [], cursor: "", pageSize: 0, maxResults: 0 };
+}
+
+export const StreamRecommendationsRequest: MessageFns<StreamRecommendationsRequest> = {
+  encode(message: StreamRecommendationsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.userId !== "") {
+      writer.uint32(10).string(message.userId);
+    }
+    for (const v of message.productIds) {
+      writer.uint32(18).string(v!);
+    }
+    if (message.cursor !== "") {
+      writer.uint32(26).string(message.cursor);
+    }
+    if (message.pageSize !== 0) {
+      writer.uint32(32).int32(message.pageSize);
+    }
+    if (message.maxResults !== 0) {
+      writer.uint32(40).int32(message.maxResults);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StreamRecommendationsRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStreamRecommendationsRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.userId = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.productIds.push(reader.string());
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.cursor = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.pageSize = reader.int32();
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.maxResults = reader.int32();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StreamRecommendationsRequest {
+    return {
+      userId: isSet(object.userId)
+        ? globalThis.String(object.userId)
+        : isSet(object.user_id)
+        ? globalThis.String(object.user_id)
+        : "",
+      productIds: globalThis.Array.isArray(object?.productIds)
+        ? object.productIds.map((e: any) => globalThis.String(e))
+        : globalThis.Array.isArray(object?.product_ids)
+        ? object.product_ids.map((e: any) => globalThis.String(e))
+        : [],
+      cursor: isSet(object.cursor) ? globalThis.String(object.cursor) : "",
+      pageSize: isSet(object.pageSize)
+        ? globalThis.Number(object.pageSize)
+        : isSet(object.page_size)
+        ? globalThis.Number(object.page_size)
+        : 0,
+      maxResults: isSet(object.maxResults)
+        ? globalThis.Number(object.maxResults)
+        : isSet(object.max_results)
+        ? globalThis.Number(object.max_results)
+        : 0,
+    };
+  },
+
+  toJSON(message: StreamRecommendationsRequest): unknown {
+    const obj: any = {};
+    if (message.userId !== "") {
+      obj.userId = message.userId;
+    }
+    if (message.productIds?.length) {
+      obj.productIds = message.productIds;
+    }
+    if (message.cursor !== "") {
+      obj.cursor = message.cursor;
+    }
+    if (message.pageSize !== 0) {
+      obj.pageSize = Math.round(message.pageSize);
+    }
+    if (message.maxResults !== 0) {
+      obj.maxResults = Math.round(message.maxResults);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StreamRecommendationsRequest>, I>>(base?: I): StreamRecommendationsRequest {
+    return StreamRecommendationsRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StreamRecommendationsRequest>, I>>(object: I): StreamRecommendationsRequest {
+    const message = createBaseStreamRecommendationsRequest();
+    message.userId = object.userId ?? "";
+    message.productIds = object.productIds?.map((e) => e) || [];
+    message.cursor = object.cursor ?? "";
+    message.pageSize = object.pageSize ?? 0;
+    message.maxResults = object.maxResults ?? 0;
+    return message;
+  },
+};
+
+function createBaseStreamRecommendationsResponse(): StreamRecommendationsResponse {
+  return { productIds: [], cursor: "" };
+}
+
+export const StreamRecommendationsResponse: MessageFns<StreamRecommendationsResponse> = {
+  encode(message: StreamRecommendationsResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.productIds) {
+      writer.uint32(10).string(v!);
+    }
+    if (message.cursor !== "") {
+      writer.uint32(18).string(message.cursor);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StreamRecommendationsResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStreamRecommendationsResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productIds.push(reader.string());
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.cursor = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StreamRecommendationsResponse {
+    return {
+      productIds: globalThis.Array.isArray(object?.productIds)
+        ? object.productIds.map((e: any) => globalThis.String(e))
+        : globalThis.Array.isArray(object?.product_ids)
+        ? object.product_ids.map((e: any) => globalThis.String(e))
+        : [],
+      cursor: isSet(object.cursor) ? globalThis.String(object.cursor) : "",
+    };
+  },
+
+  toJSON(message: StreamRecommendationsResponse): unknown {
+    const obj: any = {};
+    if (message.productIds?.length) {
+      obj.productIds = message.productIds;
+    }
+    if (message.cursor !== "") {
+      obj.cursor = message.cursor;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StreamRecommendationsResponse>, I>>(base?: I): StreamRecommendationsResponse {
+    return StreamRecommendationsResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StreamRecommendationsResponse>, I>>(
+    object: I,
+  ): StreamRecommendationsResponse {
+    const message = createBaseStreamRecommendationsResponse();
+    message.productIds = object.productIds?.map((e) => e) || [];
+    message.cursor = object.cursor ?? "";
+    return message;
+  },
+};
+
 function createBaseProduct(): Product {
   return { id: "", name: "", description: "", picture: "", priceUsd: undefined, categories: [] };
 }
@@ -3611,10 +3990,36 @@ export const RecommendationServiceService = {
       Buffer.from(ListRecommendationsResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer): ListRecommendationsResponse => ListRecommendationsResponse.decode(value),
   },
+  listRecommendationsBatch: {
+    path: "/oteldemo.RecommendationService/ListRecommendationsBatch" as const,
+    requestStream: false as const,
+    responseStream: false as const,
+    requestSerialize: (value: ListRecommendationsBatchRequest): Buffer =>
+      Buffer.from(ListRecommendationsBatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): ListRecommendationsBatchRequest =>
+      ListRecommendationsBatchRequest.decode(value),
+    responseSerialize: (value: ListRecommendationsBatchResponse): Buffer =>
+      Buffer.from(ListRecommendationsBatchResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer): ListRecommendationsBatchResponse =>
+      ListRecommendationsBatchResponse.decode(value),
+  },
+  streamRecommendations: {
+    path: "/oteldemo.RecommendationService/StreamRecommendations" as const,
+    requestStream: false as const,
+    responseStream: true as const,
+    requestSerialize: (value: StreamRecommendationsRequest): Buffer =>
+      Buffer.from(StreamRecommendationsRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): StreamRecommendationsRequest => StreamRecommendationsRequest.decode(value),
+    responseSerialize: (value: StreamRecommendationsResponse): Buffer =>
+      Buffer.from(StreamRecommendationsResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer): StreamRecommendationsResponse => StreamRecommendationsResponse.decode(value),
+  },
 } as const;
 
 export interface RecommendationServiceServer extends UntypedServiceImplementation {
   listRecommendations: handleUnaryCall<ListRecommendationsRequest, ListRecommendationsResponse>;
+  listRecommendationsBatch: handleUnaryCall<ListRecommendationsBatchRequest, ListRecommendationsBatchResponse>;
+  streamRecommendations: handleServerStreamingCall<StreamRecommendationsRequest, StreamRecommendationsResponse>;
 }
 
 export interface RecommendationServiceClient extends Client {
@@ -3633,6 +4038,30 @@ export interface RecommendationServiceClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: ListRecommendationsResponse) => void,
   ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  streamRecommendations(
+    request: StreamRecommendationsRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<StreamRecommendationsResponse>;
+  streamRecommendations(
+    request: StreamRecommendationsRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<StreamRecommendationsResponse>;
 }
 
 export const RecommendationServiceClient = makeGenericClientConstructor(
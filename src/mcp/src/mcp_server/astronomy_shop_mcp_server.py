@@ -5,6 +5,7 @@
 #
 import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 from src.mcp_server import tools
@@ -17,10 +18,17 @@ class AstronomyShopMcp:
     def __init__(self) -> None:
         self.host = "0.0.0.0"
         self.port = int(os.getenv("MCP_PORT", "8011"))
-        self.mcp = FastMCP("astronomy-shop-mcp")
+        self.mcp = FastMCP("astronomy-shop-mcp", lifespan=self.lifespan)
 
         self._register_tools()
 
+    @asynccontextmanager
+    async def lifespan(self, server: FastMCP):
+        """Share one pooled HTTP client across tool calls for the server's lifetime."""
+        tools.start_client()
+        yield
+        await tools.close_client()
+
     def _register_tools(self):
         """Programmatically register static methods as MCP tools."""
         self.mcp.tool("add_to_cart")(tools.add_to_cart)
@@ -29,6 +37,7 @@ class AstronomyShopMcp:
         self.mcp.tool("get_ads")(tools.get_ads)
         self.mcp.tool("get_cart")(tools.get_cart)
         self.mcp.tool("get_product")(tools.get_product)
+        self.mcp.tool("get_products")(tools.get_products)
         self.mcp.tool("get_recommendations")(tools.get_recommendations)
         self.mcp.tool("get_shipping_quote")(tools.get_shipping_quote)
         self.mcp.tool("get_supported_currencies")(tools.get_supported_currencies)
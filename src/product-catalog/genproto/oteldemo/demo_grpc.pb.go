@@ -211,7 +211,9 @@ var CartService_ServiceDesc = grpc.ServiceDesc{
 }
 
 const (
-	RecommendationService_ListRecommendations_FullMethodName = "/oteldemo.RecommendationService/ListRecommendations"
+	RecommendationService_ListRecommendations_FullMethodName      = "/oteldemo.RecommendationService/ListRecommendations"
+	RecommendationService_ListRecommendationsBatch_FullMethodName = "/oteldemo.RecommendationService/ListRecommendationsBatch"
+	RecommendationService_StreamRecommendations_FullMethodName    = "/oteldemo.RecommendationService/StreamRecommendations"
 )
 
 // RecommendationServiceClient is the client API for RecommendationService service.
@@ -219,6 +221,8 @@ const (
 // For semantics around ctx use and closing/ending streaming RPCs, please refer to https://pkg.go.dev/google.golang.org/grpc/?tab=doc#ClientConn.NewStream.
 type RecommendationServiceClient interface {
 	ListRecommendations(ctx context.Context, in *ListRecommendationsRequest, opts ...grpc.CallOption) (*ListRecommendationsResponse, error)
+	ListRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (*ListRecommendationsBatchResponse, error)
+	StreamRecommendations(ctx context.Context, in *StreamRecommendationsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[StreamRecommendationsResponse], error)
 }
 
 type recommendationServiceClient struct {
@@ -239,11 +243,42 @@ func (c *recommendationServiceClient) ListRecommendations(ctx context.Context, i
 	return out, nil
 }
 
+func (c *recommendationServiceClient) ListRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (*ListRecommendationsBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(ListRecommendationsBatchResponse)
+	err := c.cc.Invoke(ctx, RecommendationService_ListRecommendationsBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *recommendationServiceClient) StreamRecommendations(ctx context.Context, in *StreamRecommendationsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[StreamRecommendationsResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &RecommendationService_ServiceDesc.Streams[0], RecommendationService_StreamRecommendations_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[StreamRecommendationsRequest, StreamRecommendationsResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type RecommendationService_StreamRecommendationsClient = grpc.ServerStreamingClient[StreamRecommendationsResponse]
+
 // RecommendationServiceServer is the server API for RecommendationService service.
 // All implementations must embed UnimplementedRecommendationServiceServer
 // for forward compatibility.
 type RecommendationServiceServer interface {
 	ListRecommendations(context.Context, *ListRecommendationsRequest) (*ListRecommendationsResponse, error)
+	ListRecommendationsBatch(context.Context, *ListRecommendationsBatchRequest) (*ListRecommendationsBatchResponse, error)
+	StreamRecommendations(*StreamRecommendationsRequest, grpc.ServerStreamingServer[StreamRecommendationsResponse]) error
 	mustEmbedUnimplementedRecommendationServiceServer()
 }
 
@@ -257,6 +292,12 @@ type UnimplementedRecommendationServiceServer struct{}
 func (UnimplementedRecommendationServiceServer) ListRecommendations(context.Context, *ListRecommendationsRequest) (*ListRecommendationsResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method ListRecommendations not implemented")
 }
+func (UnimplementedRecommendationServiceServer) ListRecommendationsBatch(context.Context, *ListRecommendationsBatchRequest) (*ListRecommendationsBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method ListRecommendationsBatch not implemented")
+}
+func (UnimplementedRecommendationServiceServer) StreamRecommendations(*StreamRecommendationsRequest, grpc.ServerStreamingServer[StreamRecommendationsResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method StreamRecommendations not implemented")
+}
 func (UnimplementedRecommendationServiceServer) mustEmbedUnimplementedRecommendationServiceServer() {}
 func (UnimplementedRecommendationServiceServer) testEmbeddedByValue()                               {}
 
@@ -296,6 +337,35 @@ func _RecommendationService_ListRecommendations_Handler(srv interface{}, ctx con
 	return interceptor(ctx, in, info, handler)
 }
 
+func _RecommendationService_ListRecommendationsBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ListRecommendationsBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(RecommendationServiceServer).ListRecommendationsBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: RecommendationService_ListRecommendationsBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(RecommendationServiceServer).ListRecommendationsBatch(ctx, req.(*ListRecommendationsBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _RecommendationService_StreamRecommendations_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(StreamRecommendationsRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(RecommendationServiceServer).StreamRecommendations(m, &grpc.GenericServerStream[StreamRecommendationsRequest, StreamRecommendationsResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type RecommendationService_StreamRecommendationsServer = grpc.ServerStreamingServer[StreamRecommendationsResponse]
+
 // RecommendationService_ServiceDesc is the grpc.ServiceDesc for RecommendationService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -307,8 +377,18 @@ var RecommendationService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "ListRecommendations",
 			Handler:    _RecommendationService_ListRecommendations_Handler,
 		},
+		{
+			MethodName: "ListRecommendationsBatch",
+			Handler:    _RecommendationService_ListRecommendationsBatch_Handler,
+		},
+	},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "StreamRecommendations",
+			Handler:       _RecommendationService_StreamRecommendations_Handler,
+			ServerStreams: true,
+		},
 	},
-	Streams:  []grpc.StreamDesc{},
 	Metadata: "demo.proto",
 }
 
@@ -0,0 +1,73 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Micro-benchmark of the recommendation sampling hot path.
+
+Compares the previous set-difference + random.sample approach with
+sample_excluding for catalogs of 1k, 100k and 1M products, reporting the
+mean latency per call and the peak memory allocated by a single call.
+
+Run from src/recommendation:
+
+    python benchmark/bench_sampling.py
+"""
+
+# Python
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Local
+from sampling import sample_excluding
+
+MAX_RESPONSES = 5
+
+
+def set_difference(product_ids, request_product_ids):
+    filtered_products = list(set(product_ids) - set(request_product_ids))
+    num_return = min(MAX_RESPONSES, len(filtered_products))
+    indices = random.sample(range(len(filtered_products)), num_return)
+    return [filtered_products[i] for i in indices]
+
+
+def rejection(product_ids, request_product_ids):
+    return sample_excluding(product_ids, MAX_RESPONSES, set(request_product_ids))
+
+
+def measure(func, product_ids, request_product_ids, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(product_ids, request_product_ids)
+    latency = (time.perf_counter() - start) / iterations
+
+    tracemalloc.start()
+    func(product_ids, request_product_ids)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return latency, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'products':>10} {'method':>15} {'latency (us)':>14} {'peak alloc (KiB)':>17}")
+    for size in args.sizes:
+        product_ids = tuple(f"{i:010d}" for i in range(size))
+        request_product_ids = random.sample(product_ids, 2)
+        for name, func in (('set-difference', set_difference), ('rejection', rejection)):
+            latency, peak = measure(func, product_ids, request_product_ids, args.iterations)
+            print(f"{size:>10} {name:>15} {latency * 1e6:>14.1f} {peak / 1024:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Load benchmark of RecommendationService.
+
+Starts RecommendationService in-process against a fake product catalog with a
+configurable size and latency, drives ListRecommendations at a fixed
+concurrency and reports throughput, p50/p95/p99 latency and RSS over time,
+with and without the recommendationCacheFailure feature flag. Results are
+written as JSON so runs can be compared between releases.
+
+Run from src/recommendation:
+
+    python benchmark/bench_service.py --products 10000 --output results.json
+"""
+
+# Python
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent import futures
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Pip
+import grpc
+import psutil
+from openfeature import api
+from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
+from opentelemetry import metrics, trace
+
+# Local
+import demo_pb2
+import demo_pb2_grpc
+import recommendation_server
+from cache import RecommendationCache
+from catalog import CatalogRefresher
+from flags import FeatureFlagCache
+from metrics import init_metrics
+
+SCENARIOS = {
+    'baseline': False,
+    'cache-failure': True,
+}
+
+
+class FakeProductCatalogStub:
+    """Stands in for ProductCatalogServiceStub with a synthetic catalog."""
+
+    def __init__(self, products, categories, latency):
+        self.latency = latency
+        self.calls = 0
+        self.response = demo_pb2.ListProductsResponse(products=[
+            demo_pb2.Product(id=f'{i:010d}', name=f'Product {i}', categories=[f'category-{i % categories}'])
+            for i in range(products)
+        ])
+
+    def ListProducts(self, request, timeout=None):
+        self.calls += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return self.response
+
+
+def set_cache_failure_flag(enabled):
+    api.set_provider(InMemoryProvider({
+        'recommendationCacheFailure': InMemoryFlag('on' if enabled else 'off', {'on': True, 'off': False}),
+    }))
+
+
+def start_service(stub, args):
+    rs = recommendation_server
+    rs.tracer = trace.get_tracer_provider().get_tracer('recommendation-benchmark')
+    rs.logger = logging.getLogger('main')
+    rs.flag_cache = FeatureFlagCache(api.get_client(), 0)
+    rs.flag_cache.start()
+    rs.rec_svc_metrics = init_metrics(
+        metrics.get_meter_provider().get_meter('recommendation-benchmark'), rs.flag_cache,
+        lambda options: rs.recommendation_cache.observe_memory(options))
+    rs.recommendation_cache = RecommendationCache(
+        max_entries=args.cache_entries, max_bytes=args.cache_bytes, ttl=args.cache_ttl,
+        metrics=rs.rec_svc_metrics)
+    rs.catalog = CatalogRefresher(stub, rs.tracer, 0, rs.rec_svc_metrics)
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(rs.RecommendationService(), server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    return server, port
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_scenario(name, cache_failure, port, product_ids, args):
+    set_cache_failure_flag(cache_failure)
+    process = psutil.Process()
+    channel = grpc.insecure_channel(f'127.0.0.1:{port}')
+    stub = demo_pb2_grpc.RecommendationServiceStub(channel)
+    stub.ListRecommendations(demo_pb2.ListRecommendationsRequest(product_ids=[product_ids[0]]))
+
+    latencies = []
+    errors = 0
+    rss = []
+    lock = threading.Lock()
+    started = time.monotonic()
+    deadline = started + args.duration
+    stopped = threading.Event()
+
+    def sample_rss():
+        while not stopped.wait(args.rss_interval):
+            rss.append({'t': round(time.monotonic() - started, 3), 'rss_bytes': process.memory_info().rss})
+
+    def drive():
+        nonlocal errors
+        local = []
+        local_errors = 0
+        while time.monotonic() < deadline:
+            request = demo_pb2.ListRecommendationsRequest(
+                user_id='benchmark', product_ids=[random.choice(product_ids)])
+            begin = time.perf_counter()
+            try:
+                stub.ListRecommendations(request, timeout=args.timeout)
+                local.append(time.perf_counter() - begin)
+            except grpc.RpcError:
+                local_errors += 1
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    workers = [threading.Thread(target=drive) for _ in range(args.concurrency)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.monotonic() - started
+    stopped.set()
+    sampler.join()
+    channel.close()
+
+    latencies.sort()
+    result = {
+        'scenario': name,
+        'recommendation_cache_failure': cache_failure,
+        'requests': len(latencies),
+        'errors': errors,
+        'duration_s': round(elapsed, 3),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            label: round(percentile(latencies, fraction) * 1000, 3) if latencies else None
+            for label, fraction in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99))
+        },
+        'rss': rss,
+    }
+    print(f"{name:>14}: {result['throughput_rps']:>9} req/s  "
+          f"p50={result['latency_ms']['p50']}ms p95={result['latency_ms']['p95']}ms "
+          f"p99={result['latency_ms']['p99']}ms  errors={errors}  "
+          f"rss={rss[-1]['rss_bytes'] // (1024 * 1024) if rss else '?'}MiB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=1000, help='catalog size')
+    parser.add_argument('--categories', type=int, default=20, help='number of distinct categories')
+    parser.add_argument('--catalog-latency', type=float, default=0.005, help='ListProducts latency in seconds')
+    parser.add_argument('--concurrency', type=int, default=10, help='concurrent clients')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per scenario')
+    parser.add_argument('--timeout', type=float, default=5.0, help='per-call deadline in seconds')
+    parser.add_argument('--rss-interval', type=float, default=0.5, help='seconds between RSS samples')
+    parser.add_argument('--cache-entries', type=int, default=1000)
+    parser.add_argument('--cache-bytes', type=int, default=4 * 1024 * 1024)
+    parser.add_argument('--cache-ttl', type=float, default=5.0)
+    parser.add_argument('--scenarios', nargs='+', choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args()
+
+    stub = FakeProductCatalogStub(args.products, args.categories, args.catalog_latency)
+    product_ids = [product.id for product in stub.response.products]
+    set_cache_failure_flag(False)
+    server, port = start_service(stub, args)
+
+    results = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'config': {key: value for key, value in vars(args).items() if key != 'output'},
+        'scenarios': [],
+    }
+    try:
+        for name in args.scenarios:
+            results['scenarios'].append(run_scenario(name, SCENARIOS[name], port, product_ids, args))
+    finally:
+        server.stop(None)
+    results['catalog_calls'] = stub.calls
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f'Results written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# Pip
+from opentelemetry.metrics import Observation
+
+# Upper bound on the product ids kept by the recommendationCacheFailure fault
+# mode, about 16 MiB of list slots
+MAX_LEAKED_IDS = 2 * 1024 * 1024
+
+
+def estimate_size(value):
+    """Rough memory footprint in bytes of a cache key or value."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class RecommendationCache:
+    """LRU cache bounded by entry count and byte budget, with a per-entry TTL.
+
+    Caching is disabled when `max_entries` or `ttl` is 0: `get` then always
+    misses without recording metrics and `put` does nothing.
+
+    The `recommendationCacheFailure` flag can still make the service leak
+    memory, but only through `leak`, which keeps the leaked ids apart from the
+    bounded entries so they can be released when the flag is turned off. The
+    leaked ids grow on every leaking miss up to `MAX_LEAKED_IDS`.
+    """
+
+    def __init__(self, max_entries, max_bytes, ttl, metrics):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._metrics = metrics
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.leaked = []
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, size, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._metrics["demo.recommendation.cache.hits"].add(1)
+                    return value
+                self._evict(key, "expired")
+        self._metrics["demo.recommendation.cache.misses"].add(1)
+        return None
+
+    def put(self, key, value):
+        if not self.enabled:
+            return
+        size = estimate_size(key) + estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size, time.monotonic() + self.ttl)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._evict(next(iter(self._entries)), "capacity")
+
+    def leak(self, product_ids):
+        """Fault mode: grow the leaked id list, up to `MAX_LEAKED_IDS`."""
+        with self._lock:
+            leaked = self.leaked + product_ids
+            leaked = leaked + leaked[:len(leaked) // 4]
+            self.leaked = leaked[:MAX_LEAKED_IDS]
+            return self.leaked
+
+    def release_leak(self):
+        with self._lock:
+            self.leaked = []
+
+    def memory_bytes(self):
+        with self._lock:
+            # Leaked entries reference the catalog's id strings, so only the
+            # list itself is accounted for.
+            return self._bytes + sys.getsizeof(self.leaked)
+
+    def observe_memory(self, options):
+        yield Observation(self.memory_bytes())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict(self, key, reason):
+        self._bytes -= self._entries.pop(key)[1]
+        self._metrics["demo.recommendation.cache.evictions"].add(
+            1, {'recommendation.cache.eviction_reason': reason})
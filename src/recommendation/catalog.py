@@ -0,0 +1,312 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import asyncio
+import hashlib
+import logging
+import queue
+import random
+import threading
+import time
+from collections import deque
+
+# Pip
+import grpc
+from opentelemetry import trace
+
+# Local
+import demo_pb2
+from sampling import iter_permutation
+
+logger = logging.getLogger('main')
+
+# Successful ListProducts latencies kept to derive the hedging delay
+HEDGE_LATENCY_SAMPLES = 100
+HEDGE_MIN_SAMPLES = 20
+
+
+def catalog_version(response):
+    """Fingerprint a ListProductsResponse so unchanged catalogs can be detected."""
+    digest = hashlib.sha256(response.SerializeToString(deterministic=True))
+    return digest.hexdigest()[:16]
+
+
+class CatalogSnapshot:
+    """In-memory view of the product catalog at a given version.
+
+    The category index is built once per version so that finding related
+    products does not scan the catalog on every request.
+    """
+
+    def __init__(self, products, version):
+        self.version = version
+        self.product_ids = tuple(product.id for product in products)
+        self.product_categories = {}
+        category_index = {}
+        for product in products:
+            categories = tuple(dict.fromkeys(product.categories))
+            self.product_categories[product.id] = categories
+            for category in categories:
+                category_index.setdefault(category, []).append(product.id)
+        self.category_index = {
+            category: tuple(ids) for category, ids in category_index.items()
+        }
+        self.checked_at = time.monotonic()
+
+    def age(self):
+        return time.monotonic() - self.checked_at
+
+    def related_products(self, product_ids, count):
+        """Pick up to `count` products sharing a category with `product_ids`.
+
+        Products are drawn at random from the matching category lists and
+        rejected when already requested or picked, so the cost depends on
+        `count` and the number of categories rather than on the catalog size.
+        """
+        categories = set()
+        for product_id in product_ids:
+            categories.update(self.product_categories.get(product_id, ()))
+        pools = [self.category_index[category] for category in categories]
+        if not pools:
+            return []
+
+        excluded = set(product_ids)
+        picked = []
+        weights = [len(pool) for pool in pools]
+        for _ in range(count * 8):
+            pool = random.choices(pools, weights)[0]
+            candidate = pool[random.randrange(len(pool))]
+            if candidate not in excluded:
+                excluded.add(candidate)
+                picked.append(candidate)
+                if len(picked) == count:
+                    break
+        return picked
+
+    def iter_shuffled(self, seed, start=0):
+        """Lazily yield (offset, product_id) in a random order fixed by `seed`."""
+        product_ids = self.product_ids
+        for offset, index in iter_permutation(len(product_ids), seed, start):
+            yield offset, product_ids[index]
+
+
+class CatalogRefresher:
+    """Keeps a catalog snapshot in memory and refreshes it in the background.
+
+    Readers always get the last good snapshot (stale-while-revalidate); only
+    the very first read blocks on the product catalog. The `*_async` methods
+    are used with a `grpc.aio` product catalog stub.
+
+    ListProducts calls get the tighter of the configured `timeout` and the
+    deadline passed by the caller. With `hedge_percentile` set, a call still
+    running after that percentile of recent latencies is duplicated and the
+    first response wins.
+    """
+
+    def __init__(self, stub, tracer, interval, metrics, timeout=None, hedge_percentile=0):
+        self._stub = stub
+        self._tracer = tracer
+        self._interval = interval
+        self._metrics = metrics
+        self._timeout = timeout
+        self._hedge_percentile = hedge_percentile
+        self._latencies = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._async_lock = None
+        self._stopped = threading.Event()
+        self._thread = None
+        self._task = None
+
+    def get(self, timeout=None):
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self.refresh(timeout)
+            snapshot = self._snapshot
+        return snapshot
+
+    async def get_async(self, timeout=None):
+        snapshot = self._snapshot
+        if snapshot is None:
+            if self._async_lock is None:
+                self._async_lock = asyncio.Lock()
+            async with self._async_lock:
+                if self._snapshot is None:
+                    await self.refresh_async(timeout)
+            snapshot = self._snapshot
+        return snapshot
+
+    def refresh(self, timeout=None):
+        with self._tracer.start_as_current_span("refresh_product_catalog") as span:
+            return self._update(span, self.fetch(timeout))
+
+    async def refresh_async(self, timeout=None):
+        with self._tracer.start_as_current_span("refresh_product_catalog") as span:
+            return self._update(span, await self.fetch_async(timeout))
+
+    def fetch(self, timeout=None):
+        """Call ListProducts directly, bypassing the snapshot."""
+        timeout = self._deadline(timeout)
+        hedge_delay = self._hedge_delay(timeout)
+        start = time.perf_counter()
+        try:
+            if hedge_delay is None:
+                response = self._stub.ListProducts(demo_pb2.Empty(), timeout=timeout)
+            else:
+                response = self._fetch_hedged(timeout, hedge_delay)
+            self._latencies.append(time.perf_counter() - start)
+            return response
+        finally:
+            self._metrics["demo.recommendation.catalog.duration"].record(time.perf_counter() - start)
+
+    async def fetch_async(self, timeout=None):
+        timeout = self._deadline(timeout)
+        hedge_delay = self._hedge_delay(timeout)
+        start = time.perf_counter()
+        try:
+            if hedge_delay is None:
+                response = await self._stub.ListProducts(demo_pb2.Empty(), timeout=timeout)
+            else:
+                response = await self._fetch_hedged_async(timeout, hedge_delay)
+            self._latencies.append(time.perf_counter() - start)
+            return response
+        finally:
+            self._metrics["demo.recommendation.catalog.duration"].record(time.perf_counter() - start)
+
+    def product_ids(self, timeout=None):
+        """Fetch the current product ids, or fall back to the last snapshot.
+
+        Used on the request path, so a slow or unavailable product catalog
+        costs at most `timeout` once a snapshot exists.
+        """
+        try:
+            return [product.id for product in self.fetch(timeout).products]
+        except grpc.RpcError as e:
+            return self._fallback(e)
+
+    async def product_ids_async(self, timeout=None):
+        try:
+            return [product.id for product in (await self.fetch_async(timeout)).products]
+        except grpc.RpcError as e:
+            return self._fallback(e)
+
+    def start(self):
+        if self._interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="catalog-refresher", daemon=True)
+        self._thread.start()
+
+    def start_async(self):
+        if self._interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run_async())
+
+    def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    def _deadline(self, timeout):
+        if timeout is None:
+            return self._timeout
+        if self._timeout is None:
+            return timeout
+        return min(timeout, self._timeout)
+
+    def _hedge_delay(self, timeout):
+        if self._hedge_percentile <= 0 or len(self._latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * self._hedge_percentile / 100), len(latencies) - 1)
+        delay = latencies[index]
+        # No point in hedging a call that will be past its deadline by then
+        if timeout is not None and delay >= timeout:
+            return None
+        return delay
+
+    def _fetch_hedged(self, timeout, hedge_delay):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = queue.Queue()
+        calls = [self._stub.ListProducts.future(demo_pb2.Empty(), timeout=timeout)]
+        calls[0].add_done_callback(done.put)
+        try:
+            try:
+                winner = done.get(timeout=hedge_delay)
+            except queue.Empty:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                calls.append(self._stub.ListProducts.future(demo_pb2.Empty(), timeout=remaining))
+                calls[1].add_done_callback(done.put)
+                self._metrics["demo.recommendation.catalog.hedges"].add(1)
+                winner = done.get()
+                # The first call to finish failed, give the other one a chance
+                if winner.exception() is not None:
+                    winner = done.get()
+            return winner.result()
+        finally:
+            for call in calls:
+                call.cancel()
+
+    async def _fetch_hedged_async(self, timeout, hedge_delay):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        calls = [asyncio.ensure_future(self._stub.ListProducts(demo_pb2.Empty(), timeout=timeout))]
+        try:
+            done, pending = await asyncio.wait(calls, timeout=hedge_delay)
+            if not done:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                calls.append(asyncio.ensure_future(self._stub.ListProducts(demo_pb2.Empty(), timeout=remaining)))
+                self._metrics["demo.recommendation.catalog.hedges"].add(1)
+                done, pending = await asyncio.wait(calls, return_when=asyncio.FIRST_COMPLETED)
+            winner = done.pop()
+            # The first call to finish failed, give the other one a chance
+            if pending and winner.exception() is not None:
+                done, pending = await asyncio.wait(pending)
+                winner = done.pop()
+            return winner.result()
+        finally:
+            for call in calls:
+                call.cancel()
+
+    def _fallback(self, error):
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise error
+        logger.warning(f"Product catalog call failed, using catalog snapshot {snapshot.version}: {error.code()}")
+        span = trace.get_current_span()
+        span.set_attribute("demo.recommendation.catalog.fallback", True)
+        span.set_attribute("demo.recommendation.catalog.version", snapshot.version)
+        return list(snapshot.product_ids)
+
+    def _update(self, span, response):
+        version = catalog_version(response)
+        current = self._snapshot
+        changed = current is None or current.version != version
+        if changed:
+            self._snapshot = CatalogSnapshot(response.products, version)
+        else:
+            current.checked_at = time.monotonic()
+        span.set_attribute("demo.recommendation.catalog.version", version)
+        span.set_attribute("demo.recommendation.catalog.changed", changed)
+        span.set_attribute("demo.product.count", len(response.products))
+        return self._snapshot
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the previous snapshot until the catalog is back.
+                logger.warning(f"Product catalog refresh failed: {e}")
+
+    async def _run_async(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.refresh_async()
+            except Exception as e:
+                logger.warning(f"Product catalog refresh failed: {e}")
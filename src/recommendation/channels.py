@@ -0,0 +1,56 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import itertools
+import os
+
+# Pip
+import grpc
+
+# Local
+import demo_pb2_grpc
+
+
+def catalog_target(address):
+    # Resolve through DNS so round_robin sees every product catalog replica
+    if address.startswith(('dns:', 'ipv4:', 'ipv6:', 'unix:')):
+        return address
+    return f'dns:///{address}'
+
+
+def catalog_channel_options():
+    # The product catalog keeps the Go gRPC server defaults, which reject
+    # pings more frequent than every 5 minutes or sent without active calls.
+    return [
+        ('grpc.lb_policy_name', 'round_robin'),
+        ('grpc.keepalive_time_ms', int(float(os.environ.get('PRODUCT_CATALOG_KEEPALIVE_TIME', 300)) * 1000)),
+        ('grpc.keepalive_timeout_ms', int(float(os.environ.get('PRODUCT_CATALOG_KEEPALIVE_TIMEOUT', 20)) * 1000)),
+        ('grpc.keepalive_permit_without_calls', 0),
+        # Keep the subchannels of each pooled channel to itself
+        ('grpc.use_local_subchannel_pool', 1),
+    ]
+
+
+class PooledProductCatalogStub:
+    """ProductCatalogServiceStub spreading calls over a pool of channels.
+
+    Each channel load balances with round_robin over the DNS-resolved product
+    catalog replicas and owns its own connections, so concurrent calls are not
+    queued behind each other on a single HTTP/2 connection.
+    """
+
+    def __init__(self, address, size, aio=False):
+        create_channel = grpc.aio.insecure_channel if aio else grpc.insecure_channel
+        target = catalog_target(address)
+        self.channels = [
+            create_channel(target, options=catalog_channel_options()) for _ in range(max(size, 1))
+        ]
+        self._stubs = itertools.cycle(
+            [demo_pb2_grpc.ProductCatalogServiceStub(channel) for channel in self.channels])
+
+    @property
+    def ListProducts(self):
+        return next(self._stubs).ListProducts
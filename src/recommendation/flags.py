@@ -0,0 +1,88 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import logging
+import threading
+
+# Pip
+from openfeature import api
+from openfeature.event import ProviderEvent
+from opentelemetry.metrics import Observation
+
+logger = logging.getLogger('main')
+
+
+class FeatureFlagCache:
+    """Serves boolean feature flags from memory.
+
+    A flag is resolved through one shared OpenFeature client the first time it
+    is read. After that it is re-resolved when flagd reports a configuration
+    change, and polled every `max_staleness` seconds in case a change event is
+    missed, so request handlers only do a dictionary lookup.
+    """
+
+    def __init__(self, client, max_staleness):
+        self._client = client
+        self._max_staleness = max_staleness
+        self._values = {}
+        self._defaults = {}
+        self._evaluations = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def get_boolean_value(self, flag_name, default_value=False):
+        value = self._values.get(flag_name)
+        if value is None:
+            self._defaults[flag_name] = default_value
+            value = self._resolve(flag_name)
+        with self._lock:
+            self._evaluations[flag_name] = self._evaluations.get(flag_name, 0) + 1
+        return value
+
+    def __contains__(self, flag_name):
+        return flag_name in self._values
+
+    def refresh(self, flag_names=None):
+        for flag_name in flag_names or list(self._defaults):
+            if flag_name in self._defaults:
+                self._resolve(flag_name)
+
+    def start(self):
+        api.add_handler(ProviderEvent.PROVIDER_READY, self._on_provider_event)
+        api.add_handler(ProviderEvent.PROVIDER_CONFIGURATION_CHANGED, self._on_provider_event)
+        if self._max_staleness <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="feature-flag-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def observe_evaluations(self, options):
+        with self._lock:
+            evaluations = list(self._evaluations.items())
+        for flag_name, count in evaluations:
+            yield Observation(count, {'feature_flag.key': flag_name})
+
+    def _resolve(self, flag_name):
+        value = self._client.get_boolean_value(flag_name, self._defaults[flag_name])
+        self._values[flag_name] = value
+        return value
+
+    def _on_provider_event(self, details):
+        try:
+            self.refresh(details.flags_changed)
+        except Exception as e:
+            logger.warning(f"Feature flag refresh failed: {e}")
+
+    def _run(self):
+        while not self._stopped.wait(self._max_staleness):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Feature flag refresh failed: {e}")
@@ -3,15 +3,79 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-def init_metrics(meter):
+# Bucket boundaries in seconds, fine-grained below a millisecond where most of
+# the recommendation work happens
+LATENCY_BUCKETS = [
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5,
+]
+
+CANDIDATE_BUCKETS = [0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000, 50000, 100000, 1000000]
+
+
+def init_metrics(meter, flag_cache, cache_memory):
 
     # Recommendations counter
     recommendation_requests = meter.create_counter(
         'demo.recommendation.requests', unit='recommendations', description="Counts the total number of given recommendations"
     )
 
+    # Recommendation cache counters
+    cache_hits = meter.create_counter(
+        'demo.recommendation.cache.hits', unit='{hit}', description="Counts recommendation cache hits"
+    )
+    cache_misses = meter.create_counter(
+        'demo.recommendation.cache.misses', unit='{miss}', description="Counts recommendation cache misses"
+    )
+    cache_evictions = meter.create_counter(
+        'demo.recommendation.cache.evictions', unit='{eviction}', description="Counts entries evicted from the recommendation cache"
+    )
+
+    # Feature flag reads served by the local flag cache
+    flag_evaluations = meter.create_observable_counter(
+        'demo.recommendation.feature_flag.evaluations', callbacks=[flag_cache.observe_evaluations],
+        unit='{evaluation}', description="Counts feature flag evaluations per flag"
+    )
+
+    # Hot path latency histograms
+    request_duration = meter.create_histogram(
+        'demo.recommendation.duration', unit='s', description="Duration of recommendation RPC handlers",
+        explicit_bucket_boundaries_advisory=LATENCY_BUCKETS
+    )
+    catalog_duration = meter.create_histogram(
+        'demo.recommendation.catalog.duration', unit='s', description="Duration of product catalog ListProducts calls",
+        explicit_bucket_boundaries_advisory=LATENCY_BUCKETS
+    )
+    catalog_hedges = meter.create_counter(
+        'demo.recommendation.catalog.hedges', unit='{call}', description="Counts hedged product catalog ListProducts calls"
+    )
+    flag_duration = meter.create_histogram(
+        'demo.recommendation.feature_flag.duration', unit='s', description="Duration of feature flag evaluations",
+        explicit_bucket_boundaries_advisory=LATENCY_BUCKETS
+    )
+    candidates = meter.create_histogram(
+        'demo.recommendation.candidates', unit='{product}', description="Number of candidate products recommendations are sampled from",
+        explicit_bucket_boundaries_advisory=CANDIDATE_BUCKETS
+    )
+
+    # Recommendation cache memory
+    cache_memory_usage = meter.create_observable_gauge(
+        'demo.recommendation.cache.memory', callbacks=[cache_memory],
+        unit='By', description="Approximate memory held by the recommendation cache"
+    )
+
     rec_svc_metrics = {
         "demo.recommendation.requests": recommendation_requests,
+        "demo.recommendation.cache.hits": cache_hits,
+        "demo.recommendation.cache.misses": cache_misses,
+        "demo.recommendation.cache.evictions": cache_evictions,
+        "demo.recommendation.feature_flag.evaluations": flag_evaluations,
+        "demo.recommendation.duration": request_duration,
+        "demo.recommendation.catalog.duration": catalog_duration,
+        "demo.recommendation.catalog.hedges": catalog_hedges,
+        "demo.recommendation.feature_flag.duration": flag_duration,
+        "demo.recommendation.candidates": candidates,
+        "demo.recommendation.cache.memory": cache_memory_usage,
     }
 
     return rec_svc_metrics
@@ -5,9 +5,14 @@
 
 
 # Python
+import asyncio
 import os
 import random
+import signal
+import sys
+import time
 from concurrent import futures
+from contextlib import contextmanager
 
 # Pip
 import grpc
@@ -32,85 +37,334 @@ import demo_pb2_grpc
 from grpc_health.v1 import health_pb2
 from grpc_health.v1 import health_pb2_grpc
 
+from cache import RecommendationCache
+from catalog import CatalogRefresher
+from channels import PooledProductCatalogStub
+from flags import FeatureFlagCache
+from sampling import sample_excluding
+from supervisor import Supervisor
+from telemetry import list_attribute
 from metrics import (
     init_metrics
 )
 
-cached_ids = []
-first_run = True
+MAX_RESPONSES = 5
+MAX_STREAM_PAGE_SIZE = 100
+# Characters of the catalog version kept in stream cursors
+CURSOR_VERSION_LENGTH = 8
+SHUTDOWN_GRACE = 5
 
 class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
     def ListRecommendations(self, request, context):
-        prod_list = get_product_list(request.product_ids)
-        span = trace.get_current_span()
-        span.set_attribute("demo.product.recommended.count", len(prod_list))
-        logger.info(f"Receive ListRecommendations for product ids:{prod_list}")
+        with recorded_duration('ListRecommendations', context):
+            prod_list = get_product_list(request.product_ids, context.time_remaining())
+            return build_response(prod_list)
+
+    def ListRecommendationsBatch(self, request, context):
+        with recorded_duration('ListRecommendationsBatch', context):
+            prod_lists = get_product_lists(request.requests, context.time_remaining())
+            return build_batch_response(prod_lists)
+
+    def StreamRecommendations(self, request, context):
+        with recorded_duration('StreamRecommendations', context):
+            try:
+                stream = RecommendationStream(request)
+                snapshot = catalog.get(context.time_remaining())
+                stream.check_snapshot(snapshot)
+            except ValueError as e:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            yield from stream.pages(snapshot, context.is_active)
 
-        # build and return response
-        response = demo_pb2.ListRecommendationsResponse()
-        response.product_ids.extend(prod_list)
+    def Check(self, request, context):
+        return health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.SERVING)
 
-        # Collect metrics for this service
-        rec_svc_metrics["demo.recommendation.requests"].add(len(prod_list), {'recommendation.type': 'catalog'})
+    def Watch(self, request, context):
+        return health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
 
-        return response
 
-    def Check(self, request, context):
+class AioRecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
+    async def ListRecommendations(self, request, context):
+        with recorded_duration('ListRecommendations', context):
+            prod_list = await get_product_list_async(request.product_ids, context.time_remaining())
+            return build_response(prod_list)
+
+    async def ListRecommendationsBatch(self, request, context):
+        with recorded_duration('ListRecommendationsBatch', context):
+            prod_lists = await get_product_lists_async(request.requests, context.time_remaining())
+            return build_batch_response(prod_lists)
+
+    async def StreamRecommendations(self, request, context):
+        with recorded_duration('StreamRecommendations', context):
+            try:
+                stream = RecommendationStream(request)
+                snapshot = await catalog.get_async(context.time_remaining())
+                stream.check_snapshot(snapshot)
+            except ValueError as e:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            # Cancellation interrupts the pending write, no need to poll for it
+            for page in stream.pages(snapshot, lambda: True):
+                yield page
+
+    async def Check(self, request, context):
         return health_pb2.HealthCheckResponse(
             status=health_pb2.HealthCheckResponse.SERVING)
 
-    def Watch(self, request, context):
+    async def Watch(self, request, context):
         return health_pb2.HealthCheckResponse(
             status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
 
 
-def get_product_list(request_product_ids):
-    global first_run
-    global cached_ids
+class RecommendationStream:
+    """Pages of recommendations produced lazily from a catalog snapshot.
+
+    Products are visited in a random order derived from a seed, so a cursor
+    only needs the catalog version, the seed and the offset reached to resume
+    the stream. Invalid requests raise ValueError.
+    """
+
+    def __init__(self, request):
+        if request.page_size < 0 or request.max_results < 0:
+            raise ValueError('page_size and max_results must not be negative')
+        self.excluded = set(parse_product_ids(request.product_ids))
+        self.page_size = min(request.page_size or MAX_RESPONSES, MAX_STREAM_PAGE_SIZE)
+        self.max_results = request.max_results
+        self.version, self.seed, self.start = self.parse_cursor(request.cursor)
+
+    def parse_cursor(self, cursor):
+        if not cursor:
+            return None, random.getrandbits(32), 0
+        try:
+            version, seed, offset = cursor.split('.')
+            seed, offset = int(seed), int(offset)
+        except ValueError:
+            raise ValueError(f'Invalid cursor: {cursor}') from None
+        if offset < 0:
+            raise ValueError(f'Invalid cursor: {cursor}')
+        return version, seed, offset + 1
+
+    def check_snapshot(self, snapshot):
+        # The order depends on the catalog, resuming on another version would skip or repeat products
+        if self.version is not None and self.version != snapshot.version[:CURSOR_VERSION_LENGTH]:
+            raise ValueError('The catalog changed since the cursor was issued, restart the stream without a cursor')
+
+    def pages(self, snapshot, is_active):
+        span = trace.get_current_span()
+        if span.is_recording():
+            span.set_attribute("demo.recommendation.catalog.version", snapshot.version)
+        self.version = snapshot.version[:CURSOR_VERSION_LENGTH]
+        sent = 0
+        page = []
+        for offset, product_id in snapshot.iter_shuffled(self.seed, self.start):
+            if product_id in self.excluded:
+                continue
+            page.append(product_id)
+            sent += 1
+            if len(page) == self.page_size or sent == self.max_results:
+                yield self.build_page(page, offset)
+                page = []
+                if sent == self.max_results or not is_active():
+                    break
+        else:
+            if page:
+                yield self.build_page(page, offset)
+
+        if span.is_recording():
+            span.set_attribute("demo.product.recommended.count", sent)
+        rec_svc_metrics["demo.recommendation.requests"].add(sent, {'recommendation.type': 'catalog'})
+
+    def build_page(self, page, offset):
+        response = demo_pb2.StreamRecommendationsResponse(
+            cursor=f'{self.version}.{self.seed}.{offset}')
+        response.product_ids.extend(page)
+        return response
+
+
+@contextmanager
+def recorded_duration(method, context):
+    """Records the duration and gRPC status code of an RPC handler, also when it fails."""
+    start = time.perf_counter()
+    code = grpc.StatusCode.OK
+    try:
+        yield
+    except (GeneratorExit, asyncio.CancelledError):
+        # The client went away before a stream finished
+        code = grpc.StatusCode.CANCELLED
+        raise
+    except BaseException:
+        # Set by context.abort, anything else reaches the client as UNKNOWN
+        code = context.code() or grpc.StatusCode.UNKNOWN
+        raise
+    finally:
+        if isinstance(code, grpc.StatusCode):
+            code = code.value[0]
+        rec_svc_metrics["demo.recommendation.duration"].record(
+            time.perf_counter() - start, {'rpc.method': method, 'rpc.grpc.status_code': int(code)})
+
+
+def build_response(prod_list):
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attribute("demo.product.recommended.count", len(prod_list))
+    logger.info("Receive ListRecommendations for product ids:%s", prod_list)
+
+    # build and return response
+    response = demo_pb2.ListRecommendationsResponse()
+    response.product_ids.extend(prod_list)
+
+    # Collect metrics for this service
+    rec_svc_metrics["demo.recommendation.requests"].add(len(prod_list), {'recommendation.type': 'catalog'})
+
+    return response
+
+
+def build_batch_response(prod_lists):
+    span = trace.get_current_span()
+    recommended_count = sum(len(prod_list) for prod_list in prod_lists)
+    if span.is_recording():
+        span.set_attribute("demo.product.recommended.count", recommended_count)
+
+    response = demo_pb2.ListRecommendationsBatchResponse()
+    for prod_list in prod_lists:
+        response.responses.add().product_ids.extend(prod_list)
+
+    rec_svc_metrics["demo.recommendation.requests"].add(recommended_count, {'recommendation.type': 'catalog'})
+
+    return response
+
+
+def get_product_list(request_product_ids, timeout=None):
     with tracer.start_as_current_span("get_product_list") as span:
-        max_responses = 5
+        request_product_ids = parse_product_ids(request_product_ids)
+
+        # Feature flag scenario - Cache Leak
+        if check_feature_flag("recommendationCacheFailure"):
+            if leaked_cache_miss(span):
+                recommendation_cache.leak(catalog.product_ids(timeout))
+            return recommend(span, request_product_ids, recommendation_cache.leaked)
+
+        return recommend_from_snapshot(span, request_product_ids, catalog.get(timeout))
+
+
+async def get_product_list_async(request_product_ids, timeout=None):
+    with tracer.start_as_current_span("get_product_list") as span:
+        request_product_ids = parse_product_ids(request_product_ids)
+
+        # Feature flag scenario - Cache Leak
+        if await check_feature_flag_async("recommendationCacheFailure"):
+            if leaked_cache_miss(span):
+                recommendation_cache.leak(await catalog.product_ids_async(timeout))
+            return recommend(span, request_product_ids, recommendation_cache.leaked)
+
+        return recommend_from_snapshot(span, request_product_ids, await catalog.get_async(timeout))
 
-        # Formulate the list of characters to list of strings
-        request_product_ids_str = ''.join(request_product_ids)
-        request_product_ids = request_product_ids_str.split(',')
+
+def get_product_lists(requests, timeout=None):
+    with tracer.start_as_current_span("get_product_lists") as span:
+        span.set_attribute("demo.recommendation.batch.size", len(requests))
 
         # Feature flag scenario - Cache Leak
         if check_feature_flag("recommendationCacheFailure"):
-            span.set_attribute("demo.feature_flag.recommendation_cache", True)
-            if random.random() < 0.5 or first_run:
-                first_run = False
-                span.set_attribute("demo.recommendation.cache_hit", False)
-                logger.info("get_product_list: cache miss")
-                cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-                response_ids = [x.id for x in cat_response.products]
-                cached_ids = cached_ids + response_ids
-                cached_ids = cached_ids + cached_ids[:len(cached_ids) // 4]
-                product_ids = cached_ids
-            else:
-                span.set_attribute("demo.recommendation.cache_hit", True)
-                logger.info("get_product_list: cache hit")
-                product_ids = cached_ids
-        else:
-            span.set_attribute("demo.feature_flag.recommendation_cache", False)
-            cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-            product_ids = [x.id for x in cat_response.products]
+            if leaked_cache_miss(span):
+                recommendation_cache.leak(catalog.product_ids(timeout))
+            return recommend_batch(span, requests, None)
 
-        span.set_attribute("demo.product.count", len(product_ids))
+        return recommend_batch(span, requests, catalog.get(timeout))
 
-        # Create a filtered list of products excluding the products received as input
-        filtered_products = list(set(product_ids) - set(request_product_ids))
-        num_products = len(filtered_products)
-        span.set_attribute("demo.product.filtered.count", num_products)
-        num_return = min(max_responses, num_products)
 
-        # Sample list of indices to return
-        indices = random.sample(range(num_products), num_return)
-        # Fetch product ids from indices
-        prod_list = [filtered_products[i] for i in indices]
+async def get_product_lists_async(requests, timeout=None):
+    with tracer.start_as_current_span("get_product_lists") as span:
+        span.set_attribute("demo.recommendation.batch.size", len(requests))
 
-        span.set_attribute("demo.product.filtered.list", prod_list)
+        # Feature flag scenario - Cache Leak
+        if await check_feature_flag_async("recommendationCacheFailure"):
+            if leaked_cache_miss(span):
+                recommendation_cache.leak(await catalog.product_ids_async(timeout))
+            return recommend_batch(span, requests, None)
+
+        return recommend_batch(span, requests, await catalog.get_async(timeout))
+
+
+def recommend_batch(span, requests, snapshot):
+    # All requests share the catalog snapshot (or leaked ids) picked above. The
+    # per-request attributes would overwrite each other, so only the batch
+    # span records them.
+    if snapshot is not None and span.is_recording():
+        span.set_attribute("demo.feature_flag.recommendation_cache", False)
+        span.set_attribute("demo.recommendation.catalog.version", snapshot.version)
+    prod_lists = []
+    for request in requests:
+        request_product_ids = parse_product_ids(request.product_ids)
+        if snapshot is None:
+            prod_lists.append(recommend(trace.INVALID_SPAN, request_product_ids, recommendation_cache.leaked))
+        else:
+            prod_lists.append(recommend_from_snapshot(trace.INVALID_SPAN, request_product_ids, snapshot))
+    return prod_lists
+
+
+def parse_product_ids(request_product_ids):
+    # Formulate the list of characters to list of strings
+    request_product_ids_str = ''.join(request_product_ids)
+    return request_product_ids_str.split(',')
+
+
+def leaked_cache_miss(span):
+    miss = random.random() < 0.5 or not recommendation_cache.leaked
+    if span.is_recording():
+        span.set_attribute("demo.feature_flag.recommendation_cache", True)
+        span.set_attribute("demo.recommendation.cache_hit", not miss)
+    logger.info("get_product_list: cache %s", "miss" if miss else "hit")
+    return miss
+
+
+def recommend_from_snapshot(span, request_product_ids, snapshot):
+    recording = span.is_recording()
+    if recording:
+        span.set_attribute("demo.feature_flag.recommendation_cache", False)
+        span.set_attribute("demo.recommendation.catalog.version", snapshot.version)
+    if recommendation_cache.leaked:
+        recommendation_cache.release_leak()
+
+    # Cached lists repeat the same random picks until they expire
+    cache_key = None
+    if recommendation_cache.enabled:
+        cache_key = (snapshot.version, frozenset(request_product_ids))
+        cached_list = recommendation_cache.get(cache_key)
+        if recording:
+            span.set_attribute("demo.recommendation.cache_hit", cached_list is not None)
+        if cached_list is not None:
+            return cached_list
+
+    # Prefer products sharing a category with the requested ones
+    prod_list = snapshot.related_products(request_product_ids, MAX_RESPONSES)
+    if recording:
+        span.set_attribute("demo.product.related.count", len(prod_list))
+
+    prod_list = recommend(span, request_product_ids, snapshot.product_ids, prod_list)
+    if cache_key is not None:
+        recommendation_cache.put(cache_key, prod_list)
+    return prod_list
+
+
+def recommend(span, request_product_ids, product_ids, prod_list=None):
+    prod_list = prod_list or []
+    recording = span.is_recording()
+
+    # Fill up with random products, excluding the products received as input
+    if len(prod_list) < MAX_RESPONSES:
+        excluded = set(request_product_ids).union(prod_list)
+        candidates = max(len(product_ids) - len(excluded), 0)
+        rec_svc_metrics["demo.recommendation.candidates"].record(candidates)
+        if recording:
+            span.set_attribute("demo.product.filtered.count", candidates)
+        prod_list += sample_excluding(product_ids, MAX_RESPONSES - len(prod_list), excluded)
+
+    if recording:
+        span.set_attribute("demo.product.count", len(product_ids))
+        span.set_attribute("demo.product.filtered.list", list_attribute(prod_list))
 
-        return prod_list
+    return prod_list
 
 
 def must_map_env(key: str):
@@ -121,20 +375,116 @@ def must_map_env(key: str):
 
 
 def check_feature_flag(flag_name: str):
-    # Initialize OpenFeature
-    client = api.get_client()
-    return client.get_boolean_value(flag_name, False)
+    start = time.perf_counter()
+    value = flag_cache.get_boolean_value(flag_name, False)
+    rec_svc_metrics["demo.recommendation.feature_flag.duration"].record(
+        time.perf_counter() - start, {'feature_flag.key': flag_name})
+    return value
+
+
+async def check_feature_flag_async(flag_name: str):
+    if flag_name in flag_cache:
+        return check_feature_flag(flag_name)
+    # The first read resolves the flag through flagd synchronously, keep it off the event loop
+    return await asyncio.to_thread(check_feature_flag, flag_name)
+
+
+def serve(catalog_addr, port):
+    global catalog
+
+    product_catalog_stub = PooledProductCatalogStub(catalog_addr, catalog_pool_size())
+
+    # Keep a catalog snapshot in memory, refreshed in the background
+    catalog = CatalogRefresher(
+        product_catalog_stub, tracer, catalog_refresh_interval(), rec_svc_metrics, catalog_timeout(),
+        catalog_hedge_percentile())
+    catalog.start()
+
+    # Create gRPC server
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=server_options())
+
+    # Add class to gRPC server
+    service = RecommendationService()
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
+    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+
+    # Start server
+    server.add_insecure_port(f'[::]:{port}')
+    server.start()
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.stop(SHUTDOWN_GRACE))
+    logger.info(f'Recommendation service started, listening on port {port}')
+    server.wait_for_termination()
+
+
+async def serve_aio(catalog_addr, port):
+    global catalog
+
+    product_catalog_stub = PooledProductCatalogStub(catalog_addr, catalog_pool_size(), aio=True)
+
+    # Keep a catalog snapshot in memory, refreshed in the background
+    catalog = CatalogRefresher(
+        product_catalog_stub, tracer, catalog_refresh_interval(), rec_svc_metrics, catalog_timeout(),
+        catalog_hedge_percentile())
+    catalog.start_async()
+
+    # Create asyncio gRPC server, not bound to a thread per in-flight RPC
+    server = grpc.aio.server(options=server_options())
+
+    # Add class to gRPC server
+    service = AioRecommendationService()
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
+    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+
+    # Start server
+    server.add_insecure_port(f'[::]:{port}')
+    await server.start()
+    asyncio.get_running_loop().add_signal_handler(
+        signal.SIGTERM, lambda: asyncio.ensure_future(server.stop(SHUTDOWN_GRACE)))
+    logger.info(f'Recommendation service started in asyncio mode, listening on port {port}')
+    await server.wait_for_termination()
+
+
+def server_options():
+    # Let the workers started by the supervisor share the listening port
+    return [('grpc.so_reuseport', 1)]
+
+
+def catalog_refresh_interval():
+    return float(os.environ.get('RECOMMENDATION_CATALOG_REFRESH_INTERVAL', 30))
+
+
+def catalog_pool_size():
+    return int(os.environ.get('PRODUCT_CATALOG_CHANNELS', 2))
+
+
+def catalog_timeout():
+    # Deadline of each ListProducts call, 0 disables it
+    return float(os.environ.get('PRODUCT_CATALOG_TIMEOUT', 5)) or None
+
+
+def catalog_hedge_percentile():
+    # Latency percentile after which a second ListProducts call is sent, 0 disables hedging
+    return float(os.environ.get('PRODUCT_CATALOG_HEDGE_PERCENTILE', 0))
 
 
 if __name__ == "__main__":
+    workers = int(os.environ.get('RECOMMENDATION_WORKERS', 1))
+    if workers > 1 and 'RECOMMENDATION_WORKER_ID' not in os.environ:
+        sys.exit(Supervisor(workers).run())
+
     service_name = must_map_env('OTEL_SERVICE_NAME')
     api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
     api.add_hooks([TracingHook()])
 
+    # Serve feature flags from memory, refreshed on flagd changes and polling
+    flag_cache = FeatureFlagCache(api.get_client(), float(os.environ.get('RECOMMENDATION_FLAG_MAX_STALENESS', 5)))
+    flag_cache.start()
+
     # Initialize Traces and Metrics
     tracer = trace.get_tracer_provider().get_tracer(service_name)
     meter = metrics.get_meter_provider().get_meter(service_name)
-    rec_svc_metrics = init_metrics(meter)
+    # The cache is created below, the memory gauge only looks it up when observed
+    rec_svc_metrics = init_metrics(meter, flag_cache, lambda options: recommendation_cache.observe_memory(options))
 
     # Initialize Logs
     logger_provider = LoggerProvider(
@@ -149,21 +499,17 @@ if __name__ == "__main__":
     logger = logging.getLogger('main')
     logger.addHandler(handler)
 
-    catalog_addr = must_map_env('PRODUCT_CATALOG_ADDR')
-    pc_channel = grpc.insecure_channel(catalog_addr)
-    product_catalog_stub = demo_pb2_grpc.ProductCatalogServiceStub(pc_channel)
-
-    # Create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-
-    # Add class to gRPC server
-    service = RecommendationService()
-    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
-    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+    # Bounded cache of computed recommendations
+    recommendation_cache = RecommendationCache(
+        max_entries=int(os.environ.get('RECOMMENDATION_CACHE_MAX_ENTRIES', 1000)),
+        max_bytes=int(os.environ.get('RECOMMENDATION_CACHE_MAX_BYTES', 4 * 1024 * 1024)),
+        ttl=float(os.environ.get('RECOMMENDATION_CACHE_TTL', 5)),
+        metrics=rec_svc_metrics,
+    )
 
-    # Start server
+    catalog_addr = must_map_env('PRODUCT_CATALOG_ADDR')
     port = must_map_env('RECOMMENDATION_PORT')
-    server.add_insecure_port(f'[::]:{port}')
-    server.start()
-    logger.info(f'Recommendation service started, listening on port {port}')
-    server.wait_for_termination()
+    if os.environ.get('RECOMMENDATION_SERVER_MODE', 'threads') == 'aio':
+        asyncio.run(serve_aio(catalog_addr, port))
+    else:
+        serve(catalog_addr, port)
@@ -0,0 +1,75 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import random
+
+# Rounds of the Feistel network behind iter_permutation
+FEISTEL_ROUNDS = 4
+
+
+def sample_excluding(population, count, excluded, max_attempts=None):
+    """Draw up to `count` distinct items from `population` not in `excluded`.
+
+    Candidates are drawn by index and rejected against the (small) exclusion
+    set, so the cost is O(count + len(excluded)) instead of materialising the
+    filtered population. Only when rejections keep piling up, e.g. for tiny or
+    mostly excluded populations, does it fall back to a linear scan.
+    """
+    size = len(population)
+    if count <= 0 or size == 0:
+        return []
+
+    seen = set(excluded)
+    picked = []
+    attempts = max_attempts if max_attempts is not None else 4 * count + len(seen)
+    for _ in range(attempts):
+        candidate = population[random.randrange(size)]
+        if candidate not in seen:
+            seen.add(candidate)
+            picked.append(candidate)
+            if len(picked) == count:
+                return picked
+
+    remaining = [item for item in dict.fromkeys(population) if item not in seen]
+    picked += random.sample(remaining, min(count - len(picked), len(remaining)))
+    return picked
+
+
+def iter_permutation(size, seed, start=0):
+    """Lazily yield the positions of a pseudo-random permutation of range(size).
+
+    Positions are mapped through a seeded Feistel network on the smallest
+    power-of-four domain covering `size`, walking the cycle until the result
+    falls inside range(size). This needs O(1) memory and can resume from any
+    `start` offset given the same `size` and `seed`.
+    """
+    if size <= 0:
+        return
+    half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+    rng = random.Random(seed)
+    keys = [rng.getrandbits(32) for _ in range(FEISTEL_ROUNDS)]
+    for offset in range(start, size):
+        index = _feistel(offset, half_bits, keys)
+        while index >= size:
+            index = _feistel(index, half_bits, keys)
+        yield offset, index
+
+
+def _feistel(value, half_bits, keys):
+    mask = (1 << half_bits) - 1
+    left, right = value >> half_bits, value & mask
+    for key in keys:
+        left, right = right, left ^ (_mix(right ^ key) & mask)
+    return (left << half_bits) | right
+
+
+def _mix(value):
+    # 32-bit integer hash (lowbias32), spreads every input bit over the output
+    value ^= value >> 16
+    value = (value * 0x7feb352d) & 0xffffffff
+    value ^= value >> 15
+    value = (value * 0x846ca68b) & 0xffffffff
+    return value ^ (value >> 16)
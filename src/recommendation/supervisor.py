@@ -0,0 +1,104 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+# Local
+from logger import getJSONLogger
+
+logger = getJSONLogger('supervisor')
+
+
+class Supervisor:
+    """Runs the recommendation server as several worker processes.
+
+    Workers are separate interpreters started before any gRPC or OpenTelemetry
+    state exists, so each one sets up its own providers and catalog snapshot.
+    They all bind the same port with SO_REUSEPORT and the kernel spreads
+    incoming connections across them. Crashed workers are restarted, with an
+    increasing delay when they keep crashing right after startup.
+    """
+
+    def __init__(self, workers, shutdown_timeout=10.0, min_restart_delay=1.0, max_restart_delay=30.0):
+        self.workers = workers
+        self.shutdown_timeout = shutdown_timeout
+        self.min_restart_delay = min_restart_delay
+        self.max_restart_delay = max_restart_delay
+        self._processes = {}
+        self._started_at = {}
+        self._restart_delay = {}
+        self._restart_at = {}
+        self._stopping = threading.Event()
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+
+        for worker_id in range(self.workers):
+            self._spawn(worker_id)
+        logger.info(f'Supervisor started {self.workers} recommendation workers')
+
+        while not self._stopping.wait(0.5):
+            for worker_id in range(self.workers):
+                self._check(worker_id)
+
+        self._shutdown()
+        return 0
+
+    def _spawn(self, worker_id):
+        env = dict(os.environ)
+        env['RECOMMENDATION_WORKER_ID'] = str(worker_id)
+        # Keep telemetry of each worker apart
+        instance_id = f'service.instance.id={socket.gethostname()}-{worker_id}'
+        resource_attributes = env.get('OTEL_RESOURCE_ATTRIBUTES')
+        env['OTEL_RESOURCE_ATTRIBUTES'] = (
+            f'{resource_attributes},{instance_id}' if resource_attributes else instance_id)
+
+        self._processes[worker_id] = subprocess.Popen([sys.executable] + sys.argv, env=env)
+        self._started_at[worker_id] = time.monotonic()
+        self._restart_at.pop(worker_id, None)
+
+    def _check(self, worker_id):
+        process = self._processes.get(worker_id)
+        if process is not None:
+            code = process.poll()
+            if code is None:
+                return
+            uptime = time.monotonic() - self._started_at[worker_id]
+            delay = self._restart_delay.get(worker_id, self.min_restart_delay)
+            if uptime > self.max_restart_delay:
+                delay = self.min_restart_delay
+            self._restart_delay[worker_id] = min(delay * 2, self.max_restart_delay)
+            self._restart_at[worker_id] = time.monotonic() + delay
+            self._processes[worker_id] = None
+            logger.warning(f'Recommendation worker {worker_id} exited with code {code}, restarting in {delay:.1f}s')
+
+        if time.monotonic() >= self._restart_at.get(worker_id, 0):
+            self._spawn(worker_id)
+
+    def _handle_signal(self, signum, frame):
+        self._stopping.set()
+
+    def _shutdown(self):
+        running = [process for process in self._processes.values() if process is not None]
+        logger.info(f'Stopping {len(running)} recommendation workers')
+        for process in running:
+            if process.poll() is None:
+                process.terminate()
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for process in running:
+            try:
+                process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
@@ -0,0 +1,21 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import os
+
+# List-valued span attributes are cut to this many items
+MAX_LIST_ATTRIBUTE_LENGTH = int(os.environ.get('RECOMMENDATION_SPAN_LIST_LIMIT', 10))
+
+
+def list_attribute(values, limit=MAX_LIST_ATTRIBUTE_LENGTH):
+    """Bound the size of a list-valued span attribute.
+
+    Only the first `limit` items are kept; callers record the full length in
+    a separate count attribute.
+    """
+    if len(values) <= limit:
+        return values
+    return values[:limit]
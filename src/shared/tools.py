@@ -3,32 +3,299 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import json
 import os
+import random
+import time
+from collections import OrderedDict
 
 import httpx
+from opentelemetry import metrics
 
 BASE_URL = os.getenv("APPLICATION_ENDPOINT", "localhost:8080")
 TIMEOUT = httpx.Timeout(10.0)
+LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("TOOLS_HTTP_MAX_CONNECTIONS", "20")),
+    max_keepalive_connections=int(os.getenv("TOOLS_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")),
+    keepalive_expiry=float(os.getenv("TOOLS_HTTP_KEEPALIVE_EXPIRY", "30")),
+)
+
+# Seconds read-only tool results are cached for, 0 disables caching
+CACHE_TTL = {
+    "list_products": float(os.getenv("TOOLS_CACHE_TTL_LIST_PRODUCTS", "60")),
+    "get_product": float(os.getenv("TOOLS_CACHE_TTL_GET_PRODUCT", "60")),
+    "get_supported_currencies": float(os.getenv("TOOLS_CACHE_TTL_GET_SUPPORTED_CURRENCIES", "300")),
+}
+CACHE_MAX_ENTRIES = int(os.getenv("TOOLS_CACHE_MAX_ENTRIES", "256"))
+# Products fetched at once by get_products
+BATCH_CONCURRENCY = int(os.getenv("TOOLS_BATCH_CONCURRENCY", "8"))
+
+# Product fields list tools return unless asked for other fields or `full`
+PRODUCT_LIST_FIELDS = ["id", "name", "categories", "priceUsd"]
+PRODUCT_DETAIL_FIELDS = ["id", "name", "description", "categories", "priceUsd"]
+LIST_LIMIT = int(os.getenv("TOOLS_LIST_LIMIT", "20"))
+
+# Retries of idempotent GET requests, with jittered exponential backoff
+RETRY_ATTEMPTS = int(os.getenv("TOOLS_RETRY_ATTEMPTS", "3"))
+RETRY_BACKOFF = float(os.getenv("TOOLS_RETRY_BACKOFF", "0.1"))
+RETRY_STATUS_CODES = {502, 503, 504}
+# Consecutive failures after which calls to an endpoint fail fast, and for how long
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("TOOLS_BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("TOOLS_BREAKER_RESET_TIMEOUT", "30"))
+
+_client: httpx.AsyncClient | None = None
+
+meter = metrics.get_meter("astronomy-shop-tools")
+cache_hits = meter.create_counter(
+    "demo.agent.tool.cache.hits", unit="{hit}", description="Counts shop tool calls served from the tool cache or a shared in-flight request"
+)
+cache_misses = meter.create_counter(
+    "demo.agent.tool.cache.misses", unit="{miss}", description="Counts shop tool calls that went to the frontend"
+)
+request_retries = meter.create_counter(
+    "demo.agent.tool.retries", unit="{retry}", description="Counts retried frontend requests"
+)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """Fails calls to a frontend endpoint fast while the endpoint is down.
+
+    Only signs that the endpoint is unavailable count as failures: transport
+    errors and 502/503/504 responses. Other errors come from the request
+    itself, such as an unknown product id, and do not open the breaker.
+    After `failure_threshold` consecutive failures the breaker opens and calls
+    are rejected without a request. Once `reset_timeout` has passed, one call
+    is let through (half-open): success closes the breaker, failure opens it
+    again.
+    """
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+    def __init__(self, method, route, failure_threshold, reset_timeout):
+        self.method = method
+        self.route = route
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def before_call(self):
+        if self.state == self.CLOSED:
+            return
+        retry_in = self.opened_at + self.reset_timeout - time.monotonic()
+        if retry_in > 0:
+            raise CircuitOpenError(
+                f"{self.method} {self.route} is unavailable after {self.failures} failed calls, not retrying for {retry_in:.0f}s"
+            )
+        # Let one trial call through, and another one if it never completes
+        self.state = self.HALF_OPEN
+        self.opened_at = time.monotonic()
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+_breakers = {}
+
+
+def _breaker(method, route):
+    breaker = _breakers.get((method, route))
+    if breaker is None:
+        breaker = _breakers[(method, route)] = CircuitBreaker(
+            method, route, BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT
+        )
+    return breaker
+
+
+def _observe_breakers(options):
+    for (method, route), breaker in list(_breakers.items()):
+        yield metrics.Observation(breaker.state, {"http.request.method": method, "url.template": route})
+
+
+meter.create_observable_gauge(
+    "demo.agent.tool.circuit_breaker.state", callbacks=[_observe_breakers],
+    unit="1", description="State of the circuit breaker of each frontend endpoint and method: 0 closed, 1 half-open, 2 open"
+)
+
+
+class ToolCache:
+    """TTL cache for the results of read-only tools.
+
+    Entries expire after the TTL of their tool and the least recently used
+    entries are dropped beyond `max_entries`. Concurrent calls for a key that
+    is not cached share one in-flight request. Failed calls are not cached.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+
+    async def get(self, tool_name, args, ttl, load):
+        if ttl <= 0:
+            return await load()
+        key = (tool_name, args)
+        attributes = {"gen_ai.tool.name": tool_name}
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            cache_hits.add(1, attributes)
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            cache_misses.add(1, attributes)
+            task = asyncio.ensure_future(load())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, ttl, done))
+        else:
+            # Joining the request already in flight is as good as a hit
+            cache_hits.add(1, attributes)
+        # A cancelled caller must not cancel the request other callers wait for
+        return await asyncio.shield(task)
+
+    def peek(self, tool_name, args):
+        """Return a cached result that has not expired, without loading it."""
+        entry = self._entries.get((tool_name, args))
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def clear(self):
+        self._entries.clear()
+
+    def _store(self, key, ttl, task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (time.monotonic() + ttl, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+tool_cache = ToolCache(CACHE_MAX_ENTRIES)
+
+
+def http_client():
+    """Return the HTTP client shared by all tools, creating it if needed."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=TIMEOUT,
+            limits=LIMITS,
+        )
+    return _client
+
+
+def start_client():
+    """Open the shared HTTP client when the service starts."""
+    http_client()
+
+
+async def close_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _request(method, route, path=None, **kwargs):
+    """Send a request to the frontend through the circuit breaker of `method` and `route`.
+
+    GET requests are retried on transport errors and 502/503/504 responses.
+    Other methods are sent once since they are not idempotent.
+    """
+    breaker = _breaker(method, route)
+    breaker.before_call()
+    url = f"http://{BASE_URL}{path or route}"
+    attempts = RETRY_ATTEMPTS if method == "GET" else 1
+    for attempt in range(attempts):
+        if attempt:
+            request_retries.add(1, {"url.template": route})
+            await asyncio.sleep(random.uniform(0, RETRY_BACKOFF * 2 ** attempt))
+        try:
+            res = await http_client().request(method, url, **kwargs)
+        except httpx.TransportError:
+            if attempt + 1 < attempts:
+                continue
+            breaker.record_failure()
+            raise
+        if res.status_code in RETRY_STATUS_CODES and attempt + 1 < attempts:
+            continue
+        if res.status_code in RETRY_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return res
+
+
+async def _get_json(route, path=None, params=None):
+    res = await _request("GET", route, path, params=params)
+    res.raise_for_status()
+    return res.json()
+
+
+def _compact(value):
+    # Money is sent as {currencyCode, units, nanos}, the model only needs the amount
+    if isinstance(value, dict) and "currencyCode" in value:
+        amount = int(value.get("units", 0)) + int(value.get("nanos", 0)) / 1e9
+        return f"{value['currencyCode']} {amount:.2f}"
+    return value
+
+
+def _page(items, offset=0, limit=None):
+    """Slice a page of `items` and return it with its paging metadata."""
+    end = None if limit is None else offset + limit
+    page = items[offset:end]
+    paging = {"total": len(items)}
+    if offset + len(page) < len(items):
+        paging["next_offset"] = offset + len(page)
+    return page, paging
+
+
+def _table(items, fields, offset=0, limit=None):
+    """Encode a page of JSON objects as one list of columns and a row per object.
+
+    Keys are sent once instead of once per object, and only `fields` are
+    kept, which keeps large lists small in the model context.
+    """
+    page, paging = _page(items, offset, limit)
+    return {
+        "columns": list(fields),
+        "rows": [[_compact(item.get(field)) for field in fields] for item in page],
+        **paging,
+    }
 
 
 async def get_ads(category: str):
     """Fetch promotional ads for Astronomy Shop homepage.
     Eg : category: `telescopes` or `travel`"""
-    url = f"http://{BASE_URL}/api/data"
     params = {"contextKeys": category}
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.get(url, params=params)
-            res.raise_for_status()
-            return res.json()
+        return await _get_json("/api/data", params=params)
     except Exception as e:
         return f"Error fetching ads: {e}"
 
 
 async def add_to_cart(user_id: str, product_id: str, quantity: int = 1):
     """Add a product (product_id) to the shopping cart for a user (user_id)."""
-    url = f"http://{BASE_URL}/api/cart"
     data = {
         "item": {
             "productId": product_id,
@@ -37,110 +304,152 @@ async def add_to_cart(user_id: str, product_id: str, quantity: int = 1):
         "userId": user_id,
     }
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.post(url, json=data)
-            res.raise_for_status()
-            return res.json()
+        res = await _request("POST", "/api/cart", json=data)
+        res.raise_for_status()
+        return res.json()
     except Exception as e:
         return f"Error while adding product to cart: {e}"
 
 
 async def get_cart(user_id: str):
     """Retrieve the current contents of a user's cart."""
-    url = f"http://{BASE_URL}/api/cart"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.get(url, params={"user_id": user_id})
-            res.raise_for_status()
-            return res.json()
+        return await _get_json("/api/cart", params={"user_id": user_id})
     except Exception as e:
         return f"Error while fetching cart: {e}"
 
 
 async def empty_cart(user_id: str):
     """Empty the shopping cart for a user."""
-    url = f"http://{BASE_URL}/api/cart"
     payload = {"userId": user_id}
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.request("DELETE", url, json=payload)
-            res.raise_for_status()
-            if res.status_code == 204 or not res.content:
-                return {"status": "success", "message": f"Cart emptied for user {user_id}"}
-            return res.json()
+        res = await _request("DELETE", "/api/cart", json=payload)
+        res.raise_for_status()
+        if res.status_code == 204 or not res.content:
+            return {"status": "success", "message": f"Cart emptied for user {user_id}"}
+        return res.json()
     except Exception as e:
         return f"Error while emptying cart: {e}"
 
 
-async def list_products():
-    """List all products available in the Astronomy Shop."""
-    url = f"http://{BASE_URL}/api/products"
+async def list_products(
+    fields: list[str] | None = None,
+    limit: int = LIST_LIMIT,
+    offset: int = 0,
+    full: bool = False,
+):
+    """List products available in the Astronomy Shop.
+    Returns {columns, rows, total, next_offset} with the id, name, categories and price of each product.
+    `fields` selects other product fields (e.g. description, picture), `limit` and `offset` page through
+    the catalog while `next_offset` is returned, and `full=True` returns {products, total, next_offset}
+    with the complete product objects of the same page."""
+    if limit < 1 or offset < 0:
+        return "Error while fetching product list: limit must be at least 1 and offset must not be negative"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.get(url)
-            res.raise_for_status()
-            return res.json()
+        catalog = await _fetch_catalog()
     except Exception as e:
         return f"Error while fetching product list: {e}"
+    if full:
+        page, paging = _page(catalog, offset, limit)
+        return {"products": page, **paging}
+    return _table(catalog, fields or PRODUCT_LIST_FIELDS, offset, limit)
+
+
+async def _fetch_product(product_id):
+    path = f"/api/products/{product_id}"
+    return await tool_cache.get(
+        "get_product", (product_id,), CACHE_TTL["get_product"],
+        lambda: _get_json("/api/products/{productId}", path))
+
+
+async def _fetch_catalog():
+    return await tool_cache.get(
+        "list_products", (), CACHE_TTL["list_products"], lambda: _get_json("/api/products"))
 
 
 async def get_product(product_id: str):
     """Get detailed information about a product using its ID."""
-    url = f"http://{BASE_URL}/api/products/{product_id}"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.get(url)
-            res.raise_for_status()
-            return res.json()
+        return await _fetch_product(product_id)
     except Exception as e:
         return f"Error while fetching product {product_id}: {e}"
 
 
+async def get_products(product_ids: list[str], fields: list[str] | None = None, full: bool = False):
+    """Get detailed information about several products at once using their IDs.
+    Prefer this over calling get_product once per product.
+    Returns {columns, rows} with one row per product in the order of `product_ids`, plus `errors`
+    for products that could not be fetched. `fields` selects other product fields and `full=True`
+    returns the complete product objects."""
+    unique_ids = list(dict.fromkeys(product_ids))
+    catalog = tool_cache.peek("list_products", ())
+    if catalog is None and len(unique_ids) > BATCH_CONCURRENCY:
+        # One catalog request is cheaper than many product requests
+        try:
+            catalog = await _fetch_catalog()
+        except Exception:
+            catalog = None
+    known = {product.get("id"): product for product in catalog or []}
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def fetch(product_id):
+        if product_id in known:
+            return known[product_id]
+        async with semaphore:
+            try:
+                return await _fetch_product(product_id)
+            except Exception as e:
+                return {"id": product_id, "error": f"Error while fetching product {product_id}: {e}"}
+
+    products = dict(zip(unique_ids, await asyncio.gather(*(fetch(pid) for pid in unique_ids))))
+    results = [products[product_id] for product_id in product_ids]
+    if full:
+        return results
+    table = _table([product for product in results if "error" not in product], fields or PRODUCT_DETAIL_FIELDS)
+    del table["total"]
+    errors = [product["error"] for product in products.values() if "error" in product]
+    if errors:
+        table["errors"] = errors
+    return table
+
+
 async def checkout(checkout_person):
     """Checkout the user's cart and create an order.
     Takes request in the format {string user_id, string userCurrency, Address address, string email, CreditCardInfo creditCard}
     Where Address is {string streetAddress, string city, string state, string country, string zipCode} and
     CreditCardInfo is {string creditCardNumber, int32 creditCardCvv, int32 creditCardExpirationYear, int32 creditCardExpirationMonth}
     """
-    url = f"http://{BASE_URL}/api/checkout"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.post(url, json=checkout_person)
-            if not res.is_success:
-                body = res.text.strip() or "<empty body>"
-                user_id = checkout_person.get("userId", "<unknown>")
-                return (
-                    f"Checkout failed with HTTP {res.status_code} for user "
-                    f"{user_id}: {body}. "
-                    "Note: the user's cart must contain at least one item before "
-                    "calling checkout; call add_to_cart first."
-                )
-            return res.json()
+        res = await _request("POST", "/api/checkout", json=checkout_person)
+        if not res.is_success:
+            body = res.text.strip() or "<empty body>"
+            user_id = checkout_person.get("userId", "<unknown>")
+            return (
+                f"Checkout failed with HTTP {res.status_code} for user "
+                f"{user_id}: {body}. "
+                "Note: the user's cart must contain at least one item before "
+                "calling checkout; call add_to_cart first."
+            )
+        return res.json()
     except Exception as e:
         return f"Error while performing checkout: {e}"
 
 
 async def get_supported_currencies():
     """List supported currencies in Astronomy Shop."""
-    url = f"http://{BASE_URL}/api/currency"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.get(url)
-            res.raise_for_status()
-            return res.json()
+        return await tool_cache.get(
+            "get_supported_currencies", (), CACHE_TTL["get_supported_currencies"],
+            lambda: _get_json("/api/currency"))
     except Exception as e:
         return f"Error while fetching currency list: {e}"
 
 
 async def get_recommendations(product_id: str):
     """Get product recommendations for a user."""
-    url = f"http://{BASE_URL}/api/recommendations"
     params = {"productIds": product_id}
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.get(url, params=params)
-            res.raise_for_status()
-            return res.json()
+        return await _get_json("/api/recommendations", params=params)
     except Exception as e:
         return f"Error fetching recommendations: {e}"
 
@@ -151,8 +460,6 @@ async def get_shipping_quote(items, currency_code, address):
     `currency_code`: ISO 4217 code, e.g. "USD".
     `address`: {streetAddress, city, state, country, zipCode}.
     """
-    url = f"http://{BASE_URL}/api/shipping"
-
     if isinstance(items, dict):
         items = [items]
 
@@ -172,11 +479,10 @@ async def get_shipping_quote(items, currency_code, address):
         "address": json.dumps(address),
     }
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-            res = await client.get(url, params=params)
-            if not res.is_success:
-                body = res.text.strip() or "<empty body>"
-                return f"Shipping quote failed with HTTP {res.status_code}: {body}. "
-            return res.json()
+        res = await _request("GET", "/api/shipping", params=params)
+        if not res.is_success:
+            body = res.text.strip() or "<empty body>"
+            return f"Shipping quote failed with HTTP {res.status_code}: {body}. "
+        return res.json()
     except Exception as e:
         return f"Error fetching shipping quote: {e}"